@@ -31,7 +31,14 @@ __all__ = [
     
     # From display.py
     'SCREEN_WIDTH', 'SCREEN_HEIGHT', 'FULLSCREEN', 'FPS',
+    'FRAME_PACING_ENABLED', 'FRAME_RATE_TIERS', 'FRAME_RATE_INPUT_BOOST', 'FRAME_RATE_BOOST_SECONDS',
+    'FRAME_RATE_IDLE', 'FRAME_RATE_IDLE_AFTER_SECONDS', 'FRAME_RATE_INPUT_POLL_INTERVAL',
     'GRAPH_HISTORY_SIZE', 'GRAPH_LINE_WIDTH', 'GRAPH_POINT_SIZE',
+    'HISTORY_TIERS', 'GRAPH_WINDOW_SECONDS',
+    'ASSET_CACHE_MAX_BYTES', 'LOGO_BREATHING_FRAMES', 'TEXT_CACHE_MAX_ENTRIES',
+    'DIRTY_RECT_RENDERING', 'DIRTY_RECT_PIXEL_DIFF', 'DIRTY_RECT_TILE_SIZE',
+    'DIRTY_RECT_FULL_UPDATE_RATIO',
+    'AMBIENT_LAYER_FRAME_RATE', 'AMBIENT_LAYER_CACHE_BYTES',
     'SPLASH_LOGO_PATH', 'SPLASH_DURATION_MS', 'LOADING_SCREEN_MIN_DURATION',
     'SCHEMATICS_ZOOM_DEFAULT', 'SCHEMATICS_ZOOM_MIN', 'SCHEMATICS_ZOOM_MAX',
     'SCHEMATICS_ZOOM_STEP', 'SCHEMATICS_ZOOM_FAST_STEP',
@@ -42,6 +49,7 @@ __all__ = [
     'ARROW_INDICATOR_WIDTH', 'ARROW_INDICATOR_SIZE', 'ARROW_USE_ITEM_COLOR',
     'AUTO_CYCLE_INTERVAL',
     'AUTO_CYCLE_INTERVAL_OPTIONS',
+    'DASHBOARD_COLUMNS', 'DASHBOARD_REDRAW_BUDGET_MS',
     'SECRET_COMBO_DURATION_OPTIONS',
     'LIST_MENU_MAX_VISIBLE_ITEMS',
     'UI_BASE_WIDTH', 'UI_BASE_HEIGHT',
@@ -68,10 +76,15 @@ __all__ = [
     'SENSOR_CPU_USAGE', 'SENSOR_MEMORY_USAGE', 'SENSOR_DISK_USAGE',
     'SENSOR_VOLTAGE', 'SENSOR_BATTERY',
     'INFO_WIFI_STATUS', 'INFO_WIFI_SSID', 'INFO_BLUETOOTH_STATUS', 'INFO_BLUETOOTH_DEVICE',
-    'SENSOR_MODES', 'SENSOR_DISPLAY_PROPERTIES',
+    'SENSOR_MODES', 'SENSOR_DISPLAY_PROPERTIES', 'SENSOR_WORKER_ENABLED', 'IMU_SAMPLE_MAX_AGE',
+    'SENSOR_LOG_ENABLED', 'SENSOR_LOG_DIR', 'SENSOR_LOG_SEGMENT_RECORDS', 'SENSOR_LOG_MAX_SEGMENTS',
+    'SENSOR_LOG_FLUSH_INTERVAL', 'SENSOR_LOG_REPLAY_SECONDS',
     
     # From schematics.py
-    'SCHEMATICS_CONFIG', 'SENSOR_3D_CONFIG', 'get_model_config', 'get_initial_rotations',
+    'SCHEMATICS_CONFIG', 'SENSOR_3D_CONFIG', 'MESH_CACHE_ENABLED', 'MESH_VBO_ENABLED',
+    'SCHEMATICS_LOD_RATIOS', 'SCHEMATICS_LOD_MIN_TRIANGLES', 'SCHEMATICS_LOD_ZOOM_THRESHOLDS',
+    'SCHEMATICS_LOD_TARGET_FPS', 'SCHEMATICS_TEXTURE_MAX_SIZE', 'SCHEMATICS_TEXTURE_CACHE_ENABLED',
+    'get_model_config', 'get_initial_rotations',
     
     # From network.py
     'AUTO_REPORT_EMAIL', 'AUTO_REPORT_PASS', 'AUTO_REPORT_TARGET',
@@ -16,11 +16,46 @@ else:
 
 FPS = 60                # Frames per second/update rate (higher for smooth video playback)
 
+# -- Adaptive Frame Pacing (all rates are capped at FPS) --
+FRAME_PACING_ENABLED = True          # False = run every state at FPS
+FRAME_RATE_TIERS = {
+    "realtime": 60,  # Games and the 3D schematics viewer
+    "animated": 30,  # Menus, sensor views and other animated screens
+    "static": 10,    # Settings pages, pickers and confirmation dialogs
+}
+FRAME_RATE_INPUT_BOOST = 60          # Rate right after input so navigation stays smooth
+FRAME_RATE_BOOST_SECONDS = 1.5       # How long the boost lasts after the last input
+FRAME_RATE_IDLE = 2                  # Rate after FRAME_RATE_IDLE_AFTER_SECONDS without input
+FRAME_RATE_IDLE_AFTER_SECONDS = 30   # 0 disables idle mode (games, 3D, video and dashboard never idle)
+FRAME_RATE_INPUT_POLL_INTERVAL = 0.02  # Input check interval (s) while waiting out a slow frame
+
 # -- Graph Settings (Mainly for Line Graphs) --
 GRAPH_HISTORY_SIZE = 30  # Number of data points to keep (= seconds at 1 reading/sec)
 GRAPH_LINE_WIDTH = 1     # Width of the graph line in pixels
 GRAPH_POINT_SIZE = 2     # Size of the data points in pixels
 
+# Downsampled history tiers kept alongside the raw samples: (bucket seconds, bucket count).
+# Each bucket stores min/max/mean. Defaults: 1 hour at 10 s, 1 day at 1 min, 1 week at 10 min.
+HISTORY_TIERS = ((10, 360), (60, 1440), (600, 1008))
+GRAPH_WINDOW_SECONDS = None  # Line graph time window; None = raw GRAPH_HISTORY_SIZE samples
+
+# -- Image Asset Cache --
+ASSET_CACHE_MAX_BYTES = 16 * 1024 * 1024  # Loaded/scaled surfaces kept in memory (LRU beyond this)
+LOGO_BREATHING_FRAMES = 8                 # Precomputed scale steps for the main menu logo breathing
+
+# -- Text Render Cache --
+TEXT_CACHE_MAX_ENTRIES = 512  # Rendered strings kept for reuse across frames (LRU beyond this)
+
+# -- Dirty-Rectangle Presentation --
+DIRTY_RECT_RENDERING = True         # Push only changed screen regions; False = flip every frame
+DIRTY_RECT_PIXEL_DIFF = True        # Diff frames of views that redraw in full, push only changed tiles (costs a full-frame copy + compare)
+DIRTY_RECT_TILE_SIZE = 16           # Tile size (px) used to find changed regions (pixel diff)
+DIRTY_RECT_FULL_UPDATE_RATIO = 0.5  # Flip the whole screen when at least this fraction of it changed
+
+# -- Pre-rendered Ambient Animations --
+AMBIENT_LAYER_FRAME_RATE = 30                 # Frames rendered per second of a periodic effect (then replayed)
+AMBIENT_LAYER_CACHE_BYTES = 16 * 1024 * 1024  # Memory for rendered effect frames (LRU beyond this)
+
 # -- Splash Screen --
 SPLASH_LOGO_PATH = "assets/images/logo.png"
 SPLASH_DURATION_MS = 3000  # Original splash duration (not used in loading screen)
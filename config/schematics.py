@@ -41,6 +41,26 @@ SCHEMATICS_CONFIG = {
 # Model keys shown in the Ship submenu (others remain in config but are not rendered in the UI).
 SCHEMATICS_VISIBLE_KEYS = ('ncc_1701', 'apollo_1570')
 
+# Compile OBJ models to a binary mesh next to the file (<name>.obj.mesh) on first load and
+# memory-map it afterwards; rebuilt automatically when the OBJ changes.
+MESH_CACHE_ENABLED = True
+
+# Draw models from vertex buffers (one draw call per material) instead of a display list
+MESH_VBO_ENABLED = True
+
+# Level-of-detail meshes: triangle fraction per level, full model first. Coarser levels are
+# built by vertex clustering on first load and cached next to the OBJ (<name>.obj.lod<n>.mesh).
+SCHEMATICS_LOD_RATIOS = (1.0, 0.3, 0.1)
+SCHEMATICS_LOD_MIN_TRIANGLES = 20000     # Smaller models are always drawn at full detail
+SCHEMATICS_LOD_ZOOM_THRESHOLDS = (1.0, 0.5)  # Below the n-th zoom level, use LOD n + 1 or coarser
+SCHEMATICS_LOD_TARGET_FPS = 30           # Step to a coarser level while the viewer runs slower than this
+
+# Model textures are downscaled to power-of-two sides of at most this many pixels, mipmapped
+# and prepared during the loading screen; the results are cached compressed next to each
+# image (<image>.<size>.tex). Larger sizes add memory but no visible detail at 320x240.
+SCHEMATICS_TEXTURE_MAX_SIZE = 256
+SCHEMATICS_TEXTURE_CACHE_ENABLED = True
+
 # Sensor configuration for 3D viewer (separate from other app sensor usage)
 SENSOR_3D_CONFIG = {
     # Balanced noise filtering - responsive but stable
@@ -56,6 +76,13 @@ SENSOR_3D_CONFIG = {
     
     # Lighter smoothing for responsiveness
     'smoothing_factor': 0.3,     # Less aggressive smoothing (30% of new reading)
+
+    # High-rate streaming: IMU sampled on a worker thread, filtered over every buffered sample
+    'stream_enabled': True,
+    'stream_rate_hz': 100,        # Fixed sampling rate (100-200 Hz)
+    'stream_buffer_size': 256,    # Ring buffer capacity (~2.5 s at 100 Hz)
+    'stream_time_constant': 0.08, # Low-pass time constant in seconds (frame-rate independent)
+    'stream_idle_timeout': 1.0,   # Stop sampling after this long without the viewer reading
 }
 
 def get_model_config(model_key):
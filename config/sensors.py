@@ -6,6 +6,25 @@
 # Set to False for testing when you want stable readings
 ENABLE_MOCK_SENSOR_DYNAMICS = False
 
+# -- Sensor Acquisition --
+# When True, Sense HAT sensors (SENSOR_MODES) are polled on a background thread on their
+# update_interval and the main loop reads the latest snapshot, so I2C reads never stall a frame
+SENSOR_WORKER_ENABLED = True
+
+# Readers asking for the IMU within this many seconds of the last read share that sample
+# (orientation, accelerometer and gyroscope come from one I2C read per tick)
+IMU_SAMPLE_MAX_AGE = 0.015
+
+# -- Sensor Log --
+# Append-only binary log of every scheduled reading (16-byte records in rotating segment files).
+# Replayed into the reading history on startup so graphs survive restarts.
+SENSOR_LOG_ENABLED = True
+SENSOR_LOG_DIR = "logs/sensors"
+SENSOR_LOG_SEGMENT_RECORDS = 65536    # Records per segment file (1 MiB)
+SENSOR_LOG_MAX_SEGMENTS = 64          # Oldest segments are deleted beyond this (64 MiB total)
+SENSOR_LOG_FLUSH_INTERVAL = 5.0       # Seconds between batched write + fsync
+SENSOR_LOG_REPLAY_SECONDS = 3600      # How much logged history to load on startup
+
 # -- Sense HAT LED Matrix --
 # When True, the 8x8 LED panel shows state-based patterns (menu, sensor bar, media play/pause, etc.)
 # Set to False to leave the matrix off after init (saves a small amount of I2C traffic)
@@ -24,6 +24,8 @@ ARROW_USE_ITEM_COLOR = True       # Whether to use menu item color or red alert
 # -- Dashboard Settings --
 AUTO_CYCLE_INTERVAL = 5  # Seconds between auto-cycling in dashboard mode
 AUTO_CYCLE_INTERVAL_OPTIONS = [1, 5, 10, 15, 30, 60, "<- Back to Main Menu"] # Seconds, New, updated string option with simpler arrow
+DASHBOARD_COLUMNS = 2             # Sensor panels per row in the multi-sensor dashboard
+DASHBOARD_REDRAW_BUDGET_MS = 4.0  # Per-frame time for redrawing changed panels (at least one is redrawn each frame)
 
 # -- Secret Menu Settings -- (New Section)
 SECRET_COMBO_DURATION_OPTIONS = [2.0, 3.0, 5.0, 7.0, 10.0] # Seconds
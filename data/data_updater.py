@@ -11,6 +11,9 @@ import config
 
 logger = logging.getLogger(__name__)
 
+# Last formatted entry per sensor with the display key it was built from (see _display_key)
+_last_formatted = {}
+
 def _format_sensor_value(sensor_key, raw_value, display_props):
     """Helper to format a single sensor value and prepare it for sensor_values dict."""
     text_val = "N/A"
@@ -71,7 +74,88 @@ def _format_sensor_value(sensor_key, raw_value, display_props):
 
     return {"text": text_val, "unit": unit, "note": note, "value": numeric_val}
 
-def update_sensors_by_schedule(sensor_values, reading_history, app_config, current_time, last_update_times, network_manager=None, system_info_manager=None):
+def _display_key(sensor_key, raw_value, display_props):
+    """
+    Return (display_key, numeric_value) for a raw reading.
+
+    display_key captures everything the formatted text/note depend on, quantised to the
+    displayed precision (so e.g. 21.43 and 21.44 at precision 1 share a key). Equal keys
+    mean _format_sensor_value would produce the same text. numeric_value matches the
+    entry's "value" field.
+    """
+    if raw_value is None:
+        return (None,), None
+    if sensor_key == config.SENSOR_ORIENTATION and isinstance(raw_value, dict):
+        return (round(raw_value['pitch']), round(raw_value['roll'])), raw_value.get(display_props.get("component_to_graph", 'pitch'))
+    if sensor_key == config.SENSOR_ACCELERATION and isinstance(raw_value, dict):
+        return (round(raw_value['x'], 2), round(raw_value['y'], 2)), raw_value.get('z')
+    if sensor_key == config.SENSOR_CLOCK and hasattr(raw_value, 'strftime'):
+        return raw_value.replace(microsecond=0), None
+    if sensor_key == config.SENSOR_BATTERY and isinstance(raw_value, tuple):
+        percent, status = raw_value
+        if percent is None:
+            return (None, None), None
+        return (round(percent), status), float(percent)
+    numeric_val = float(raw_value)
+    precision = display_props.get("precision", 1)
+    return round(numeric_val, precision), numeric_val
+
+def _format_sensor_value_cached(sensor_key, raw_value, display_props):
+    """
+    Like _format_sensor_value, but reuse the previous entry when its text would not change.
+
+    The reused entry only gets its "value" refreshed (history still sees the exact reading);
+    no f-string formatting or dict allocation happens in that case.
+
+    Returns:
+        tuple: (entry dict, changed) where changed is False if the previous entry was reused
+    """
+    try:
+        display_key, numeric_val = _display_key(sensor_key, raw_value, display_props)
+    except (ValueError, TypeError, KeyError, AttributeError):
+        display_key = numeric_val = None  # Malformed reading: let the full formatter report it
+
+    cached = _last_formatted.get(sensor_key)
+    if display_key is not None and cached is not None and cached[0] == display_key:
+        entry = cached[1]
+        entry["value"] = numeric_val
+        return entry, False
+
+    entry = _format_sensor_value(sensor_key, raw_value, display_props)
+    if display_key is not None:
+        _last_formatted[sensor_key] = (display_key, entry)
+    else:
+        _last_formatted.pop(sensor_key, None)
+    return entry, True
+
+def _store_reading(sensor_key, raw_value, display_props, sensor_values, reading_history, app_config, timestamp=None, sensor_log=None, dirty_text=None, dirty_data=None):
+    """
+    Format a raw reading into sensor_values and append it (at timestamp) to the reading history and log.
+
+    The sensor is added to dirty_data (a new sample for the graphs) and, only when its entry
+    was replaced because the displayed text changed, to dirty_text.
+    """
+    formatted_data, changed = _format_sensor_value_cached(sensor_key, raw_value, display_props)
+    if changed or sensor_values.get(sensor_key) is not formatted_data:
+        sensor_values[sensor_key] = formatted_data
+        if dirty_text is not None:
+            dirty_text.add(sensor_key)
+    if dirty_data is not None:
+        dirty_data.add(sensor_key)
+
+    # Add to reading history
+    history_val_to_add = formatted_data['value']
+    if sensor_key == app_config.SENSOR_ACCELERATION and isinstance(raw_value, dict):
+        history_val_to_add = raw_value
+
+    reading_history.add_reading(sensor_key, history_val_to_add, timestamp)
+
+    if sensor_log is not None:
+        # Same scalar the history graphs (acceleration: X component)
+        log_value = raw_value.get('x') if isinstance(history_val_to_add, dict) else history_val_to_add
+        sensor_log.append(sensor_key, log_value, timestamp)
+
+def update_sensors_by_schedule(sensor_values, reading_history, app_config, current_time, last_update_times, network_manager=None, system_info_manager=None, sensor_worker=None, sensor_log=None, dirty_text=None, dirty_data=None):
     """
     Fetches data from sensors based on their individual update schedules.
     Only updates sensors whose update interval has elapsed.
@@ -82,11 +166,25 @@ def update_sensors_by_schedule(sensor_values, reading_history, app_config, curre
         app_config (module): Configuration module (passed as `config` from main).
         current_time (float): Current timestamp.
         last_update_times (dict): Dictionary tracking last update time for each sensor.
+        sensor_worker (SensorAcquisitionWorker, optional): When running, Sense HAT sensors are
+            taken from its latest snapshot instead of being read on this thread.
+        sensor_log (SensorLog, optional): Persistent log every new reading is appended to.
+        dirty_text (set, optional): Filled with the keys whose displayed entry (text or note)
+            changed in this call, so views re-render only that text. The caller clears it.
+        dirty_data (set, optional): Filled with the keys that got a new reading (a new sample
+            for the graphs), whether or not their text changed. The caller clears it.
     
     Returns:
         list: List of sensor keys that were updated.
     """
     updated_sensors = []
+
+    # One SystemSnapshot per pass, shared by the CPU/memory/disk values and their notes
+    system_snapshot = []
+    def get_system_snapshot():
+        if not system_snapshot:
+            system_snapshot.append(system_info_manager.get_snapshot() if system_info_manager else system_info.read_system_snapshot())
+        return system_snapshot[0]
     
     # Data fetching functions map (Sensor Key -> Function to call)
     # Use cached versions for system info, direct calls for Sense HAT sensors
@@ -94,20 +192,36 @@ def update_sensors_by_schedule(sensor_values, reading_history, app_config, curre
         app_config.SENSOR_TEMPERATURE: sensors.get_temperature,  # Sense HAT - real-time
         app_config.SENSOR_HUMIDITY: sensors.get_humidity,        # Sense HAT - real-time
         app_config.SENSOR_PRESSURE: sensors.get_pressure,        # Sense HAT - real-time
-        app_config.SENSOR_ORIENTATION: sensors.get_orientation,  # Sense HAT - real-time
-        app_config.SENSOR_ACCELERATION: sensors.get_acceleration, # Sense HAT - real-time
+        app_config.SENSOR_ORIENTATION: lambda: sensors.read_imu(blocking=False).orientation,    # Sense HAT - shared IMU sample
+        app_config.SENSOR_ACCELERATION: lambda: sensors.read_imu(blocking=False).acceleration,  # Sense HAT - shared IMU sample
         app_config.SENSOR_CLOCK: system_info.get_current_time,   # System - can be cached
-        app_config.SENSOR_CPU_USAGE: lambda: (system_info_manager.get_cpu_info_cached()[0] if system_info_manager else system_info.get_cpu_usage()[0]),
-        app_config.SENSOR_MEMORY_USAGE: lambda: (system_info_manager.get_memory_info_cached()[0] if system_info_manager else system_info.get_memory_usage()[0]),
-        app_config.SENSOR_DISK_USAGE: lambda: (system_info_manager.get_disk_info_cached()[0] if system_info_manager else system_info.get_disk_usage()[0]),
+        app_config.SENSOR_CPU_USAGE: lambda: get_system_snapshot().cpu_percent,       # System - shared snapshot
+        app_config.SENSOR_MEMORY_USAGE: lambda: get_system_snapshot().mem_percent,    # System - shared snapshot
+        app_config.SENSOR_DISK_USAGE: lambda: get_system_snapshot().disk_percent,     # System - shared snapshot
         app_config.SENSOR_VOLTAGE: lambda: (system_info_manager.get_voltage_info_cached() if system_info_manager else system_info.get_voltage_info()),
         app_config.SENSOR_BATTERY: lambda: (system_info_manager.get_battery_info_cached() if system_info_manager else system_info.get_battery_info()),
     }
 
+    # Sense HAT sensors polled by the acquisition worker: consume each new sample once
+    worker_snapshot = None
+    if sensor_worker is not None and sensor_worker.is_running():
+        worker_snapshot = sensor_worker.get_snapshot()
+
     # Check each sensor's update schedule
     for sensor_key in app_config.ALL_SENSOR_MODES:
         display_props = app_config.SENSOR_DISPLAY_PROPERTIES.get(sensor_key, {})
         update_interval = display_props.get("update_interval", app_config.DEFAULT_SENSOR_UPDATE_INTERVAL)
+
+        if worker_snapshot is not None and sensor_key in sensor_worker.sensor_keys:
+            sample = worker_snapshot.get(sensor_key)
+            # The worker already honours update_interval; only take samples we have not seen
+            if sample is None or sample[0] <= last_update_times[sensor_key]:
+                continue
+            sample_time, raw_value = sample
+            last_update_times[sensor_key] = sample_time
+            updated_sensors.append(sensor_key)
+            _store_reading(sensor_key, raw_value, display_props, sensor_values, reading_history, app_config, sample_time, sensor_log, dirty_text, dirty_data)
+            continue
         
         # Check if enough time has passed for this sensor
         if (current_time - last_update_times[sensor_key]) >= update_interval:
@@ -125,69 +239,76 @@ def update_sensors_by_schedule(sensor_values, reading_history, app_config, curre
             else:
                 logger.warning(f"No data fetch function defined for sensor mode: {sensor_key}")
 
-            # Format the value and update sensor_values dict
-            formatted_data = _format_sensor_value(sensor_key, raw_value, display_props)
-            sensor_values[sensor_key] = formatted_data
-            
-            # Add to reading history
-            history_val_to_add = formatted_data['value']
-            if sensor_key == app_config.SENSOR_ACCELERATION and isinstance(raw_value, dict):
-                history_val_to_add = raw_value
-            
-            reading_history.add_reading(sensor_key, history_val_to_add)
+            _store_reading(sensor_key, raw_value, display_props, sensor_values, reading_history, app_config, current_time, sensor_log, dirty_text, dirty_data)
 
     # Update network information (always update these as they're not part of the scheduled sensors)
-    _update_network_info(sensor_values, app_config, network_manager)
+    _update_network_info(sensor_values, app_config, network_manager, dirty_text)
     
-    # Update special notes for system sensors that were updated
-    _update_sensor_notes(sensor_values, app_config, updated_sensors)
+    # Update special notes for system sensors that were updated (from the same snapshot as their values)
+    if system_snapshot:
+        _update_sensor_notes(sensor_values, app_config, updated_sensors, system_snapshot[0], dirty_text)
     
     if updated_sensors:
         logger.debug(f"Updated sensors: {updated_sensors}")
     
     return updated_sensors
 
-def _update_network_info(sensor_values, app_config, network_manager=None):
+def _set_info_value(sensor_values, key, text, dirty_text=None):
+    """Store a text-only info entry, keeping the existing dict when the text is unchanged."""
+    entry = sensor_values.get(key)
+    if entry is not None and entry["text"] == text:
+        return
+    sensor_values[key] = {"text": text, "unit": "", "note": "", "value": None}
+    if dirty_text is not None:
+        dirty_text.add(key)
+
+def _set_note(sensor_values, key, note, dirty_text=None):
+    """Update an entry's note, marking it dirty only if the text actually changed."""
+    entry = sensor_values[key]
+    if entry["note"] != note:
+        entry["note"] = note
+        if dirty_text is not None:
+            dirty_text.add(key)
+
+def _update_network_info(sensor_values, app_config, network_manager=None, dirty_text=None):
     """Update network information (WiFi, Bluetooth) with optional caching."""
     # WiFi Info
     if network_manager:
         wifi_status_val, wifi_ssid_val = network_manager.get_wifi_info_cached()
     else:
         wifi_status_val, wifi_ssid_val = system_info.get_wifi_info()
-    sensor_values[app_config.INFO_WIFI_STATUS] = {"text": wifi_status_val, "unit": "", "note": "", "value": None}
-    sensor_values[app_config.INFO_WIFI_SSID] = {"text": wifi_ssid_val, "unit": "", "note": "", "value": None}
+    _set_info_value(sensor_values, app_config.INFO_WIFI_STATUS, wifi_status_val, dirty_text)
+    _set_info_value(sensor_values, app_config.INFO_WIFI_SSID, wifi_ssid_val, dirty_text)
 
     # Bluetooth Info
     if network_manager:
         bluetooth_status_val, bluetooth_device_val = network_manager.get_bluetooth_info_cached()
     else:
         bluetooth_status_val, bluetooth_device_val = system_info.get_bluetooth_info()
-    sensor_values[app_config.INFO_BLUETOOTH_STATUS] = {"text": bluetooth_status_val, "unit": "", "note": "", "value": None}
-    sensor_values[app_config.INFO_BLUETOOTH_DEVICE] = {"text": bluetooth_device_val, "unit": "", "note": "", "value": None}
+    _set_info_value(sensor_values, app_config.INFO_BLUETOOTH_STATUS, bluetooth_status_val, dirty_text)
+    _set_info_value(sensor_values, app_config.INFO_BLUETOOTH_DEVICE, bluetooth_device_val, dirty_text)
+
+def _update_sensor_notes(sensor_values, app_config, updated_sensors, snapshot, dirty_text=None):
+    """Update special notes for sensors that were just updated, from a SystemSnapshot."""
+    if snapshot is None:
+        return
 
-def _update_sensor_notes(sensor_values, app_config, updated_sensors):
-    """Update special notes for sensors that were just updated."""
-    # CPU temperature note
-    if app_config.SENSOR_CPU_USAGE in updated_sensors and app_config.SENSOR_CPU_USAGE in sensor_values:
-        _, cpu_info_details = system_info.get_cpu_usage()
-        if cpu_info_details:
-            info_type, info_value = cpu_info_details
-            if info_type == "temperature":
-                sensor_values[app_config.SENSOR_CPU_USAGE]["note"] = f"Temp: {info_value:.1f}°C"
-            elif info_type == "cores":
-                sensor_values[app_config.SENSOR_CPU_USAGE]["note"] = f"Cores: {info_value}"
+    # CPU temperature note (core count when there is no thermal zone); keeps "psutil N/A" without psutil
+    if app_config.SENSOR_CPU_USAGE in updated_sensors and app_config.SENSOR_CPU_USAGE in sensor_values and snapshot.cpu_percent is not None:
+        if snapshot.cpu_temp_c is not None:
+            _set_note(sensor_values, app_config.SENSOR_CPU_USAGE, f"Temp: {snapshot.cpu_temp_c:.1f}°C", dirty_text)
+        elif snapshot.cpu_cores is not None:
+            _set_note(sensor_values, app_config.SENSOR_CPU_USAGE, f"Cores: {snapshot.cpu_cores}", dirty_text)
 
     # Memory usage note
     if app_config.SENSOR_MEMORY_USAGE in updated_sensors and app_config.SENSOR_MEMORY_USAGE in sensor_values:
-        _, mem_used, mem_total = system_info.get_memory_usage()
-        if mem_used is not None and mem_total is not None:
-            sensor_values[app_config.SENSOR_MEMORY_USAGE]["note"] = f"{mem_used:.0f}MB/{mem_total:.0f}MB"
+        if snapshot.mem_used_mb is not None and snapshot.mem_total_mb is not None:
+            _set_note(sensor_values, app_config.SENSOR_MEMORY_USAGE, f"{snapshot.mem_used_mb:.0f}MB/{snapshot.mem_total_mb:.0f}MB", dirty_text)
     
     # Disk usage note
     if app_config.SENSOR_DISK_USAGE in updated_sensors and app_config.SENSOR_DISK_USAGE in sensor_values:
-        _, disk_used, disk_total = system_info.get_disk_usage()
-        if disk_used is not None and disk_total is not None:
-            sensor_values[app_config.SENSOR_DISK_USAGE]["note"] = f"{disk_used:.1f}GB/{disk_total:.1f}GB"
+        if snapshot.disk_used_gb is not None and snapshot.disk_total_gb is not None:
+            _set_note(sensor_values, app_config.SENSOR_DISK_USAGE, f"{snapshot.disk_used_gb:.1f}GB/{snapshot.disk_total_gb:.1f}GB", dirty_text)
 
     # Battery status note is now handled in _format_sensor_value
 
@@ -203,18 +324,23 @@ def update_all_data(sensor_values, reading_history, app_config):
     """
     logger.debug("Updating all sensor and system data...")
 
+    # All Sense HAT values in one batched read (single IMU sample for orientation + acceleration)
+    readings = sensors.read_all()
+    # CPU, temperature, memory and disk in one read, shared by values and notes
+    system_snapshot = system_info.read_system_snapshot()
+
     # Data fetching functions map (Sensor Key -> Function to call)
     # These are general system/sensor reading functions
     data_fetch_map = {
-        app_config.SENSOR_TEMPERATURE: sensors.get_temperature,
-        app_config.SENSOR_HUMIDITY: sensors.get_humidity,
-        app_config.SENSOR_PRESSURE: sensors.get_pressure,
-        app_config.SENSOR_ORIENTATION: sensors.get_orientation,
-        app_config.SENSOR_ACCELERATION: sensors.get_acceleration,
+        app_config.SENSOR_TEMPERATURE: lambda: readings.temperature,
+        app_config.SENSOR_HUMIDITY: lambda: readings.humidity,
+        app_config.SENSOR_PRESSURE: lambda: readings.pressure,
+        app_config.SENSOR_ORIENTATION: lambda: readings.imu.orientation,
+        app_config.SENSOR_ACCELERATION: lambda: readings.imu.acceleration,
         app_config.SENSOR_CLOCK: system_info.get_current_time,
-        app_config.SENSOR_CPU_USAGE: lambda: system_info.get_cpu_usage()[0], # Only need percent for now
-        app_config.SENSOR_MEMORY_USAGE: lambda: system_info.get_memory_usage()[0], # Only need percent
-        app_config.SENSOR_DISK_USAGE: lambda: system_info.get_disk_usage()[0], # Only need percent
+        app_config.SENSOR_CPU_USAGE: lambda: system_snapshot.cpu_percent,
+        app_config.SENSOR_MEMORY_USAGE: lambda: system_snapshot.mem_percent,
+        app_config.SENSOR_DISK_USAGE: lambda: system_snapshot.disk_percent,
         app_config.SENSOR_VOLTAGE: system_info.get_voltage_info,
         app_config.SENSOR_BATTERY: lambda: system_info.get_battery_info()[0], # Only need percent
     }
@@ -235,7 +361,7 @@ def update_all_data(sensor_values, reading_history, app_config):
             logger.warning(f"No data fetch function defined for sensor mode: {sensor_key}")
 
         # Format the value and update sensor_values dict
-        formatted_data = _format_sensor_value(sensor_key, raw_value, display_props)
+        formatted_data, _changed = _format_sensor_value_cached(sensor_key, raw_value, display_props)
         sensor_values[sensor_key] = formatted_data
         
         # Add to reading history (use the processed numeric_val)
@@ -265,30 +391,8 @@ def update_all_data(sensor_values, reading_history, app_config):
     sensor_values[app_config.INFO_BLUETOOTH_STATUS] = {"text": bluetooth_status_val, "unit": "", "note": "", "value": None}
     sensor_values[app_config.INFO_BLUETOOTH_DEVICE] = {"text": bluetooth_device_val, "unit": "", "note": "", "value": None}
 
-    # --- Special case for CPU to include temperature as note if available ---
-    if app_config.SENSOR_CPU_USAGE in sensor_values:
-        _ , cpu_info_details = system_info.get_cpu_usage() # Call again to get the tuple
-        if cpu_info_details:
-            info_type, info_value = cpu_info_details
-            current_note = sensor_values[app_config.SENSOR_CPU_USAGE]["note"]
-            new_note = current_note
-            if info_type == "temperature":
-                new_note = f"Temp: {info_value:.1f}°C"
-            elif info_type == "cores":
-                new_note = f"Cores: {info_value}"
-            if new_note:
-                 sensor_values[app_config.SENSOR_CPU_USAGE]["note"] = new_note.strip()
-
-    # --- Special case for Memory and Disk to include Used/Total as note ---
-    if app_config.SENSOR_MEMORY_USAGE in sensor_values:
-        _p, mem_used, mem_total = system_info.get_memory_usage()
-        if mem_used is not None and mem_total is not None:
-            sensor_values[app_config.SENSOR_MEMORY_USAGE]["note"] = f"{mem_used:.0f}MB/{mem_total:.0f}MB"
-    
-    if app_config.SENSOR_DISK_USAGE in sensor_values:
-        _p, disk_used, disk_total = system_info.get_disk_usage()
-        if disk_used is not None and disk_total is not None:
-             sensor_values[app_config.SENSOR_DISK_USAGE]["note"] = f"{disk_used:.1f}GB/{disk_total:.1f}GB"
+    # --- CPU temperature/cores and Memory/Disk Used/Total notes, from the same snapshot ---
+    _update_sensor_notes(sensor_values, app_config, sensor_values, system_snapshot)
 
     # Battery status note is now handled in _format_sensor_value
 
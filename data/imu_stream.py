@@ -0,0 +1,137 @@
+# --- data/imu_stream.py ---
+# High-rate IMU capture into a preallocated ring buffer (used by the 3D schematics viewer)
+
+import logging
+import threading
+import time
+
+import numpy as np
+
+from . import sensors
+
+logger = logging.getLogger(__name__)
+
+# Ring buffer columns
+COL_TIME = 0
+COL_PITCH = 1
+COL_ROLL = 2
+COL_YAW = 3
+NUM_COLUMNS = 4
+
+
+class ImuStream:
+    """
+    Samples orientation at a fixed rate on a worker thread into a preallocated ring buffer.
+
+    Readers keep a cursor (total samples seen) and call read_new() once per frame to get every
+    sample captured since, so filtering runs at the sample rate instead of the frame rate. The
+    thread stops itself when nobody has read for idle_timeout seconds; read_new() restarts it.
+    """
+
+    def __init__(self, rate_hz=100, capacity=256, idle_timeout=1.0):
+        """
+        Initialize the stream.
+
+        Args:
+            rate_hz (float): Sampling rate (100-200 Hz is what the Sense HAT IMU sustains)
+            capacity (int): Ring buffer size in samples
+            idle_timeout (float): Seconds without a read before the worker stops
+        """
+        self.rate_hz = rate_hz
+        self.capacity = capacity
+        self.idle_timeout = idle_timeout
+        self._buffer = np.zeros((capacity, NUM_COLUMNS), dtype=np.float64)
+        self._written = 0  # Total samples ever written; write slot is _written % capacity
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._last_read_time = 0.0
+
+    def start(self):
+        """Start the capture thread (no-op if already running)."""
+        if self.is_running():
+            return
+        self._stop_event.clear()
+        self._last_read_time = time.time()
+        self._thread = threading.Thread(target=self._run, name="ImuStream", daemon=True)
+        self._thread.start()
+        logger.info(f"IMU stream started at {self.rate_hz} Hz (buffer {self.capacity} samples)")
+
+    def stop(self, timeout=1.0):
+        """Signal the capture thread to stop and wait briefly for it."""
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._thread = None
+
+    def is_running(self):
+        """Return True while the capture thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def cursor(self):
+        """Cursor positioned after the newest sample (start here to skip history)."""
+        with self._lock:
+            return self._written
+
+    def read_new(self, cursor):
+        """
+        Return samples captured after cursor, oldest first, and the updated cursor.
+
+        Args:
+            cursor (int): Value returned by the previous call (or .cursor)
+
+        Returns:
+            tuple: (ndarray of shape (n, 4) with columns time/pitch/roll/yaw, new cursor).
+                   If the reader fell more than capacity behind, only the newest capacity
+                   samples are returned.
+        """
+        self._last_read_time = time.time()
+        if not self.is_running():
+            self.start()
+        with self._lock:
+            written = self._written
+            count = min(written - cursor, self.capacity)
+            if count <= 0:
+                return self._buffer[:0].copy(), written
+            start = (written - count) % self.capacity
+            end = start + count
+            if end <= self.capacity:
+                samples = self._buffer[start:end].copy()
+            else:
+                samples = np.concatenate((self._buffer[start:], self._buffer[:end - self.capacity]))
+        return samples, written
+
+    def _write(self, timestamp, orientation):
+        """Append one orientation sample (overwrites the oldest once full)."""
+        with self._lock:
+            row = self._buffer[self._written % self.capacity]
+            row[COL_TIME] = timestamp
+            row[COL_PITCH] = orientation.get('pitch', 0.0)
+            row[COL_ROLL] = orientation.get('roll', 0.0)
+            row[COL_YAW] = orientation.get('yaw', 0.0)
+            self._written += 1
+
+    def _run(self):
+        """Thread body: fixed-rate sampling on an absolute schedule (no drift from read time)."""
+        period = 1.0 / self.rate_hz
+        next_tick = time.time()
+        while not self._stop_event.is_set():
+            if time.time() - self._last_read_time > self.idle_timeout:
+                logger.info("IMU stream idle; stopping capture")
+                break
+            try:
+                # max_age=0: always a fresh read; other readers this tick share it via read_imu()
+                sample = sensors.read_imu(max_age=0)
+                if sample.orientation:
+                    self._write(sample.timestamp, sample.orientation)
+            except Exception as e:
+                logger.error(f"IMU stream read failed: {e}", exc_info=True)
+
+            next_tick += period
+            delay = next_tick - time.time()
+            if delay < 0:
+                # Fell behind (slow I2C read); resync instead of bursting to catch up
+                next_tick = time.time()
+                delay = 0
+            self._stop_event.wait(delay)
@@ -0,0 +1,279 @@
+# --- data/native_probes.py ---
+# Fork-free readers for WiFi, Bluetooth and core voltage (sysfs, netlink, BlueZ D-Bus, VC mailbox)
+#
+# Each reader returns the same contract as its system_info counterpart, or None when it cannot
+# answer (wrong platform, missing device node, permissions, ...). system_info then falls back to
+# the subprocess path (iwconfig/nmcli, bluetoothctl/hciconfig, vcgencmd).
+
+import array
+import logging
+import os
+import socket
+import struct
+
+logger = logging.getLogger(__name__)
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Optional: BlueZ over D-Bus (python3-dbus on Raspberry Pi OS)
+try:
+    import dbus
+    DBUS_AVAILABLE = True
+except ImportError:
+    dbus = None
+    DBUS_AVAILABLE = False
+
+SYS_CLASS_NET = "/sys/class/net"
+PROC_NET_WIRELESS = "/proc/net/wireless"
+SYS_CLASS_BLUETOOTH = "/sys/class/bluetooth"
+VCIO_DEVICE = "/dev/vcio"
+
+# -- Generic netlink / nl80211 constants (linux/netlink.h, linux/genetlink.h, linux/nl80211.h) --
+NETLINK_GENERIC = 16
+NLM_F_REQUEST = 0x1
+NLMSG_ERROR = 0x2
+NLMSG_HEADER = "IHHII"      # len, type, flags, seq, pid
+GENL_HEADER = "BBH"         # cmd, version, reserved
+NLA_HEADER = "HH"           # len, type
+NLA_TYPE_MASK = 0x3FFF
+GENL_ID_CTRL = 0x10
+CTRL_CMD_GETFAMILY = 3
+CTRL_ATTR_FAMILY_ID = 1
+CTRL_ATTR_FAMILY_NAME = 2
+NL80211_CMD_GET_INTERFACE = 5
+NL80211_ATTR_IFINDEX = 3
+NL80211_ATTR_SSID = 52
+NETLINK_TIMEOUT = 0.5
+
+# -- HCI (linux/bluetooth/hci_sock.h) --
+HCIGETDEVINFO = (2 << 30) | (4 << 16) | (ord("H") << 8) | 211   # _IOR('H', 211, int)
+HCI_DEV_INFO_SIZE = 128     # struct hci_dev_info is 92 bytes; oversized buffer is fine
+HCI_DEV_INFO_FLAGS_OFFSET = 16
+HCI_UP = 0x1
+
+# -- VideoCore mailbox (raspberrypi firmware property interface) --
+IOCTL_MBOX_PROPERTY = (3 << 30) | (struct.calcsize("P") << 16) | (100 << 8) | 0   # _IOWR(100, 0, char *)
+MBOX_REQUEST = 0x00000000
+MBOX_RESPONSE_OK = 0x80000000
+MBOX_TAG_GET_VOLTAGE = 0x00030003
+MBOX_VOLTAGE_ID_CORE = 1
+
+_nl80211_family_id = None
+
+
+def _read_sysfs(path):
+    """Read and strip a small sysfs/proc file; None if missing or unreadable."""
+    try:
+        with open(path, "r") as f:
+            return f.read().strip()
+    except (OSError, ValueError):
+        return None
+
+
+# --- WiFi ---
+
+def _wireless_interfaces():
+    """Names of wireless interfaces (sysfs 'wireless' dir, plus /proc/net/wireless)."""
+    names = []
+    try:
+        for iface in sorted(os.listdir(SYS_CLASS_NET)):
+            if os.path.isdir(os.path.join(SYS_CLASS_NET, iface, "wireless")):
+                names.append(iface)
+    except OSError:
+        pass
+    proc = _read_sysfs(PROC_NET_WIRELESS)
+    if proc:
+        # Two header lines, then "wlan0: 0000   70.  -40.  -256 ..."
+        for line in proc.split("\n")[2:]:
+            iface = line.split(":", 1)[0].strip()
+            if iface and iface not in names:
+                names.append(iface)
+    return names
+
+
+def _align4(length):
+    return (length + 3) & ~3
+
+
+def _nl_attr(attr_type, payload):
+    """Encode one netlink attribute (header + payload, padded to 4 bytes)."""
+    length = struct.calcsize(NLA_HEADER) + len(payload)
+    return struct.pack(NLA_HEADER, length, attr_type) + payload + b"\0" * (_align4(length) - length)
+
+
+def _parse_nl_attrs(data):
+    """Decode a flat run of netlink attributes into {type: payload}."""
+    attrs = {}
+    offset = 0
+    header_size = struct.calcsize(NLA_HEADER)
+    while offset + header_size <= len(data):
+        length, attr_type = struct.unpack_from(NLA_HEADER, data, offset)
+        if length < header_size:
+            break
+        attrs[attr_type & NLA_TYPE_MASK] = data[offset + header_size:offset + length]
+        offset += _align4(length)
+    return attrs
+
+
+def _genl_request(family_id, cmd, attrs):
+    """Send one generic netlink request and return the attributes of the first reply."""
+    genl = struct.pack(GENL_HEADER, cmd, 1, 0)
+    header_size = struct.calcsize(NLMSG_HEADER)
+    body = genl + attrs
+    message = struct.pack(NLMSG_HEADER, header_size + len(body), family_id, NLM_F_REQUEST, 1, 0) + body
+    with socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, NETLINK_GENERIC) as sock:
+        sock.settimeout(NETLINK_TIMEOUT)
+        sock.bind((0, 0))
+        sock.send(message)
+        reply = sock.recv(65536)
+    msg_len, msg_type, _flags, _seq, _pid = struct.unpack_from(NLMSG_HEADER, reply, 0)
+    if msg_type == NLMSG_ERROR:
+        error = struct.unpack_from("i", reply, header_size)[0]
+        raise OSError(-error, os.strerror(-error))
+    return _parse_nl_attrs(reply[header_size + struct.calcsize(GENL_HEADER):msg_len])
+
+
+def _get_nl80211_family_id():
+    """Resolve (and cache) the generic netlink family id for nl80211."""
+    global _nl80211_family_id
+    if _nl80211_family_id is None:
+        attrs = _genl_request(GENL_ID_CTRL, CTRL_CMD_GETFAMILY, _nl_attr(CTRL_ATTR_FAMILY_NAME, b"nl80211\0"))
+        family = attrs.get(CTRL_ATTR_FAMILY_ID)
+        if family is None:
+            raise OSError("nl80211 family not found")
+        _nl80211_family_id = struct.unpack("H", family[:2])[0]
+    return _nl80211_family_id
+
+
+def _get_ssid_nl80211(iface):
+    """SSID of the network an interface is associated with (nl80211 GET_INTERFACE), or None."""
+    ifindex = socket.if_nametoindex(iface)
+    attrs = _genl_request(
+        _get_nl80211_family_id(), NL80211_CMD_GET_INTERFACE,
+        _nl_attr(NL80211_ATTR_IFINDEX, struct.pack("I", ifindex))
+    )
+    ssid = attrs.get(NL80211_ATTR_SSID)
+    if not ssid:
+        return None
+    return ssid.decode("utf-8", errors="replace")
+
+
+def read_wifi_info():
+    """
+    WiFi status and SSID from sysfs operstate + nl80211.
+    Returns ("Connected", ssid), ("Offline", "N/A"), or None to fall back to iwconfig/nmcli.
+    """
+    if not hasattr(socket, "AF_NETLINK") or not os.path.isdir(SYS_CLASS_NET):
+        return None
+    interfaces = _wireless_interfaces()
+    if not interfaces:
+        return "Offline", "N/A"
+    try:
+        for iface in interfaces:
+            if _read_sysfs(os.path.join(SYS_CLASS_NET, iface, "operstate")) != "up":
+                continue
+            ssid = _get_ssid_nl80211(iface)
+            if ssid:
+                return "Connected", ssid
+            # Link is up but the kernel did not report an SSID; let the tools answer
+            return None
+    except (OSError, ValueError, struct.error) as e:
+        logger.debug(f"nl80211 WiFi read failed: {e}")
+        return None
+    return "Offline", "N/A"
+
+
+# --- Bluetooth ---
+
+def _read_bluetooth_dbus():
+    """Powered state and first connected device from the BlueZ object tree."""
+    bus = dbus.SystemBus()
+    manager = dbus.Interface(bus.get_object("org.bluez", "/"), "org.freedesktop.DBus.ObjectManager")
+    objects = manager.GetManagedObjects()
+
+    adapters = [ifaces["org.bluez.Adapter1"] for ifaces in objects.values() if "org.bluez.Adapter1" in ifaces]
+    if not adapters:
+        return "N/A", "Not Available"
+    if not any(bool(adapter.get("Powered", False)) for adapter in adapters):
+        return "Off", "Disabled"
+
+    for ifaces in objects.values():
+        device = ifaces.get("org.bluez.Device1")
+        if device and bool(device.get("Connected", False)):
+            name = device.get("Alias") or device.get("Name") or device.get("Address") or "Device"
+            return "Connected", str(name)
+    return "On", "No Devices"
+
+
+def _hci_is_up(dev_id):
+    """True/False for the HCI_UP flag of hci<dev_id> (HCIGETDEVINFO ioctl), None if unavailable."""
+    if fcntl is None or not hasattr(socket, "AF_BLUETOOTH") or not hasattr(socket, "BTPROTO_HCI"):
+        return None
+    buf = bytearray(HCI_DEV_INFO_SIZE)
+    struct.pack_into("H", buf, 0, dev_id)
+    with socket.socket(socket.AF_BLUETOOTH, socket.SOCK_RAW, socket.BTPROTO_HCI) as sock:
+        fcntl.ioctl(sock.fileno(), HCIGETDEVINFO, buf, True)
+    flags = struct.unpack_from("I", buf, HCI_DEV_INFO_FLAGS_OFFSET)[0]
+    return bool(flags & HCI_UP)
+
+
+def _read_bluetooth_sysfs():
+    """Adapter presence/power from sysfs + HCI; None when a device is connected (name needs BlueZ)."""
+    if not os.path.isdir(SYS_CLASS_BLUETOOTH):
+        return None
+    entries = os.listdir(SYS_CLASS_BLUETOOTH)
+    adapters = sorted(e for e in entries if e.startswith("hci") and ":" not in e)
+    if not adapters:
+        return "N/A", "Not Available"
+    powered = _hci_is_up(int(adapters[0][3:]))
+    if powered is None:
+        return None
+    if not powered:
+        return "Off", "Disabled"
+    # Live ACL links appear as hciX:<handle>
+    if any(":" in e for e in entries):
+        return None
+    return "On", "No Devices"
+
+
+def read_bluetooth_info():
+    """
+    Bluetooth status and connected device without bluetoothctl.
+    Returns (status, device) like system_info.get_bluetooth_info, or None to fall back.
+    """
+    if DBUS_AVAILABLE:
+        try:
+            return _read_bluetooth_dbus()
+        except Exception as e:
+            logger.debug(f"BlueZ D-Bus read failed: {e}")
+    try:
+        return _read_bluetooth_sysfs()
+    except (OSError, ValueError, struct.error) as e:
+        logger.debug(f"Bluetooth sysfs/HCI read failed: {e}")
+        return None
+
+
+# --- Voltage ---
+
+def read_core_voltage():
+    """Core voltage in volts via the VideoCore mailbox (/dev/vcio), or None to fall back to vcgencmd."""
+    if fcntl is None or not os.path.exists(VCIO_DEVICE):
+        return None
+    # size, request code, tag, value buffer size, tag request code, voltage id, value, end tag
+    buf = array.array("I", [0, MBOX_REQUEST, MBOX_TAG_GET_VOLTAGE, 8, 0, MBOX_VOLTAGE_ID_CORE, 0, 0])
+    buf[0] = len(buf) * buf.itemsize
+    try:
+        fd = os.open(VCIO_DEVICE, os.O_RDONLY)
+        try:
+            fcntl.ioctl(fd, IOCTL_MBOX_PROPERTY, buf, True)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        logger.debug(f"VC mailbox voltage read failed: {e}")
+        return None
+    if buf[1] != MBOX_RESPONSE_OK or not (buf[4] & MBOX_RESPONSE_OK):
+        return None
+    return buf[6] / 1000000.0
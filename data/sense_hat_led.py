@@ -52,6 +52,28 @@ def _normalize_sensor_value(sensor_key, value, config_module):
         return None
 
 
+def _shared_imu_value(sensor_key, value, app_state, config_module):
+    """For motion sensors, prefer the latest shared IMU sample so the matrix tracks the 3D view (not while frozen)."""
+    if getattr(app_state, "is_frozen", False):
+        return value  # The reading the display froze on; the IMU worker keeps sampling regardless
+    try:
+        if sensor_key == config_module.SENSOR_ORIENTATION:
+            field = "orientation"
+        elif sensor_key == config_module.SENSOR_ACCELERATION:
+            field = "acceleration"
+        else:
+            return value
+        from data.sensors import get_last_imu_sample
+        sample = get_last_imu_sample()
+        reading = getattr(sample, field, None) if sample else None
+        component = config_module.SENSOR_DISPLAY_PROPERTIES.get(sensor_key, {}).get("component_to_graph")
+        if reading and component in reading:
+            return reading[component]
+    except (AttributeError, ImportError):
+        pass
+    return value
+
+
 def _sensor_led_color(sensor_key, config_module, brightness=_MID):
     """Return (r, g, b) for LED from sensor's theme color, scaled to brightness."""
     try:
@@ -102,7 +124,7 @@ def _pattern_dashboard_or_sensor(pixels, app_state, sensor_values, config_module
     if not data or not isinstance(data, dict):
         _pattern_menu(pixels, time.time())
         return
-    value = data.get("value")
+    value = _shared_imu_value(sensor_key, data.get("value"), app_state, config_module)
     norm = _normalize_sensor_value(sensor_key, value, config_module)
     if norm is None:
         _pattern_menu(pixels, time.time())
@@ -148,7 +170,7 @@ def _pattern_sensors_menu(pixels, app_state, sensor_values, config_module):
     if sensor_key and sensor_key in config_module.SENSOR_MODES:
         data = sensor_values.get(sensor_key)
         if data and isinstance(data, dict):
-            value = data.get("value")
+            value = _shared_imu_value(sensor_key, data.get("value"), app_state, config_module)
             norm = _normalize_sensor_value(sensor_key, value, config_module)
             if norm is not None:
                 height = norm * 8
@@ -171,7 +193,7 @@ def _pattern_sensor_view(pixels, app_state, sensor_values, config_module):
     if not data or not isinstance(data, dict):
         _pattern_menu(pixels, time.time())
         return
-    value = data.get("value")
+    value = _shared_imu_value(sensor_key, data.get("value"), app_state, config_module)
     norm = _normalize_sensor_value(sensor_key, value, config_module)
     if norm is None:
         _pattern_menu(pixels, time.time())
@@ -0,0 +1,276 @@
+# --- data/sensor_log.py ---
+# Append-only binary sensor log (fixed-size records in rotating segment files, mmap'd for replay)
+#
+# Segment layout:
+#   header:  magic "TRSL", version (u16), header size (u16), sensor names ("\n"-joined UTF-8),
+#            zero-padded to a multiple of RECORD_SIZE
+#   records: timestamp (f64), sensor id (u32, index into the header names), value (f32)
+#
+# Records are only ever appended, so a crash can at worst leave a torn final record, which
+# readers drop. Each segment names its own sensors, so the id table can change between runs.
+
+import logging
+import math
+import os
+import queue
+import struct
+import threading
+import time
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"TRSL"
+VERSION = 1
+HEADER = struct.Struct("<4sHH")
+RECORD = struct.Struct("<dIf")
+RECORD_SIZE = RECORD.size  # 16 bytes
+RECORD_DTYPE = np.dtype([("timestamp", "<f8"), ("sensor_id", "<u4"), ("value", "<f4")])
+SEGMENT_SUFFIX = ".seg"
+
+
+def _segment_paths(log_dir):
+    """Segment files oldest → newest (names are zero-padded start times in ms)."""
+    try:
+        names = sorted(n for n in os.listdir(log_dir) if n.endswith(SEGMENT_SUFFIX))
+    except OSError:
+        return []
+    return [os.path.join(log_dir, n) for n in names]
+
+
+def read_segment(path):
+    """
+    Map one segment read-only.
+
+    Returns:
+        tuple: (sensor names list, records as a numpy structured memmap), or None if the
+               file is empty, truncated inside the header, or not a sensor log segment
+    """
+    try:
+        size = os.path.getsize(path)
+        if size < HEADER.size:
+            return None
+        with open(path, "rb") as f:
+            magic, version, header_size = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != VERSION or size < header_size:
+                return None
+            names_blob = f.read(header_size - HEADER.size).rstrip(b"\0")
+        names = names_blob.decode("utf-8").split("\n") if names_blob else []
+        count = (size - header_size) // RECORD_SIZE  # Drops a torn final record
+        if count == 0:
+            return names, np.empty(0, dtype=RECORD_DTYPE)
+        records = np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=header_size, shape=(count,))
+        return names, records
+    except (OSError, ValueError, struct.error) as e:
+        logger.warning(f"Skipping unreadable sensor log segment {path}: {e}")
+        return None
+
+
+class SensorLog:
+    """
+    Persists sensor readings as fixed 16-byte records in rotating segment files.
+
+    append() only queues the record; a daemon writer thread batches the queue into the
+    current segment and flushes + fsyncs every flush_interval seconds, so the render loop
+    never waits on the SD card. Segments rotate at segment_records and the oldest are
+    deleted beyond max_segments.
+    """
+
+    def __init__(self, config_module, sensor_keys=None):
+        """
+        Initialize the sensor log.
+
+        Args:
+            config_module: The configuration module (SENSOR_LOG_* settings)
+            sensor_keys (list, optional): Sensor modes that may be logged (defaults to ALL_SENSOR_MODES)
+        """
+        self.config = config_module
+        self.log_dir = getattr(config_module, "SENSOR_LOG_DIR", os.path.join("logs", "sensors"))
+        self.segment_records = getattr(config_module, "SENSOR_LOG_SEGMENT_RECORDS", 65536)
+        self.max_segments = getattr(config_module, "SENSOR_LOG_MAX_SEGMENTS", 64)
+        self.flush_interval = getattr(config_module, "SENSOR_LOG_FLUSH_INTERVAL", 5.0)
+        self.sensor_keys = list(sensor_keys if sensor_keys is not None else config_module.ALL_SENSOR_MODES)
+        self._sensor_ids = {key: index for index, key in enumerate(self.sensor_keys)}
+
+        self._queue = queue.Queue()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._file = None
+        self._segment_count = 0
+
+    # --- Writing ---
+
+    def start(self):
+        """Start the writer thread (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        os.makedirs(self.log_dir, exist_ok=True)
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="SensorLog", daemon=True)
+        self._thread.start()
+        logger.info(f"Sensor log writing to {self.log_dir}")
+
+    def stop(self, timeout=2.0):
+        """Write out anything queued, fsync and close the current segment."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                logger.warning("Sensor log writer did not stop within %.1fs", timeout)
+        self._thread = None
+
+    def append(self, sensor_key, value, timestamp=None):
+        """Queue one reading; non-numeric values and unknown sensors are ignored, as is everything while the writer is not running."""
+        if self._thread is None or not self._thread.is_alive():
+            return  # Stopped, or disabled after a write error: nothing would drain the queue
+        sensor_id = self._sensor_ids.get(sensor_key)
+        if sensor_id is None or value is None or isinstance(value, bool):
+            return
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return
+        if math.isnan(value):
+            return
+        self._queue.put(RECORD.pack(time.time() if timestamp is None else timestamp, sensor_id, value))
+
+    def _open_segment(self):
+        """Start a new segment file with its header and fsync it so it is always readable."""
+        names_blob = "\n".join(self.sensor_keys).encode("utf-8")
+        header_size = HEADER.size + len(names_blob)
+        header_size += -header_size % RECORD_SIZE
+        header = HEADER.pack(MAGIC, VERSION, header_size) + names_blob
+        header += b"\0" * (header_size - len(header))
+
+        start_ms = int(time.time() * 1000)
+        path = os.path.join(self.log_dir, f"{start_ms:013d}{SEGMENT_SUFFIX}")
+        while os.path.exists(path):  # Never append a second header to an existing segment
+            start_ms += 1
+            path = os.path.join(self.log_dir, f"{start_ms:013d}{SEGMENT_SUFFIX}")
+        self._file = open(path, "ab")
+        self._file.write(header)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._segment_count = 0
+        self._prune_segments()
+        logger.debug(f"Opened sensor log segment {path}")
+
+    def _close_segment(self):
+        if self._file is not None:
+            try:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+            finally:
+                self._file.close()
+                self._file = None
+
+    def _prune_segments(self):
+        """Delete the oldest segments beyond max_segments."""
+        paths = _segment_paths(self.log_dir)
+        for path in paths[:max(0, len(paths) - self.max_segments)]:
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.warning(f"Could not remove old sensor log segment {path}: {e}")
+
+    def _write_batch(self, records):
+        """Append records, rotating segments as they fill."""
+        while records:
+            if self._file is None or self._segment_count >= self.segment_records:
+                self._close_segment()
+                self._open_segment()
+            room = self.segment_records - self._segment_count
+            chunk, records = records[:room], records[room:]
+            self._file.write(b"".join(chunk))
+            self._segment_count += len(chunk)
+
+    def _drain(self):
+        records = []
+        while True:
+            try:
+                records.append(self._queue.get_nowait())
+            except queue.Empty:
+                return records
+
+    def _run(self):
+        """Thread body: batch queued records, write + fsync once per flush_interval."""
+        try:
+            while not self._stop_event.wait(self.flush_interval):
+                records = self._drain()
+                if records:
+                    self._write_batch(records)
+                    self._file.flush()
+                    os.fsync(self._file.fileno())
+            self._write_batch(self._drain())
+        except OSError as e:
+            logger.error(f"Sensor log write failed, logging disabled: {e}", exc_info=True)
+            self._drain()  # Drop what was queued; append() stops queueing once this thread has exited
+        finally:
+            try:
+                self._close_segment()
+            except OSError as e:
+                logger.warning(f"Error closing sensor log segment: {e}")
+
+    # --- Reading ---
+
+    def read_range(self, sensor_key, start_time=None, end_time=None):
+        """
+        Logged (timestamps, values) for one sensor between start_time and end_time.
+
+        Segments are memory-mapped and filtered with numpy, so only the matching records
+        are copied out. Results are in time order.
+        """
+        timestamps, values = [], []
+        for names, records in self._iter_segments(start_time):
+            if sensor_key not in names or records.size == 0:
+                continue
+            mask = records["sensor_id"] == names.index(sensor_key)
+            if start_time is not None:
+                mask &= records["timestamp"] >= start_time
+            if end_time is not None:
+                mask &= records["timestamp"] <= end_time
+            selected = records[mask]
+            timestamps.append(np.array(selected["timestamp"]))
+            values.append(selected["value"].astype(np.float64))
+        if not timestamps:
+            return np.empty(0), np.empty(0)
+        return np.concatenate(timestamps), np.concatenate(values)
+
+    def replay_into(self, reading_history, since_seconds=None):
+        """
+        Feed logged readings from the last since_seconds into a ReadingHistory (raw + tiers).
+
+        Returns:
+            int: Number of readings replayed
+        """
+        if since_seconds is None:
+            since_seconds = getattr(self.config, "SENSOR_LOG_REPLAY_SECONDS", 3600)
+        start_time = time.time() - since_seconds
+        replayed = 0
+        for names, records in self._iter_segments(start_time):
+            if records.size == 0:
+                continue
+            records = records[records["timestamp"] >= start_time]
+            for timestamp, sensor_id, value in records.tolist():
+                if sensor_id < len(names) and names[sensor_id] in reading_history.sensor_data:
+                    reading_history.add_reading(names[sensor_id], value, timestamp)
+                    replayed += 1
+        logger.info(f"Replayed {replayed} logged sensor readings into history")
+        return replayed
+
+    def _iter_segments(self, start_time=None):
+        """Yield (names, records) per segment, skipping segments that end before start_time."""
+        paths = _segment_paths(self.log_dir)
+        for index, path in enumerate(paths):
+            # Names are start times, so a segment ends before the next one starts
+            if start_time is not None and index + 1 < len(paths):
+                try:
+                    next_start = int(os.path.basename(paths[index + 1])[:-len(SEGMENT_SUFFIX)]) / 1000.0
+                except ValueError:
+                    next_start = None
+                if next_start is not None and next_start < start_time:
+                    continue
+            segment = read_segment(path)
+            if segment is not None:
+                yield segment
@@ -0,0 +1,123 @@
+# --- data/sensor_worker.py ---
+# Background Sense HAT acquisition so I2C reads never block the render loop
+
+import logging
+import threading
+import time
+from types import MappingProxyType
+
+from . import sensors
+
+logger = logging.getLogger(__name__)
+
+# Shortest sleep between polling passes (seconds); keeps the thread from spinning
+# if a sensor is configured with a zero or tiny update_interval
+MIN_POLL_SLEEP = 0.01
+
+
+class SensorAcquisitionWorker:
+    """
+    Polls the Sense HAT sensors on a dedicated thread.
+
+    Each sensor is read on its own update_interval from SENSOR_DISPLAY_PROPERTIES. After a
+    polling pass that read anything, a new read-only snapshot {sensor_key: (timestamp, raw_value)}
+    is published by swapping a single reference, so the main loop picks it up without locking.
+    Published raw values are never mutated by the worker.
+    """
+
+    def __init__(self, config_module, sensor_keys=None):
+        """
+        Initialize the acquisition worker.
+
+        Args:
+            config_module: The configuration module
+            sensor_keys (list, optional): Sensor modes to poll (defaults to config SENSOR_MODES,
+                which are the Sense HAT sensors)
+        """
+        self.config = config_module
+        self.sensor_keys = list(sensor_keys if sensor_keys is not None else config_module.SENSOR_MODES)
+
+        fetch_map = {
+            config_module.SENSOR_TEMPERATURE: sensors.get_temperature,
+            config_module.SENSOR_HUMIDITY: sensors.get_humidity,
+            config_module.SENSOR_PRESSURE: sensors.get_pressure,
+            # Orientation and acceleration due in the same pass share one IMU read
+            config_module.SENSOR_ORIENTATION: lambda: sensors.read_imu().orientation,
+            config_module.SENSOR_ACCELERATION: lambda: sensors.read_imu().acceleration,
+        }
+        self._fetch_map = {key: fetch_map[key] for key in self.sensor_keys if key in fetch_map}
+        for key in self.sensor_keys:
+            if key not in self._fetch_map:
+                logger.warning(f"No Sense HAT fetch function for sensor mode: {key}")
+        self.sensor_keys = list(self._fetch_map.keys())
+
+        self._intervals = {}
+        for key in self.sensor_keys:
+            display_props = config_module.SENSOR_DISPLAY_PROPERTIES.get(key, {})
+            self._intervals[key] = display_props.get("update_interval", config_module.DEFAULT_SENSOR_UPDATE_INTERVAL)
+        self._last_read_times = {key: 0.0 for key in self.sensor_keys}
+
+        self._snapshot = MappingProxyType({})
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start the acquisition thread (no-op if already running)."""
+        if self.is_running():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="SensorAcquisition", daemon=True)
+        self._thread.start()
+        logger.info(f"Sensor acquisition worker started for: {', '.join(self.sensor_keys)}")
+
+    def stop(self, timeout=1.0):
+        """Signal the thread to stop and wait briefly for it to exit."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                logger.warning("Sensor acquisition worker did not stop within %.1fs", timeout)
+            else:
+                logger.info("Sensor acquisition worker stopped.")
+        self._thread = None
+
+    def is_running(self):
+        """Return True while the acquisition thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def get_snapshot(self):
+        """Return the latest published snapshot: read-only {sensor_key: (timestamp, raw_value)}."""
+        return self._snapshot
+
+    def _run(self):
+        """Thread body: read whatever is due, publish, then sleep until the next sensor is due."""
+        while not self._stop_event.is_set():
+            now = time.time()
+            next_due = None
+            readings = None
+
+            for key in self.sensor_keys:
+                interval = self._intervals[key]
+                due_at = self._last_read_times[key] + interval
+                if now >= due_at:
+                    try:
+                        raw_value = self._fetch_map[key]()
+                    except Exception as e:
+                        logger.error(f"Error fetching data for {key}: {e}", exc_info=True)
+                        raw_value = None
+                    read_time = time.time()
+                    self._last_read_times[key] = read_time
+                    if readings is None:
+                        readings = dict(self._snapshot)
+                    readings[key] = (read_time, raw_value)
+                    due_at = read_time + interval
+                if next_due is None or due_at < next_due:
+                    next_due = due_at
+
+            if readings is not None:
+                # Single reference swap; readers never see a half-built snapshot
+                self._snapshot = MappingProxyType(readings)
+
+            if next_due is None:
+                break
+            self._stop_event.wait(max(MIN_POLL_SLEEP, next_due - time.time()))
@@ -2,9 +2,11 @@
 # Handles raw data acquisition from the Sense HAT sensors
 
 import logging
+import collections
 import datetime
 import platform
 import random
+import threading
 import time
 import math
 from config import sensors as sensor_config
@@ -28,6 +30,16 @@ sense = None
 # Windows development mode detection
 IS_WINDOWS_DEV = platform.system() == "Windows"
 
+# One IMU read: orientation (degrees), accelerometer (G) and gyroscope (rad/s) taken together
+ImuSample = collections.namedtuple("ImuSample", ["timestamp", "orientation", "acceleration", "gyroscope"])
+
+# Everything from the Sense HAT in one call: environmental readings plus a shared ImuSample
+SensorReadings = collections.namedtuple("SensorReadings", ["timestamp", "temperature", "humidity", "pressure", "imu"])
+
+# Shared IMU sample; the lock serialises RTIMU access between the acquisition worker and the main thread
+_imu_lock = threading.Lock()
+_last_imu_sample = None
+
 # Mock data class definition
 class MockSensorData:
     def __init__(self):
@@ -110,6 +122,14 @@ class MockSensorData:
             'z': 1.0 + random.uniform(-0.05, 0.05)
         }
 
+    def get_gyroscope(self):
+        # Simulate gyro noise around zero rotation rate
+        return {
+            'x': random.uniform(-0.01, 0.01),
+            'y': random.uniform(-0.01, 0.01),
+            'z': random.uniform(-0.01, 0.01)
+        }
+
 # Initialize mock data for Windows development
 mock_data = None
 if IS_WINDOWS_DEV:
@@ -209,41 +229,134 @@ def get_pressure():
         logger.error(f"Error reading pressure: {e}", exc_info=True)
         return None
 
-def get_orientation():
-    """Get the orientation reading from the Sense HAT."""
+def _xyz(raw):
+    """RTIMU (x, y, z) tuple -> dict like SenseHat's *_raw getters."""
+    return {'x': raw[0], 'y': raw[1], 'z': raw[2]}
+
+
+def _fusion_pose_degrees(fusion_pose):
+    """RTIMU fusionPose (radians, roll/pitch/yaw as x/y/z) -> 0-360 degrees like get_orientation_degrees()."""
+    orientation = {}
+    for key, val in zip(('roll', 'pitch', 'yaw'), fusion_pose):
+        deg = math.degrees(val)
+        orientation[key] = deg + 360 if deg < 0 else deg
+    return orientation
+
+
+def is_imu_available():
+    """True when read_imu() can return data (real Sense HAT, or mock data in Windows dev mode)."""
+    return sense is not None or bool(IS_WINDOWS_DEV and mock_data)
+
+
+def _read_imu_direct():
+    """
+    Read RTIMU once through SenseHat's private _read_imu()/_imu members.
+
+    Every public SenseHat getter re-reads the IMU, so this saves two I2C reads per sample. It
+    depends on sense-hat internals (checked against 2.6.0); returns None when they are missing
+    so the caller falls back to the public getters. Fields that are invalid this read are None.
+    """
+    read = getattr(sense, '_read_imu', None)
+    imu = getattr(sense, '_imu', None)
+    if read is None or imu is None:
+        return None
+    if not read():
+        return (None, None, None)
+    data = imu.getIMUData()
+    orientation = _fusion_pose_degrees(data['fusionPose']) if data.get('fusionPoseValid') else None
+    acceleration = _xyz(data['accel']) if data.get('accelValid') else None
+    gyroscope = _xyz(data['gyro']) if data.get('gyroValid') else None
+    return (orientation, acceleration, gyroscope)
+
+
+def _read_imu_sample(timestamp):
+    """Read the IMU once and unpack orientation, accelerometer and gyroscope. Call with _imu_lock held."""
     if not sense:
         # Return mock data on Windows for development
         if IS_WINDOWS_DEV and mock_data:
-            return mock_data.get_orientation()
-        logger.warning("Attempted to read orientation but Sense HAT is not available.")
-        return None
-        
+            return ImuSample(timestamp, mock_data.get_orientation(), mock_data.get_acceleration(), mock_data.get_gyroscope())
+        logger.warning("Attempted to read IMU but Sense HAT is not available. If Running on Windows this is expected")
+        return ImuSample(timestamp, None, None, None)
+
+    previous = _last_imu_sample
+    # Anything not read this time keeps its last good value, as SenseHat's own getters do
+    if previous is not None:
+        fallback = ImuSample(timestamp, previous.orientation, previous.acceleration, previous.gyroscope)
+    else:
+        fallback = ImuSample(timestamp, None, None, None)
     try:
-        orientation = sense.get_orientation_degrees()
-        
+        values = _read_imu_direct()
+        if values is None:
+            # Documented public API: three IMU reads, but no reliance on SenseHat internals
+            values = (sense.get_orientation_degrees(), sense.get_accelerometer_raw(), sense.get_gyroscope_raw())
+        orientation, acceleration, gyroscope = values
+
+        sample = ImuSample(timestamp,
+                           orientation if orientation is not None else fallback.orientation,
+                           acceleration if acceleration is not None else fallback.acceleration,
+                           gyroscope if gyroscope is not None else fallback.gyroscope)
+
         # Debug logging for real sensor data
-        if SENSOR_DEBUG_LOGGING and orientation:
+        if SENSOR_DEBUG_LOGGING and sample.orientation:
+            orientation = sample.orientation
             logger.info(f"REAL ORIENTATION: pitch={orientation.get('pitch', 'N/A'):.2f}°, roll={orientation.get('roll', 'N/A'):.2f}°, yaw={orientation.get('yaw', 'N/A'):.2f}°")
-        
-        return orientation
+
+        return sample
     except Exception as e:
-        logger.error(f"Error reading orientation: {e}", exc_info=True)
-        return None
+        logger.error(f"Error reading IMU: {e}", exc_info=True)
+        return fallback
 
-def get_acceleration():
-    """Get the acceleration reading from the Sense HAT."""
-    if not sense:
-        # Return mock data on Windows for development
-        if IS_WINDOWS_DEV and mock_data:
-            return mock_data.get_acceleration()
-        logger.warning("Attempted to read acceleration but Sense HAT is not available. If Running on Windows this is expected")
-        return None
-        
+
+def read_imu(max_age=None, blocking=True):
+    """
+    Take one IMU sample: orientation, accelerometer and gyroscope from a single read.
+
+    Callers within max_age seconds of the previous read (default IMU_SAMPLE_MAX_AGE, about one
+    frame) share that sample instead of touching I2C again, so the data updater, the 3D viewer
+    and the LED matrix all see the same tick. Always returns an ImuSample; fields are None when
+    the sensor is unavailable.
+
+    With blocking=False (render-thread callers) the shared sample is returned as-is whenever
+    another thread is mid-read, so the frame never waits on I2C or SenseHat's retry sleeps.
+    """
+    global _last_imu_sample
+    if max_age is None:
+        max_age = getattr(sensor_config, "IMU_SAMPLE_MAX_AGE", 0.0)
+    if not _imu_lock.acquire(blocking):
+        sample = _last_imu_sample
+        return sample if sample is not None else ImuSample(time.time(), None, None, None)
     try:
-        return sense.get_accelerometer_raw()
-    except Exception as e:
-        logger.error(f"Error reading acceleration: {e}", exc_info=True)
-        return None
+        now = time.time()
+        if _last_imu_sample is not None and (now - _last_imu_sample.timestamp) < max_age:
+            return _last_imu_sample
+        # Stamp on completion so a slow read still counts as fresh for the next caller this tick
+        _last_imu_sample = _read_imu_sample(now)._replace(timestamp=time.time())
+        return _last_imu_sample
+    finally:
+        _imu_lock.release()
+
+
+def get_last_imu_sample():
+    """Return the most recent shared ImuSample without reading the hardware (None before the first read)."""
+    return _last_imu_sample
+
+
+def read_all(max_age=None):
+    """Read every Sense HAT sensor in one call. Returns SensorReadings with a shared ImuSample."""
+    return SensorReadings(time.time(), get_temperature(), get_humidity(), get_pressure(), read_imu(max_age))
+
+
+def get_orientation():
+    """Get the orientation reading from the Sense HAT (from the shared IMU sample)."""
+    return read_imu().orientation
+
+def get_acceleration():
+    """Get the acceleration reading from the Sense HAT (from the shared IMU sample)."""
+    return read_imu().acceleration
+
+def get_gyroscope():
+    """Get the gyroscope reading from the Sense HAT (from the shared IMU sample)."""
+    return read_imu().gyroscope
 
 
 def get_ambient_light_clear():
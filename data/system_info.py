@@ -1,13 +1,17 @@
 # --- data/system_info.py ---
 # Handles system monitoring (CPU, memory, disk)
 
+import collections
 import logging
 import os
+import time
 import platform
 import datetime
 import subprocess
 import socket
 
+from . import native_probes
+
 # Get a logger for this module
 logger = logging.getLogger(__name__)
 
@@ -93,10 +97,75 @@ def get_disk_usage():
         logger.error(f"Error getting disk usage: {e}")
         return None, None, None
 
+THERMAL_ZONE_PATH = '/sys/class/thermal/thermal_zone0/temp'
+
+# One consistent reading of CPU, temperature, memory and disk; fields are None when unavailable
+SystemSnapshot = collections.namedtuple("SystemSnapshot", [
+    "timestamp", "cpu_percent", "cpu_temp_c", "cpu_cores",
+    "mem_percent", "mem_used_mb", "mem_total_mb",
+    "disk_percent", "disk_used_gb", "disk_total_gb",
+])
+
+def read_cpu_temperature():
+    """Get CPU/SoC temperature in °C (e.g. Pi thermal_zone0), or None if unavailable."""
+    try:
+        with open(THERMAL_ZONE_PATH, 'r') as f:
+            return float(f.read()) / 1000.0
+    except (OSError, ValueError):
+        return None
+
+def read_system_snapshot():
+    """
+    Read CPU%, temperature, core count, memory and disk once each into a SystemSnapshot.
+
+    Use this (or SystemInfoManager.get_snapshot()) instead of calling get_cpu_usage(),
+    get_memory_usage() and get_disk_usage() separately, so every consumer sees the same
+    numbers and psutil/sysfs are only hit once per refresh.
+    """
+    cpu_percent = mem_percent = mem_used_mb = mem_total_mb = None
+    disk_percent = disk_used_gb = disk_total_gb = None
+    cpu_cores = os.cpu_count()
+    cpu_temp_c = read_cpu_temperature()
+
+    if PSUTIL_AVAILABLE:
+        try:
+            cpu_percent = psutil.cpu_percent()  # Non-blocking call
+            cpu_cores = psutil.cpu_count() or cpu_cores
+        except Exception as e:
+            logger.error(f"Error getting CPU usage: {e}")
+        try:
+            memory = psutil.virtual_memory()
+            mem_percent = memory.percent
+            mem_used_mb = memory.used / (1024 * 1024)
+            mem_total_mb = memory.total / (1024 * 1024)
+        except Exception as e:
+            logger.error(f"Error getting memory usage: {e}")
+        try:
+            disk = psutil.disk_usage('/')
+            disk_percent = disk.percent
+            disk_used_gb = disk.used / (1024 * 1024 * 1024)
+            disk_total_gb = disk.total / (1024 * 1024 * 1024)
+        except Exception as e:
+            logger.error(f"Error getting disk usage: {e}")
+    else:
+        logger.debug("psutil not available for system snapshot")
+
+    return SystemSnapshot(
+        time.time(), cpu_percent, cpu_temp_c, cpu_cores,
+        mem_percent, mem_used_mb, mem_total_mb,
+        disk_percent, disk_used_gb, disk_total_gb,
+    )
+
 def get_voltage_info():
     """Get system voltage information for both Windows and Linux."""
     try:
         if platform.system() == "Linux":
+            # Native VideoCore mailbox read first (no fork); vcgencmd below is the fallback
+            voltage_val = native_probes.read_core_voltage()
+            if voltage_val is not None:
+                logger.debug(f"Core voltage (mailbox): {voltage_val:.2f}V")
+                return voltage_val
+
             # Try vcgencmd for Raspberry Pi
             try:
                 result = subprocess.run(['vcgencmd', 'measure_volts', 'core'], 
@@ -221,7 +290,11 @@ def get_bluetooth_info():
 
 
 def _get_bluetooth_info_linux():
-    """Linux: use bluetoothctl to get powered state and connected device. Fallback to hciconfig for on/off."""
+    """Linux: BlueZ D-Bus / sysfs first, then bluetoothctl for powered state and connected device. Fallback to hciconfig for on/off."""
+    native_info = native_probes.read_bluetooth_info()
+    if native_info is not None:
+        return native_info
+
     # 1) Check powered state and connected devices via bluetoothctl
     try:
         show_result = subprocess.run(
@@ -299,6 +372,15 @@ def _get_bluetooth_info_linux():
 
 def get_wifi_info():
     """Get WiFi status and SSID."""
+    if platform.system() == "Linux":
+        # sysfs operstate + nl80211 SSID (no fork); iwconfig/nmcli below are the fallback
+        try:
+            native_info = native_probes.read_wifi_info()
+            if native_info is not None:
+                return native_info
+        except Exception as e:
+            logger.debug(f"Native WiFi read failed: {e}")
+
     if not PSUTIL_AVAILABLE:
         logger.debug("psutil not available for WiFi monitoring")
         return "N/A", "N/A"
@@ -237,4 +237,21 @@ def process_input(events, config_module): # config_module is the actual config p
             sense = None
             logger.warning("Sense HAT joystick disabled due to error")
 
-    return results 
\ No newline at end of file
+    return results 
+
+# Event types that count as user input when checking for pending input
+_PENDING_INPUT_EVENT_TYPES = (pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+
+
+def has_pending_input():
+    """
+    Check, without consuming anything, whether keyboard or mouse input is waiting.
+
+    Used by the frame scheduler to cut a long low-rate frame wait short when the user acts.
+    The Sense HAT joystick has no public non-blocking probe, so its events are picked up by
+    process_input() on the next scheduled frame.
+
+    Returns:
+        bool: True if a pygame input event is queued
+    """
+    return bool(pygame.event.peek(_PENDING_INPUT_EVENT_TYPES))
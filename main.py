@@ -25,10 +25,13 @@ from data import sensors
 from data import system_info
 # Import the new data updater function
 from data.data_updater import update_all_data, update_sensors_by_schedule
+from data.sensor_worker import SensorAcquisitionWorker
+from data.sensor_log import SensorLog
 from data.sense_hat_led import update_led_display
 from ui.display_manager import init_display, update_display
-from input.input_handler import process_input, init_joystick
+from input.input_handler import process_input, init_joystick, has_pending_input
 from utils.error_handling import display_critical_error_on_screen
+from utils.frame_scheduler import FrameScheduler
 from ui.components.loading.main_loading_screen import draw_loading_screen, LoadingProgress, loading_worker
 
 # Get a logger for this module
@@ -72,6 +75,20 @@ def main():
     reading_history = ReadingHistory(config.ALL_SENSOR_MODES, config.GRAPH_HISTORY_SIZE)
     logger.info("Application state and reading history initialized.")
 
+    # Persistent binary sensor log: restore recent history while the loading screen runs,
+    # then keep recording (started once the replay finished, before the main loop)
+    sensor_log = None
+    replay_thread = None
+    if getattr(config, "SENSOR_LOG_ENABLED", False):
+        try:
+            sensor_log = SensorLog(config)
+            replay_thread = threading.Thread(target=sensor_log.replay_into, args=(reading_history,),
+                                             name="SensorLogReplay", daemon=True)
+            replay_thread.start()
+        except Exception as e_log:
+            logger.warning(f"Sensor log unavailable: {e_log}")
+            sensor_log = None
+
     admin_timer = None
     try:
         from utils.admin_timer import AdminTimer
@@ -150,6 +167,16 @@ def main():
         except Exception as e_splash:
             logger.warning(f"Could not load or display loading screen: {e_splash}", exc_info=True)
 
+        # History must be complete before the main loop adds readings to it
+        if replay_thread is not None:
+            replay_thread.join()
+        if sensor_log is not None:
+            try:
+                sensor_log.start()
+            except Exception as e_log:
+                logger.warning(f"Sensor log unavailable: {e_log}")
+                sensor_log = None
+
         try:
             sensors_active = sensors.init_sensors()
             if not sensors_active:
@@ -165,6 +192,16 @@ def main():
             logger.error(f"Error initializing sensors: {e_sensors}", exc_info=True)
             sensors_active = False # Assume sensors are not active if init fails
 
+        # Background Sense HAT polling so I2C reads don't block frames
+        sensor_worker = None
+        if getattr(config, "SENSOR_WORKER_ENABLED", False):
+            try:
+                sensor_worker = SensorAcquisitionWorker(config)
+                sensor_worker.start()
+            except Exception as e_worker:
+                logger.warning(f"Sensor acquisition worker unavailable, reading inline: {e_worker}")
+                sensor_worker = None
+
         sensor_values = {}
         running = True
         last_sensor_update_times = {}  # Track when we last updated each sensor
@@ -180,6 +217,8 @@ def main():
             graph_type = display_props.get("graph_type", "NONE")
             logger.info(f"  {sensor_key}: {interval}s ({graph_type})")
         
+        frame_scheduler = FrameScheduler(config)
+
         logger.info("Entering main event loop...")
 
         # Main Application Loop
@@ -196,6 +235,8 @@ def main():
                     continue
 
                 input_results = process_input(events, config)
+                if input_results:
+                    frame_scheduler.note_input()
                 app_state.handle_input(input_results)
 
                 # 2. Update App State
@@ -217,12 +258,15 @@ def main():
                     app_state.game_manager.update_snake(app_state.keys_held)
 
                 # 3. Read Sensor Data (per-sensor scheduled updates)
+                app_state.dirty_text.clear()
+                app_state.dirty_data.clear()
                 if app_state.current_state not in [STATE_PONG_ACTIVE, STATE_BREAKOUT_ACTIVE, STATE_SNAKE_ACTIVE]:
                     # Only update sensors if not frozen
                     if not app_state.is_frozen:
                         updated_sensors = update_sensors_by_schedule(
                             sensor_values, reading_history, config, 
-                            current_time, last_sensor_update_times, app_state.network_manager, app_state.system_info_manager
+                            current_time, last_sensor_update_times, app_state.network_manager, app_state.system_info_manager,
+                            sensor_worker, sensor_log, app_state.dirty_text, app_state.dirty_data
                         )
                         if updated_sensors:
                             app_state.last_reading_time = current_time
@@ -237,8 +281,8 @@ def main():
                 if admin_timer and app_state.admin_timer_enabled:
                     admin_timer.log_sample(app_state)
 
-                # 5. Control Frame Rate
-                clock.tick(config.FPS)
+                # 5. Control Frame Rate (per-state rate, boosted after input, throttled when idle)
+                frame_scheduler.wait(clock, app_state.current_state, bool(app_state.keys_held), has_pending_input)
 
             except Exception as e_runtime: # Catch runtime errors within the main loop
                 logger.critical(f"Runtime error in main loop: {e_runtime}", exc_info=True)
@@ -280,6 +324,21 @@ def main():
                 admin_timer.stop()
             except Exception as e_at:
                 logger.warning("Admin timer stop: %s", e_at)
+        if 'sensor_worker' in locals() and sensor_worker:
+            try:
+                sensor_worker.stop()
+            except Exception as e_worker_stop:
+                logger.warning("Sensor worker stop: %s", e_worker_stop)
+        if 'sensor_log' in locals() and sensor_log:
+            try:
+                sensor_log.stop()
+            except Exception as e_log_stop:
+                logger.warning("Sensor log stop: %s", e_log_stop)
+        if 'app_state' in locals() and app_state:
+            try:
+                app_state.schematics_manager.stop_imu_stream()
+            except Exception as e_stream_stop:
+                logger.warning("IMU stream stop: %s", e_stream_stop)
         try:
             # Only cleanup sensors if the module was loaded and init attempted
             if 'sensors' in sys.modules and 'sensors_active' in locals(): 
@@ -2,7 +2,6 @@
 # Application state management using component managers
 
 import logging
-import time
 import os # For device actions
 from .state_manager import StateManager
 from .input_manager import InputManager
@@ -21,6 +20,7 @@ from .update_manager import UpdateManager
 from .audio_manager import AudioManager
 from .network_manager import NetworkManager
 from .system_info_manager import SystemInfoManager
+from .probe_service import ProbeService
 from .media_player_manager import MediaPlayerManager
 from .st_wiki_manager import StWikiManager
 import config as app_config
@@ -132,14 +132,15 @@ class AppState:
         self.bluetooth_manager = BluetoothManager(config_module)
         self.update_manager = UpdateManager(config_module) # Instantiate UpdateManager
         self.audio_manager = AudioManager(config_module) # Instantiate AudioManager
-        self.network_manager = NetworkManager() # Instantiate NetworkManager
-        self.system_info_manager = SystemInfoManager() # Instantiate SystemInfoManager
+        self.probe_service = ProbeService() # Background subprocess probes shared by the status managers
+        self.network_manager = NetworkManager(probe_service=self.probe_service) # Instantiate NetworkManager
+        self.system_info_manager = SystemInfoManager(probe_service=self.probe_service) # Instantiate SystemInfoManager
         self.media_player_manager = MediaPlayerManager(config_module) # Instantiate MediaPlayerManager
         self.st_wiki_manager = StWikiManager(config_module)  # Star Trek wiki (STAPI cache)
 
         # Debug overlay - initialized with screen dimensions
         from ui.components.debug import DebugOverlay
-        self.debug_overlay = DebugOverlay(screen_width, screen_height)
+        self.debug_overlay = DebugOverlay(screen_width, screen_height, self.system_info_manager)
         # Admin timer: runtime toggle (main.py sets .admin_timer reference after creating it)
         self.admin_timer_enabled = getattr(config_module, "ADMIN_TIMER", False)
         # LED matrix on/off (simulates "lid open" when True; Sense HAT has no light sensor)
@@ -167,6 +168,11 @@ class AppState:
         self.last_cycle_time = 0
         self.cycle_index = 0
         self.last_reading_time = 0.0
+        # Sensor keys whose displayed text/note changed, and keys with a new reading (graph
+        # sample), this frame (both cleared every frame); the sensor views and the dashboard
+        # re-render value text only for dirty_text and graphs only for dirty_data
+        self.dirty_text = set()
+        self.dirty_data = set()
         
     @property
     def current_state(self):
@@ -583,56 +589,9 @@ class AppState:
         """Update application state and check for timed events."""
         state_changed = False
         
-        # Handle pending model loads (after loading screen is displayed)
-        if self.loading_manager.has_pending_model_load() and self.current_state == STATE_LOADING:
-            # Ensure loading screen is visible for at least a short time
-            if not hasattr(self, '_loading_start_time'):
-                self._loading_start_time = time.time()
-                return True  # Keep showing loading screen
-            
-            # Wait at least 0.5 seconds before starting model load
-            if time.time() - self._loading_start_time < 0.5:
-                return True  # Keep showing loading screen
-            
-            pending_load = self.loading_manager.get_pending_model_load()
-            schematics_model_key = pending_load['schematics_model_key']
-            loading_operation = pending_load['loading_operation']
-            
-            try:
-                # Perform the actual model loading with progress tracking
-                # Don't use context manager to avoid blocking - manually manage progress
-                loading_operation.current_step = 0
-                loading_operation.loading_screen.update_progress(0.0, loading_operation.operation_name)
-                
-                success = self.schematics_manager.set_schematics_model(schematics_model_key, loading_operation)
-                
-                # Manually complete the loading operation
-                loading_operation.loading_screen.update_progress(1.0, "Complete!")
-                
-                if success:
-                    logger.info(f"Model '{schematics_model_key}' loaded successfully")
-                else:
-                    logger.warning(f"Failed to load model '{schematics_model_key}'")
-                
-                # Clear the pending load and transition to target state
-                target_state = self.loading_manager.complete_loading_operation()
-                if target_state:
-                    # Clean up loading timing
-                    if hasattr(self, '_loading_start_time'):
-                        delattr(self, '_loading_start_time')
-                    self.state_manager.transition_to(target_state)
-                    state_changed = True
-                
-            except Exception as e:
-                logger.error(f"Error during model loading: {e}")
-                # On error, still complete the loading but log the issue
-                target_state = self.loading_manager.complete_loading_operation()
-                if target_state:
-                    if hasattr(self, '_loading_start_time'):
-                        delattr(self, '_loading_start_time')
-                    self.state_manager.transition_to(target_state)
-            
-            return True  # State will change when loading completes
+        # Model loads run on a worker thread while the loading screen is shown
+        if self.current_state == STATE_LOADING and self.loading_manager.has_model_load():
+            return self._update_model_load()
         
         # Check secret combo duration (keyboard: A+D held from main menu for configured duration)
         if (self.current_state == STATE_MENU and
@@ -789,6 +748,67 @@ class AppState:
         """Get current menu index for the current state."""
         return self.menu_manager.get_current_menu_index(self.current_state)
     
+    def _update_model_load(self):
+        """
+        Advance the model load of the current loading operation by one frame, without blocking.
+        
+        Starts the ModelLoadJob for a pending load, mirrors its progress onto the loading
+        screen while it runs and, once it is done, makes the model current and moves on to
+        the operation's target state.
+        
+        Returns:
+            bool: True (the loading screen needs redrawing or the state changed)
+        """
+        job = self.loading_manager.model_load_job
+        if job is None:
+            pending_load = self.loading_manager.get_pending_model_load()
+            loading_operation = pending_load['loading_operation']
+            loading_operation.current_step = 0
+            loading_operation.loading_screen.update_progress(0.0, loading_operation.operation_name)
+            job = self.schematics_manager.start_model_load(pending_load['schematics_model_key'])
+            if job is None:
+                target_state = self.loading_manager.complete_loading_operation()
+                if target_state:
+                    self.state_manager.transition_to(target_state)
+                return True
+            self.loading_manager.model_load_job = job
+        
+        loading_operation = self.loading_manager.loading_operation
+        if not job.done:
+            if loading_operation:
+                fraction, detail = job.progress()
+                loading_operation.loading_screen.update_progress(fraction, loading_operation.operation_name, detail)
+            return True
+        
+        self.loading_manager.model_load_job = None
+        try:
+            success = self.schematics_manager.finish_model_load(job)
+            if success:
+                logger.info(f"Model '{job.schematics_model_key}' loaded successfully")
+            else:
+                logger.warning(f"Failed to load model '{job.schematics_model_key}'")
+        except Exception as e:
+            logger.error(f"Error during model loading: {e}", exc_info=True)
+        if loading_operation:
+            loading_operation.loading_screen.update_progress(1.0, "Complete!")
+        
+        # On failure the target state shows the model's fallback view
+        target_state = self.loading_manager.complete_loading_operation()
+        if target_state:
+            self.state_manager.transition_to(target_state)
+        return True
+    
+    def cancel_model_load(self):
+        """
+        Cancel the model load behind the loading screen and go back to where it was started.
+        
+        Returns:
+            bool: True if a model load was cancelled
+        """
+        if self.current_state != STATE_LOADING or not self.loading_manager.cancel_model_load():
+            return False
+        return self.state_manager.return_to_previous() or self.state_manager.return_to_menu()
+    
     def start_loading_operation(self, target_state, operation_name="Loading", total_steps=3):
         """
         Start a loading operation with progress tracking.
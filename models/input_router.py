@@ -50,6 +50,7 @@ STATE_CONFIRM_FORGET_WIFI = "CONFIRM_FORGET_WIFI"
 STATE_CONFIRM_REBOOT = "CONFIRM_REBOOT"
 STATE_CONFIRM_SHUTDOWN = "CONFIRM_SHUTDOWN"
 STATE_CONFIRM_RESTART_APP = "CONFIRM_RESTART_APP"
+STATE_LOADING = "LOADING"
 
 class InputRouter:
     """Routes input actions to appropriate managers based on current state."""
@@ -152,6 +153,8 @@ class InputRouter:
         
     def _handle_back_action(self, current_state):
         """Handle back action based on current state."""
+        if current_state == STATE_LOADING and self.app_state.cancel_model_load():
+            return True
         if current_state == STATE_SECRET_GAMES:
             return self.app_state.state_manager.return_to_menu()
         elif current_state == STATE_SENSORS_MENU:
@@ -20,6 +20,7 @@ class LoadingManager:
         self.loading_target_state = None
         self.loading_operation = None
         self.pending_model_load = None
+        self.model_load_job = None  # ModelLoadJob running for the current loading operation
         
         logger.info("Loading manager initialized")
     
@@ -90,4 +91,26 @@ class LoadingManager:
     
     def has_pending_model_load(self):
         """Check if there's a pending model load."""
-        return self.pending_model_load is not None 
\ No newline at end of file
+        return self.pending_model_load is not None
+    
+    def has_model_load(self):
+        """Check if a model load is pending or running."""
+        return self.pending_model_load is not None or self.model_load_job is not None
+    
+    def cancel_model_load(self):
+        """
+        Abandon the pending or running model load and its loading operation.
+        
+        Returns:
+            bool: True if there was a model load to cancel
+        """
+        if not self.has_model_load():
+            return False
+        if self.model_load_job is not None:
+            self.model_load_job.cancel()
+            logger.info(f"Model load cancelled: {self.model_load_job.schematics_model_key}")
+        self.pending_model_load = None
+        self.model_load_job = None
+        self.loading_target_state = None
+        self.loading_operation = None
+        return True 
\ No newline at end of file
@@ -0,0 +1,99 @@
+# --- models/model_load_job.py ---
+# Loads a schematics OBJ model (parse/compile, LOD meshes, textures) off the main thread
+
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class ModelLoadJob:
+    """
+    One schematics model load running on a daemon thread.
+
+    The worker does everything that needs no OpenGL context: compiling (or memory-mapping)
+    the OBJ and its LOD meshes, and preparing the material textures. The main thread polls
+    done/progress() every frame, so the loading screen keeps animating and input keeps
+    being handled, and once the job is done hands the model to the renderer, where the GL
+    upload happens. cancel() stops the worker at the next stage boundary; a single OBJ
+    compile cannot be interrupted, so asking for the same model again resumes the running
+    job (SchematicsManager.start_model_load) instead of compiling the file a second time.
+    """
+
+    def __init__(self, schematics_model_key, file_path, cached_model=None):
+        """
+        Initialize the job (start() runs it).
+
+        Args:
+            schematics_model_key (str): Key of the model in SchematicsManager.schematics_models
+            file_path (str): OBJ file to load; None if it is known to fail
+            cached_model (OBJModel, optional): Already loaded model (only its textures are prepared)
+        """
+        self.schematics_model_key = schematics_model_key
+        self.file_path = file_path
+        self.model = cached_model
+        self._lock = threading.Lock()
+        self._progress = (0.0, "Preparing model...")
+        self._cancelled = threading.Event()
+        self._done = threading.Event()
+
+    def start(self):
+        """Start the worker thread; returns self."""
+        t = threading.Thread(target=self._run, name=f"ModelLoad-{self.schematics_model_key}", daemon=True)
+        t.start()
+        return self
+
+    @property
+    def done(self):
+        """True once the worker finished, failed or gave up after cancel()."""
+        return self._done.is_set()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        """Ask the worker to stop; its result is ignored from then on."""
+        self._cancelled.set()
+
+    def resume(self):
+        """Undo cancel() for a job that is still running (the same model was requested again)."""
+        self._cancelled.clear()
+
+    def wait(self, timeout=None):
+        """Block until the worker finished; returns done."""
+        return self._done.wait(timeout)
+
+    def progress(self):
+        """(fraction 0.0-1.0, detail text) of the worker's current stage."""
+        with self._lock:
+            return self._progress
+
+    def _set_progress(self, fraction, detail):
+        with self._lock:
+            self._progress = (fraction, detail)
+
+    def _run(self):
+        """Thread body: load the model unless cached, then prepare its textures."""
+        try:
+            if self.model is None and self.file_path:
+                self._set_progress(0.1, f"Loading {os.path.basename(self.file_path)}...")
+                from ui.components.rendering.obj_loader import OBJLoader
+                self.model = OBJLoader.load(self.file_path)
+            if self.model is None or self.cancelled:
+                return
+
+            materials = list(self.model.materials)
+            for index, material_name in enumerate(materials):
+                if self.cancelled:
+                    return
+                self._set_progress(0.6 + 0.35 * index / len(materials),
+                                   f"Preparing textures ({index + 1}/{len(materials)})...")
+                self.model.prepared_texture(material_name)
+            self._set_progress(1.0, "Model ready")
+        except Exception as e:
+            logger.error(f"Error loading model '{self.schematics_model_key}': {e}", exc_info=True)
+            self.model = None
+        finally:
+            self._done.set()
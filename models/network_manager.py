@@ -4,22 +4,24 @@
 import time
 import logging
 from data import system_info
+from .probe_service import ProbeService
 
 logger = logging.getLogger(__name__)
 
 class NetworkManager:
     """Simple network status manager with caching to reduce polling frequency."""
-    
-    def __init__(self, cache_interval=5.0):
+
+    def __init__(self, cache_interval=5.0, probe_service=None):
         """
         Initialize network manager.
-        
+
         Args:
             cache_interval (float): How often to refresh network status (seconds)
+            probe_service (ProbeService, optional): Shared background prober for the
+                subprocess-based WiFi/Bluetooth checks
         """
         self.cache_interval = cache_interval
-        self.last_wifi_check = 0
-        self.last_bluetooth_check = 0
+        self.probe_service = probe_service or ProbeService()
         self.last_ip_check = 0
         self.cached_wifi_status = "Unknown", "Unknown"
         self.cached_bluetooth_status = "Unknown", "Unknown"
@@ -35,35 +37,17 @@ class NetworkManager:
             except Exception as e:
                 logger.debug(f"Error updating IP cache: {e}")
         return self.cached_ip
-    
+
     def get_wifi_info_cached(self):
-        """Get WiFi status with caching."""
-        current_time = time.time()
-        
-        # Check if cache is stale
-        if (current_time - self.last_wifi_check) >= self.cache_interval:
-            try:
-                self.cached_wifi_status = system_info.get_wifi_info()
-                self.last_wifi_check = current_time
-                logger.debug(f"WiFi status updated: {self.cached_wifi_status}")
-            except Exception as e:
-                logger.error(f"Error updating WiFi status: {e}")
-                # Keep cached value on error
-        
+        """Get WiFi status with caching. Never blocks; the probe (iwconfig/nmcli) runs in the background."""
+        self.cached_wifi_status = self.probe_service.get_cached(
+            "wifi", system_info.get_wifi_info, self.cache_interval, self.cached_wifi_status
+        )
         return self.cached_wifi_status
-    
+
     def get_bluetooth_info_cached(self):
-        """Get Bluetooth status with caching."""
-        current_time = time.time()
-        
-        # Check if cache is stale
-        if (current_time - self.last_bluetooth_check) >= self.cache_interval:
-            try:
-                self.cached_bluetooth_status = system_info.get_bluetooth_info()
-                self.last_bluetooth_check = current_time
-                logger.debug(f"Bluetooth status updated: {self.cached_bluetooth_status}")
-            except Exception as e:
-                logger.error(f"Error updating Bluetooth status: {e}")
-                # Keep cached value on error
-        
+        """Get Bluetooth status with caching. Never blocks; the probe (bluetoothctl) runs in the background."""
+        self.cached_bluetooth_status = self.probe_service.get_cached(
+            "bluetooth", system_info.get_bluetooth_info, self.cache_interval, self.cached_bluetooth_status
+        )
         return self.cached_bluetooth_status
@@ -0,0 +1,80 @@
+# --- models/probe_service.py ---
+# Runs slow status probes (iwconfig, nmcli, bluetoothctl, vcgencmd) off the main thread
+
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class ProbeService:
+    """
+    Runs blocking status probes on background threads and serves last-known values immediately.
+
+    Each probe is identified by a name. A refresh starts the probe on a daemon thread unless one
+    with the same name is already in flight, so repeated requests coalesce into a single
+    subprocess call. Reads never block; a hung command only delays its own next value.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values = {}
+        self._started_at = {}
+        self._in_flight = set()
+
+    def get(self, name, default=None):
+        """Return the last completed value for a probe, or default if it has never completed."""
+        with self._lock:
+            return self._values.get(name, default)
+
+    def is_running(self, name):
+        """Return True while a probe with this name is in flight."""
+        with self._lock:
+            return name in self._in_flight
+
+    def refresh(self, name, probe_func):
+        """
+        Start probe_func in the background unless the same probe is already running.
+
+        Returns:
+            bool: True if a new probe thread was started, False if coalesced into a running one
+        """
+        with self._lock:
+            if name in self._in_flight:
+                return False
+            self._in_flight.add(name)
+            self._started_at[name] = time.time()
+
+        t = threading.Thread(target=self._run_probe, args=(name, probe_func), name=f"Probe-{name}", daemon=True)
+        t.start()
+        return True
+
+    def get_cached(self, name, probe_func, max_age, default=None):
+        """
+        Return the last-known value and start a background refresh if it is older than max_age.
+
+        Args:
+            name (str): Probe name (cache key)
+            probe_func (callable): Blocking function that returns the new value
+            max_age (float): Seconds between refreshes
+            default: Returned until the first probe completes
+        """
+        with self._lock:
+            started_at = self._started_at.get(name, 0)
+        if (time.time() - started_at) >= max_age:
+            self.refresh(name, probe_func)
+        return self.get(name, default)
+
+    def _run_probe(self, name, probe_func):
+        """Thread body: run the probe and store its result; keep the previous value on error."""
+        try:
+            value = probe_func()
+            with self._lock:
+                self._values[name] = value
+            logger.debug(f"Probe '{name}' updated: {value}")
+        except Exception as e:
+            logger.error(f"Error running probe '{name}': {e}")
+        finally:
+            with self._lock:
+                self._in_flight.discard(name)
@@ -3,92 +3,274 @@
 
 import collections
 import logging
+import math
+import time
+import numpy as np
 import config as app_config # Import config for sensor mode constants
 
 logger = logging.getLogger(__name__)
 
+# Pre-aggregated slice of one tier: read-only views (oldest → newest, NaN = empty bucket)
+AggregateWindow = collections.namedtuple("AggregateWindow", ["bucket_seconds", "mean", "min", "max"])
+
+
+class _AggregateTier:
+    """
+    Rolling fixed-width time buckets (min/max/mean) for one sensor.
+
+    Uses the same doubled ring buffer as the raw history so any trailing window is a
+    contiguous view. Only the open (newest) bucket accumulates; closed buckets never change.
+    """
+
+    def __init__(self, bucket_seconds, capacity):
+        self.bucket_seconds = bucket_seconds
+        self.capacity = capacity
+        self.mean = np.full(2 * capacity, np.nan, dtype=np.float64)
+        self.min = np.full(2 * capacity, np.nan, dtype=np.float64)
+        self.max = np.full(2 * capacity, np.nan, dtype=np.float64)
+        self._cursor = 0      # Slot of the open bucket
+        self._bucket = None   # Bucket number (timestamp // bucket_seconds) of the open bucket
+        self._sum = 0.0
+        self._count = 0
+
+    def _write(self, mean, low, high):
+        for index in (self._cursor, self._cursor + self.capacity):
+            self.mean[index] = mean
+            self.min[index] = low
+            self.max[index] = high
+
+    def advance(self, timestamp):
+        """Close the open bucket if timestamp falls in a later one, leaving NaN for empty buckets."""
+        bucket = int(timestamp // self.bucket_seconds)
+        if self._bucket is None:
+            self._bucket = bucket
+            return
+        if bucket <= self._bucket:
+            return  # Same bucket, or the clock stepped back: keep folding into the open bucket
+        for _ in range(min(bucket - self._bucket, self.capacity)):
+            self._cursor = (self._cursor + 1) % self.capacity
+            self._write(np.nan, np.nan, np.nan)
+        self._bucket = bucket
+        self._sum = 0.0
+        self._count = 0
+
+    def add(self, timestamp, value):
+        """Fold one sample into its bucket (None/NaN only moves time forward)."""
+        self.advance(timestamp)
+        if value is None or math.isnan(value):
+            return
+        self._sum += value
+        self._count += 1
+        if self._count == 1:
+            self._write(value, value, value)
+        else:
+            self._write(self._sum / self._count, min(self.min[self._cursor], value), max(self.max[self._cursor], value))
+
+    def window(self, num_buckets):
+        """Trailing num_buckets buckets (including the open one) as read-only views."""
+        end = self._cursor + self.capacity + 1
+        start = end - num_buckets
+        views = []
+        for array in (self.mean, self.min, self.max):
+            view = array[start:end]
+            view.flags.writeable = False
+            views.append(view)
+        return AggregateWindow(self.bucket_seconds, *views)
+
 class ReadingHistory:
-    """Maintains history of sensor readings for graphing."""
-    
-    def __init__(self, sensor_modes, history_size=60):
+    """
+    Maintains history of sensor readings for graphing.
+
+    Each sensor mode is a preallocated float64 ring buffer with NaN marking missing samples.
+    Every value is written twice (at slot i and i + history_size), so the ordered history
+    oldest → newest is always the contiguous slice [cursor, cursor + history_size) and can be
+    handed out as a read-only view without copying. Min/max are cached until the next write.
+
+    Alongside the raw samples, each reading is folded into downsampled tiers (HISTORY_TIERS,
+    e.g. 10 s / 1 min / 10 min buckets) so long windows can be graphed from a bounded
+    number of pre-aggregated points; see get_window().
+    """
+
+    def __init__(self, sensor_modes, history_size=60, tiers=None):
         """
         Initialize the reading history.
-        
+
         Args:
             sensor_modes (list): List of sensor mode constants (e.g., app_config.SENSOR_TEMPERATURE)
             history_size (int): Number of readings to keep in history
+            tiers (tuple, optional): (bucket_seconds, bucket_count) pairs; defaults to config HISTORY_TIERS
         """
         self.history_size = history_size
         self.sensor_data = {}
-        
-        # Initialize history buffers for each sensor mode
+        self._cursors = {}
+        self._ranges = {}
+        tier_specs = sorted(tiers if tiers is not None else getattr(app_config, "HISTORY_TIERS", ()))
+        self._tiers = {
+            mode_key: [_AggregateTier(bucket_seconds, capacity) for bucket_seconds, capacity in tier_specs]
+            for mode_key in sensor_modes
+        }
+
+        # Initialize history buffers for each sensor mode (NaN = no data yet)
         for mode_key in sensor_modes: # mode_key is a constant like app_config.SENSOR_TEMPERATURE
-            self.sensor_data[mode_key] = collections.deque(maxlen=history_size)
-            # Pre-fill with None to indicate no data yet
-            for _ in range(history_size):
-                self.sensor_data[mode_key].append(None)
-                
+            self.sensor_data[mode_key] = np.full(2 * history_size, np.nan, dtype=np.float64)
+            self._cursors[mode_key] = 0
+            self._ranges[mode_key] = None
+
         logger.debug(f"Initialized reading history for {len(sensor_modes)} sensor modes")
-    
-    def add_reading(self, mode_key, value):
+
+    def _append(self, mode_key, value, timestamp):
+        """Write one sample (None → NaN) at the cursor, advance it, and fold it into the tiers."""
+        buffer = self.sensor_data[mode_key]
+        cursor = self._cursors[mode_key]
+        stored = np.nan if value is None else value
+        buffer[cursor] = stored
+        buffer[cursor + self.history_size] = stored
+        self._cursors[mode_key] = (cursor + 1) % self.history_size
+        self._ranges[mode_key] = None  # Invalidate cached min/max
+        for tier in self._tiers[mode_key]:
+            tier.add(timestamp, value)
+
+    def add_reading(self, mode_key, value, timestamp=None):
         """
         Add a reading to the history for a specific sensor mode.
-        
+
         Args:
             mode_key (str): The sensor mode constant (e.g., app_config.SENSOR_TEMPERATURE)
             value: The value to add. For ACCELERATION, this might be the dict from sensors.py.
                    For others, it's expected to be a numeric value or None.
+            timestamp (float, optional): When the reading was taken (defaults to now); picks
+                   the aggregate buckets it lands in
         """
         if mode_key not in self.sensor_data:
             logger.warning(f"Attempted to add reading for unknown mode: {mode_key}")
             return
-            
+        if timestamp is None:
+            timestamp = time.time()
+
         # For ACCELERATION, we expect the raw dict from sensors.py, and store just the X component for graphing for now.
         # This specific handling for 'x' might need to be more flexible if other components are graphed.
         if mode_key == app_config.SENSOR_ACCELERATION and isinstance(value, dict):
             try:
                 # Store just the X value from the raw acceleration dict for line graph history
                 # VerticalBarGraph in sensor_view.py will pick its component ('y') from SENSOR_DISPLAY_PROPERTIES.
-                # This part is a bit inconsistent: line graph history gets X, VBar gets Y. 
+                # This part is a bit inconsistent: line graph history gets X, VBar gets Y.
                 # TODO: Consolidate which component of ACCELERATION is used for generic history if line graph is still used.
                 # For now, matching old behavior for line graph history.
-                self.sensor_data[mode_key].append(value.get('x')) 
-                logger.debug(f"Added acceleration X reading to history: {value.get('x')}")
+                x_value = value.get('x')
+                self._append(mode_key, None if x_value is None else float(x_value), timestamp)
+                logger.debug(f"Added acceleration X reading to history: {x_value}")
                 return
-            except (KeyError, TypeError) as e:
+            except (KeyError, TypeError, ValueError) as e:
                 logger.error(f"Error processing acceleration data for history: {e}")
-                self.sensor_data[mode_key].append(None)
+                self._append(mode_key, None, timestamp)
                 return
-                
+
         # Try to convert to float for other numerical modes
         if value is not None:
             try:
                 # Skip for CLOCK mode which shouldn't be graphed numerically
                 if mode_key == app_config.SENSOR_CLOCK:
-                    self.sensor_data[mode_key].append(None) # CLOCK has no numeric history
+                    self._append(mode_key, None, timestamp) # CLOCK has no numeric history
                     return
-                    
+
                 numeric_value = float(value)
-                self.sensor_data[mode_key].append(numeric_value)
+                self._append(mode_key, numeric_value, timestamp)
                 # logger.debug(f"Added {mode_key} reading to history: {numeric_value}") # Can be spammy
             except (ValueError, TypeError):
                 logger.debug(f"Non-numeric {mode_key} reading for history, storing None: {value}")
-                self.sensor_data[mode_key].append(None)
+                self._append(mode_key, None, timestamp)
         else:
-            self.sensor_data[mode_key].append(None)
-            
-    def get_history(self, mode_key):
+            self._append(mode_key, None, timestamp)
+
+    def get_view(self, mode_key):
         """
-        Get the history for a specific sensor mode.
-        
+        Get the ordered history (oldest → newest) as a read-only array view.
+
+        No copy is made; the view reflects later writes, so callers that need a stable
+        snapshot should copy it. Missing samples are NaN.
+
         Args:
             mode_key (str): The sensor mode constant (e.g., app_config.SENSOR_TEMPERATURE)
-            
+
         Returns:
-            list: List of readings for the specified mode
+            numpy.ndarray or None: View of history_size readings, None for unknown modes
         """
         if mode_key not in self.sensor_data:
             logger.warning(f"Requested history for unknown mode: {mode_key}")
+            return None
+
+        cursor = self._cursors[mode_key]
+        view = self.sensor_data[mode_key][cursor:cursor + self.history_size]
+        view.flags.writeable = False
+        return view
+
+    def get_range(self, mode_key):
+        """
+        Get the (min, max) of the valid readings in the history, cached until the next write.
+
+        Returns:
+            tuple or None: (min, max) as floats, or None if there is no valid data
+        """
+        if mode_key not in self.sensor_data:
+            return None
+
+        cached = self._ranges[mode_key]
+        if cached is None:
+            view = self.get_view(mode_key)
+            valid = view[~np.isnan(view)]
+            cached = (float(valid.min()), float(valid.max())) if valid.size else ()
+            self._ranges[mode_key] = cached
+        return cached or None
+
+    def get_history(self, mode_key):
+        """
+        Get the history for a specific sensor mode.
+
+        Args:
+            mode_key (str): The sensor mode constant (e.g., app_config.SENSOR_TEMPERATURE)
+
+        Returns:
+            list: List of readings for the specified mode (None for missing samples).
+                  Builds a new list; prefer get_view() for per-frame use.
+        """
+        view = self.get_view(mode_key)
+        if view is None:
             return []
-            
-        return list(self.sensor_data[mode_key]) 
\ No newline at end of file
+
+        return [None if math.isnan(v) else v for v in view.tolist()]
+
+    def get_window(self, mode_key, window_seconds, max_points=None, now=None):
+        """
+        Get pre-aggregated points covering the last window_seconds.
+
+        Picks the finest tier that spans the window in at most max_points buckets (the
+        coarsest tier, clipped to its capacity, if none does). Cost and memory depend on
+        the number of points, not on how many samples fell in the window.
+
+        Args:
+            mode_key (str): The sensor mode constant
+            window_seconds (float): Time span to cover, ending now
+            max_points (int, optional): Upper bound on returned buckets (e.g. graph width in pixels)
+            now (float, optional): End of the window (defaults to time.time())
+
+        Returns:
+            AggregateWindow or None: bucket_seconds plus mean/min/max views oldest → newest,
+                                     None for unknown modes or when no tiers are configured
+        """
+        tiers = self._tiers.get(mode_key)
+        if not tiers:
+            return None
+
+        chosen = tiers[-1]
+        for tier in tiers:
+            needed = math.ceil(window_seconds / tier.bucket_seconds)
+            if needed <= tier.capacity and (max_points is None or needed <= max_points):
+                chosen = tier
+                break
+
+        num_buckets = max(1, min(math.ceil(window_seconds / chosen.bucket_seconds), chosen.capacity))
+        if max_points is not None:
+            num_buckets = max(1, min(num_buckets, max_points))
+        # Roll the tier forward so a quiet sensor shows trailing gaps instead of stale buckets
+        chosen.advance(time.time() if now is None else now)
+        return chosen.window(num_buckets)
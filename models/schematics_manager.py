@@ -6,6 +6,8 @@ import math
 import logging
 import os
 from data import sensors
+from data.imu_stream import ImuStream
+from .model_load_job import ModelLoadJob
 from config import schematics
 
 # OpenGL imports (optional - will be checked for availability)
@@ -124,6 +126,7 @@ class SchematicsManager:
         # Loaded OBJ models cache
         self.loaded_obj_models = {}  # Cache for loaded OBJ models
         self._failed_obj_paths = set()  # Paths that failed to load (avoid retry every frame)
+        self._model_load_jobs = {}  # file_path -> latest ModelLoadJob (kept after cancel until harvested)
         
         # Sensor smoothing for noise reduction (parameters now come from config)
         self.smoothing_enabled = True
@@ -138,6 +141,11 @@ class SchematicsManager:
         self.prev_raw_roll = None  
         self.prev_raw_yaw = None
         
+        # High-rate IMU stream (created on first auto-rotation update)
+        self.imu_stream = None
+        self._stream_cursor = 0
+        self._stream_last_time = None
+        
         logger.info("Schematics manager initialized with config-based sensor smoothing")
     
     # UIScaler removed - UI concerns handled by display_manager.py
@@ -242,6 +250,67 @@ class SchematicsManager:
             logger.warning(f"Unknown schematics model: {schematics_model_key}")
             return False
     
+    def start_model_load(self, schematics_model_key):
+        """
+        Start loading an OBJ model in the background (see ModelLoadJob).
+
+        Returns:
+            ModelLoadJob or None: The running job, None if the key is not an OBJ model
+        """
+        schematics_model = self.schematics_models.get(schematics_model_key)
+        if not schematics_model or schematics_model.get('type') != 'opengl_model':
+            logger.warning(f"Not an OBJ schematics model: {schematics_model_key}")
+            return None
+        file_path = schematics_model.get('file_path')
+        if not file_path or file_path in self._failed_obj_paths:
+            # Known to fail: the job finishes at once without a model
+            return ModelLoadJob(schematics_model_key, None).start()
+
+        job = self._model_load_jobs.get(file_path)
+        if job is not None and not job.done:
+            # A cancelled load of the same file is still compiling: pick it up again
+            job.schematics_model_key = schematics_model_key
+            job.resume()
+            logger.info(f"Resuming background load of schematics model '{schematics_model_key}'")
+            return job
+        if job is not None and job.model is not None:
+            # Finished after being cancelled; keep what it loaded
+            self.loaded_obj_models[file_path] = job.model
+
+        logger.info(f"Loading schematics model '{schematics_model_key}' in the background")
+        job = ModelLoadJob(schematics_model_key, file_path, self.loaded_obj_models.get(file_path)).start()
+        self._model_load_jobs[file_path] = job
+        return job
+
+    def finish_model_load(self, job):
+        """
+        Make a finished ModelLoadJob's model current (main thread; hands it to the renderer).
+
+        Returns:
+            bool: True if the model loaded
+        """
+        schematics_model = self.schematics_models[job.schematics_model_key]
+        file_path = schematics_model.get('file_path')
+        if self._model_load_jobs.get(file_path) is job:
+            del self._model_load_jobs[file_path]
+        obj_model = job.model
+        if obj_model:
+            self.loaded_obj_models[file_path] = obj_model
+        elif file_path:
+            self._failed_obj_paths.add(file_path)
+
+        self.set_schematics_model(job.schematics_model_key)
+        if OPENGL_AVAILABLE and obj_model:
+            if not self.model_renderer:
+                from ui.components.rendering.opengl_model_renderer import OpenGLModelRenderer
+                self.model_renderer = OpenGLModelRenderer(
+                    self.screen_width, self.screen_height, self.config, self.ui_scaler
+                )
+                logger.info("OpenGL model renderer created")
+            # GL resources (vertex buffers, textures) are uploaded on the first render
+            self.model_renderer.load_model(obj_model)
+        return obj_model is not None
+    
     def _load_obj_model_with_progress(self, schematics_model, loading_operation):
         """Load an OBJ model from file with progress tracking."""
         file_path = schematics_model.get('file_path')
@@ -315,9 +384,18 @@ class SchematicsManager:
         # Only update from sensors if in auto mode
         if not self.auto_rotation_mode:
             return False
+        
+        config = schematics.SENSOR_3D_CONFIG
+        if self.smoothing_enabled and config.get('stream_enabled', False) and sensors.is_imu_available():
+            try:
+                return self._update_rotation_from_stream(config)
+            except Exception as e:
+                logger.debug(f"Could not read IMU stream: {e}")
+                return False
             
         try:
-            orientation = sensors.get_orientation()
+            # Shared IMU sample: same tick the data updater and LED matrix see; never wait on another reader
+            orientation = sensors.read_imu(blocking=False).orientation
             if orientation:
                 # Get raw sensor readings
                 raw_pitch = orientation.get('pitch', 0.0)
@@ -332,9 +410,6 @@ class SchematicsManager:
                 sensor_roll = raw_pitch   # User's left/right tilt → model roll rotation
                 sensor_yaw = raw_yaw      # User's rotation → model yaw rotation
                 
-                # Get smoothing config
-                config = schematics.SENSOR_3D_CONFIG
-                
                 # Apply smoothing filter if enabled
                 if self.smoothing_enabled:
                     # Initialize smoothed values on first reading
@@ -377,6 +452,72 @@ class SchematicsManager:
             logger.debug(f"Could not read sensor orientation: {e}")
         return False
     
+    def _update_rotation_from_stream(self, config):
+        """
+        Filter every IMU sample buffered since the last frame and update the rotation.
+
+        Each sample goes through a first-order low-pass whose weight comes from the sample
+        spacing (alpha = 1 - exp(-dt / tau)), so the response is the same at any frame rate.
+        """
+        if self.imu_stream is None:
+            self.imu_stream = ImuStream(
+                rate_hz=config['stream_rate_hz'],
+                capacity=config['stream_buffer_size'],
+                idle_timeout=config['stream_idle_timeout']
+            )
+            self._stream_cursor = self.imu_stream.cursor
+        
+        samples, self._stream_cursor = self.imu_stream.read_new(self._stream_cursor)
+        if len(samples) == 0:
+            return False
+        
+        time_constant = config['stream_time_constant']
+        for timestamp, raw_pitch, raw_roll, raw_yaw in samples:
+            # Same axis mapping as the per-frame path: device up/down tilt (roll) → model pitch
+            sensor_pitch = raw_roll
+            sensor_roll = raw_pitch
+            sensor_yaw = raw_yaw
+            
+            if self.prev_raw_pitch is None or self._stream_last_time is None:
+                self.smoothed_pitch = sensor_pitch
+                self.smoothed_roll = sensor_roll
+                self.smoothed_yaw = sensor_yaw
+                logger.info("Initialized 3D sensor smoothing from IMU stream")
+            else:
+                dt = max(0.0, timestamp - self._stream_last_time)
+                alpha = 1.0 - math.exp(-dt / time_constant) if time_constant > 0 else 1.0
+                self.smoothed_pitch = self._smooth_angle_strong(self.smoothed_pitch, sensor_pitch, alpha)
+                self.smoothed_roll = self._smooth_angle_strong(self.smoothed_roll, sensor_roll, alpha)
+                self.smoothed_yaw = self._smooth_angle_strong(self.smoothed_yaw, sensor_yaw, alpha)
+            
+            self._stream_last_time = timestamp
+            self.prev_raw_pitch = raw_pitch
+            self.prev_raw_roll = raw_roll
+            self.prev_raw_yaw = raw_yaw
+        
+        # Deadzone only: the low-pass already does the damping the per-frame sensitivity did
+        self.pitch = self._apply_stream_deadzone(self.pitch, self.smoothed_pitch, config['primary_deadzone'])
+        self.roll = self._apply_stream_deadzone(self.roll, self.smoothed_roll, config['secondary_deadzone'])
+        self.yaw = self._apply_stream_deadzone(self.yaw, self.smoothed_yaw, config['secondary_deadzone'])
+        return True
+    
+    def _apply_stream_deadzone(self, current_value, target_value, deadzone):
+        """Hold the current angle until the filtered target moves past the deadzone."""
+        change = target_value - current_value
+        if change > 180:
+            change -= 360
+        elif change < -180:
+            change += 360
+        if abs(change) < deadzone:
+            return current_value
+        return target_value % 360
+    
+    def stop_imu_stream(self):
+        """Stop high-rate IMU sampling (it also stops on its own once the viewer stops reading)."""
+        if self.imu_stream is not None:
+            self.imu_stream.stop()
+        self._stream_last_time = None
+    
     def _smooth_angle_strong(self, current_smooth, new_raw, smoothing_factor):
         """Apply strong exponential moving average to an angle, handling 360-degree wraparound."""
         # Handle angle wraparound (e.g., 359° to 1°)
@@ -480,6 +621,8 @@ class SchematicsManager:
         """Toggle between auto (sensor) and manual rotation modes."""
         self.auto_rotation_mode = not self.auto_rotation_mode
         mode_name = "Auto (Sensor)" if self.auto_rotation_mode else "Manual"
+        if not self.auto_rotation_mode:
+            self.stop_imu_stream()
         logger.info(f"Rotation mode switched to: {mode_name}")
         return self.auto_rotation_mode
     
@@ -802,6 +945,9 @@ class SchematicsManager:
         self.smoothed_pitch = 0.0
         self.smoothed_roll = 0.0
         self.smoothed_yaw = 0.0
+        self._stream_last_time = None
+        if self.imu_stream is not None:
+            self._stream_cursor = self.imu_stream.cursor
         logger.debug("Sensor smoothing state reset")
 
     def _refresh_loading_display(self, loading_operation):
@@ -837,6 +983,8 @@ class SchematicsManager:
             
             # Force display update
             pygame.display.flip()
+            from ui.frame_presenter import get_frame_presenter
+            get_frame_presenter().invalidate()
             
             # Process any pending events to keep the application responsive
             pygame.event.pump()
@@ -847,10 +995,10 @@ class SchematicsManager:
             pass 
 
     def _preload_model_textures(self, obj_model, loading_operation):
-        """Preload textures for a model during loading phase."""
+        """Decode and downscale the model's textures while the loading screen is up (upload happens on first render)."""
         try:
             # Check if model renderer is available and has texture loading capability
-            if not self.model_renderer or not hasattr(self.model_renderer, '_load_material_texture'):
+            if not self.model_renderer or not hasattr(self.model_renderer, 'prepare_textures'):
                 loading_operation.set_detail("Skipping texture preload (no renderer)")
                 self._refresh_loading_display(loading_operation)
                 return
@@ -861,15 +1009,19 @@ class SchematicsManager:
                 self._refresh_loading_display(loading_operation)
                 return
             
-            # We need an OpenGL context to load textures, but during loading phase
-            # we're in normal pygame mode. We'll defer texture loading to first render
-            # but update the loading screen to show we're ready
-            loading_operation.set_detail(f"Ready to load {len(obj_model.materials)} textures on first render")
+            # No OpenGL context exists during the loading phase, so only the CPU work
+            # (decode, downscale, mipmaps, disk cache) happens here
+            def progress(index, total, material_name):
+                loading_operation.set_detail(f"Preparing textures ({index + 1}/{total})...")
+                self._refresh_loading_display(loading_operation)
+            
+            ready = self.model_renderer.prepare_textures(progress)
+            loading_operation.set_detail(f"{ready} textures ready")
             self._refresh_loading_display(loading_operation)
             
-            logger.info(f"Model loaded with {len(obj_model.materials)} materials, textures will load on first render")
+            logger.info(f"Model loaded with {len(obj_model.materials)} materials, {ready} textures prepared")
             
         except Exception as e:
             logger.warning(f"Error in texture preload: {e}")
             loading_operation.set_detail("Texture preload failed, will load on first render")
-            self._refresh_loading_display(loading_operation) 
\ No newline at end of file
+            self._refresh_loading_display(loading_operation)
@@ -3,95 +3,79 @@
 
 import time
 import logging
-import os
 from data import system_info
+from .probe_service import ProbeService
 
 logger = logging.getLogger(__name__)
 
 class SystemInfoManager:
     """Manages system information with caching to reduce expensive operations."""
     
-    def __init__(self, cache_interval=2.0):
+    def __init__(self, cache_interval=2.0, probe_service=None):
         """
         Initialize system info manager.
         
         Args:
             cache_interval (float): How often to refresh system info (seconds)
+            probe_service (ProbeService, optional): Shared background prober for vcgencmd
         """
         self.cache_interval = cache_interval
-        self.last_cpu_check = 0
-        self.last_memory_check = 0
-        self.last_disk_check = 0
-        self.last_voltage_check = 0
+        self.probe_service = probe_service or ProbeService()
+        self.last_snapshot_check = 0
         self.last_battery_check = 0
-        self.last_temp_check = 0
         
         # Cached values
-        self.cached_cpu_info = None
-        self.cached_memory_info = None
-        self.cached_disk_info = None
+        self.cached_snapshot = None
         self.cached_voltage_info = None
         self.cached_battery_info = None
-        self.cached_temp_info = None
     
-    def get_cpu_info_cached(self):
-        """Get CPU info with caching."""
+    def get_snapshot(self):
+        """
+        Get the shared SystemSnapshot (CPU%, temperature, cores, memory, disk), refreshed
+        at most once per cache_interval. The data updater, admin timer and debug overlay
+        all read this one object instead of querying psutil/sysfs themselves.
+        """
         current_time = time.time()
         
-        if (current_time - self.last_cpu_check) >= self.cache_interval:
+        if self.cached_snapshot is None or (current_time - self.last_snapshot_check) >= self.cache_interval:
             try:
-                self.cached_cpu_info = system_info.get_cpu_usage()
-                self.last_cpu_check = current_time
-                logger.debug("CPU info updated from cache")
+                self.cached_snapshot = system_info.read_system_snapshot()
+                self.last_snapshot_check = current_time
+                logger.debug("System snapshot updated")
             except Exception as e:
-                logger.error(f"Error updating CPU info: {e}")
+                logger.error(f"Error updating system snapshot: {e}")
                 # Keep cached value on error
         
-        return self.cached_cpu_info
+        return self.cached_snapshot
+    
+    def get_cpu_info_cached(self):
+        """Get CPU info with caching: (percent, ("temperature", °C) or ("cores", n))."""
+        snapshot = self.get_snapshot()
+        if snapshot is None:
+            return None, None
+        if snapshot.cpu_temp_c is not None:
+            return snapshot.cpu_percent, ("temperature", snapshot.cpu_temp_c)
+        return snapshot.cpu_percent, ("cores", snapshot.cpu_cores)
     
     def get_memory_info_cached(self):
-        """Get memory info with caching."""
-        current_time = time.time()
-        
-        if (current_time - self.last_memory_check) >= self.cache_interval:
-            try:
-                self.cached_memory_info = system_info.get_memory_usage()
-                self.last_memory_check = current_time
-                logger.debug("Memory info updated from cache")
-            except Exception as e:
-                logger.error(f"Error updating memory info: {e}")
-                # Keep cached value on error
-        
-        return self.cached_memory_info
+        """Get memory info with caching: (percent, used MB, total MB)."""
+        snapshot = self.get_snapshot()
+        if snapshot is None:
+            return None, None, None
+        return snapshot.mem_percent, snapshot.mem_used_mb, snapshot.mem_total_mb
     
     def get_disk_info_cached(self):
-        """Get disk info with caching."""
-        current_time = time.time()
-        
-        if (current_time - self.last_disk_check) >= self.cache_interval:
-            try:
-                self.cached_disk_info = system_info.get_disk_usage()
-                self.last_disk_check = current_time
-                logger.debug("Disk info updated from cache")
-            except Exception as e:
-                logger.error(f"Error updating disk info: {e}")
-                # Keep cached value on error
-        
-        return self.cached_disk_info
+        """Get disk info with caching: (percent, used GB, total GB)."""
+        snapshot = self.get_snapshot()
+        if snapshot is None:
+            return None, None, None
+        return snapshot.disk_percent, snapshot.disk_used_gb, snapshot.disk_total_gb
     
     def get_voltage_info_cached(self):
-        """Get voltage info with caching."""
-        current_time = time.time()
-        
-        if (current_time - self.last_voltage_check) >= self.cache_interval:
-            try:
-                self.cached_voltage_info = system_info.get_voltage_info()
-                self.last_voltage_check = current_time
-                logger.debug("Voltage info updated from cache")
-            except Exception as e:
-                logger.error(f"Error updating voltage info: {e}")
-                # Keep cached value on error
-        
+        """Get voltage info with caching. Never blocks; the probe (vcgencmd) runs in the background."""
+        self.cached_voltage_info = self.probe_service.get_cached(
+            "voltage", system_info.get_voltage_info, self.cache_interval, self.cached_voltage_info
+        )
         return self.cached_voltage_info
     
     def get_battery_info_cached(self):
@@ -110,20 +94,6 @@ class SystemInfoManager:
         return self.cached_battery_info
     
     def get_cpu_temperature_cached(self):
-        """Get CPU temperature with caching (5-second interval for file reads)."""
-        current_time = time.time()
-        
-        # Use longer cache interval for file reads (5 seconds)
-        if (current_time - self.last_temp_check) >= 5.0:
-            try:
-                if os.path.exists('/sys/class/thermal/thermal_zone0/temp'):
-                    with open('/sys/class/thermal/thermal_zone0/temp', 'r') as f:
-                        temp = float(f.read()) / 1000.0
-                    self.cached_temp_info = temp
-                    self.last_temp_check = current_time
-                    logger.debug(f"CPU temperature updated from cache: {temp:.1f}°C")
-            except Exception as e:
-                logger.error(f"Error updating CPU temperature: {e}")
-                # Keep cached value on error
-        
-        return self.cached_temp_info
+        """Get CPU temperature (°C) from the shared snapshot, or None if unavailable."""
+        snapshot = self.get_snapshot()
+        return snapshot.cpu_temp_c if snapshot is not None else None
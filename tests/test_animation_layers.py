@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for pre-rendered animation layers: frame slot selection, rendering each slot once and
+the frame key.
+"""
+
+import os
+import sys
+
+import pygame
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.animation_layers import AnimationLayerCache
+
+RED = (255, 0, 0)
+
+
+class Recorder:
+    """draw_frame stand-in: records the time of every frame it renders and draws a dot."""
+
+    def __init__(self):
+        self.times = []
+
+    def __call__(self, surface, t):
+        self.times.append(t)
+        surface.set_at((0, 0), RED)
+
+
+def test_frame_slot_follows_time_modulo_period():
+    layers = AnimationLayerCache(frame_rate=10)
+    screen = pygame.Surface((50, 50))
+    draw = Recorder()
+    for current_time in (0.05, 0.15, 0.25, 2.05):
+        layers.blit(screen, "scan", (0, 0, 10, 10), 1.0, current_time, draw)
+    # int((t % period) * frames / period): 0.05 -> 0, 0.15 -> 1, 0.25 -> 2, 2.05 -> 0 (replayed)
+    assert draw.times == [0.0, 0.1, 0.2]
+
+
+def test_explicit_frame_count_sets_the_slots():
+    layers = AnimationLayerCache(frame_rate=30)
+    screen = pygame.Surface((50, 50))
+    draw = Recorder()
+    for current_time in (0.0, 0.9, 1.1, 1.9, 2.0):
+        layers.blit(screen, "pulse", (0, 0, 10, 10), 2.0, current_time, draw, frame_count=2)
+    assert draw.times == [0.0, 1.0]
+    assert layers.frame_count(0.5) == 15
+
+
+def test_each_slot_is_drawn_once_and_replayed():
+    layers = AnimationLayerCache(frame_rate=10)
+    screen = pygame.Surface((50, 50))
+    draw = Recorder()
+    for _ in range(5):
+        rect = layers.blit(screen, "stream", (20, 30, 10, 10), 1.0, 0.42, draw)
+    assert draw.times == [0.4]
+    assert rect == pygame.Rect(20, 30, 10, 10)
+    assert screen.get_at((20, 30))[:3] == RED
+    assert screen.get_at((21, 31))[:3] == (0, 0, 0)  # Color-keyed background is transparent
+
+
+def test_key_includes_bounds_size_but_not_position():
+    layers = AnimationLayerCache(frame_rate=10)
+    screen = pygame.Surface((50, 50))
+    draw = Recorder()
+    layers.blit(screen, "scan", (0, 0, 10, 10), 1.0, 0.0, draw)
+    assert layers.blit(screen, "scan", (5, 5, 10, 10), 1.0, 0.0, draw) == pygame.Rect(5, 5, 10, 10)
+    assert len(draw.times) == 1
+    layers.blit(screen, "scan", (0, 0, 12, 10), 1.0, 0.0, draw)
+    layers.blit(screen, "other", (0, 0, 10, 10), 1.0, 0.0, draw)
+    assert len(draw.times) == 3
+
+
+def test_empty_bounds_or_period_draw_nothing():
+    layers = AnimationLayerCache()
+    screen = pygame.Surface((50, 50))
+    draw = Recorder()
+    assert layers.blit(screen, "scan", (0, 0, 0, 10), 1.0, 0.0, draw) is None
+    assert layers.blit(screen, "scan", (0, 0, 10, 10), 0, 0.0, draw) is None
+    assert draw.times == []
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared image cache: LRU eviction by bytes, failed-load memoization and one
+decode per file across sizes.
+"""
+
+import os
+import sys
+
+import pygame
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.asset_cache import AssetCache
+
+SURFACE_BYTES = 400  # 10x10 at 32 bits per pixel
+
+
+def _surface():
+    return pygame.Surface((10, 10), 0, 32)
+
+
+@pytest.fixture
+def image_path(tmp_path):
+    pygame.init()
+    pygame.display.set_mode((16, 16))  # convert()/convert_alpha() need a display surface
+    path = tmp_path / "logo.png"
+    pygame.image.save(pygame.Surface((20, 10)), str(path))
+    return str(path)
+
+
+@pytest.fixture
+def decodes(monkeypatch):
+    """Record the paths pygame.image.load decodes."""
+    calls = []
+    load = pygame.image.load
+    monkeypatch.setattr(pygame.image, "load", lambda path: calls.append(path) or load(path))
+    return calls
+
+
+def test_evicts_least_recently_used_beyond_max_bytes():
+    cache = AssetCache(max_bytes=2 * SURFACE_BYTES)
+    first = cache.get_or_create("a", _surface)
+    cache.get_or_create("b", _surface)
+    assert cache.get_or_create("a", pytest.fail) is first  # "a" is now the most recent
+    cache.get_or_create("c", _surface)
+    assert cache.total_bytes == 2 * SURFACE_BYTES
+    assert cache.get_or_create("a", pytest.fail) is first
+    rebuilt = []
+    cache.get_or_create("b", lambda: rebuilt.append("b") or _surface())
+    assert rebuilt == ["b"]
+
+
+def test_never_evicts_the_entry_just_added():
+    cache = AssetCache(max_bytes=SURFACE_BYTES // 2)
+    cache.get_or_create("a", _surface)
+    assert cache.total_bytes == SURFACE_BYTES
+    big = cache.get_or_create("b", _surface)
+    assert cache.total_bytes == SURFACE_BYTES
+    assert cache.get_or_create("b", pytest.fail) is big
+
+
+def test_factory_returning_none_caches_nothing():
+    cache = AssetCache()
+    assert cache.get_or_create("a", lambda: None) is None
+    assert cache.total_bytes == 0
+
+
+def test_one_decode_serves_every_size(image_path, decodes):
+    cache = AssetCache()
+    original = cache.load(image_path)
+    small = cache.load(image_path, (10, 5))
+    assert small.get_size() == (10, 5)
+    assert cache.load(image_path, (10.7, 5.2)) is small  # Sizes are truncated to ints
+    assert cache.load(image_path, (20, 10)) is original
+    assert cache.load(image_path, (40, 20)).get_size() == (40, 20)
+    assert len(decodes) == 1
+
+
+def test_failed_path_is_not_retried(tmp_path, decodes):
+    cache = AssetCache()
+    missing = str(tmp_path / "missing.png")
+    assert cache.load(missing) is None
+    assert cache.load(missing, (10, 10)) is None
+    assert len(decodes) == 1
+    cache.clear()
+    assert cache.load(missing) is None
+    assert len(decodes) == 2
+
+
+def test_failed_scale_is_not_retried(image_path, monkeypatch):
+    cache = AssetCache()
+    scales = []
+
+    def smoothscale(surface, size):
+        scales.append(size)
+        raise ValueError("bad size")
+
+    monkeypatch.setattr(pygame.transform, "smoothscale", smoothscale)
+    assert cache.load(image_path, (5, 5)) is None
+    assert cache.load(image_path, (5, 5)) is None
+    assert scales == [(5, 5)]
+    assert cache.load(image_path) is not None  # The original and other sizes are unaffected
+    assert cache.load(image_path, (6, 6)) is None
+    assert scales == [(5, 5), (6, 6)]
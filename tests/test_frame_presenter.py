@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests for the frame presenter: retained frames pushing only marked rects, the opt-in pixel
+diff, and merging changed tiles into rects.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pygame
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ui.frame_presenter import FramePresenter
+
+
+@pytest.fixture
+def pushed(monkeypatch):
+    """Record display pushes: "flip" or the list of updated rects."""
+    calls = []
+    monkeypatch.setattr(pygame.display, "flip", lambda: calls.append("flip"))
+    monkeypatch.setattr(pygame.display, "update", lambda rects: calls.append([tuple(rect) for rect in rects]))
+    return calls
+
+
+def _tiles(rows):
+    return np.array([[cell == "#" for cell in row] for row in rows], dtype=bool)
+
+
+def test_tiles_to_rects_merges_runs_and_stacks_equal_runs():
+    presenter = FramePresenter(tile_size=10)
+    tiles = _tiles([
+        "##..#",
+        "##...",
+        ".###.",
+    ])
+    rects = presenter._tiles_to_rects(tiles, pygame.Rect(0, 0, 50, 30))
+    assert sorted(tuple(rect) for rect in rects) == [(0, 0, 20, 20), (10, 20, 30, 10), (40, 0, 10, 10)]
+
+
+def test_tiles_to_rects_restarts_a_run_after_a_gap_row():
+    presenter = FramePresenter(tile_size=8)
+    tiles = _tiles(["#.", "..", "#."])
+    rects = presenter._tiles_to_rects(tiles, pygame.Rect(0, 0, 16, 24))
+    assert [tuple(rect) for rect in rects] == [(0, 0, 8, 8), (0, 16, 8, 8)]
+
+
+def test_tiles_to_rects_clips_partial_edge_tiles():
+    presenter = FramePresenter(tile_size=16)
+    rects = presenter._tiles_to_rects(_tiles(["##", "##"]), pygame.Rect(0, 0, 20, 18))
+    assert [tuple(rect) for rect in rects] == [(0, 0, 20, 18)]
+    assert presenter._tiles_to_rects(_tiles(["..", ".."]), pygame.Rect(0, 0, 20, 18)) == []
+
+
+def test_retained_frames_push_only_marked_rects(pushed):
+    presenter = FramePresenter()
+    screen = pygame.Surface((100, 100))
+    presenter.present(screen, retained=True)  # First frame goes out in full
+    presenter.mark_dirty((10, 10, 5, 5))
+    presenter.mark_dirty((95, 95, 20, 20))  # Clipped to the screen
+    presenter.present(screen, retained=True)
+    presenter.present(screen, retained=True)  # Nothing marked: nothing pushed
+    assert pushed == ["flip", [(10, 10, 5, 5), (95, 95, 5, 5)]]
+    assert presenter.frames_skipped == 1
+
+
+def test_retained_frame_flips_when_invalidated_or_mostly_dirty(pushed):
+    presenter = FramePresenter(full_update_ratio=0.5)
+    screen = pygame.Surface((100, 100))
+    presenter.present(screen, retained=True)
+    assert not presenter.invalidated
+    presenter.invalidate()
+    presenter.mark_dirty((0, 0, 1, 1))
+    presenter.present(screen, retained=True)
+    presenter.mark_dirty((0, 0, 100, 60))
+    presenter.present(screen, retained=True)
+    assert pushed == ["flip", "flip", "flip"]
+
+
+def test_full_frames_flip_without_pixel_diff(pushed):
+    presenter = FramePresenter()
+    screen = pygame.Surface((64, 64))
+    presenter.present(screen)
+    presenter.present(screen)
+    assert pushed == ["flip", "flip"]
+
+
+def test_pixel_diff_pushes_changed_tiles(pushed):
+    presenter = FramePresenter(tile_size=16, pixel_diff=True)
+    screen = pygame.Surface((64, 64))
+    presenter.present(screen)
+    presenter.present(screen)  # Unchanged
+    screen.fill((255, 0, 0), (20, 20, 2, 2))
+    presenter.present(screen)
+    assert pushed == ["flip", [(16, 16, 16, 16)]]
+    assert presenter.frames_skipped == 1
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Tests for the frame scheduler: per-state tiers, the input boost, idle throttling and
+ending a slow frame's wait early when input arrives.
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.app_state import STATE_DASHBOARD, STATE_MENU, STATE_PONG_ACTIVE, STATE_SCHEMATICS, STATE_SETTINGS_WIFI
+from utils import frame_scheduler
+from utils.frame_scheduler import FrameScheduler
+
+
+class FakeTime:
+    """Stands in for the time module: monotonic() only moves when sleep() is called."""
+
+    def __init__(self, now=100.0):
+        self.now = now
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeClock:
+    def __init__(self):
+        self.ticks = []
+
+    def tick(self, fps=0):
+        self.ticks.append(fps)
+
+
+def _config(**overrides):
+    settings = dict(
+        FPS=60,
+        FRAME_RATE_TIERS={"realtime": 60, "animated": 30, "static": 10},
+        FRAME_RATE_INPUT_BOOST=60,
+        FRAME_RATE_BOOST_SECONDS=1.5,
+        FRAME_RATE_IDLE=2,
+        FRAME_RATE_IDLE_AFTER_SECONDS=30,
+        FRAME_RATE_INPUT_POLL_INTERVAL=0.02,
+    )
+    settings.update(overrides)
+    return SimpleNamespace(**settings)
+
+
+@pytest.fixture
+def fake_time(monkeypatch):
+    fake = FakeTime()
+    monkeypatch.setattr(frame_scheduler, "time", fake)
+    return fake
+
+
+def test_each_state_runs_at_its_tier_rate():
+    scheduler = FrameScheduler(_config())
+    scheduler.note_input(now=0.0)
+    now = 5.0  # Past the boost window, before idle
+    assert scheduler.target_fps(STATE_PONG_ACTIVE, now=now) == 60
+    assert scheduler.target_fps(STATE_MENU, now=now) == 30  # Unlisted states are "animated"
+    assert scheduler.target_fps(STATE_SETTINGS_WIFI, now=now) == 10
+
+
+def test_rates_are_capped_at_fps_and_pacing_can_be_disabled():
+    scheduler = FrameScheduler(_config(FPS=20, FRAME_RATE_INPUT_BOOST=120))
+    scheduler.note_input(now=0.0)
+    assert scheduler.target_fps(STATE_PONG_ACTIVE, now=5.0) == 20
+    assert scheduler.target_fps(STATE_SETTINGS_WIFI, now=0.5) == 20  # Boost, capped
+
+    disabled = FrameScheduler(_config(FRAME_PACING_ENABLED=False))
+    disabled.note_input(now=0.0)
+    assert disabled.target_fps(STATE_SETTINGS_WIFI, now=500.0) == 60
+
+
+def test_input_boosts_the_rate_for_the_boost_window():
+    scheduler = FrameScheduler(_config())
+    scheduler.note_input(now=0.0)
+    assert scheduler.target_fps(STATE_SETTINGS_WIFI, now=1.0) == 60
+    assert scheduler.target_fps(STATE_SETTINGS_WIFI, now=1.5) == 10
+    # A held key keeps the boost however long ago the press was
+    assert scheduler.target_fps(STATE_SETTINGS_WIFI, keys_held=True, now=1000.0) == 60
+
+
+def test_idle_rate_after_no_input_except_exempt_states():
+    scheduler = FrameScheduler(_config())
+    scheduler.note_input(now=0.0)
+    assert scheduler.target_fps(STATE_MENU, now=29.9) == 30
+    assert scheduler.target_fps(STATE_MENU, now=30.0) == 2
+    assert scheduler.target_fps(STATE_SETTINGS_WIFI, now=30.0) == 2
+    for state in (STATE_PONG_ACTIVE, STATE_SCHEMATICS, STATE_DASHBOARD):
+        assert scheduler.target_fps(state, now=30.0) > 2
+    scheduler.note_input(now=40.0)
+    assert scheduler.target_fps(STATE_MENU, now=40.1) == 60
+
+
+def test_idle_mode_can_be_disabled():
+    scheduler = FrameScheduler(_config(FRAME_RATE_IDLE_AFTER_SECONDS=0))
+    scheduler.note_input(now=0.0)
+    assert scheduler.target_fps(STATE_MENU, now=1000.0) == 30
+
+
+def test_fast_frames_use_the_clock(fake_time):
+    scheduler = FrameScheduler(_config())
+    clock = FakeClock()
+    assert scheduler.wait(clock, STATE_PONG_ACTIVE, input_pending=lambda: pytest.fail("not polled")) == 60
+    assert clock.ticks == [60]
+    assert fake_time.sleeps == []
+
+
+def test_slow_frame_sleeps_in_slices_until_due(fake_time):
+    scheduler = FrameScheduler(_config())
+    scheduler.note_input(now=fake_time.now - 100.0)  # Long idle: 2 FPS
+    clock = FakeClock()
+    assert scheduler.wait(clock, STATE_MENU, input_pending=lambda: False) == 2
+    assert sum(fake_time.sleeps) == pytest.approx(0.5)
+    assert max(fake_time.sleeps) <= 0.02 + 1e-9
+    assert clock.ticks == [0]
+    assert scheduler.current_fps == 2
+
+
+def test_pending_input_ends_a_slow_frame_early(fake_time):
+    scheduler = FrameScheduler(_config())
+    scheduler.note_input(now=fake_time.now - 100.0)
+    polls = []
+
+    def input_pending():
+        polls.append(fake_time.now)
+        return len(polls) > 3
+
+    scheduler.wait(FakeClock(), STATE_MENU, input_pending=input_pending)
+    assert len(fake_time.sleeps) == 3
+    assert sum(fake_time.sleeps) == pytest.approx(0.06)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Tests for the line graph component: auto-scaling over several series and overlay drawing.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pygame
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from ui.components.charts import graph
+
+NAN = float("nan")
+
+
+def test_combined_range_scans_only_series_without_a_range():
+    series = [
+        (np.array([100.0, 200.0]), (0, 255, 0), (1.0, 2.0)),  # Precomputed range wins over the data
+        (np.array([NAN, 5.0, -3.0]), (255, 0, 0), None),
+    ]
+    assert graph._combined_range(series) == (-3.0, 5.0)
+    assert graph._combined_range(series[:1]) == (1.0, 2.0)
+
+
+def test_combined_range_is_none_without_valid_data():
+    assert graph._combined_range([(np.array([NAN, NAN]), (0, 0, 0), None)]) is None
+
+
+def test_draw_graph_scales_to_cover_overlays():
+    screen = pygame.Surface((120, 80))
+    rect = pygame.Rect(10, 10, 100, 60)
+    history = np.array([1.0, 2.0, 3.0])
+    y_min, y_max = graph.draw_graph(
+        screen, history, rect, (0, 255, 0), sensor_name="overlay-test",
+        config_module=config, value_range=(1.0, 3.0),
+        overlays=[(np.array([0.0, 1.0, 2.0]), (255, 0, 0), None),
+                  (np.array([2.0, 4.0, 6.0]), (0, 0, 255), (2.0, 6.0))],
+    )
+    assert y_min < 0.0 and y_max > 6.0
+
+
+def test_draw_graph_redraws_when_an_overlay_changes():
+    screen = pygame.Surface((120, 80))
+    rect = pygame.Rect(0, 0, 100, 60)
+    history = np.array([1.0, 1.0, 1.0])
+    draw = lambda overlay: graph.draw_graph(
+        screen, history, rect, (0, 255, 0), 0.0, 10.0, sensor_name="overlay-cache",
+        config_module=config, overlays=[(overlay, (255, 0, 0), None)])
+    draw(np.array([2.0, 2.0, 2.0]))
+    before = pygame.image.tobytes(screen, "RGB")
+    draw(np.array([8.0, 8.0, 8.0]))
+    assert pygame.image.tobytes(screen, "RGB") != before
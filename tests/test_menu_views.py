@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Tests for the retained list menu and dialog views: only animated regions are redrawn and
+pushed while a menu is unchanged, and a static dialog is drawn once per change.
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pygame
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from ui.components.menus import list_menu_base
+from ui.frame_presenter import get_frame_presenter
+from ui.view_registry import ListMenuView, StaticDrawFunctionView
+
+ITEMS = ["Alpha", "Bravo", "Charlie", "Delta", "Echo", "Foxtrot"]
+SCREEN_SIZE = (480, 320)
+
+
+def _fonts():
+    pygame.font.init()
+    return {"large": pygame.font.Font(None, 28), "medium": pygame.font.Font(None, 20)}
+
+
+def draw_test_menu(screen, app_state, fonts, config_module, ui_scaler=None, layout=None, animate=True):
+    return list_menu_base.draw_scrollable_list_menu(
+        screen, "Menu", ITEMS, app_state.selected, fonts, config_module,
+        item_style=app_state.item_style, ui_scaler=ui_scaler, layout=layout, animate=animate)
+
+
+@pytest.fixture(autouse=True)
+def clear_marks():
+    """Leave no marked rects behind for the next frame presented by another test."""
+    yield
+    del get_frame_presenter()._marked_rects[:]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = SimpleNamespace(value=100.0)
+    monkeypatch.setattr(list_menu_base.time, "time", lambda: now.value)
+    return now
+
+
+def _render(view, screen, app_state, fonts):
+    presenter = get_frame_presenter()
+    del presenter._marked_rects[:]
+    view.render(screen, app_state, {}, None, fonts, config, None)
+    return [pygame.Rect(rect) for rect in presenter._marked_rects]
+
+
+def _full_drawing(app_state, fonts):
+    surface = pygame.Surface(SCREEN_SIZE)
+    draw_test_menu(surface, app_state, fonts, config)
+    return pygame.image.tobytes(surface, "RGB")
+
+
+@pytest.mark.parametrize("item_style", ["simple", "button"])
+def test_list_menu_frames_match_a_full_drawing(item_style, clock):
+    view = ListMenuView(draw_test_menu, item_style)
+    screen = pygame.Surface(SCREEN_SIZE)
+    fonts = _fonts()
+    app_state = SimpleNamespace(selected=1, item_style=item_style)
+    for frame in range(12):
+        clock.value = 100.0 + frame * 0.13
+        if frame == 6:
+            app_state.selected = 4
+        _render(view, screen, app_state, fonts)
+        assert pygame.image.tobytes(screen, "RGB") == _full_drawing(app_state, fonts)
+
+
+def test_unchanged_list_menu_pushes_only_animated_regions(clock):
+    view = ListMenuView(draw_test_menu)
+    screen = pygame.Surface(SCREEN_SIZE)
+    fonts = _fonts()
+    app_state = SimpleNamespace(selected=0, item_style="simple")
+    assert _render(view, screen, app_state, fonts)[0] == screen.get_rect()
+
+    clock.value += 0.2
+    rects = _render(view, screen, app_state, fonts)
+    assert screen.get_rect() not in rects
+    assert sum(rect.width * rect.height for rect in rects) < SCREEN_SIZE[0] * SCREEN_SIZE[1] // 4
+
+    app_state.selected = 1  # The static drawing changed: everything goes out
+    assert _render(view, screen, app_state, fonts)[0] == screen.get_rect()
+    view.invalidate_frame()
+    assert _render(view, screen, app_state, fonts)[0] == screen.get_rect()
+
+
+def test_static_dialog_is_drawn_only_when_it_changes():
+    drawn = []
+    app_state = SimpleNamespace(option=0, message="Reboot?")
+    view = StaticDrawFunctionView(
+        lambda screen, app_state, fonts, config_module, ui_scaler, message: drawn.append((message, app_state.option)),
+        lambda app_state, values, history: {"message": app_state.message},
+        state=lambda app_state: app_state.option)
+    screen = pygame.Surface(SCREEN_SIZE)
+    fonts = _fonts()
+
+    assert _render(view, screen, app_state, fonts) == [screen.get_rect()]
+    assert _render(view, screen, app_state, fonts) == []
+    app_state.option = 1
+    _render(view, screen, app_state, fonts)
+    app_state.message = "Shutdown?"
+    _render(view, screen, app_state, fonts)
+    view.invalidate_frame()
+    _render(view, screen, app_state, fonts)
+    assert drawn == [("Reboot?", 0), ("Reboot?", 1), ("Shutdown?", 1), ("Shutdown?", 1)]
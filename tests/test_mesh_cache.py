@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Tests for the OBJ mesh compiler (face parsing and fan triangulation) and the binary
+compiled-mesh cache.
+"""
+
+import json
+import os
+import struct
+import sys
+
+import numpy as np
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ui.components.rendering import mesh_cache
+from ui.components.rendering.mesh_cache import FLAG_NORMAL, FLAG_UV, compile_obj, load_compiled_mesh
+
+SQUARE = """\
+# unit square in z=0, plus a pentagon
+mtllib parts.mtl
+v 0 0 0
+v 1 0 0
+v 1 1 0
+v 0 1 0
+vt 0 0
+vt 1 0
+vt 1 1
+vn 0 0 1
+o square
+usemtl hull
+f 1 2 3 4
+o pentagon
+usemtl trim
+    f 1 2 3 4 1
+"""
+
+
+def _write_obj(tmp_path, text, name="model.obj"):
+    path = tmp_path / name
+    path.write_text(text)
+    return str(path)
+
+
+def _triangles(mesh):
+    """Triangles as tuples of vertex positions, to compare independent of vertex order."""
+    return [tuple(tuple(mesh.positions[i].tolist()) for i in triangle) for triangle in mesh.indices.reshape(-1, 3)]
+
+
+def _header(cache_path):
+    with open(cache_path, "rb") as file:
+        file.read(len(mesh_cache._MAGIC))
+        (length,) = struct.unpack("<I", file.read(4))
+        return json.loads(file.read(length).decode("utf-8"))
+
+
+def test_triangulate_fans_each_polygon_from_its_first_corner():
+    corners, faces = mesh_cache._triangulate(["1", "2", "3", "4", "5", "6", "7"], [4, 3], [(7, 0, 0), (7, 0, 0)])
+    assert corners[:, 0].reshape(-1, 3).tolist() == [[0, 1, 2], [0, 2, 3], [4, 5, 6]]
+    assert faces.tolist() == [0, 0, 1]
+
+
+def test_triangulate_reads_every_corner_form():
+    tokens = ["1", "2/3", "3//4", "4/5/6"]
+    corners, _faces = mesh_cache._triangulate(tokens, [4], [(9, 9, 9)])
+    # (v, t, n) 0-based, -1 where not given; corner order is the fan 1-2-3, 1-3-4
+    assert corners.tolist() == [[0, -1, -1], [1, 2, -1], [2, -1, 3],
+                                [0, -1, -1], [2, -1, 3], [3, 4, 5]]
+
+
+def test_triangulate_resolves_negative_indices_against_elements_read_so_far():
+    corners, _faces = mesh_cache._triangulate(["-3/-1/-2", "-2", "-1"], [3], [(5, 2, 4)])
+    assert corners.tolist() == [[2, 1, 2], [3, -1, -1], [4, -1, -1]]
+
+
+def test_compile_obj_triangulates_quads_and_indented_faces(tmp_path):
+    mesh = compile_obj(_write_obj(tmp_path, SQUARE))
+    assert mesh.triangle_count == 5
+    assert mesh.material_ranges == [("hull", 0, 6), ("trim", 6, 9)]
+    assert mesh.group_names == ["default", "square", "pentagon"]
+    assert mesh.triangle_groups.tolist() == [1, 1, 2, 2, 2]
+    assert mesh.mtllibs == ["parts.mtl"]
+    assert mesh.bounds == (0.0, 0.0, 0.0, 1.0, 1.0, 0.0)
+    assert _triangles(mesh)[:2] == [((0, 0, 0), (1, 0, 0), (1, 1, 0)), ((0, 0, 0), (1, 1, 0), (0, 1, 0))]
+
+
+def test_compile_obj_uses_given_normals_and_uvs_and_computes_missing_normals(tmp_path):
+    obj = """\
+v 0 0 0
+v 1 0 0
+v 0 1 0
+vt 0.5 0.25
+vn 0 0 -1
+f 1/1/1 2//1 -1/1
+"""
+    mesh = compile_obj(_write_obj(tmp_path, obj))
+    by_position = {tuple(mesh.positions[i].tolist()): i for i in range(len(mesh.vertices))}
+    first, second, third = (by_position[p] for p in ((0, 0, 0), (1, 0, 0), (0, 1, 0)))
+    assert mesh.flags[first] == FLAG_NORMAL | FLAG_UV
+    assert mesh.flags[second] == FLAG_NORMAL
+    assert mesh.flags[third] == FLAG_UV
+    assert mesh.uvs[first].tolist() == [0.5, 0.25]
+    assert mesh.normals[second].tolist() == [0, 0, -1]
+    # Computed from the triangle's winding
+    assert mesh.normals[third].tolist() == [0, 0, 1]
+
+
+def test_compile_obj_drops_out_of_range_positions_and_ignores_bad_attributes(tmp_path):
+    obj = """\
+v 0 0 0
+v 1 0 0
+v 0 1 0
+vt 0 0
+f 1 2 9
+f 1 2 -7
+f 1/5/3 2/1 3
+f 1 2
+"""
+    mesh = compile_obj(_write_obj(tmp_path, obj))
+    assert mesh.triangle_count == 1
+    uv_flags = sorted(int(flag) & FLAG_UV for flag in mesh.flags)
+    assert uv_flags == [0, 0, FLAG_UV]
+    assert not (mesh.flags & FLAG_NORMAL).any()
+
+
+def test_cache_round_trip_maps_the_compiled_arrays(tmp_path, monkeypatch):
+    obj_path = _write_obj(tmp_path, SQUARE)
+    compiled = load_compiled_mesh(obj_path)
+    cache_path = mesh_cache.mesh_cache_path(obj_path)
+    assert os.path.exists(cache_path)
+
+    monkeypatch.setattr(mesh_cache, "compile_obj", lambda path: pytest.fail("cache not used"))
+    loaded = load_compiled_mesh(obj_path)
+    assert isinstance(loaded.vertices.base, np.memmap) or isinstance(loaded.vertices, np.memmap)
+    for name in ("vertices", "indices", "flags", "triangle_groups"):
+        assert np.array_equal(getattr(loaded, name), getattr(compiled, name))
+    assert loaded.material_ranges == compiled.material_ranges
+    assert loaded.group_names == compiled.group_names
+    assert loaded.bounds == compiled.bounds
+
+
+def test_stale_cache_is_rebuilt(tmp_path):
+    obj_path = _write_obj(tmp_path, SQUARE)
+    load_compiled_mesh(obj_path)
+    # Same size, different content and mtime: the hash check rejects the cache
+    with open(obj_path, "w") as file:
+        file.write(SQUARE.replace("v 1 1 0", "v 2 2 0"))
+    os.utime(obj_path, ns=(0, 1_000_000_000))
+    assert load_compiled_mesh(obj_path).bounds == (0.0, 0.0, 0.0, 2.0, 2.0, 0.0)
+    assert _header(mesh_cache.mesh_cache_path(obj_path))["source"]["mtime_ns"] == 1_000_000_000
+
+
+def test_other_variant_or_version_is_rejected(tmp_path):
+    obj_path = _write_obj(tmp_path, SQUARE)
+    cache_path = mesh_cache.mesh_cache_path(obj_path)
+    load_compiled_mesh(obj_path)
+    stat = os.stat(obj_path)
+    assert mesh_cache._read_cache(cache_path, obj_path, stat, variant={"lod": 1}) is None
+    header = _header(cache_path)
+    header["version"] = mesh_cache.MESH_FORMAT_VERSION + 1
+    mesh_cache._rewrite_header(cache_path, header, len(json.dumps(_header(cache_path))))
+    assert mesh_cache._read_cache(cache_path, obj_path, stat) is None
+
+
+def test_touched_obj_with_same_content_refreshes_the_cache_mtime(tmp_path, monkeypatch):
+    obj_path = _write_obj(tmp_path, SQUARE)
+    load_compiled_mesh(obj_path)
+    cache_path = mesh_cache.mesh_cache_path(obj_path)
+    os.utime(obj_path, ns=(0, 2_000_000_000_000_000_000))
+
+    monkeypatch.setattr(mesh_cache, "compile_obj", lambda path: pytest.fail("cache not used"))
+    assert load_compiled_mesh(obj_path).triangle_count == 5
+    assert _header(cache_path)["source"]["mtime_ns"] == 2_000_000_000_000_000_000
+    # The refreshed header matches on size/mtime: no hashing on the next load
+    monkeypatch.setattr(mesh_cache, "_file_sha256", lambda path: pytest.fail("hashed again"))
+    assert load_compiled_mesh(obj_path).triangle_count == 5
+
+
+def test_refreshed_header_that_no_longer_fits_rewrites_the_cache(tmp_path, monkeypatch):
+    obj_path = _write_obj(tmp_path, SQUARE)
+    os.utime(obj_path, ns=(0, 5))
+    load_compiled_mesh(obj_path)
+    cache_path = mesh_cache.mesh_cache_path(obj_path)
+    os.utime(obj_path, ns=(0, 1_500_000_000_000_000_000))  # Longer number than the header has room for
+
+    monkeypatch.setattr(mesh_cache, "compile_obj", lambda path: pytest.fail("cache not used"))
+    assert load_compiled_mesh(obj_path).triangle_count == 5
+    assert _header(cache_path)["source"]["mtime_ns"] == 1_500_000_000_000_000_000
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Tests for the level-of-detail meshes: vertex-clustering decimation and the cached LOD levels.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ui.components.rendering import mesh_lod
+from ui.components.rendering.mesh_cache import compile_obj, mesh_cache_path
+from ui.components.rendering.mesh_lod import decimate_mesh, load_lod_meshes
+
+
+def _grid_obj(tmp_path, size=16, name="grid.obj"):
+    """A size x size grid of quads in z=0; the left half uses material "left", the right half "right"."""
+    lines = [f"v {x} {y} 0" for y in range(size + 1) for x in range(size + 1)]
+    lines.append("vn 0 0 1")
+    for material, columns in (("left", range(size // 2)), ("right", range(size // 2, size))):
+        lines.append(f"usemtl {material}")
+        for y in range(size):
+            for x in columns:
+                corner = y * (size + 1) + x + 1
+                lines.append(f"f {corner}//1 {corner + 1}//1 {corner + size + 2}//1 {corner + size + 1}//1")
+    path = tmp_path / name
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+
+def test_decimate_meets_the_target_and_keeps_bounds_and_materials(tmp_path):
+    mesh = compile_obj(_grid_obj(tmp_path))
+    assert mesh.triangle_count == 512
+    lod = decimate_mesh(mesh, 128)
+    assert 0 < lod.triangle_count <= 128
+    assert lod.bounds == mesh.bounds
+    assert [name for name, _start, _count in lod.material_ranges] == ["left", "right"]
+    # The ranges tile the index list in order
+    assert lod.material_ranges[0][1] == 0
+    assert lod.material_ranges[1][1] == lod.material_ranges[0][2]
+    assert sum(count for _name, _start, count in lod.material_ranges) == len(lod.indices)
+    assert len(lod.triangle_groups) == lod.triangle_count
+    assert lod.indices.max() < len(lod.vertices)
+
+
+def test_decimate_never_shares_vertices_between_materials(tmp_path):
+    lod = decimate_mesh(compile_obj(_grid_obj(tmp_path)), 64)
+    used = [set(lod.indices[start:start + count].tolist()) for _name, start, count in lod.material_ranges]
+    assert used[0] and used[1]
+    assert not used[0] & used[1]
+
+
+def test_decimate_averages_positions_and_renormalizes_normals(tmp_path):
+    mesh = compile_obj(_grid_obj(tmp_path))
+    lod = decimate_mesh(mesh, 100)
+    low, high = np.array(mesh.bounds[:3]), np.array(mesh.bounds[3:])
+    assert (lod.positions >= low).all() and (lod.positions <= high).all()
+    assert np.allclose(lod.normals, [0, 0, 1])
+
+
+def test_decimate_keeps_everything_when_the_target_allows_it(tmp_path):
+    mesh = compile_obj(_grid_obj(tmp_path, size=4))
+    lod = decimate_mesh(mesh, mesh.triangle_count)
+    assert lod.triangle_count == mesh.triangle_count
+
+
+def test_decimate_below_any_grid_returns_the_coarsest_clustering(tmp_path):
+    lod = decimate_mesh(compile_obj(_grid_obj(tmp_path, size=4)), 0)
+    # One cell per material: every triangle collapses
+    assert lod.triangle_count == 0
+    assert lod.material_ranges == []
+
+
+def test_decimate_drops_faces_that_collapse_onto_the_same_triangle(tmp_path):
+    path = tmp_path / "twice.obj"
+    path.write_text("v 0 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 3\nf 3 1 2\n")
+    mesh = compile_obj(str(path))
+    assert mesh.triangle_count == 2
+    assert decimate_mesh(mesh, 2).triangle_count == 1
+
+
+def test_lod_levels_are_cached_and_skip_levels_that_do_not_shrink(tmp_path, monkeypatch):
+    obj_path = _grid_obj(tmp_path)
+    mesh = compile_obj(obj_path)
+    levels = load_lod_meshes(obj_path, mesh, [1.0, 0.25, 0.9, 0.05])
+    counts = [level.triangle_count for level in levels]
+    assert counts[0] == 512 and counts == sorted(counts, reverse=True) and len(set(counts)) == len(counts)
+    # The 0.9 level is not smaller than the 0.25 one before it
+    assert len(levels) == 3
+    assert os.path.exists(mesh_cache_path(obj_path, 1)) and os.path.exists(mesh_cache_path(obj_path, 3))
+    assert not os.path.exists(mesh_cache_path(obj_path, 2))
+
+    monkeypatch.setattr(mesh_lod, "decimate_mesh", lambda mesh, target: pytest.fail("cache not used"))
+    cached = load_lod_meshes(obj_path, mesh, [1.0, 0.25, 0.9, 0.05])
+    assert [level.triangle_count for level in cached] == counts
+
+
+def test_lod_cache_is_rebuilt_when_the_ratio_changes(tmp_path, monkeypatch):
+    obj_path = _grid_obj(tmp_path)
+    mesh = compile_obj(obj_path)
+    load_lod_meshes(obj_path, mesh, [1.0, 0.5])
+    built = []
+    decimate = mesh_lod.decimate_mesh
+    monkeypatch.setattr(mesh_lod, "decimate_mesh", lambda mesh, target: built.append(target) or decimate(mesh, target))
+    levels = load_lod_meshes(obj_path, mesh, [1.0, 0.1])
+    assert built == [51]
+    assert levels[1].triangle_count <= 51
+
+
+def test_small_meshes_get_no_lod_levels(tmp_path):
+    obj_path = _grid_obj(tmp_path, size=4)
+    mesh = compile_obj(obj_path)
+    assert load_lod_meshes(obj_path, mesh, [1.0, 0.5], min_triangles=100) == [mesh]
+    assert not os.path.exists(mesh_cache_path(obj_path, 1))
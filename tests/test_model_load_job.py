@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Tests for background schematics model loading: cancel, reopening a running load, adopting
+a load that finished after cancel, and remembering paths that fail.
+"""
+
+import os
+import sys
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from models.model_load_job import ModelLoadJob
+from models.schematics_manager import SchematicsManager
+from ui.components.rendering.obj_loader import OBJLoader
+
+MODEL_KEY = "ncc_1701"
+TIMEOUT = 5.0
+
+
+class FakeModel:
+    def __init__(self):
+        self.materials = {"hull": {}, "saucer": {}}
+        self.prepared = []
+
+    def prepared_texture(self, material_name):
+        self.prepared.append(material_name)
+
+
+@pytest.fixture
+def loader(monkeypatch):
+    """Stubbed OBJLoader.load that blocks until release is set; returns model (None fails)."""
+    stub = SimpleNamespace(release=threading.Event(), model=FakeModel(), calls=[])
+
+    def load(file_path, use_cache=None):
+        stub.calls.append(file_path)
+        assert stub.release.wait(TIMEOUT)
+        return stub.model
+
+    monkeypatch.setattr(OBJLoader, "load", staticmethod(load))
+    return stub
+
+
+@pytest.fixture
+def manager():
+    return SchematicsManager(config, 320, 240)
+
+
+def test_cancel_stops_the_worker_before_preparing_textures(loader):
+    job = ModelLoadJob(MODEL_KEY, "model.obj").start()
+    job.cancel()
+    loader.release.set()
+    assert job.wait(TIMEOUT)
+    assert loader.calls == ["model.obj"]
+    assert loader.model.prepared == []
+
+
+def test_reopening_a_running_load_resumes_it(loader, manager):
+    job = manager.start_model_load(MODEL_KEY)
+    job.cancel()
+    assert manager.start_model_load(MODEL_KEY) is job
+    assert not job.cancelled
+    loader.release.set()
+    assert job.wait(TIMEOUT)
+    assert len(loader.calls) == 1
+    assert loader.model.prepared == ["hull", "saucer"]
+    assert job.progress()[0] == 1.0
+
+
+def test_load_finished_after_cancel_is_adopted(loader, manager):
+    file_path = manager.schematics_models[MODEL_KEY]["file_path"]
+    first = manager.start_model_load(MODEL_KEY)
+    first.cancel()
+    loader.release.set()
+    assert first.wait(TIMEOUT)
+
+    second = manager.start_model_load(MODEL_KEY)
+    assert second is not first
+    assert manager.loaded_obj_models[file_path] is loader.model
+    assert second.wait(TIMEOUT)
+    assert second.model is loader.model
+    assert len(loader.calls) == 1  # Not parsed again, only its textures are prepared
+    assert loader.model.prepared == ["hull", "saucer"]
+
+
+def test_failing_path_is_remembered(loader, manager):
+    file_path = manager.schematics_models[MODEL_KEY]["file_path"]
+    loader.model = None
+    loader.release.set()
+    job = manager.start_model_load(MODEL_KEY)
+    assert job.wait(TIMEOUT)
+    assert manager.finish_model_load(job) is False
+    assert file_path in manager._failed_obj_paths
+
+    retry = manager.start_model_load(MODEL_KEY)
+    assert retry.wait(TIMEOUT)
+    assert retry.model is None
+    assert len(loader.calls) == 1
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for the background status probes: coalescing refreshes and keeping the last value.
+"""
+
+import os
+import sys
+import threading
+import time
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.probe_service import ProbeService
+
+TIMEOUT = 5.0
+
+
+def _wait_idle(service, name):
+    deadline = time.monotonic() + TIMEOUT
+    while service.is_running(name):
+        assert time.monotonic() < deadline, f"probe '{name}' still running"
+        time.sleep(0.001)
+
+
+class BlockingProbe:
+    """Probe that blocks until release is set, then returns value (or raises error)."""
+
+    def __init__(self, value=None, error=None):
+        self.value = value
+        self.error = error
+        self.release = threading.Event()
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        assert self.release.wait(TIMEOUT)
+        if self.error:
+            raise self.error
+        return self.value
+
+
+def test_concurrent_refreshes_coalesce_into_one_run():
+    service = ProbeService()
+    probe = BlockingProbe("wlan0: up")
+    started = []
+    threads = [threading.Thread(target=lambda: started.append(service.refresh("wifi", probe))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(TIMEOUT)
+    assert started.count(True) == 1
+    assert service.is_running("wifi")
+    assert service.get("wifi", "unknown") == "unknown"  # Reads never wait for the probe
+
+    probe.release.set()
+    _wait_idle(service, "wifi")
+    assert probe.calls == 1
+    assert service.get("wifi") == "wlan0: up"
+    # Once finished, the next refresh runs the probe again
+    assert service.refresh("wifi", probe)
+    _wait_idle(service, "wifi")
+    assert probe.calls == 2
+
+
+def test_probe_error_keeps_the_last_value():
+    service = ProbeService()
+    good = BlockingProbe(1.2)
+    good.release.set()
+    service.refresh("volts", good)
+    _wait_idle(service, "volts")
+
+    failing = BlockingProbe(error=OSError("vcgencmd not found"))
+    assert service.refresh("volts", failing)
+    failing.release.set()
+    _wait_idle(service, "volts")
+    assert failing.calls == 1
+    assert service.get("volts") == 1.2
+
+
+def test_get_cached_refreshes_only_when_older_than_max_age(monkeypatch):
+    service = ProbeService()
+    probe = BlockingProbe("on")
+    now = [1000.0]
+    monkeypatch.setattr("models.probe_service.time.time", lambda: now[0])
+
+    assert service.get_cached("bt", probe, max_age=10, default="?") == "?"
+    probe.release.set()
+    _wait_idle(service, "bt")
+    now[0] += 5
+    assert service.get_cached("bt", probe, max_age=10) == "on"
+    assert probe.calls == 1
+    now[0] += 5
+    service.get_cached("bt", probe, max_age=10)
+    _wait_idle(service, "bt")
+    assert probe.calls == 2
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Tests for ReadingHistory: the doubled NumPy ring buffer, its read-only views and the
+aggregate tiers behind get_window().
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from models.reading_history import ReadingHistory
+
+TEMP = config.SENSOR_TEMPERATURE
+ACCEL = config.SENSOR_ACCELERATION
+
+
+def _history(size=4, tiers=()):
+    return ReadingHistory([TEMP, ACCEL, config.SENSOR_CLOCK], history_size=size, tiers=tiers)
+
+
+def test_view_is_ordered_oldest_to_newest_across_wraparound():
+    history = _history(size=4)
+    for value in range(1, 7):
+        history.add_reading(TEMP, value)
+    assert history.get_view(TEMP).tolist() == [3.0, 4.0, 5.0, 6.0]
+
+
+def test_view_starts_as_nan_and_is_read_only():
+    history = _history(size=3)
+    view = history.get_view(TEMP)
+    assert np.isnan(view).all()
+    with pytest.raises(ValueError):
+        view[0] = 1.0
+
+
+def test_view_is_zero_copy():
+    history = _history(size=3)
+    history.add_reading(TEMP, 1.0)
+    view = history.get_view(TEMP)
+    assert np.shares_memory(view, history.sensor_data[TEMP])
+
+
+def test_missing_and_non_numeric_values_are_stored_as_none():
+    history = _history(size=3)
+    history.add_reading(TEMP, 1.5)
+    history.add_reading(TEMP, None)
+    history.add_reading(TEMP, "n/a")
+    assert history.get_history(TEMP) == [1.5, None, None]
+
+
+def test_acceleration_dict_stores_x_component():
+    history = _history(size=2)
+    history.add_reading(ACCEL, {'x': 0.25, 'y': 0.0, 'z': 1.0})
+    history.add_reading(ACCEL, {'y': 0.0})
+    assert history.get_history(ACCEL) == [0.25, None]
+
+
+def test_clock_has_no_numeric_history():
+    history = _history(size=2)
+    history.add_reading(config.SENSOR_CLOCK, "12:00")
+    assert history.get_history(config.SENSOR_CLOCK) == [None, None]
+
+
+def test_range_ignores_nan_and_is_invalidated_by_writes():
+    history = _history(size=4)
+    assert history.get_range(TEMP) is None
+    history.add_reading(TEMP, 5.0)
+    history.add_reading(TEMP, None)
+    history.add_reading(TEMP, -1.0)
+    assert history.get_range(TEMP) == (-1.0, 5.0)
+    history.add_reading(TEMP, 9.0)
+    assert history.get_range(TEMP) == (-1.0, 9.0)
+
+
+def test_range_forgets_values_that_scrolled_out():
+    history = _history(size=2)
+    for value in (100.0, 1.0, 2.0):
+        history.add_reading(TEMP, value)
+    assert history.get_range(TEMP) == (1.0, 2.0)
+
+
+def test_unknown_mode_is_ignored():
+    history = _history(size=2)
+    history.add_reading("UNKNOWN", 1.0)
+    assert history.get_view("UNKNOWN") is None
+    assert history.get_history("UNKNOWN") == []
+    assert history.get_range("UNKNOWN") is None
+    assert np.isnan(history.get_view(TEMP)).all()
+
+
+def test_tier_buckets_hold_mean_min_max():
+    history = _history(size=4, tiers=((10, 6),))
+    for timestamp, value in ((100.0, 1.0), (104.0, 3.0), (109.0, 5.0), (112.0, 7.0)):
+        history.add_reading(TEMP, value, timestamp=timestamp)
+    window = history.get_window(TEMP, 20, now=112.0)
+    assert window.bucket_seconds == 10
+    assert window.mean.tolist() == [3.0, 7.0]
+    assert window.min.tolist() == [1.0, 7.0]
+    assert window.max.tolist() == [5.0, 7.0]
+
+
+def test_tier_leaves_nan_for_empty_buckets_and_rolls_forward():
+    history = _history(size=4, tiers=((10, 6),))
+    history.add_reading(TEMP, 2.0, timestamp=100.0)
+    history.add_reading(TEMP, 4.0, timestamp=130.0)
+    # Buckets 10..15; nothing since t=130, so the window still ends at "now" with empty buckets
+    window = history.get_window(TEMP, 60, now=150.0)
+    assert window.mean[0] == 2.0
+    assert window.mean[3] == 4.0
+    assert np.isnan(window.mean[[1, 2, 4, 5]]).all()
+
+
+def test_tier_ignores_missing_values_but_keeps_time_moving():
+    history = _history(size=4, tiers=((10, 4),))
+    history.add_reading(TEMP, 1.0, timestamp=0.0)
+    history.add_reading(TEMP, None, timestamp=5.0)
+    history.add_reading(TEMP, None, timestamp=15.0)
+    window = history.get_window(TEMP, 20, now=15.0)
+    assert window.mean[0] == 1.0
+    assert np.isnan(window.mean[1])
+
+
+def test_window_picks_finest_tier_within_max_points():
+    history = _history(size=4, tiers=((60, 10), (10, 30)))
+    for second in range(0, 600, 5):
+        history.add_reading(TEMP, float(second), timestamp=float(second))
+    assert history.get_window(TEMP, 120, max_points=20, now=595.0).bucket_seconds == 10
+    assert history.get_window(TEMP, 120, max_points=5, now=595.0).bucket_seconds == 60
+    # Wider than every tier: coarsest tier, clipped to its capacity
+    wide = history.get_window(TEMP, 3600, now=595.0)
+    assert wide.bucket_seconds == 60 and len(wide.mean) == 10
+
+
+def test_window_respects_max_points_and_is_read_only():
+    history = _history(size=4, tiers=((10, 30),))
+    history.add_reading(TEMP, 1.0, timestamp=0.0)
+    window = history.get_window(TEMP, 300, max_points=8, now=0.0)
+    assert len(window.mean) == 8
+    with pytest.raises(ValueError):
+        window.mean[0] = 0.0
+
+
+def test_window_without_tiers_is_none():
+    history = _history(size=4, tiers=())
+    assert history.get_window(TEMP, 60) is None
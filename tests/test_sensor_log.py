@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests for the append-only binary sensor log: record format, segment rollover,
+read_range() bounds and replay into ReadingHistory.
+"""
+
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data import sensor_log
+from data.sensor_log import RECORD, RECORD_SIZE, SensorLog, read_segment
+from models.reading_history import ReadingHistory
+
+KEYS = ["TEMPERATURE", "HUMIDITY", "CLOCK"]
+
+
+def _log(tmp_path, **overrides):
+    settings = dict(
+        SENSOR_LOG_DIR=str(tmp_path),
+        SENSOR_LOG_SEGMENT_RECORDS=4,
+        SENSOR_LOG_MAX_SEGMENTS=8,
+        SENSOR_LOG_FLUSH_INTERVAL=0.01,
+        SENSOR_LOG_REPLAY_SECONDS=3600,
+        ALL_SENSOR_MODES=KEYS,
+    )
+    settings.update(overrides)
+    return SensorLog(SimpleNamespace(**settings))
+
+
+def _write(log, rows):
+    """Write (timestamp, sensor_key, value) rows synchronously, bypassing the writer thread."""
+    os.makedirs(log.log_dir, exist_ok=True)
+    log._write_batch([RECORD.pack(t, log._sensor_ids[key], v) for t, key, v in rows])
+    log._close_segment()
+
+
+def test_record_layout_is_16_bytes():
+    assert RECORD_SIZE == 16
+    assert sensor_log.RECORD_DTYPE.itemsize == RECORD_SIZE
+
+
+def test_segment_header_names_sensors_and_records_follow(tmp_path):
+    log = _log(tmp_path)
+    _write(log, [(10.0, "HUMIDITY", 45.5), (11.0, "TEMPERATURE", 21.25)])
+    (path,) = sensor_log._segment_paths(str(tmp_path))
+    names, records = read_segment(path)
+    assert names == KEYS
+    assert records["timestamp"].tolist() == [10.0, 11.0]
+    assert records["sensor_id"].tolist() == [1, 0]
+    assert records["value"].tolist() == [45.5, 21.25]
+    # Header is padded so records stay aligned
+    assert (os.path.getsize(path) - records.size * RECORD_SIZE) % RECORD_SIZE == 0
+
+
+def test_torn_final_record_is_dropped(tmp_path):
+    log = _log(tmp_path)
+    _write(log, [(1.0, "TEMPERATURE", 1.0), (2.0, "TEMPERATURE", 2.0)])
+    (path,) = sensor_log._segment_paths(str(tmp_path))
+    with open(path, "ab") as f:
+        f.write(b"\x01\x02\x03")
+    names, records = read_segment(path)
+    assert records.size == 2
+
+
+def test_non_segment_files_are_skipped(tmp_path):
+    path = tmp_path / "0000000000000.seg"
+    path.write_bytes(b"not a sensor log")
+    assert read_segment(str(path)) is None
+    assert _log(tmp_path).read_range("TEMPERATURE")[0].size == 0
+
+
+def test_segments_roll_over_and_oldest_are_pruned(tmp_path):
+    log = _log(tmp_path, SENSOR_LOG_SEGMENT_RECORDS=4, SENSOR_LOG_MAX_SEGMENTS=2)
+    _write(log, [(float(t), "TEMPERATURE", float(t)) for t in range(10)])
+    paths = sensor_log._segment_paths(str(tmp_path))
+    assert len(paths) == 2
+    assert [read_segment(p)[1].size for p in paths] == [4, 2]
+    timestamps, values = log.read_range("TEMPERATURE")
+    assert values.tolist() == [4.0, 5.0, 6.0, 7.0, 8.0, 9.0]
+
+
+def test_read_range_bounds_are_inclusive_and_per_sensor(tmp_path):
+    log = _log(tmp_path)
+    rows = [(float(t), "TEMPERATURE", float(t)) for t in range(6)]
+    rows += [(2.5, "HUMIDITY", 50.0)]
+    _write(log, rows)
+    timestamps, values = log.read_range("TEMPERATURE", start_time=1.0, end_time=4.0)
+    assert timestamps.tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert values.dtype == np.float64
+    assert log.read_range("HUMIDITY")[1].tolist() == [50.0]
+    assert log.read_range("PRESSURE")[0].size == 0
+
+
+def test_append_ignores_unloggable_values_and_writes_on_stop(tmp_path):
+    log = _log(tmp_path)
+    log.append("TEMPERATURE", 20.0)  # Writer not running yet: dropped
+    log.start()
+    for value in (21.0, None, True, "n/a", float("nan")):
+        log.append("TEMPERATURE", value, timestamp=100.0)
+    log.append("UNKNOWN", 1.0, timestamp=100.0)
+    log.append("HUMIDITY", "40", timestamp=101.0)
+    log.stop()
+    assert log.read_range("TEMPERATURE")[1].tolist() == [21.0]
+    assert log.read_range("HUMIDITY")[1].tolist() == [40.0]
+
+
+def test_replay_into_feeds_recent_readings(tmp_path):
+    log = _log(tmp_path)
+    now = time.time()
+    _write(log, [
+        (now - 7200, "TEMPERATURE", 1.0),  # Older than the replay window
+        (now - 20, "TEMPERATURE", 2.0),
+        (now - 10, "HUMIDITY", 3.0),
+        (now - 5, "TEMPERATURE", 4.0),
+    ])
+    history = ReadingHistory(["TEMPERATURE"], history_size=4, tiers=())
+    assert log.replay_into(history, since_seconds=3600) == 2
+    assert history.get_history("TEMPERATURE") == [None, None, 2.0, 4.0]
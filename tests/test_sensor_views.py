@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Tests for the sensor view and dashboard redrawing only what app_state.dirty_text (value
+text) and app_state.dirty_data (graphs and sparklines) list.
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pygame
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from models.reading_history import ReadingHistory
+from ui.views.sensors import dashboard_view, sensor_view
+
+HUMIDITY = config.SENSOR_HUMIDITY
+PRESSURE = config.SENSOR_PRESSURE
+
+
+def _fonts():
+    pygame.font.init()
+    font = pygame.font.Font(None, 20)
+    return {"large": font, "medium": font, "small": font, "tiny": font}
+
+
+def _app_state(current_sensor=HUMIDITY, dirty=(), text=(), data=()):
+    """dirty: sensors with both new text and a new sample."""
+    return SimpleNamespace(current_sensor=current_sensor, is_frozen=False,
+                           dirty_text=set(dirty) | set(text), dirty_data=set(dirty) | set(data))
+
+
+def _values(text):
+    return {key: {"text": text, "unit": "", "note": "", "value": None} for key in (HUMIDITY, PRESSURE)}
+
+
+def _history():
+    return ReadingHistory([HUMIDITY, PRESSURE], history_size=4, tiers=())
+
+
+def test_sensor_view_draws_everything_only_for_a_new_sensor_or_on_enter(monkeypatch):
+    view = sensor_view.SensorView()
+    screen = pygame.Surface((320, 240))
+    fonts, history = _fonts(), _history()
+    drawn = []
+    draw = sensor_view.draw_sensor_view
+    monkeypatch.setattr(sensor_view, "draw_sensor_view", lambda *args, **kwargs: drawn.append(args[2][HUMIDITY]["text"]) or draw(*args, **kwargs))
+
+    view.render(screen, _app_state(), _values("1"), history, fonts, config, None)
+    view.render(screen, _app_state(dirty=[PRESSURE]), _values("2"), history, fonts, config, None)
+    assert drawn == ["1"]
+    view.render(screen, _app_state(dirty=[HUMIDITY]), _values("3"), history, fonts, config, None)
+    assert drawn == ["1"]  # Only the changed areas
+    view.render(screen, _app_state(current_sensor=PRESSURE), _values("4"), history, fonts, config, None)
+    assert drawn == ["1", "4"]
+    view.on_enter(_app_state())
+    view.render(screen, _app_state(current_sensor=PRESSURE), _values("5"), history, fonts, config, None)
+    assert drawn == ["1", "4", "5"]
+
+
+def test_sensor_view_redraws_the_graph_only_for_new_samples(monkeypatch):
+    view = sensor_view.SensorView()
+    screen = pygame.Surface((320, 240))
+    fonts, history = _fonts(), _history()
+    graphs, texts = [], []
+    draw_graph, draw_text = sensor_view._draw_sensor_graph, sensor_view._draw_sensor_text
+    monkeypatch.setattr(sensor_view, "_draw_sensor_graph", lambda *args: graphs.append(args[2][HUMIDITY]["text"]) or draw_graph(*args))
+    monkeypatch.setattr(sensor_view, "_draw_sensor_text", lambda *args: texts.append(args[3][HUMIDITY]["text"]) or draw_text(*args))
+
+    view.render(screen, _app_state(), _values("1"), history, fonts, config, None)
+    del graphs[:], texts[:]
+    # Humidity's bar spans the note row, so a text change far from it is needed to skip the graph
+    monkeypatch.setattr(sensor_view, "_graph_area", lambda layout, kind: pygame.Rect(0, 200, 320, 40))
+    view.render(screen, _app_state(text=[HUMIDITY]), _values("2"), history, fonts, config, None)
+    assert (texts, graphs) == (["2"], [])
+    view.render(screen, _app_state(data=[HUMIDITY]), _values("3"), history, fonts, config, None)
+    assert (texts, graphs) == (["2", "3"], ["3"])
+
+
+def test_sensor_view_partial_redraw_matches_a_full_drawing():
+    view = sensor_view.SensorView()
+    screen = pygame.Surface((320, 240))
+    fonts, history = _fonts(), _history()
+    view.render(screen, _app_state(), _values("1"), history, fonts, config, None)
+    history.add_reading(HUMIDITY, 40.0, timestamp=1.0)
+    values = _values("2")
+    values[HUMIDITY]["note"] = "Rising"
+    view.render(screen, _app_state(dirty=[HUMIDITY]), values, history, fonts, config, None)
+
+    expected = pygame.Surface((320, 240))
+    sensor_view.draw_sensor_view(expected, _app_state(), values, history, fonts, config, None, animate=False)
+    assert pygame.image.tobytes(view._static, "RGB") == pygame.image.tobytes(expected, "RGB")
+
+
+def test_dashboard_redraws_dirty_panels_and_everything_on_enter(monkeypatch):
+    view = dashboard_view.DashboardView([HUMIDITY, PRESSURE])
+    screen = pygame.Surface((320, 240))
+    fonts, history = _fonts(), _history()
+    drawn = []
+    monkeypatch.setattr(view, "_draw_panel", lambda panel, key, *args, **kwargs: drawn.append(key))
+
+    view.render(screen, _app_state(), _values("1"), history, fonts, config, None)
+    assert sorted(drawn) == [HUMIDITY, PRESSURE]
+    del drawn[:]
+    view.render(screen, _app_state(), _values("1"), history, fonts, config, None)
+    assert drawn == []
+    view.render(screen, _app_state(dirty=[PRESSURE]), _values("2"), history, fonts, config, None)
+    assert drawn == [PRESSURE]
+    del drawn[:]
+    view.on_enter(_app_state())
+    view.render(screen, _app_state(), _values("2"), history, fonts, config, None)
+    assert sorted(drawn) == [HUMIDITY, PRESSURE]
+
+
+def test_dashboard_keeps_deferred_marks_until_drawn(monkeypatch):
+    view = dashboard_view.DashboardView([HUMIDITY, PRESSURE])
+    screen = pygame.Surface((320, 240))
+    fonts, history = _fonts(), _history()
+    drawn = []
+    monkeypatch.setattr(view, "_draw_panel", lambda panel, key, *args, **kwargs: drawn.append(key))
+    monkeypatch.setattr(config, "DASHBOARD_REDRAW_BUDGET_MS", 0.0, raising=False)
+
+    view.render(screen, _app_state(), _values("1"), history, fonts, config, None)
+    view.render(screen, _app_state(), _values("1"), history, fonts, config, None)
+    del drawn[:]
+    # Zero budget: one panel per frame, the other stays pending
+    view.render(screen, _app_state(dirty=[HUMIDITY, PRESSURE]), _values("2"), history, fonts, config, None)
+    view.render(screen, _app_state(), _values("2"), history, fonts, config, None)
+    assert sorted(drawn) == [HUMIDITY, PRESSURE]
+
+
+def test_dashboard_redraws_only_the_changed_part_of_a_panel(monkeypatch):
+    view = dashboard_view.DashboardView([HUMIDITY, PRESSURE])
+    screen = pygame.Surface((320, 240))
+    fonts, history = _fonts(), _history()
+    sparklines = []
+    draw_sparkline = dashboard_view.draw_sparkline
+    monkeypatch.setattr(dashboard_view, "draw_sparkline", lambda surface, *args, **kwargs: sparklines.append(1) or draw_sparkline(surface, *args, **kwargs))
+
+    view.render(screen, _app_state(), _values("1"), history, fonts, config, None)
+    history.add_reading(HUMIDITY, 40.0, timestamp=1.0)
+    del sparklines[:]
+    view.render(screen, _app_state(text=[PRESSURE]), _values("2"), history, fonts, config, None)
+    assert sparklines == []
+    view.render(screen, _app_state(data=[HUMIDITY]), _values("2"), history, fonts, config, None)
+    assert sparklines == [1]
+
+    expected = dashboard_view.DashboardView([HUMIDITY, PRESSURE])
+    expected_screen = pygame.Surface((320, 240))
+    expected.render(expected_screen, _app_state(), _values("2"), history, fonts, config, None)
+    for key in (HUMIDITY, PRESSURE):
+        assert pygame.image.tobytes(view._panels[key].surface, "RGB") == pygame.image.tobytes(expected._panels[key].surface, "RGB")
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared text cache: keying, LRU eviction and the per-glyph atlases used for
+frequently changing values.
+"""
+
+import os
+import sys
+
+import pygame
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import text_cache
+from utils.text_cache import GlyphAtlas, TextCache
+
+WHITE = (255, 255, 255)
+
+
+@pytest.fixture
+def font():
+    pygame.font.init()
+    return pygame.font.Font(None, 24)
+
+
+def test_render_reuses_surfaces_for_equal_keys(font):
+    cache = TextCache()
+    surface = cache.render(font, "Temp", WHITE)
+    assert cache.render(font, "Temp", (255, 255, 255, 255)) is surface
+    assert cache.render(font, "Temp", pygame.Color("white")) is surface
+    assert len(cache) == 1
+
+
+def test_render_keys_on_color_antialias_and_background(font):
+    cache = TextCache()
+    surfaces = {
+        id(cache.render(font, "Temp", WHITE)),
+        id(cache.render(font, "Temp", (255, 0, 0))),
+        id(cache.render(font, "Temp", WHITE, antialias=False)),
+        id(cache.render(font, "Temp", WHITE, background=(0, 0, 0))),
+    }
+    assert len(surfaces) == 4
+    assert len(cache) == 4
+
+
+def test_render_evicts_least_recently_used(font):
+    cache = TextCache(max_entries=2)
+    first = cache.render(font, "a", WHITE)
+    cache.render(font, "b", WHITE)
+    assert cache.render(font, "a", WHITE) is first  # "a" is now the most recent
+    cache.render(font, "c", WHITE)
+    assert len(cache) == 2
+    assert cache.render(font, "a", WHITE) is first
+    assert cache._entries.get((font, "b", (255, 255, 255, 255), True, None)) is None
+
+
+def test_atlas_is_shared_per_font_color_and_bounded(font, monkeypatch):
+    monkeypatch.setattr(text_cache, "MAX_ATLASES", 2)
+    cache = TextCache()
+    atlas = cache.atlas(font, WHITE)
+    assert cache.atlas(font, (255, 255, 255, 255)) is atlas
+    assert cache.atlas(font, WHITE, antialias=False) is not atlas
+    cache.atlas(font, (1, 2, 3))
+    assert len(cache._atlases) == 2
+    assert cache.atlas(font, WHITE) is not atlas  # Evicted and created again
+
+
+def test_atlas_size_matches_sum_of_glyph_advances(font):
+    atlas = GlyphAtlas(font, WHITE)
+    text = "12.5 %"
+    width, height = atlas.size(text)
+    assert width == sum(font.size(char)[0] for char in text)
+    assert height == font.get_height()
+
+
+def test_atlas_grows_and_keeps_earlier_glyphs(font):
+    atlas = GlyphAtlas(font, WHITE)
+    before = atlas._surface.get_width()
+    first_area = pygame.Rect(atlas._glyph("0"))
+    first_pixels = pygame.image.tobytes(atlas._surface.subsurface(first_area), "RGBA")
+    atlas.size("0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+    assert atlas._surface.get_width() > before
+    assert atlas._glyph("0") == first_area
+    assert pygame.image.tobytes(atlas._surface.subsurface(first_area), "RGBA") == first_pixels
+
+
+def test_blit_text_positions_like_get_rect_and_draws_glyphs(font):
+    cache = TextCache()
+    screen = pygame.Surface((200, 60))
+    rect = cache.draw_dynamic(screen, font, "42", WHITE, midright=(150, 30))
+    assert rect.midright == (150, 30)
+    assert rect.size == cache.atlas(font, WHITE).size("42")
+    lit = [screen.get_at((x, y))[0] for x in range(rect.left, rect.right) for y in range(rect.top, rect.bottom)]
+    assert max(lit) > 0
+    outside = [screen.get_at((x, 30))[0] for x in range(0, rect.left)]
+    assert max(outside) == 0
+
+
+def test_clear_drops_surfaces_and_atlases(font):
+    cache = TextCache()
+    cache.render(font, "a", WHITE)
+    atlas = cache.atlas(font, WHITE)
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.atlas(font, WHITE) is not atlas
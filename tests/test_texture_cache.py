@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tests for prepared model textures: power-of-two downscaling, the mipmap chain and the
+compressed on-disk cache.
+"""
+
+import os
+import sys
+
+import pygame
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ui.components.rendering import texture_cache
+from ui.components.rendering.texture_cache import load_prepared_texture, prepare_texture, texture_cache_path
+
+
+def _image(tmp_path, size=(8, 4), color=(200, 100, 50), name="skin.png"):
+    surface = pygame.Surface(size)
+    surface.fill(color)
+    surface.fill((0, 0, 0), (0, 0, size[0] // 2, size[1]))
+    path = tmp_path / name
+    pygame.image.save(surface, str(path))
+    return str(path)
+
+
+def test_prepare_builds_power_of_two_mipmaps_down_to_one_pixel():
+    surface = pygame.Surface((100, 20))
+    surface.fill((10, 20, 30))
+    texture = prepare_texture(surface, 64)
+    assert [(width, height) for width, height, _data in texture.levels] == [
+        (64, 16), (32, 8), (16, 4), (8, 2), (4, 1), (2, 1), (1, 1)]
+    assert all(len(data) == width * height * 3 for width, height, data in texture.levels)
+    assert texture.nbytes == sum(len(data) for _width, _height, data in texture.levels)
+
+
+def test_prepare_keeps_row_order_and_box_filters_levels():
+    surface = pygame.Surface((2, 2))
+    surface.fill((255, 0, 0), (0, 0, 2, 1))  # Top row red
+    surface.fill((0, 0, 255), (0, 1, 2, 1))
+    texture = prepare_texture(surface, 16)
+    assert texture.levels[0][2] == bytes((255, 0, 0) * 2 + (0, 0, 255) * 2)
+    assert texture.levels[1][2] == bytes((128, 0, 128))
+
+
+def test_uniform_texture_stays_uniform_down_the_chain():
+    surface = pygame.Surface((8, 2))
+    surface.fill((10, 20, 30))
+    texture = prepare_texture(surface, 8)
+    assert all(data == bytes((10, 20, 30)) * (width * height) for width, height, data in texture.levels)
+
+
+def test_prepare_converts_paletted_surfaces_to_rgb():
+    surface = pygame.Surface((4, 4), 0, 8)
+    surface.set_palette([(0, 255, 0)] * 256)
+    texture = prepare_texture(surface, 4)
+    assert texture.levels[0][2] == bytes((0, 255, 0) * 16)
+
+
+def test_cache_path_includes_the_size_limit():
+    assert texture_cache_path("models/skin.png", 256) == "models/skin.png.256.tex"
+
+
+def test_cache_round_trip(tmp_path, monkeypatch):
+    image_path = _image(tmp_path)
+    built = load_prepared_texture(image_path, 4)
+    assert os.path.exists(texture_cache_path(image_path, 4))
+
+    monkeypatch.setattr(texture_cache, "prepare_texture", lambda surface, max_size: pytest.fail("cache not used"))
+    assert load_prepared_texture(image_path, 4).levels == built.levels
+
+
+def test_cache_is_rebuilt_for_another_size_limit_or_a_changed_image(tmp_path):
+    image_path = _image(tmp_path)
+    load_prepared_texture(image_path, 8)
+    # Another limit has its own file and is not answered from the 8 px one
+    assert load_prepared_texture(image_path, 2).width == 2
+    assert os.path.exists(texture_cache_path(image_path, 2))
+
+    _image(tmp_path, color=(0, 0, 255))
+    os.utime(image_path, ns=(0, 1_000_000_000))
+    assert load_prepared_texture(image_path, 8).levels[0][2][-3:] == bytes((0, 0, 255))
+
+
+def test_unreadable_cache_is_ignored_and_rewritten(tmp_path):
+    image_path = _image(tmp_path)
+    cache_path = texture_cache_path(image_path, 8)
+    expected = load_prepared_texture(image_path, 8, use_cache=False)
+    assert not os.path.exists(cache_path)
+    with open(cache_path, "wb") as file:
+        file.write(texture_cache._MAGIC + b"\xff\xff")
+    assert load_prepared_texture(image_path, 8).levels == expected.levels
+    assert texture_cache._read_cache(cache_path, {"size": os.path.getsize(image_path),
+                                                  "mtime_ns": os.stat(image_path).st_mtime_ns}, 8) is not None
+    assert [name for name in os.listdir(tmp_path) if name.endswith(".tmp")] == []
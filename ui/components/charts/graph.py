@@ -1,28 +1,51 @@
 # --- ui/components/graph.py ---
 # Reusable graphing component
 
+import collections
 import pygame
 import logging
+import numpy as np
+
+from utils.animation_layers import COLORKEY
+from utils.asset_cache import get_asset_cache
 
 # No direct config import needed here if config_module is always passed
 # import config # This would be the global config
 
 logger = logging.getLogger(__name__)
 
-def draw_graph(screen, history, rect, color, min_val=None, max_val=None, sensor_name="Data", config_module=None, ui_scaler=None):
+MAX_CACHED_PLOTS = 8  # Finished plots kept per (rect, sensor) so unchanged data is one blit
+_plot_cache = collections.OrderedDict()  # (rect, sensor_name) -> (state, series values, surface)
+
+# Graphs are drawn on rect-sized surfaces. Coordinates are computed in screen space exactly as
+# when drawing on the screen and then shifted by the rect origin; subtracting an integer from
+# these floats is exact, so the pixels match drawing in place.
+
+def draw_graph(screen, history, rect, color, min_val=None, max_val=None, sensor_name="Data", config_module=None, ui_scaler=None, value_range=None, overlays=None):
     """
     Draws a time-series line graph for the given history.
 
+    The border, grid and axes come from a cached background surface, point coordinates
+    are computed with NumPy and the points are blitted from one dot stamp. The finished
+    plot is kept and re-blitted as long as the data and scale are unchanged (between
+    sensor readings), so a frame without a new sample costs one blit.
+
     Args:
         screen (pygame.Surface): The surface to draw on.
-        history (list): List of numerical data points (or None for no data).
+        history (list or numpy.ndarray): Data points oldest → newest; None or NaN for no data.
+            Pass ReadingHistory.get_view() to avoid building a list every frame.
         rect (pygame.Rect): The rectangle where the graph should be drawn.
         color (tuple): The color of the graph line and points.
         min_val (float, optional): Minimum value for the Y-axis. Auto-scales if None.
         max_val (float, optional): Maximum value for the Y-axis. Auto-scales if None.
-        sensor_name (str): Name of the sensor/data, used for logging.
+        sensor_name (str): Name of the sensor/data, used for logging and to key the cached plot.
         config_module (module): The main configuration module. This is now MANDATORY.
         ui_scaler (UIScaler, optional): The UI scaler for scaling values.
+        value_range (tuple, optional): Precomputed (min, max) of the valid data (e.g.
+            ReadingHistory.get_range()); skips the scan over history when auto-scaling.
+        overlays (list, optional): Extra (history, color, value_range) series drawn as lines on
+            the same axes; value_range may be None. Auto-scaling covers all series, and only
+            series without a precomputed range are scanned.
     """
     if not config_module:
         logger.error(f"Graph for '{sensor_name}' cannot be drawn: config_module is mandatory but was not provided.")
@@ -36,6 +59,7 @@ def draw_graph(screen, history, rect, color, min_val=None, max_val=None, sensor_
     color_grid = config_module.Theme.GRAPH_GRID
     color_border = config_module.Theme.GRAPH_BORDER
     color_axis = config_module.Theme.GRAPH_AXIS # New theme color for axes
+    color_background = config_module.Theme.BACKGROUND
     
     # Use UIScaler for responsive dimensions if available
     if ui_scaler:
@@ -50,26 +74,27 @@ def draw_graph(screen, history, rect, color, min_val=None, max_val=None, sensor_
         point_size = config_module.GRAPH_POINT_SIZE
         line_width = config_module.GRAPH_LINE_WIDTH
 
-    # Filter out None values for min/max calculation and actual plotting
-    valid_history = [v for v in history if v is not None]
+    # NaN marks missing samples (None converts to NaN for plain lists)
+    values = np.asarray(history, dtype=np.float64)
+    series = [(values, color, value_range)]
+    series.extend((np.asarray(overlay_values, dtype=np.float64), overlay_color, overlay_range)
+                  for overlay_values, overlay_color, overlay_range in (overlays or ()))
+    value_range = _combined_range(series)
 
-    if not valid_history:
-        # logger.debug(f"No valid data to plot for {sensor_name}.")
-        # Draw empty graph area (border and grid)
-        pygame.draw.rect(screen, config_module.Theme.BACKGROUND, rect) # Clear area
-        pygame.draw.rect(screen, color_border, rect, 1)
-        # Draw grid lines even if no data
-        num_grid_lines = 4 # Horizontal grid lines
-        spacing_y = rect.height / (num_grid_lines + 1)
-        for i in range(1, num_grid_lines + 1):
-            y = rect.top + i * spacing_y
-            pygame.draw.line(screen, color_grid, (rect.left, y), (rect.right, y), 1)
-        # No data points to draw, so return early
+    # Inner plot area: inset so line/points don't sit on border (improves readability)
+    inset_x = ui_scaler.scale(4) if ui_scaler else 4
+    inset_y = ui_scaler.scale(4) if ui_scaler else 4
+
+    rect = pygame.Rect(rect)
+    if value_range is None:
+        # No valid data: empty graph area (border and grid only)
+        background = _get_background(rect, (color_background, color_border, color_grid, color_axis), None, 0)
+        screen.blit(background, rect)
         return
 
     # Auto-scaling if min_val or max_val is not provided
-    auto_min_val = min(valid_history) if min_val is None else min_val
-    auto_max_val = max(valid_history) if max_val is None else max_val
+    auto_min_val = value_range[0] if min_val is None else min_val
+    auto_max_val = value_range[1] if max_val is None else max_val
 
     # Handle case where all values are the same or min/max are equal
     if auto_min_val == auto_max_val:
@@ -88,75 +113,222 @@ def draw_graph(screen, history, rect, color, min_val=None, max_val=None, sensor_
     # Final min/max for y-axis
     y_min = auto_min_val
     y_max = auto_max_val
-    y_range = y_max - y_min
-    if y_range == 0: y_range = 1 # Avoid division by zero
 
-    # Inner plot area: inset so line/points don't sit on border (improves readability)
-    inset_x = ui_scaler.scale(4) if ui_scaler else 4
-    inset_y = ui_scaler.scale(4) if ui_scaler else 4
     plot_rect = pygame.Rect(
         rect.left + inset_x,
         rect.top + inset_y,
         max(1, rect.width - 2 * inset_x),
         max(1, rect.height - 2 * inset_y)
     )
+    # Time markers are only drawn once there is a line (more than one sample)
+    time_markers = config_module.GRAPH_HISTORY_SIZE if len(values) > 1 else 0
+    colors = (color_background, color_border, color_grid, color_axis)
+    radius = max(2, int(point_size))
 
-    num_points = len(history)
-    x_spacing = plot_rect.width / max(1, num_points - 1) if num_points > 1 else plot_rect.width
+    # Between samples the data (and so the whole graph) is unchanged: reuse the last plot
+    cache_key = (tuple(rect), sensor_name)
+    state = (colors, tuple(plot_rect), time_markers, y_min, y_max, line_width, radius,
+             tuple(tuple(pygame.Color(series_color)) for _values, series_color, _range in series))
+    entry = _plot_cache.get(cache_key)
+    if entry is not None and entry[0] == state and len(entry[1]) == len(series) and all(
+            np.array_equal(old, new, equal_nan=True) for old, (new, _color, _range) in zip(entry[1], series)):
+        _plot_cache.move_to_end(cache_key)
+        screen.blit(entry[2], rect)
+        return y_min, y_max
+
+    if entry is not None and entry[2].get_size() == rect.size:
+        plot_surface = entry[2]
+    else:
+        plot_surface = pygame.Surface(rect.size)
+        if pygame.display.get_surface() is not None:
+            plot_surface = plot_surface.convert()
+    plot_surface.blit(_get_background(rect, colors, plot_rect, time_markers), (0, 0))
+    # Overlays first and without point dots, so the primary series stays on top and readable
+    for overlay_values, overlay_color, _range in series[1:]:
+        _plot_series(plot_surface, rect.topleft, overlay_values, plot_rect, y_min, y_max, overlay_color, line_width, 0)
+    _plot_series(plot_surface, rect.topleft, values, plot_rect, y_min, y_max, color, line_width, radius)
 
-    # --- Drawing ---
-    pygame.draw.rect(screen, config_module.Theme.BACKGROUND, rect)
-    pygame.draw.rect(screen, color_border, rect, 1)
+    _plot_cache[cache_key] = (state, [series_values.copy() for series_values, _color, _range in series], plot_surface)
+    _plot_cache.move_to_end(cache_key)
+    if len(_plot_cache) > MAX_CACHED_PLOTS:
+        _plot_cache.popitem(last=False)
+    screen.blit(plot_surface, rect)
+
+    # logger.debug(f"Drew graph for {sensor_name}. Range: {y_min:.2f}-{y_max:.2f}")
+
+    return y_min, y_max  # Return the min/max values used for the graph
+
+
+def draw_sparkline(surface, history, rect, color, min_val=None, max_val=None, value_range=None, line_width=1):
+    """
+    Draws a bare line of the history (no border, grid, axes or point dots) into rect.
+
+    Meant for small multiples such as dashboard panels, where the caller caches the
+    surface it draws on. Uses the same scaling and column decimation as draw_graph.
+
+    Args:
+        surface (pygame.Surface): The surface to draw on.
+        history (list or numpy.ndarray): Data points oldest → newest; None or NaN for no data.
+        rect (pygame.Rect): Area of surface the line is fitted into.
+        color (tuple): Line color.
+        min_val (float, optional): Bottom of the Y range. Auto-scales if None.
+        max_val (float, optional): Top of the Y range. Auto-scales if None.
+        value_range (tuple, optional): Precomputed (min, max) of the valid data.
+        line_width (int): Line width in pixels.
+
+    Returns:
+        bool: True if anything was drawn (False when there is no valid data).
+    """
+    values = np.asarray(history, dtype=np.float64)
+    if value_range is None:
+        value_range = _value_range(values)
+    rect = pygame.Rect(rect)
+    if value_range is None or rect.width < 2 or rect.height < 2:
+        return False
+
+    y_min = value_range[0] if min_val is None else min_val
+    y_max = value_range[1] if max_val is None else max_val
+    if y_min == y_max:
+        y_min -= 0.5
+        y_max += 0.5
+    # Keep the line off the top and bottom edges (inclusive pixel range)
+    plot_rect = pygame.Rect(rect.left, rect.top, rect.width - 1, rect.height - 1)
+    _plot_series(surface, (0, 0), values, plot_rect, y_min, y_max, color, line_width, 0)
+    return True
+
+
+def _value_range(values):
+    """(min, max) of the valid (non-NaN) samples, or None if there are none."""
+    valid_values = values[~np.isnan(values)]
+    if not valid_values.size:
+        return None
+    return float(valid_values.min()), float(valid_values.max())
+
+
+def _combined_range(series):
+    """(min, max) over (values, color, value_range) series; only series without a value_range are scanned."""
+    low = high = None
+    for values, _color, value_range in series:
+        if value_range is None:
+            value_range = _value_range(values)
+        if value_range:
+            low = value_range[0] if low is None else min(low, value_range[0])
+            high = value_range[1] if high is None else max(high, value_range[1])
+    return None if low is None else (low, high)
+
+
+def _get_background(rect, colors, plot_rect, time_markers):
+    """
+    Border, grid, time markers and axes for a graph at rect, drawn once and cached.
+
+    plot_rect None gives the empty-graph look (grid across the full rect, no axes).
+    """
+    key = ("graph_background", tuple(rect), colors, tuple(plot_rect) if plot_rect else None, time_markers)
+    return get_asset_cache().get_or_create(key, lambda: _draw_background(rect, colors, plot_rect, time_markers))
+
+
+def _draw_background(rect, colors, plot_rect, time_markers):
+    color_background, color_border, color_grid, color_axis = colors
+    surface = pygame.Surface(rect.size)
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert()
+    ox, oy = rect.topleft
+
+    def line(color, start, end):
+        pygame.draw.line(surface, color, (start[0] - ox, start[1] - oy), (end[0] - ox, end[1] - oy), 1)
+
+    surface.fill(color_background)
+    pygame.draw.rect(surface, color_border, surface.get_rect(), 1)
 
-    # Grid and axes use plot_rect so they align with the data
     num_grid_lines_h = 4
+    if plot_rect is None:
+        # Draw grid lines even if no data
+        spacing_y = rect.height / (num_grid_lines_h + 1)
+        for i in range(1, num_grid_lines_h + 1):
+            y = rect.top + i * spacing_y
+            line(color_grid, (rect.left, y), (rect.right, y))
+        return surface
+
+    # Grid and axes use plot_rect so they align with the data
     spacing_y = plot_rect.height / (num_grid_lines_h + 1)
     for i in range(1, num_grid_lines_h + 1):
         y = plot_rect.top + i * spacing_y
-        pygame.draw.line(screen, color_grid, (plot_rect.left, y), (plot_rect.right, y), 1)
-
-    history_size = config_module.GRAPH_HISTORY_SIZE
-    if history_size <= 10:
-        time_interval = 2
-    elif history_size <= 30:
-        time_interval = 5
-    elif history_size <= 60:
-        time_interval = 10
-    else:
-        time_interval = 15
+        line(color_grid, (plot_rect.left, y), (plot_rect.right, y))
+
+    history_size = time_markers
+    if history_size:
+        if history_size <= 10:
+            time_interval = 2
+        elif history_size <= 30:
+            time_interval = 5
+        elif history_size <= 60:
+            time_interval = 10
+        else:
+            time_interval = 15
 
-    num_time_markers = history_size // time_interval
-    if num_time_markers > 0 and num_points > 1:
+        num_time_markers = history_size // time_interval
         for i in range(1, num_time_markers + 1):
             time_position = i * time_interval
             x_ratio = time_position / history_size
             x = plot_rect.left + x_ratio * plot_rect.width
             if x < plot_rect.right:
-                pygame.draw.line(screen, color_grid, (x, plot_rect.top), (x, plot_rect.bottom), 1)
+                line(color_grid, (x, plot_rect.top), (x, plot_rect.bottom))
 
-    pygame.draw.line(screen, color_axis, (plot_rect.left, plot_rect.top), (plot_rect.left, plot_rect.bottom), 1)
-    pygame.draw.line(screen, color_axis, (plot_rect.left, plot_rect.bottom), (plot_rect.right, plot_rect.bottom), 1)
+    line(color_axis, (plot_rect.left, plot_rect.top), (plot_rect.left, plot_rect.bottom))
+    line(color_axis, (plot_rect.left, plot_rect.bottom), (plot_rect.right, plot_rect.bottom))
+    return surface
+
+
+def _point_stamp(color, radius):
+    """Color-keyed surface with one data point dot, so points are blitted instead of drawn one by one."""
+    def draw_stamp():
+        stamp = pygame.Surface((2 * radius + 1, 2 * radius + 1))
+        stamp.fill(COLORKEY)
+        pygame.draw.circle(stamp, color, (radius, radius), radius)
+        stamp.set_colorkey(COLORKEY)
+        return stamp
+    return get_asset_cache().get_or_create(("graph_point", tuple(pygame.Color(color)), radius), draw_stamp)
+
+
+def _plot_series(surface, origin, values, plot_rect, y_min, y_max, color, line_width, radius):
+    """Line plus point dots for one series (surface is placed at origin on screen), coordinates computed with NumPy."""
+    y_range = y_max - y_min
+    if y_range == 0: y_range = 1 # Avoid division by zero
+    num_points = len(values)
+    x_spacing = plot_rect.width / max(1, num_points - 1) if num_points > 1 else plot_rect.width
 
     # Plot within plot_rect so line doesn't touch border
-    points_to_draw = []
-    for i, value in enumerate(history):
-        if value is None:
-            continue
-        x = plot_rect.left + i * x_spacing
-        clamped_value = max(y_min, min(y_max, value))
-        y = plot_rect.bottom - ((clamped_value - y_min) / y_range * plot_rect.height)
-        x = max(plot_rect.left, min(plot_rect.right, x))
-        y = max(plot_rect.top, min(plot_rect.bottom, y))
-        points_to_draw.append((x, y))
-
-    if len(points_to_draw) >= 2:
-        pygame.draw.lines(screen, color, False, points_to_draw, line_width)
+    indices = np.flatnonzero(~np.isnan(values))
+    xs = np.clip(plot_rect.left + indices * x_spacing, plot_rect.left, plot_rect.right)
+    clamped_values = np.clip(values[indices], y_min, y_max)
+    ys = np.clip(plot_rect.bottom - ((clamped_values - y_min) / y_range * plot_rect.height), plot_rect.top, plot_rect.bottom)
+
+    if len(xs) > 2 * plot_rect.width:
+        # More samples than pixel columns: keep each column's lowest and highest point, so
+        # the cost is bounded by the graph width and the envelope of the data is unchanged
+        xs, ys = _decimate_to_columns(xs, ys, plot_rect.left)
+    xs = xs - origin[0]
+    ys = ys - origin[1]
 
+    if len(xs) >= 2:
+        pygame.draw.lines(surface, color, False, np.column_stack((xs, ys)).tolist(), line_width)
+
+    if not radius:
+        return
     # Green dots at each data point (radius >= 2 so they stay visible when scaled)
-    radius = max(2, int(point_size))
-    for point_x, point_y in points_to_draw:
-        pygame.draw.circle(screen, color, (int(point_x), int(point_y)), radius)
+    stamp = _point_stamp(color, radius)
+    corners = np.column_stack((xs.astype(np.int64) - radius, ys.astype(np.int64) - radius)).tolist()
+    surface.blits([(stamp, corner) for corner in corners], doreturn=False)
 
-    # logger.debug(f"Drew graph for {sensor_name} with {len(valid_history)} points. Range: {y_min:.2f}-{y_max:.2f}")
 
-    return y_min, y_max  # Return the min/max values used for the graph 
\ No newline at end of file
+def _decimate_to_columns(xs, ys, left):
+    """Reduce points to the min-y and max-y point of every pixel column, in x order."""
+    columns = (xs - left).astype(np.int64)
+    # Points are in x order, so each column is a contiguous run
+    starts = np.flatnonzero(np.r_[True, columns[1:] != columns[:-1]])
+    low = np.minimum.reduceat(ys, starts)
+    high = np.maximum.reduceat(ys, starts)
+    column_x = xs[starts]
+    out_x = np.repeat(column_x, 2)
+    out_y = np.column_stack((low, high)).ravel()
+    return out_x, out_y
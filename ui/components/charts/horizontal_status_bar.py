@@ -5,6 +5,8 @@ import pygame
 import logging
 import time
 
+from utils.text_cache import get_text_cache
+
 logger = logging.getLogger(__name__)
 
 class HorizontalStatusBar:
@@ -117,8 +119,8 @@ class HorizontalStatusBar:
         current_time = time.time()
         
         # Draw label with improved styling
-        font_small = self.fonts.get('small', pygame.font.Font(None, self.config.FONT_SIZE_SMALL))
-        label_surface = font_small.render(self.label, True, self.config.Theme.FOREGROUND)
+        font_small = self.fonts.get('small') or pygame.font.Font(None, self.config.FONT_SIZE_SMALL)
+        label_surface = get_text_cache().render(font_small, self.label, self.config.Theme.FOREGROUND)
         
         # Center label vertically and position it properly
         label_rect = label_surface.get_rect(midleft=(self.rect.left + 6, self.rect.centery))
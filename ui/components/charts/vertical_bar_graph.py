@@ -3,6 +3,7 @@ import logging
 
 # Import the main config file (used by _load_font if kept, or by main app for font sizes)
 import config # app_config will be passed in for colors etc.
+from utils.text_cache import get_text_cache
 
 logger = logging.getLogger(__name__)
 
@@ -71,8 +72,9 @@ class VerticalBarGraph:
             raise ValueError("max_val must be greater than min_val")
         self.value_range = max_val - min_val
 
-        self.font_small = self.fonts.get('small', pygame.font.Font(None, self.config.FONT_SIZE_SMALL))
-        self.font_medium = self.fonts.get('medium', pygame.font.Font(None, self.config.FONT_SIZE_MEDIUM))
+        # The graph is rebuilt every frame: only create fallback fonts when one is actually missing
+        self.font_small = self.fonts.get('small') or pygame.font.Font(None, self.config.FONT_SIZE_SMALL)
+        self.font_medium = self.fonts.get('medium') or pygame.font.Font(None, self.config.FONT_SIZE_MEDIUM)
 
         self._calculate_layout()
 
@@ -316,12 +318,12 @@ class VerticalBarGraph:
             
             # Draw value label (right-aligned so longest label doesn't overlap unit)
             label_text = f"{tick_value:.0f}"
-            label_surface = self.font_small.render(label_text, True, self.config.Theme.WHITE)
+            label_surface = get_text_cache().render(self.font_small, label_text, self.config.Theme.WHITE)
             label_rect = label_surface.get_rect(centery=y, right=self.scale_line_x - self.label_offset_x)
             self.screen.blit(label_surface, label_rect)
 
         # Draw units once in reserved top/bottom bands (avoids overlap with tick values e.g. "1701" and "K")
-        units_surface = self.font_small.render(self.units, True, self.config.Theme.WHITE)
+        units_surface = get_text_cache().render(self.font_small, self.units, self.config.Theme.WHITE)
         pad = self.ui_scaler.margin("medium") if self.ui_scaler else 15
         top_band_center_y = self.scale_rect.top + pad + self.unit_band_height // 2
         bottom_band_center_y = self.scale_rect.bottom - pad - self.unit_band_height // 2
@@ -369,9 +371,8 @@ class VerticalBarGraph:
             
             if show_pointer_label:
                 temp_text = formatted_text if formatted_text else f"{current_value:.1f}"
-                temp_surface = self.font_medium.render(temp_text, True, self.config.Theme.WHITE)
-                temp_rect = temp_surface.get_rect(midleft=(pointer_base_x + arrow_width + 8, pointer_y))
-                self.screen.blit(temp_surface, temp_rect)
+                get_text_cache().draw_dynamic(self.screen, self.font_medium, temp_text, self.config.Theme.WHITE,
+                                              midleft=(pointer_base_x + arrow_width + 8, pointer_y))
 
         # Debug: Draw bounding box
         # pygame.draw.rect(self.screen, (0, 0, 255), self.rect, 1)
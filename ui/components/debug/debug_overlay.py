@@ -6,6 +6,8 @@ import time
 import logging
 from collections import deque
 
+from utils.text_cache import get_text_cache
+
 logger = logging.getLogger(__name__)
 
 class FPSTracker:
@@ -80,16 +82,19 @@ class InputTracker:
 class DebugOverlay:
     """Debug overlay component for displaying debug information."""
     
-    def __init__(self, screen_width, screen_height):
+    def __init__(self, screen_width, screen_height, system_info_manager=None):
         """
         Initialize debug overlay.
         
         Args:
             screen_width (int): Screen width
             screen_height (int): Screen height
+            system_info_manager (SystemInfoManager, optional): Source of the shared system
+                snapshot shown on the CPU/RAM line
         """
         self.screen_width = screen_width
         self.screen_height = screen_height
+        self.system_info_manager = system_info_manager
         self.ui_scaler = None
         self.fps_tracker = FPSTracker()
         self.input_tracker = InputTracker()
@@ -191,21 +196,44 @@ class DebugOverlay:
         line_spacing = self.line_height
 
         # FPS (first line)
+        # Numbers change every frame, so FPS and system lines are drawn from the glyph atlas
+        text_cache = get_text_cache()
         fps_text = f"FPS: {self.fps_tracker.get_fps():.1f}"
-        fps_surface = font.render(fps_text, True, config_module.Theme.ACCENT)
-        screen.blit(fps_surface, (self.overlay_x, y_offset))
+        text_cache.draw_dynamic(screen, font, fps_text, config_module.Theme.ACCENT, topleft=(self.overlay_x, y_offset))
         y_offset += line_spacing
 
+        # CPU / temperature / RAM from the shared system snapshot (no extra psutil calls)
+        system_text = self._format_system_snapshot()
+        if system_text:
+            text_cache.draw_dynamic(screen, font, system_text, config_module.Theme.ACCENT, topleft=(self.overlay_x, y_offset))
+            y_offset += line_spacing
+
         # Recent input events (newest last, show last 2 for small Pi screen)
         recent_events = self.input_tracker.get_recent_events()
         events_to_show = recent_events[-2:] if len(recent_events) > 2 else recent_events
         for ev in events_to_show:
             event_text = self._format_event(ev)
             if event_text:
-                event_surface = font.render(event_text, True, config_module.Theme.WARNING)
+                event_surface = text_cache.render(font, event_text, config_module.Theme.WARNING)
                 screen.blit(event_surface, (self.overlay_x, y_offset))
                 y_offset += line_spacing
 
+    def _format_system_snapshot(self):
+        """One-line CPU/temp/RAM summary, or None without a snapshot."""
+        if self.system_info_manager is None:
+            return None
+        snapshot = self.system_info_manager.get_snapshot()
+        if snapshot is None:
+            return None
+        parts = []
+        if snapshot.cpu_percent is not None:
+            parts.append(f"CPU {snapshot.cpu_percent:.0f}%")
+        if snapshot.cpu_temp_c is not None:
+            parts.append(f"{snapshot.cpu_temp_c:.0f}°C")
+        if snapshot.mem_percent is not None:
+            parts.append(f"RAM {snapshot.mem_percent:.0f}%")
+        return " ".join(parts) or None
+
     def _format_event(self, ev):
         """Format a single input event for display. Handles key codes and joystick action strings."""
         if ev.get('key') is not None and ev['key'] != '':
@@ -4,6 +4,8 @@
 import pygame
 import logging
 
+from utils.text_cache import get_text_cache
+
 logger = logging.getLogger(__name__)
 
 class Header:
@@ -90,7 +92,7 @@ class Header:
             title_text += f" {status_text}"
         
         # Render title text
-        title_surface = font.render(title_text, True, text_color)
+        title_surface = get_text_cache().render(font, title_text, text_color)
         
         # Position title (within safe area when enabled)
         content_center_x = safe_rect.centerx if self.ui_scaler.safe_area_enabled else (screen_width // 2)
@@ -8,6 +8,7 @@ import math
 import config
 from data import sensors
 from utils.loc import count_python_lines
+from ui.frame_presenter import get_frame_presenter
 
 logger = logging.getLogger(__name__)
 
@@ -264,6 +265,7 @@ def draw_loading_screen(screen, fonts, logo_splash, logo_rect, progress, current
         screen.blit(lines_surface, lines_rect)
     
     pygame.display.flip()
+    get_frame_presenter().invalidate()  # Drawn outside update_display()
 
 class LoadingProgress:
     """Thread-safe loading progress tracker."""
@@ -1,14 +1,121 @@
 # --- ui/components/list_menu_base.py ---
 # Shared base component for scrollable list menu rendering (settings, schematics, etc.)
 
+import collections
 import pygame
 import logging
 import time
 import math
+
+from utils.animation_layers import get_animation_layers
+from utils.text_cache import get_text_cache
 logger = logging.getLogger(__name__)
 
+# Geometry of a list menu for one screen size and item style (see compute_list_menu_layout)
+ListMenuLayout = collections.namedtuple("ListMenuLayout", [
+    "screen_size", "item_style", "safe_rect", "header_rect", "content_y", "first_item_y",
+    "item_height_padding", "item_spacing", "item_left", "item_width",
+    "accent_width", "arrow_offset", "arrow_size", "arrow_right_max",
+    "scroll_indicator_offset", "down_indicator_offset", "ambient",
+])
+
+# Ambient effect geometry: None in ListMenuLayout.ambient when the screen is too small for them
+ListAmbientLayout = collections.namedtuple("ListAmbientLayout", [
+    "dot_radius", "dot_positions", "stream_areas", "stream_dot_spacing", "status_line",
+])
+
+# Parts of a drawn list menu that change with time (see draw_list_menu_animations). selected is
+# (item rect, item text) or None, button_items (index, rect) of the unselected button items,
+# ambient the ListAmbientLayout (None: not drawn); surface_rect is where the menu surface sits
+# on its top-level surface.
+ListMenuAnimations = collections.namedtuple("ListMenuAnimations", [
+    "layout", "title", "selected", "button_items", "ambient", "surface_rect",
+])
+
+
+def compute_list_menu_layout(screen_size, config_module, item_style="simple", ui_scaler=None):
+    """
+    Compute everything about a list menu's geometry that does not change between frames.
+
+    Depends only on the screen size, the item style and the scaler, so views compute it once
+    (View.compute_layout) and pass it to draw_scrollable_list_menu every frame.
+
+    Args:
+        screen_size (tuple): (width, height) of the surface the menu is drawn on
+        config_module (module): Configuration module
+        item_style (str): "simple", "button", or "detailed"
+        ui_scaler (UIScaler, optional): UI scaler for scaling calculations
+
+    Returns:
+        ListMenuLayout: Rects and offsets used by draw_scrollable_list_menu
+    """
+    scale = ui_scaler.scale if ui_scaler else (lambda value: value)
+    # Use UIScaler dimensions when available; respect safe area so content clears curved bezel
+    if ui_scaler:
+        layout = ui_scaler.layout
+        screen_width = layout.screen_width
+        screen_height = layout.screen_height
+        safe_rect = layout.safe_rect.copy()  # Whole screen when the safe area is disabled
+        header_top_margin = layout.header_top_margin
+        header_height = layout.header_height + ui_scaler.scale(20)
+        content_spacing = layout.margin_large
+        item_height_padding = layout.padding_medium
+        if ui_scaler.debug_mode:
+            logger.info(f"🎨 ListMenuBase: screen={screen_width}x{screen_height}, header={header_height}px, spacing={content_spacing}px")
+    else:
+        screen_width, screen_height = screen_size
+        safe_rect = pygame.Rect(0, 0, screen_width, screen_height)
+        header_top_margin = screen_height // 20
+        header_height = config_module.HEADER_HEIGHT + 20
+        content_spacing = screen_height // 10
+        item_height_padding = 20
+
+    # Header within safe area to avoid corner cutoff; content below it
+    header_rect = pygame.Rect(safe_rect.left, safe_rect.top + header_top_margin, safe_rect.width, header_height)
+    content_y = header_rect.bottom + content_spacing
+
+    # Arrow zone: reserve space so arrow stays inside safe area (smaller, LCARS-friendly chevron)
+    arrow_offset = scale(6)
+    arrow_size = scale(10)  # Slim chevron (was 16)
+    arrow_zone = arrow_offset + arrow_size
+    safe_right_margin = scale(4)  # Min gap from safe_rect.right
+    arrow_right_max = (safe_rect.right - safe_right_margin) if ui_scaler and ui_scaler.safe_area_enabled else (screen_width - safe_right_margin)
+
+    # Item rect: stay within safe area and reserve space for arrow on the right
+    if item_style == "button":
+        btn_half_w = scale(150)
+        item_left = safe_rect.centerx - btn_half_w
+        item_width = btn_half_w * 2
+    else:
+        max_item_w = scale(400)
+        side_inset = scale(60)
+        # Reserve arrow zone so arrow doesn't overlap bezel (safe area)
+        item_width = min(max_item_w, safe_rect.width - side_inset - arrow_zone)
+        item_left = safe_rect.centerx - (item_width // 2)
+
+    return ListMenuLayout(
+        screen_size=tuple(screen_size),
+        item_style=item_style,
+        safe_rect=safe_rect,
+        header_rect=header_rect,
+        content_y=content_y,
+        first_item_y=content_y + scale(20),
+        item_height_padding=item_height_padding,
+        item_spacing=scale(15),
+        item_left=item_left,
+        item_width=item_width,
+        accent_width=max(2, scale(3)),
+        arrow_offset=arrow_offset,
+        arrow_size=arrow_size,
+        arrow_right_max=arrow_right_max,
+        scroll_indicator_offset=scale(15),
+        down_indicator_offset=scale(10),
+        ambient=_compute_ambient_layout(screen_width, screen_height, content_y, ui_scaler, safe_rect),
+    )
+
+
 def draw_scrollable_list_menu(screen, title, menu_items, selected_index, fonts, config_module, 
-                             footer_hint="", item_style="simple", ui_scaler=None):
+                             footer_hint="", item_style="simple", ui_scaler=None, layout=None, animate=True):
     """
     Draw a scrollable list menu with consistent header/footer layout.
     
@@ -22,44 +129,25 @@ def draw_scrollable_list_menu(screen, title, menu_items, selected_index, fonts,
         footer_hint (str): Custom footer hint text (optional)
         item_style (str): "simple", "button", or "detailed"
         ui_scaler (UIScaler): UI scaler for scaling calculations
+        layout (ListMenuLayout, optional): Precomputed geometry; computed here when missing or
+            made for a different screen size or item style
+        animate (bool): False leaves out the animated parts (header, selected item, button
+            borders, ambient effects) so the drawing can be cached and
+            draw_list_menu_animations() drawn over it each frame
         
     Returns:
-        dict: Layout information including visible item range
+        dict: Layout information including visible item range, the ListMenuAnimations
+        ("animations") and a key that changes whenever the static drawing does ("static_key")
     """
     screen.fill(config_module.Theme.BACKGROUND)
-    # Use UIScaler dimensions when available; respect safe area so content clears curved bezel
-    if ui_scaler:
-        screen_width = ui_scaler.screen_width
-        screen_height = ui_scaler.screen_height
-        safe_rect = ui_scaler.get_safe_area_rect() if ui_scaler.safe_area_enabled else pygame.Rect(0, 0, screen_width, screen_height)
-        header_top_margin = ui_scaler.header_top_margin()
-        header_height = ui_scaler.header_height() + ui_scaler.scale(20)
-        content_spacing = ui_scaler.margin("large")
-        item_height_padding = ui_scaler.padding("medium")
-        if ui_scaler.debug_mode:
-            logger.info(f"🎨 ListMenuBase: screen={screen_width}x{screen_height}, header={header_height}px, spacing={content_spacing}px")
-    else:
-        screen_width = screen.get_width()
-        screen_height = screen.get_height()
-        safe_rect = pygame.Rect(0, 0, screen_width, screen_height)
-        header_top_margin = screen_height // 20
-        header_height = config_module.HEADER_HEIGHT + 20
-        content_spacing = screen_height // 10
-        item_height_padding = 20
+    if layout is None or layout.screen_size != screen.get_size() or layout.item_style != item_style:
+        layout = compute_list_menu_layout(screen.get_size(), config_module, item_style, ui_scaler)
+    safe_rect = layout.safe_rect
     current_time = time.time()
     
-    # === ANIMATED HEADER SECTION === (within safe area to avoid corner cutoff)
-    header_rect = pygame.Rect(safe_rect.left, safe_rect.top + header_top_margin, safe_rect.width, header_height)
-    pygame.draw.rect(screen, config_module.Theme.BACKGROUND, header_rect)
-    
-    # Draw animated header with glow effect
-    font_large = fonts['large']
-    _draw_animated_header(screen, title, font_large, header_rect, current_time, config_module)
-    
     # === CONTENT SECTION === (within safe area)
-    content_y = header_rect.bottom + content_spacing
-    bottom_margin = ui_scaler.scale(50) if ui_scaler else 50  # room for status line
-    available_height = safe_rect.bottom - content_y - bottom_margin
+    content_y = layout.content_y
+    item_height_padding = layout.item_height_padding
     
     # Calculate item dimensions
     font_medium = fonts['medium']
@@ -71,8 +159,13 @@ def draw_scrollable_list_menu(screen, title, menu_items, selected_index, fonts,
     
     # Handle scrolling
     total_items = len(menu_items)
+    surface_rect = pygame.Rect(screen.get_abs_offset(), screen.get_size())
     if total_items == 0:
-        return {"visible_start": 0, "visible_end": 0}
+        animations = ListMenuAnimations(layout, title, None, (), None, surface_rect)
+        if animate:
+            draw_list_menu_animations(screen, animations, fonts, current_time, config_module)
+        return {"visible_start": 0, "visible_end": 0, "animations": animations,
+                "static_key": (title, (), None, tuple(surface_rect))}
     
     # Calculate scroll offset to keep selected item visible
     scroll_offset = 0
@@ -85,16 +178,11 @@ def draw_scrollable_list_menu(screen, title, menu_items, selected_index, fonts,
     visible_start = scroll_offset
     visible_end = min(total_items, visible_start + max_visible_items)
     
-    # === RENDER ANIMATED ITEMS ===
-    # Arrow zone: reserve space so arrow stays inside safe area (smaller, LCARS-friendly chevron)
-    arrow_offset = ui_scaler.scale(6) if ui_scaler else 6
-    arrow_size = ui_scaler.scale(10) if ui_scaler else 10  # Slim chevron (was 16)
-    arrow_zone = arrow_offset + arrow_size
-    safe_right_margin = ui_scaler.scale(4) if ui_scaler else 4  # Min gap from safe_rect.right
-
-    content_top_offset = ui_scaler.scale(20) if ui_scaler else 20
-    item_spacing = ui_scaler.scale(15) if ui_scaler else 15
-    y_offset = content_y + content_top_offset
+    # === RENDER ITEMS === (the selected item and button borders are animated)
+    y_offset = layout.first_item_y
+    selected = None
+    button_items = []
+    item_texts = []
 
     for i in range(visible_start, visible_end):
         item = menu_items[i]
@@ -107,234 +195,245 @@ def draw_scrollable_list_menu(screen, title, menu_items, selected_index, fonts,
         else:
             item_text = str(item)
 
-        text_color = config_module.Theme.FOREGROUND
-        is_selected = (i == selected_index)
-
-        # Item rect: stay within safe area and reserve space for arrow on the right
-        if item_style == "button":
-            btn_half_w = ui_scaler.scale(150) if ui_scaler else 150
-            item_rect = pygame.Rect(
-                safe_rect.centerx - btn_half_w, y_offset - (item_height_padding // 2),
-                btn_half_w * 2, effective_item_height
-            )
+        item_texts.append(item_text)
+        item_rect = pygame.Rect(layout.item_left, y_offset - (item_height_padding // 2), layout.item_width, effective_item_height)
+        if i == selected_index:
+            selected = (item_rect, item_text)
         else:
-            max_item_w = ui_scaler.scale(400) if ui_scaler else 400
-            side_inset = ui_scaler.scale(60) if ui_scaler else 60
-            # Reserve arrow zone so arrow doesn't overlap bezel (safe area)
-            item_width = min(max_item_w, safe_rect.width - side_inset - arrow_zone)
-            item_rect = pygame.Rect(
-                safe_rect.centerx - (item_width // 2), y_offset - (item_height_padding // 2),
-                item_width, effective_item_height
-            )
-
-        # LCARS-style selected row: right-edge accent bar then slim chevron (both inside safe area)
-        if is_selected:
-            text_color = config_module.Theme.MENU_SELECTED_TEXT
-
-            # Right-edge accent bar (like menu_base left-edge accent)
-            accent_w = max(2, ui_scaler.scale(3) if ui_scaler else 3)
-            accent_rect = pygame.Rect(item_rect.right - accent_w, item_rect.top, accent_w, item_rect.height)
-            pulse = 0.6 + 0.4 * (0.5 + 0.5 * math.sin(current_time * 2.2))
-            accent_color = tuple(min(255, int(c * pulse)) for c in config_module.Theme.ACCENT)
-            pygame.draw.rect(screen, accent_color, accent_rect)
-
-            # Slim chevron arrow: clamp so it stays inside safe area
-            arrow_x = item_rect.right + arrow_offset
-            arrow_y = item_rect.centery
-            arrow_right_max = (safe_rect.right - safe_right_margin) if ui_scaler and ui_scaler.safe_area_enabled else (screen_width - safe_right_margin)
-            if arrow_x + arrow_size > arrow_right_max:
-                arrow_x = arrow_right_max - arrow_size
-            color_intensity = 0.6 + 0.4 * (0.5 + 0.5 * math.sin(current_time * 3.0))
-            arrow_color = tuple(min(255, int(c * color_intensity)) for c in config_module.Theme.ACCENT)
-            # Slim chevron (width arrow_size, height ~2/5 for LCARS look)
-            half_h = max(2, arrow_size * 2 // 5)
-            arrow_points = [
-                (arrow_x, arrow_y),
-                (arrow_x + arrow_size, arrow_y - half_h),
-                (arrow_x + arrow_size, arrow_y + half_h)
-            ]
-            pygame.draw.polygon(screen, arrow_color, arrow_points)
-        elif item_style == "button":
-            # Draw border for unselected button items with subtle animation
-            border_alpha = 0.6 + 0.2 * (0.5 + 0.5 * math.sin(current_time * 0.8 + i * 0.3))
-            border_color = tuple(min(255, int(c * border_alpha)) for c in config_module.Theme.GRAPH_BORDER)
-            pygame.draw.rect(screen, border_color, item_rect, 2, border_radius=config_module.Theme.CORNER_CURVE_RADIUS)
-        
-        # Render item text with strong breathing effect for selected item
-        if is_selected:
-            breathing_scale = 1.0 + 0.12 * (0.5 + 0.5 * math.sin(current_time * 2.5))
-            text_color = tuple(min(255, int(c * breathing_scale)) for c in text_color)
-        
-        item_surface = font_medium.render(item_text, True, text_color)
-        
-        if item_style == "button":
-            # Center text for button style
-            text_rect = item_surface.get_rect(center=item_rect.center)
-        else:
-            # Center text for simple style too
-            text_rect = item_surface.get_rect(center=item_rect.center)
-        
-        screen.blit(item_surface, text_rect)
-        y_offset += effective_item_height + item_spacing
+            if item_style == "button":
+                button_items.append((i, item_rect))
+            item_surface = get_text_cache().render(font_medium, item_text, config_module.Theme.FOREGROUND)
+            # Text is centered in the item for every style
+            screen.blit(item_surface, item_surface.get_rect(center=item_rect.center))
+        y_offset += effective_item_height + layout.item_spacing
     
     # === SCROLL INDICATORS ===
     if total_items > max_visible_items:
-        font_medium = fonts['medium']
-        
-        scroll_indicator_offset = ui_scaler.scale(15) if ui_scaler else 15
         if visible_start > 0:
             up_indicator = "↑"
-            up_surface = font_medium.render(up_indicator, True, config_module.Theme.ACCENT)
-            up_rect = up_surface.get_rect(center=(safe_rect.centerx, content_y - scroll_indicator_offset))
+            up_surface = get_text_cache().render(font_medium, up_indicator, config_module.Theme.ACCENT)
+            up_rect = up_surface.get_rect(center=(safe_rect.centerx, content_y - layout.scroll_indicator_offset))
             screen.blit(up_surface, up_rect)
         
         if visible_end < total_items:
             down_indicator = "↓"
-            down_surface = font_medium.render(down_indicator, True, config_module.Theme.ACCENT)
-            down_rect = down_surface.get_rect(center=(safe_rect.centerx, y_offset + ui_scaler.scale(10) if ui_scaler else 10))
+            down_surface = get_text_cache().render(font_medium, down_indicator, config_module.Theme.ACCENT)
+            down_rect = down_surface.get_rect(center=(safe_rect.centerx, y_offset + layout.down_indicator_offset))
             screen.blit(down_surface, down_rect)
     
-    # Draw ambient tricorder effects (respect safe area when enabled)
-    _draw_list_ambient_effects(screen, screen_width, screen_height, header_rect, content_y, current_time, config_module, ui_scaler, safe_rect)
+    animations = ListMenuAnimations(layout, title, selected, tuple(button_items), layout.ambient, surface_rect)
+    if animate:
+        draw_list_menu_animations(screen, animations, fonts, current_time, config_module)
     
     return {
         "visible_start": visible_start,
         "visible_end": visible_end,
         "total_items": total_items,
-        "scroll_offset": scroll_offset
+        "scroll_offset": scroll_offset,
+        "animations": animations,
+        "static_key": (title, tuple(item_texts), selected_index, visible_start, total_items, tuple(surface_rect)),
     }
 
+def draw_list_menu_animations(screen, animations, fonts, current_time, config_module):
+    """
+    Draw the animated parts of a list menu over its static drawing (draw_scrollable_list_menu
+    with animate=False): breathing header, selected item, button borders and ambient effects.
+
+    Returns:
+        list: Rects drawn, in screen's coordinates
+    """
+    layout = animations.layout
+    rects = [_draw_animated_header(screen, animations.title, fonts['large'], layout.header_rect, current_time, config_module)]
+
+    # Unselected buttons: border with subtle animation
+    for i, item_rect in animations.button_items:
+        border_alpha = 0.6 + 0.2 * (0.5 + 0.5 * math.sin(current_time * 0.8 + i * 0.3))
+        border_color = tuple(min(255, int(c * border_alpha)) for c in config_module.Theme.GRAPH_BORDER)
+        rects.append(pygame.draw.rect(screen, border_color, item_rect, 2, border_radius=config_module.Theme.CORNER_CURVE_RADIUS))
+
+    if animations.selected:
+        item_rect, item_text = animations.selected
+        # LCARS-style selected row: right-edge accent bar then slim chevron (both inside safe area)
+        accent_w = layout.accent_width
+        accent_rect = pygame.Rect(item_rect.right - accent_w, item_rect.top, accent_w, item_rect.height)
+        pulse = 0.6 + 0.4 * (0.5 + 0.5 * math.sin(current_time * 2.2))
+        accent_color = tuple(min(255, int(c * pulse)) for c in config_module.Theme.ACCENT)
+        rects.append(pygame.draw.rect(screen, accent_color, accent_rect))
+
+        # Slim chevron arrow: clamp so it stays inside safe area
+        arrow_size = layout.arrow_size
+        arrow_x = item_rect.right + layout.arrow_offset
+        arrow_y = item_rect.centery
+        if arrow_x + arrow_size > layout.arrow_right_max:
+            arrow_x = layout.arrow_right_max - arrow_size
+        color_intensity = 0.6 + 0.4 * (0.5 + 0.5 * math.sin(current_time * 3.0))
+        arrow_color = tuple(min(255, int(c * color_intensity)) for c in config_module.Theme.ACCENT)
+        # Slim chevron (width arrow_size, height ~2/5 for LCARS look)
+        half_h = max(2, arrow_size * 2 // 5)
+        arrow_points = [
+            (arrow_x, arrow_y),
+            (arrow_x + arrow_size, arrow_y - half_h),
+            (arrow_x + arrow_size, arrow_y + half_h)
+        ]
+        rects.append(pygame.draw.polygon(screen, arrow_color, arrow_points))
+
+        # Item text with strong breathing effect
+        breathing_scale = 1.0 + 0.12 * (0.5 + 0.5 * math.sin(current_time * 2.5))
+        breathing_scale = round(breathing_scale, 2)  # Few distinct colors so rendered labels stay cached
+        text_color = tuple(min(255, int(c * breathing_scale)) for c in config_module.Theme.MENU_SELECTED_TEXT)
+        item_surface = get_text_cache().render(fonts['medium'], item_text, text_color)
+        rects.append(screen.blit(item_surface, item_surface.get_rect(center=item_rect.center)))
+
+    # Draw ambient tricorder effects (respect safe area when enabled)
+    rects.extend(_draw_list_ambient_effects(screen, animations.ambient, current_time, config_module))
+    return [rect for rect in rects if rect]
+
 def _draw_animated_header(screen, title, font, header_rect, current_time, config_module):
-    """Draw animated header with more prominent pulsing effects."""
+    """Draw animated header with more prominent pulsing effects; returns the rect drawn."""
     # More prominent breathing effect
-    breathing_scale = 1.0 + 0.1 * (0.5 + 0.5 * math.sin(current_time * 1.5))
+    breathing_scale = round(1.0 + 0.1 * (0.5 + 0.5 * math.sin(current_time * 1.5)), 2)
     header_color = tuple(min(255, int(c * breathing_scale)) for c in config_module.Palette.VIKING_BLUE)
-    header_text = font.render(title, True, header_color)
+    header_text = get_text_cache().render(font, title, header_color)
     header_text_rect = header_text.get_rect(center=(header_rect.centerx, header_rect.centery))
-    screen.blit(header_text, header_text_rect)
+    return screen.blit(header_text, header_text_rect)
 
 
 
 
-def _draw_list_ambient_effects(screen, screen_width, screen_height, header_rect, content_y, current_time, config_module, ui_scaler=None, safe_rect=None):
-    """Draw ambient tricorder effects around the list menu. Respects safe_rect when provided (safe area enabled)."""
-    min_w = ui_scaler.scale(300) if ui_scaler else 300
-    min_h = ui_scaler.scale(200) if ui_scaler else 200
-    if screen_width < min_w or screen_height < min_h:
-        return
-    margin = ui_scaler.margin("small") if ui_scaler else 15
-    _draw_corner_status_dots(screen, screen_width, screen_height, current_time, config_module, ui_scaler, margin)
-    side_stream_breakpoint = ui_scaler.scale(400) if ui_scaler else 400
-    if screen_width > side_stream_breakpoint:
-        _draw_side_data_streams(screen, screen_width, screen_height, header_rect, content_y, current_time, config_module, ui_scaler, safe_rect)
-    _draw_bottom_status_line(screen, screen_width, screen_height, current_time, config_module, ui_scaler, safe_rect)
+def _compute_ambient_layout(screen_width, screen_height, content_y, ui_scaler=None, safe_rect=None):
+    """Positions of the ambient effects around the list menu (within safe_rect when the safe area is enabled)."""
+    scale = ui_scaler.scale if ui_scaler else (lambda value: value)
+    if screen_width < scale(300) or screen_height < scale(200):
+        return None
 
-def _draw_corner_status_dots(screen, screen_width, screen_height, current_time, config_module, ui_scaler=None, margin=15):
-    """Draw pulsing status dots in corners (within safe area when enabled)."""
-    dot_radius = ui_scaler.scale(6) if ui_scaler else 6
-    if ui_scaler:
-        margin = ui_scaler.margin("small")
-        if ui_scaler.safe_area_enabled:
-            sr = ui_scaler.get_safe_area_rect()
-            dot_positions = [
-                (sr.left + margin, sr.top + margin),
-                (sr.right - margin, sr.top + margin),
-                (sr.left + margin, sr.bottom - margin),
-                (sr.right - margin, sr.bottom - margin)
-            ]
-        else:
-            dot_positions = [
-                (margin, margin),
-                (screen_width - margin, margin),
-                (margin, screen_height - margin),
-                (screen_width - margin, screen_height - margin)
-            ]
+    # Pulsing status dots in the corners
+    margin = ui_scaler.layout.margin_small if ui_scaler else 15
+    if ui_scaler and ui_scaler.safe_area_enabled:
+        sr = ui_scaler.layout.safe_rect
+        dot_positions = (
+            (sr.left + margin, sr.top + margin),
+            (sr.right - margin, sr.top + margin),
+            (sr.left + margin, sr.bottom - margin),
+            (sr.right - margin, sr.bottom - margin)
+        )
     else:
-        dot_positions = [
+        dot_positions = (
             (margin, margin),
             (screen_width - margin, margin),
             (margin, screen_height - margin),
             (screen_width - margin, screen_height - margin)
-        ]
+        )
+
+    # Flowing data streams on the sides (wider screens only)
+    stream_areas = ()
+    if screen_width > scale(400):
+        inset = scale(5)
+        stream_w = scale(20)
+        bottom_inset = scale(50)
+        if safe_rect is not None:
+            content_bottom = min(screen_height - bottom_inset, safe_rect.bottom - inset)
+            stream_areas = (
+                pygame.Rect(safe_rect.left + inset, content_y, stream_w, content_bottom - content_y),
+                pygame.Rect(safe_rect.right - inset - stream_w, content_y, stream_w, content_bottom - content_y),
+            )
+        else:
+            stream_areas = (
+                pygame.Rect(inset, content_y, stream_w, screen_height - content_y - bottom_inset),
+                pygame.Rect(screen_width - inset - stream_w, content_y, stream_w, screen_height - content_y - bottom_inset),
+            )
+
+    # Status line at the bottom: (x, y, width, half width of the scan highlight)
+    bottom_inset = scale(30)
+    side_inset = ui_scaler.layout.margin_medium if ui_scaler else 20
+    if safe_rect is not None:
+        status_line = (safe_rect.left + side_inset, safe_rect.bottom - bottom_inset, safe_rect.width - side_inset * 2, scale(10))
+    else:
+        status_line = (side_inset, screen_height - bottom_inset, screen_width - side_inset * 2, scale(10))
+
+    return ListAmbientLayout(scale(6), dot_positions, stream_areas, scale(20), status_line)
+
+def _draw_list_ambient_effects(screen, ambient, current_time, config_module):
+    """Draw ambient tricorder effects around the list menu from its precomputed ListAmbientLayout; returns the rects drawn."""
+    if ambient is None:
+        return []
+    rects = _draw_corner_status_dots(screen, ambient.dot_positions, ambient.dot_radius, current_time, config_module)
+    for area in ambient.stream_areas:
+        rects.append(_draw_vertical_data_stream(screen, area, ambient.stream_dot_spacing, current_time))
+    rects.extend(_draw_bottom_status_line(screen, ambient.status_line, current_time))
+    return rects
+
+def _draw_corner_status_dots(screen, dot_positions, dot_radius, current_time, config_module):
+    """Draw pulsing status dots in corners (within safe area when enabled); returns the rects drawn."""
     colors = [
         config_module.Palette.GREEN,
         config_module.Palette.ENGINEERING_GOLD,
         config_module.Theme.ACCENT,
         config_module.Palette.VIKING_BLUE
     ]
+    layers = get_animation_layers()
+    period = 2 * math.pi / 2.5
+    rects = []
     for i, (pos, color) in enumerate(zip(dot_positions, colors)):
+        # Each dot is one pulsing layer; the per-dot phase offset becomes a time shift
         pulse_offset = i * 0.8
-        pulse_alpha = 0.4 + 0.6 * (0.5 + 0.5 * math.sin(current_time * 2.5 + pulse_offset))
-        dot_color = tuple(min(255, int(c * pulse_alpha)) for c in color)
-        pygame.draw.circle(screen, dot_color, pos, dot_radius)
-
-def _draw_side_data_streams(screen, screen_width, screen_height, header_rect, content_y, current_time, config_module, ui_scaler=None, safe_rect=None):
-    """Draw flowing data streams on the sides; stay inside safe_rect when provided."""
-    inset = ui_scaler.scale(5) if ui_scaler else 5
-    stream_w = ui_scaler.scale(20) if ui_scaler else 20
-    bottom_inset = ui_scaler.scale(50) if ui_scaler else 50
-    if safe_rect is not None:
-        content_bottom = min(screen_height - bottom_inset, safe_rect.bottom - inset)
-        left_area = pygame.Rect(safe_rect.left + inset, content_y, stream_w, content_bottom - content_y)
-        right_area = pygame.Rect(safe_rect.right - inset - stream_w, content_y, stream_w, content_bottom - content_y)
-    else:
-        left_area = pygame.Rect(inset, content_y, stream_w, screen_height - content_y - bottom_inset)
-        right_area = pygame.Rect(screen_width - inset - stream_w, content_y, stream_w, screen_height - content_y - bottom_inset)
-    _draw_vertical_data_stream(screen, left_area, current_time, config_module, "left", ui_scaler)
-    _draw_vertical_data_stream(screen, right_area, current_time, config_module, "right", ui_scaler)
+        bounds = pygame.Rect(pos[0] - dot_radius, pos[1] - dot_radius, 2 * dot_radius + 1, 2 * dot_radius + 1)
+
+        def draw_frame(surface, t, color=color):
+            pulse_alpha = 0.4 + 0.6 * (0.5 + 0.5 * math.sin(t * 2.5))
+            dot_color = tuple(min(255, int(c * pulse_alpha)) for c in color)
+            pygame.draw.circle(surface, dot_color, (dot_radius, dot_radius), dot_radius)
 
-def _draw_vertical_data_stream(screen, area, current_time, config_module, side, ui_scaler=None):
-    """Draw vertical flowing data stream."""
+        rects.append(layers.blit(screen, ("list_corner_dot", tuple(color), dot_radius), bounds, period,
+                                 current_time + pulse_offset / 2.5, draw_frame))
+    return rects
+
+def _draw_vertical_data_stream(screen, area, dot_spacing, current_time):
+    """Draw vertical flowing data stream; returns the rect drawn."""
     stream_speed = 2.0
-    dot_spacing = ui_scaler.scale(20) if ui_scaler else 20
     
     # Calculate number of dots that fit
     num_dots = max(1, area.height // dot_spacing)
-    
-    for i in range(num_dots):
-        dot_offset = i * 0.4
-        dot_progress = (current_time * stream_speed + dot_offset) % 2.0
-        
-        if dot_progress < 1.5:
-            dot_y = area.top + int((dot_progress / 1.5) * area.height)
-            dot_x = area.centerx
-            
-            # Calculate dot alpha and size
-            if dot_progress < 0.75:
-                alpha = dot_progress / 0.75
-                size = int(3 * (dot_progress / 0.75))
-            else:
-                alpha = (1.5 - dot_progress) / 0.75
-                size = int(3 * ((1.5 - dot_progress) / 0.75))
-            
-            if size > 0 and alpha > 0.1:
-                dot_color = (0, int(150 * alpha), int(50 * alpha))
-                pygame.draw.circle(screen, dot_color, (dot_x, dot_y), max(1, size))
-
-def _draw_bottom_status_line(screen, screen_width, screen_height, current_time, config_module, ui_scaler=None, safe_rect=None):
-    """Draw animated status line at bottom; within safe_rect when provided (clears curved bezel)."""
-    bottom_inset = ui_scaler.scale(30) if ui_scaler else 30
-    side_inset = ui_scaler.margin("medium") if ui_scaler else 20
-    if safe_rect is not None:
-        line_y = safe_rect.bottom - bottom_inset
-        line_x = safe_rect.left + side_inset
-        line_width = safe_rect.width - side_inset * 2
-    else:
-        line_y = screen_height - bottom_inset
-        line_x = side_inset
-        line_width = screen_width - side_inset * 2
+    # Layer is the column around area.centerx (dots are at most 3 px in radius)
+    bounds = pygame.Rect(area.centerx - 3, area.top - 3, 7, area.height + 7)
+
+    def draw_frame(surface, t):
+        for i in range(num_dots):
+            dot_offset = i * 0.4
+            dot_progress = (t * stream_speed + dot_offset) % 2.0
+
+            if dot_progress < 1.5:
+                dot_y = 3 + int((dot_progress / 1.5) * area.height)
+
+                # Calculate dot alpha and size
+                if dot_progress < 0.75:
+                    alpha = dot_progress / 0.75
+                    size = int(3 * (dot_progress / 0.75))
+                else:
+                    alpha = (1.5 - dot_progress) / 0.75
+                    size = int(3 * ((1.5 - dot_progress) / 0.75))
+
+                if size > 0 and alpha > 0.1:
+                    dot_color = (0, int(150 * alpha), int(50 * alpha))
+                    pygame.draw.circle(surface, dot_color, (3, dot_y), max(1, size))
+
+    return get_animation_layers().blit(screen, ("list_stream", num_dots, area.height), bounds,
+                                       2.0 / stream_speed, current_time, draw_frame)
+
+def _draw_bottom_status_line(screen, status_line, current_time):
+    """Draw animated status line at bottom; within the safe area when enabled (clears curved bezel). Returns the rects drawn."""
+    line_x, line_y, line_width, scan_half = status_line
     base_alpha = 0.3 + 0.2 * (0.5 + 0.5 * math.sin(current_time * 1.0))
     base_color = (0, int(60 * base_alpha), int(20 * base_alpha))
-    pygame.draw.line(screen, base_color, (line_x, line_y), (line_x + line_width, line_y), 1)
+    rects = [pygame.draw.line(screen, base_color, (line_x, line_y), (line_x + line_width, line_y), 1)]
     scan_progress = (current_time * 1.2) % 2.0
     if scan_progress < 1.0:
         scan_x = line_x + int(scan_progress * line_width)
-        scan_half = ui_scaler.scale(10) if ui_scaler else 10
         scan_alpha = 0.6 + 0.4 * (0.5 + 0.5 * math.sin(current_time * 4.0))
         scan_color = (0, int(150 * scan_alpha), int(60 * scan_alpha))
-        pygame.draw.line(screen, scan_color, (scan_x - scan_half, line_y), (scan_x + scan_half, line_y), 2)
+        rects.append(pygame.draw.line(screen, scan_color, (scan_x - scan_half, line_y), (scan_x + scan_half, line_y), 2))
+    return rects
 
-def draw_simple_list_menu(screen, title, menu_items, selected_index, fonts, config_module, footer_hint="", show_footer=False, ui_scaler=None):
+def draw_simple_list_menu(screen, title, menu_items, selected_index, fonts, config_module, footer_hint="", show_footer=False, ui_scaler=None, layout=None, animate=True):
     """
     Convenience function for simple list menus without scrolling complexity.
     
@@ -348,16 +447,18 @@ def draw_simple_list_menu(screen, title, menu_items, selected_index, fonts, conf
         footer_hint (str): Custom footer hint text (optional)
         show_footer (bool): Whether to show footer (default False for settings-style menus)
         ui_scaler (UIScaler, optional): UI scaling system for responsive design
+        layout (ListMenuLayout, optional): Precomputed geometry for "simple" items
+        animate (bool): False leaves out the animated parts (see draw_scrollable_list_menu)
         
     Returns:
         dict: Layout information
     """
     return draw_scrollable_list_menu(
         screen, title, menu_items, selected_index, fonts, config_module,
-        footer_hint=footer_hint if show_footer else None, item_style="simple", ui_scaler=ui_scaler
+        footer_hint=footer_hint if show_footer else None, item_style="simple", ui_scaler=ui_scaler, layout=layout, animate=animate
     )
 
-def draw_button_list_menu(screen, title, menu_items, selected_index, fonts, config_module, footer_hint="", ui_scaler=None):
+def draw_button_list_menu(screen, title, menu_items, selected_index, fonts, config_module, footer_hint="", ui_scaler=None, layout=None, animate=True):
     """
     Convenience function for button-style list menus.
     
@@ -370,11 +471,13 @@ def draw_button_list_menu(screen, title, menu_items, selected_index, fonts, conf
         config_module (module): Configuration module
         footer_hint (str): Custom footer hint text (optional)
         ui_scaler (UIScaler, optional): UI scaling system for responsive design
+        layout (ListMenuLayout, optional): Precomputed geometry for "button" items
+        animate (bool): False leaves out the animated parts (see draw_scrollable_list_menu)
         
     Returns:
         dict: Layout information
     """
     return draw_scrollable_list_menu(
         screen, title, menu_items, selected_index, fonts, config_module,
-        footer_hint=footer_hint, item_style="button", ui_scaler=ui_scaler
+        footer_hint=footer_hint, item_style="button", ui_scaler=ui_scaler, layout=layout, animate=animate
     ) 
\ No newline at end of file
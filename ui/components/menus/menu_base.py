@@ -6,6 +6,7 @@ import logging
 import time
 import math
 from config import CLASSIFIED_TEXT
+from utils.text_cache import get_text_cache
 
 logger = logging.getLogger(__name__)
 
@@ -223,7 +224,7 @@ def draw_menu_base_layout(screen, app_state, fonts, config_module, ui_scaler, ba
                 title_text = CLASSIFIED_TEXT
             else:
                 title_text = item.name # Use item.name
-            text_surface = font.render(title_text, True, config_module.Palette.BLACK) 
+            text_surface = get_text_cache().render(font, title_text, config_module.Palette.BLACK)
             # Use UIScaler for responsive text padding
             text_padding = ui_scaler.padding("medium")
             text_pos = (item_rect.left + text_padding, item_rect.centery - text_surface.get_height() // 2)
@@ -322,7 +323,7 @@ def _draw_exclamation_badge(screen, item_rect, config_module, fonts, ui_scaler=N
     badge_y = item_rect.top + inset
     badge_rect = pygame.Rect(badge_x, badge_y, badge_size, badge_size)
     pygame.draw.circle(screen, config_module.Theme.ALERT, badge_rect.center, max(1, badge_size // 2))
-    exclamation_surface = fonts['tiny'].render("!", True, config_module.Theme.WHITE)
+    exclamation_surface = get_text_cache().render(fonts['tiny'], "!", config_module.Theme.WHITE)
     exclamation_rect = exclamation_surface.get_rect(center=badge_rect.center)
     screen.blit(exclamation_surface, exclamation_rect)
 
@@ -372,13 +373,14 @@ def _draw_header_tricorder_effects(screen, header_rect, header_color, config_mod
         left_label = "UPDATE AVAILABLE"
     else:
         left_label = f"EARTH: {loc_text}"
-    left_surf = font_tiny.render(left_label, True, digit_color)
+    text_cache = get_text_cache()
+    left_surf = text_cache.render(font_tiny, left_label, digit_color)
     max_left_width = int(header_rect.width * 0.55)
     if not update_available and left_surf.get_width() > max_left_width and len(loc_text) > 3:
         # Shorten to fit (keep EARTH: prefix)
         for n in range(len(loc_text), 0, -1):
             trial = f"EARTH: {loc_text[:n]}…"
-            s = font_tiny.render(trial, True, digit_color)
+            s = text_cache.render(font_tiny, trial, digit_color)
             if s.get_width() <= max_left_width:
                 left_surf = s
                 break
@@ -394,14 +396,18 @@ def _draw_header_tricorder_effects(screen, header_rect, header_color, config_mod
         ip_str = public_ip if show_public else local_ip
     else:
         ip_str = local_ip
+    right_anchor = (header_rect.right - right_inset, header_rect.centery)
     if ip_str:
-        right_surf = font_tiny.render(ip_str, True, digit_color)
+        right_surf = text_cache.render(font_tiny, ip_str, digit_color)
+        right_rect = right_surf.get_rect(midright=right_anchor)
+        if right_rect.left >= header_rect.left:
+            screen.blit(right_surf, right_rect)
     else:
-        freq = int((t * 10) % 1000)
-        right_surf = font_tiny.render(f"{freq:03d}", True, digit_color)
-    right_rect = right_surf.get_rect(midright=(header_rect.right - right_inset, header_rect.centery))
-    if right_rect.left >= header_rect.left:
-        screen.blit(right_surf, right_rect)
+        # Counter changes every frame: draw from the glyph atlas instead of rendering a new surface
+        freq_text = f"{int((t * 10) % 1000):03d}"
+        atlas = text_cache.atlas(font_tiny, digit_color)
+        if right_anchor[0] - atlas.size(freq_text)[0] >= header_rect.left:
+            atlas.blit_text(screen, freq_text, midright=right_anchor)
 
 
 def _draw_update_indicator_header(screen, header_rect, config_module, fonts, ui_scaler):
@@ -411,6 +417,6 @@ def _draw_update_indicator_header(screen, header_rect, config_module, fonts, ui_
     dot_x = header_rect.right - inset - badge_size // 2
     dot_y = header_rect.top + inset + badge_size // 2
     pygame.draw.circle(screen, config_module.Theme.ALERT, (dot_x, dot_y), max(2, badge_size // 2))
-    exclamation_surface = fonts.get('tiny', fonts.get('small')).render("!", True, config_module.Theme.WHITE)
+    exclamation_surface = get_text_cache().render(fonts.get('tiny', fonts.get('small')), "!", config_module.Theme.WHITE)
     exclamation_rect = exclamation_surface.get_rect(center=(dot_x, dot_y))
     screen.blit(exclamation_surface, exclamation_rect)
\ No newline at end of file
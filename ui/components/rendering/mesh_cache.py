@@ -0,0 +1,405 @@
+# --- ui/components/rendering/mesh_cache.py ---
+# Compiled binary meshes for OBJ models: parsed and triangulated once, memory-mapped afterwards
+
+import hashlib
+import json
+import logging
+import os
+import re
+import struct
+import tempfile
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MESH_CACHE_SUFFIX = ".mesh"       # Cache file is written next to the OBJ as <name>.obj.mesh
+MESH_FORMAT_VERSION = 2          # Bump when compiled output changes so existing caches are rebuilt
+_MAGIC = b"TRMESH\x00\x00"
+_ALIGNMENT = 16
+
+# Interleaved vertex layout: position (3), normal (3), UV (2) as float32
+VERTEX_FLOATS = 8
+VERTEX_STRIDE = VERTEX_FLOATS * 4
+NORMAL_OFFSET = 3 * 4
+UV_OFFSET = 6 * 4
+
+# Face line with at least three "v", "v/t", "v//n" or "v/t/n" corners
+_FACE_LINE = re.compile(r"f(?:\s+-?\d+(?:/-?\d*(?:/-?\d+)?)?){3,}\s*$")
+
+# Per-vertex flags: which attributes came from the file (missing normals are computed, missing UVs are 0)
+FLAG_NORMAL = 1
+FLAG_UV = 2
+
+
+class CompiledMesh:
+    """
+    Triangulated OBJ geometry as flat arrays, ready for vertex buffers.
+
+    vertices is an (N, 8) float32 array of unique position/normal/UV corners, indices a
+    uint32 triangle list into it, sorted so each material's triangles are one contiguous
+    run (material_ranges lists (material name or None, first index, index count)).
+    triangle_groups holds each triangle's index into group_names. Loaded from the cache,
+    the arrays are read-only views of a memory map.
+    """
+
+    def __init__(self, vertices, indices, flags, triangle_groups, group_names, material_ranges, mtllibs, bounds):
+        self.vertices = vertices
+        self.indices = indices
+        self.flags = flags
+        self.triangle_groups = triangle_groups
+        self.group_names = list(group_names)
+        self.material_ranges = [(name, int(start), int(count)) for name, start, count in material_ranges]
+        self.mtllibs = list(mtllibs)
+        self.bounds = tuple(float(value) for value in bounds)
+
+    @property
+    def positions(self):
+        return self.vertices[:, 0:3]
+
+    @property
+    def normals(self):
+        return self.vertices[:, 3:6]
+
+    @property
+    def uvs(self):
+        return self.vertices[:, 6:8]
+
+    @property
+    def triangle_count(self):
+        return len(self.indices) // 3
+
+
+def mesh_cache_path(obj_path, lod_level=0):
+    """Path of the compiled mesh (or of one of its decimated LOD levels) for an OBJ file."""
+    if lod_level:
+        return f"{obj_path}.lod{lod_level}{MESH_CACHE_SUFFIX}"
+    return obj_path + MESH_CACHE_SUFFIX
+
+
+def load_compiled_mesh(obj_path, use_cache=True):
+    """
+    Return the CompiledMesh for an OBJ file.
+
+    With use_cache, a cache file that matches the OBJ (same size and modification time,
+    or failing that the same SHA-256) is memory-mapped instead of parsing the text; otherwise
+    the OBJ is compiled and the cache (re)written. Failing to write the cache (read-only
+    assets) only costs the speed-up.
+
+    Returns:
+        CompiledMesh: The mesh (raises OSError if the OBJ cannot be read)
+    """
+    return load_cached_mesh(obj_path, mesh_cache_path(obj_path), lambda: compile_obj(obj_path), use_cache)
+
+
+def load_cached_mesh(obj_path, cache_path, build, use_cache=True, variant=None):
+    """
+    Memory-map cache_path if it was written from the current obj_path, else build() and write it.
+
+    Args:
+        obj_path (str): OBJ file the mesh is derived from (its size/mtime/hash validate the cache)
+        cache_path (str): Cache file
+        build (callable): Returns the CompiledMesh when the cache cannot be used
+        use_cache (bool): Read/write the cache file at all
+        variant: JSON-serializable parameters of build(); a cache written with others is rebuilt
+
+    Returns:
+        CompiledMesh: The mesh
+    """
+    source_stat = os.stat(obj_path)
+    if use_cache and os.path.exists(cache_path):
+        mesh = _read_cache(cache_path, obj_path, source_stat, variant)
+        if mesh is not None:
+            logger.info(f"Compiled mesh loaded: {cache_path}")
+            return mesh
+
+    mesh = build()
+    if use_cache:
+        source = {"size": source_stat.st_size, "mtime_ns": source_stat.st_mtime_ns, "sha256": _file_sha256(obj_path)}
+        try:
+            _write_cache(cache_path, mesh, source, variant)
+            logger.info(f"Compiled mesh written: {cache_path}")
+        except OSError as e:
+            logger.warning(f"Could not write compiled mesh {cache_path}: {e}")
+    return mesh
+
+
+def compile_obj(obj_path):
+    """Parse an OBJ file into a CompiledMesh (fan-triangulated, corners deduplicated)."""
+    # Numbers are collected as text per element type and converted in bulk with NumPy
+    position_text, normal_text, uv_text = [], [], []
+    face_tokens = []    # "v", "v/t", "v//n" or "v/t/n" per polygon corner
+    face_sizes = []
+    face_counts = []    # (positions, UVs, normals) read before each face, for negative indices
+    face_materials = []
+    face_groups = []
+    material_ids = {}   # name (None = no usemtl) -> id in first-use order
+    group_ids = {}
+    mtllibs = []
+    current_material = material_ids.setdefault(None, 0)
+    current_group = group_ids.setdefault("default", 0)
+
+    with open(obj_path, 'r') as file:
+        for line_num, line in enumerate(file, 1):
+            parts = line.split()
+            # Skip empty lines and comments
+            if not parts or parts[0].startswith('#'):
+                continue
+            command = parts[0]
+            if command == 'v':  # Vertex
+                if len(parts) >= 4:
+                    position_text.append(' '.join(parts[1:4]))
+            elif command == 'vn':  # Vertex normal
+                if len(parts) >= 4:
+                    normal_text.append(' '.join(parts[1:4]))
+            elif command == 'vt':  # Texture coordinate
+                if len(parts) >= 3:
+                    uv_text.append(' '.join(parts[1:3]))
+            elif command == 'f':  # Face (triangulated as a fan later)
+                if len(parts) >= 4:
+                    if not _FACE_LINE.match(line.strip()):
+                        logger.warning(f"Error parsing line {line_num} in {obj_path}: {line.strip()}")
+                        continue
+                    face_tokens.extend(parts[1:])
+                    face_sizes.append(len(parts) - 1)
+                    face_counts.append((len(position_text), len(uv_text), len(normal_text)))
+                    face_materials.append(current_material)
+                    face_groups.append(current_group)
+            elif command == 'usemtl':  # Use material
+                if len(parts) >= 2:
+                    current_material = material_ids.setdefault(parts[1], len(material_ids))
+            elif command == 'o' or command == 'g':  # Object or group
+                if len(parts) >= 2:
+                    current_group = group_ids.setdefault(parts[1], len(group_ids))
+            elif command == 'mtllib':  # Material library
+                if len(parts) >= 2:
+                    mtllibs.append(parts[1])
+
+    position_array = _parse_floats(position_text, 3, obj_path).astype(np.float64)
+    normal_array = _parse_floats(normal_text, 3, obj_path)
+    uv_array = _parse_floats(uv_text, 2, obj_path)
+    if position_array.size:
+        bounds = (*position_array.min(axis=0).tolist(), *position_array.max(axis=0).tolist())
+    else:
+        bounds = (0, 0, 0, 0, 0, 0)
+
+    corner_array, triangle_faces = _triangulate(face_tokens, face_sizes, face_counts)
+    triangle_materials = np.asarray(face_materials, dtype=np.int64)[triangle_faces]
+    triangle_groups = np.asarray(face_groups, dtype=np.int64)[triangle_faces]
+
+    # Corners that point at missing data: drop triangles without a position, ignore bad normals/UVs
+    corner_array[(corner_array[:, 1] < 0) | (corner_array[:, 1] >= len(uv_array)), 1] = -1
+    corner_array[(corner_array[:, 2] < 0) | (corner_array[:, 2] >= len(normal_array)), 2] = -1
+    triangles = corner_array.reshape(-1, 3, 3)
+    valid = ((triangles[:, :, 0] >= 0) & (triangles[:, :, 0] < len(position_array))).all(axis=1)
+    triangle_materials = triangle_materials[valid]
+    triangle_groups = triangle_groups[valid]
+    triangles = triangles[valid]
+
+    # One contiguous index run per material, in first-use order
+    order = np.argsort(triangle_materials, kind="stable")
+    triangle_materials = triangle_materials[order]
+    triangle_groups = triangle_groups[order]
+    unique_corners, inverse = np.unique(triangles[order].reshape(-1, 3), axis=0, return_inverse=True)
+    indices = inverse.reshape(-1).astype(np.uint32)
+
+    has_uv = unique_corners[:, 1] >= 0
+    has_normal = unique_corners[:, 2] >= 0
+    vertices = np.zeros((len(unique_corners), VERTEX_FLOATS), dtype=np.float32)
+    vertices[:, 0:3] = position_array[unique_corners[:, 0]]
+    vertices[has_uv, 6:8] = uv_array[unique_corners[has_uv, 1]]
+    vertices[has_normal, 3:6] = normal_array[unique_corners[has_normal, 2]]
+    if not has_normal.all() and len(indices):
+        vertices[~has_normal, 3:6] = _smooth_normals(vertices[:, 0:3], indices)[~has_normal]
+    flags = (has_normal * FLAG_NORMAL + has_uv * FLAG_UV).astype(np.uint8)
+
+    material_names = sorted(material_ids, key=material_ids.get)
+    material_ranges = []
+    if len(triangle_materials):
+        starts = np.flatnonzero(np.r_[True, triangle_materials[1:] != triangle_materials[:-1]])
+        ends = np.r_[starts[1:], len(triangle_materials)]
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            material_ranges.append((material_names[triangle_materials[start]], start * 3, (end - start) * 3))
+
+    group_names = sorted(group_ids, key=group_ids.get)
+    group_dtype = np.uint16 if len(group_names) <= 0xFFFF else np.uint32
+    return CompiledMesh(vertices, indices, flags, triangle_groups.astype(group_dtype), group_names,
+                        material_ranges, mtllibs, bounds)
+
+
+def _parse_floats(texts, width, obj_path):
+    """Rows of width floats from whitespace-separated texts; rows that do not parse are skipped with a warning."""
+    if not texts:
+        return np.zeros((0, width), dtype=np.float32)
+    try:
+        values = np.array(' '.join(texts).split(), dtype=np.float64)
+        return values.reshape(-1, width)
+    except ValueError:
+        rows = []
+        for text in texts:
+            try:
+                rows.append([float(value) for value in text.split()])
+            except ValueError as e:
+                logger.warning(f"Error parsing values '{text}' in {obj_path}: {e}")
+        return np.asarray(rows, dtype=np.float64).reshape(-1, width)
+
+
+def _triangulate(face_tokens, face_sizes, face_counts):
+    """
+    Fan-triangulate the polygons.
+
+    Returns:
+        tuple: (corners, triangle_faces) with corners an (T * 3, 3) array of 0-based
+               (v, t, n) indices (-1 = not given) and the source face of every triangle
+    """
+    if not face_tokens:
+        return np.zeros((0, 3), dtype=np.int64), np.zeros(0, dtype=np.int64)
+    # Pad every corner to "v/t/n" with 0 (never a valid OBJ index) for missing fields
+    text = ' '.join(token + '/' * (2 - token.count('/')) for token in face_tokens) + ' '
+    text = text.replace('//', '/0/').replace('/ ', '/0 ').replace('/', ' ')
+    corners = np.array(text.split(), dtype=np.int64).reshape(-1, 3)
+
+    sizes = np.asarray(face_sizes, dtype=np.int64)
+    counts = np.repeat(np.asarray(face_counts, dtype=np.int64), sizes, axis=0)
+    # OBJ uses 1-based indexing; negative indices are relative to the elements read so far
+    corners = np.where(corners > 0, corners - 1, np.where(corners < 0, counts + corners, -1))
+
+    first_corner = np.r_[0, np.cumsum(sizes)[:-1]]
+    triangles_per_face = sizes - 2
+    triangle_faces = np.repeat(np.arange(len(sizes)), triangles_per_face)
+    first_triangle = np.r_[0, np.cumsum(triangles_per_face)[:-1]]
+    fan_step = np.arange(len(triangle_faces)) - first_triangle[triangle_faces] + 1
+    base = first_corner[triangle_faces]
+    corner_order = np.column_stack((base, base + fan_step, base + fan_step + 1)).reshape(-1)
+    return corners[corner_order], triangle_faces
+
+
+def _smooth_normals(positions, indices):
+    """Area-weighted vertex normals from the triangles (for corners the OBJ gave no normal)."""
+    triangles = positions[indices.reshape(-1, 3)]
+    face_normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    accumulated = np.zeros_like(positions)
+    for corner in range(3):
+        np.add.at(accumulated, indices[corner::3], face_normals)
+    lengths = np.linalg.norm(accumulated, axis=1, keepdims=True)
+    return np.divide(accumulated, lengths, out=np.zeros_like(accumulated), where=lengths > 0)
+
+
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _aligned(offset):
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _write_cache(cache_path, mesh, source, variant=None):
+    """Write magic, header length, JSON header, then each array at a 16-byte aligned offset."""
+    arrays = {
+        "vertices": np.ascontiguousarray(mesh.vertices, dtype=np.float32),
+        "indices": np.ascontiguousarray(mesh.indices, dtype=np.uint32),
+        "flags": np.ascontiguousarray(mesh.flags, dtype=np.uint8),
+        "triangle_groups": np.ascontiguousarray(mesh.triangle_groups),
+    }
+    header = {
+        "version": MESH_FORMAT_VERSION,
+        "source": source,
+        "variant": variant,
+        "bounds": list(mesh.bounds),
+        "mtllibs": mesh.mtllibs,
+        "group_names": mesh.group_names,
+        "material_ranges": [list(material_range) for material_range in mesh.material_ranges],
+        "arrays": {},
+    }
+    # Offsets depend on the header size, so lay out with placeholder offsets until they settle
+    offsets = {name: 0 for name in arrays}
+    while True:
+        header["arrays"] = {name: {"offset": offsets[name], "dtype": array.dtype.str, "shape": list(array.shape)}
+                            for name, array in arrays.items()}
+        header_bytes = json.dumps(header).encode("utf-8")
+        position = _aligned(len(_MAGIC) + 4 + len(header_bytes))
+        new_offsets = {}
+        for name, array in arrays.items():
+            new_offsets[name] = position
+            position = _aligned(position + array.nbytes)
+        if new_offsets == offsets:
+            break
+        offsets = new_offsets
+
+    # Unique temp file: a cancelled load and its retry may write the same cache concurrently
+    fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(cache_path) + ".", suffix=".tmp",
+                                     dir=os.path.dirname(cache_path) or ".")
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(_MAGIC)
+            file.write(struct.pack("<I", len(header_bytes)))
+            file.write(header_bytes)
+            for name, array in arrays.items():
+                file.write(b"\x00" * (offsets[name] - file.tell()))
+                file.write(array.tobytes())
+        os.replace(temp_path, cache_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def _read_cache(cache_path, obj_path, source_stat, variant=None):
+    """Memory-map a cache file; None if it is unreadable, from another format version or variant, or stale."""
+    try:
+        with open(cache_path, 'rb') as file:
+            if file.read(len(_MAGIC)) != _MAGIC:
+                return None
+            (header_length,) = struct.unpack("<I", file.read(4))
+            header = json.loads(file.read(header_length).decode("utf-8"))
+        if header.get("version") != MESH_FORMAT_VERSION or header.get("variant") != variant:
+            return None
+        source = header["source"]
+        if source["size"] != source_stat.st_size:
+            return None
+        refreshed = True
+        if source["mtime_ns"] != source_stat.st_mtime_ns:
+            if source["sha256"] != _file_sha256(obj_path):
+                return None
+            # Same content with a new mtime (copied, checked out again): record the mtime so
+            # later loads match on size/mtime without hashing the OBJ
+            source["mtime_ns"] = source_stat.st_mtime_ns
+            refreshed = _rewrite_header(cache_path, header, header_length)
+
+        mapped = np.memmap(cache_path, dtype=np.uint8, mode='r')
+        arrays = {}
+        for name, spec in header["arrays"].items():
+            dtype = np.dtype(spec["dtype"])
+            count = int(np.prod(spec["shape"], dtype=np.int64))
+            start = spec["offset"]
+            arrays[name] = mapped[start:start + count * dtype.itemsize].view(dtype).reshape(spec["shape"])
+        mesh = CompiledMesh(arrays["vertices"], arrays["indices"], arrays["flags"], arrays["triangle_groups"],
+                            header["group_names"], header["material_ranges"], header["mtllibs"], header["bounds"])
+    except (OSError, ValueError, KeyError, struct.error) as e:
+        logger.warning(f"Ignoring unreadable compiled mesh {cache_path}: {e}")
+        return None
+    if not refreshed:
+        # The new header no longer fits in place: write the whole cache again
+        try:
+            _write_cache(cache_path, mesh, source, variant)
+        except OSError as e:
+            logger.debug(f"Could not refresh compiled mesh {cache_path}: {e}")
+    return mesh
+
+
+def _rewrite_header(cache_path, header, header_length):
+    """Overwrite a cache's JSON header in place, space-padded to header_length; False if it does not fit."""
+    header_bytes = json.dumps(header).encode("utf-8")
+    if len(header_bytes) > header_length:
+        return False
+    try:
+        with open(cache_path, 'r+b') as file:
+            file.seek(len(_MAGIC) + 4)
+            file.write(header_bytes.ljust(header_length))
+    except OSError as e:
+        # Read-only assets: the hash check just runs again next time
+        logger.debug(f"Could not refresh compiled mesh header {cache_path}: {e}")
+    return True
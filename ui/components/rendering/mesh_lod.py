@@ -0,0 +1,157 @@
+# --- ui/components/rendering/mesh_lod.py ---
+# Level-of-detail meshes: coarser copies of a CompiledMesh built by vertex clustering
+
+import logging
+
+import numpy as np
+
+from .mesh_cache import CompiledMesh, load_cached_mesh, mesh_cache_path
+
+logger = logging.getLogger(__name__)
+
+LOD_FORMAT_VERSION = 1   # Bump when the decimation changes so cached LOD files are rebuilt
+MAX_GRID_RESOLUTION = 1024
+_SEARCH_STEPS = 12
+
+
+def load_lod_meshes(obj_path, mesh, ratios, min_triangles=0, use_cache=True):
+    """
+    Return [mesh] followed by one decimated mesh per further entry of ratios.
+
+    Each level keeps roughly ratio * the triangles of mesh (ratios[0] is the full mesh and
+    is not looked at). Levels are cached next to the OBJ as <name>.obj.lod<level>.mesh and
+    rebuilt when the OBJ or the ratio changes. Meshes with fewer than min_triangles
+    triangles, and levels that would not be smaller than the previous one, are skipped.
+
+    Args:
+        obj_path (str): OBJ file the mesh was compiled from
+        mesh (CompiledMesh): Full-detail mesh
+        ratios (sequence): Triangle fraction per level, finest first
+        min_triangles (int): Models below this are only drawn at full detail
+        use_cache (bool): Read/write the LOD cache files
+
+    Returns:
+        list: CompiledMesh per level of detail, finest first
+    """
+    levels = [mesh]
+    if mesh.triangle_count < max(1, min_triangles):
+        return levels
+    for level, ratio in enumerate(ratios[1:], 1):
+        target = int(mesh.triangle_count * ratio)
+        if target <= 0 or target >= levels[-1].triangle_count:
+            continue
+        variant = {"lod": LOD_FORMAT_VERSION, "ratio": float(ratio)}
+        try:
+            lod_mesh = load_cached_mesh(obj_path, mesh_cache_path(obj_path, level),
+                                        lambda: decimate_mesh(mesh, target), use_cache, variant)
+        except (OSError, ValueError, MemoryError) as e:
+            logger.warning(f"Could not build LOD {level} of {obj_path}: {e}")
+            break
+        if lod_mesh.triangle_count == 0 or lod_mesh.triangle_count >= levels[-1].triangle_count:
+            continue
+        logger.info(f"LOD {level} of {obj_path}: {lod_mesh.triangle_count} triangles ({ratio:.0%} target)")
+        levels.append(lod_mesh)
+    return levels
+
+
+def decimate_mesh(mesh, target_triangles):
+    """
+    Simplify a mesh to at most about target_triangles triangles by vertex clustering.
+
+    Vertices are snapped to a uniform grid over the mesh bounds; all vertices of one
+    material that fall into the same cell merge into one (averaged position, normal and
+    UV), and triangles that collapse are dropped. The grid resolution is binary-searched
+    for the largest triangle count not above the target. Triangles keep their material
+    order, so the result has the same material_ranges layout, and the bounds of the full
+    mesh so the model is centered and scaled the same at every level.
+    """
+    positions = np.asarray(mesh.positions, dtype=np.float64)
+    indices = np.asarray(mesh.indices, dtype=np.int64)
+    triangle_materials = _triangle_materials(mesh)
+
+    low, high = 1, MAX_GRID_RESOLUTION
+    best = None
+    for _ in range(_SEARCH_STEPS):
+        if low > high:
+            break
+        resolution = (low + high) // 2
+        corner_clusters, kept = _cluster(positions, indices, triangle_materials, resolution)
+        if int(kept.sum()) <= target_triangles:
+            best = (corner_clusters, kept)
+            low = resolution + 1
+        else:
+            high = resolution - 1
+    if best is None:
+        best = _cluster(positions, indices, triangle_materials, 1)
+    return _build_mesh(mesh, indices, triangle_materials, *best)
+
+
+def _triangle_materials(mesh):
+    """Material range number of every triangle."""
+    materials = np.zeros(mesh.triangle_count, dtype=np.int64)
+    for number, (_name, start, count) in enumerate(mesh.material_ranges):
+        materials[start // 3:(start + count) // 3] = number
+    return materials
+
+
+def _cluster(positions, indices, triangle_materials, resolution):
+    """
+    Cluster id of every triangle corner on a resolution-cell grid, and which triangles survive.
+
+    Returns:
+        tuple: (corner cluster ids (T * 3,), bool mask of triangles whose corners stay distinct)
+    """
+    low = positions.min(axis=0) if len(positions) else np.zeros(3)
+    extent = positions.max(axis=0) - low if len(positions) else np.zeros(3)
+    cell_size = max(float(extent.max()), 1e-12) / resolution
+    cells = np.minimum((positions - low) / cell_size, resolution - 1).astype(np.int64)
+    cell_ids = (cells[:, 0] * resolution + cells[:, 1]) * resolution + cells[:, 2]
+
+    # Cluster per (cell, material) so merged vertices never mix two materials' UVs
+    corner_keys = cell_ids[indices] * (int(triangle_materials.max(initial=0)) + 1) + np.repeat(triangle_materials, 3)
+    _keys, corner_clusters = np.unique(corner_keys, return_inverse=True)
+    corner_clusters = corner_clusters.reshape(-1)
+    triangles = corner_clusters.reshape(-1, 3)
+    kept = ((triangles[:, 0] != triangles[:, 1]) & (triangles[:, 1] != triangles[:, 2])
+            & (triangles[:, 0] != triangles[:, 2]))
+    return corner_clusters, kept
+
+
+def _build_mesh(mesh, indices, triangle_materials, corner_clusters, kept):
+    """CompiledMesh of the surviving triangles over averaged cluster vertices."""
+    triangles = corner_clusters.reshape(-1, 3)
+    # Two faces of a thin part can collapse onto the same cluster triangle; keep the first
+    kept_ids = np.flatnonzero(kept)
+    _rows, first = np.unique(np.sort(triangles[kept_ids], axis=1), axis=0, return_index=True)
+    kept_ids = kept_ids[np.sort(first)]
+
+    kept_corners = (kept_ids[:, None] * 3 + np.arange(3)).reshape(-1)
+    used, new_indices = np.unique(corner_clusters[kept_corners], return_inverse=True)
+    remap = np.full(int(corner_clusters.max(initial=-1)) + 1, -1, dtype=np.int64)
+    remap[used] = np.arange(len(used))
+
+    # Average every cluster over the original vertices of its corners
+    all_clusters = remap[corner_clusters]
+    in_use = all_clusters >= 0
+    vertex_sum = np.zeros((len(used), mesh.vertices.shape[1]), dtype=np.float64)
+    np.add.at(vertex_sum, all_clusters[in_use], np.asarray(mesh.vertices, dtype=np.float64)[indices[in_use]])
+    corner_count = np.bincount(all_clusters[in_use], minlength=len(used)).astype(np.float64)
+    vertices = (vertex_sum / corner_count[:, None]).astype(np.float32)
+    normals = vertices[:, 3:6]
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    np.divide(normals, lengths, out=normals, where=lengths > 0)
+
+    flags = np.zeros(len(used), dtype=np.uint8)
+    np.maximum.at(flags, all_clusters[in_use], np.asarray(mesh.flags)[indices[in_use]])
+
+    kept_materials = triangle_materials[kept_ids]
+    material_ranges = []
+    if len(kept_ids):
+        starts = np.flatnonzero(np.r_[True, kept_materials[1:] != kept_materials[:-1]])
+        ends = np.r_[starts[1:], len(kept_ids)]
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            material_ranges.append((mesh.material_ranges[kept_materials[start]][0], start * 3, (end - start) * 3))
+
+    return CompiledMesh(vertices, new_indices.reshape(-1).astype(np.uint32), flags,
+                        np.asarray(mesh.triangle_groups)[kept_ids], mesh.group_names,
+                        material_ranges, mesh.mtllibs, mesh.bounds)
@@ -5,23 +5,140 @@ import logging
 import os
 from typing import Dict, List, Tuple, Optional
 
+import pygame
+
+from .mesh_cache import CompiledMesh, FLAG_NORMAL, FLAG_UV, load_compiled_mesh
+from .mesh_lod import load_lod_meshes
+from .texture_cache import PreparedTexture, load_prepared_texture
+
 logger = logging.getLogger(__name__)
 
 class OBJModel:
-    """Represents a loaded OBJ model with vertices, faces, and materials."""
+    """
+    Represents a loaded OBJ model with vertices, faces, and materials.
+
+    The geometry lives in a CompiledMesh (flat arrays for rendering). The per-face
+    vertices/normals/tex_coords/faces/groups lists are built from it on first access,
+    for code that walks faces one by one.
+    """
     
-    def __init__(self):
-        self.vertices = []  # List of (x, y, z) tuples
-        self.normals = []   # List of (nx, ny, nz) tuples
-        self.tex_coords = [] # List of (u, v) tuples
-        self.faces = []     # List of face data
+    def __init__(self, mesh: Optional[CompiledMesh] = None):
+        self.mesh = mesh    # CompiledMesh with the triangulated geometry
+        self.lods = [mesh] if mesh else []  # CompiledMesh per level of detail, lods[0] is mesh
         self.materials = {} # Material definitions
-        self.groups = {}    # Object groups and their faces
-        self.bounds = None  # Bounding box (min_x, min_y, min_z, max_x, max_y, max_z)
+        self.bounds = mesh.bounds if mesh else None  # Bounding box (min_x, min_y, min_z, max_x, max_y, max_z)
         self.file_path = None  # Added for texture loading
+        self.prepared_textures = {}  # {material_name: PreparedTexture or None}, built without a GL context
+        self._lists = None
+
+    def _face_lists(self):
+        """Build (vertices, normals, tex_coords, faces, groups) from the mesh once."""
+        if self._lists is None:
+            self._lists = ([], [], [], [], {})
+            if self.mesh is not None:
+                self._lists = _face_lists_from_mesh(self.mesh)
+        return self._lists
+
+    @property
+    def vertices(self) -> List[Tuple[float, float, float]]:
+        """(x, y, z) per mesh vertex"""
+        return self._face_lists()[0]
+
+    @property
+    def normals(self) -> List[Tuple[float, float, float]]:
+        """(nx, ny, nz) per mesh vertex"""
+        return self._face_lists()[1]
+
+    @property
+    def tex_coords(self) -> List[Tuple[float, float]]:
+        """(u, v) per mesh vertex"""
+        return self._face_lists()[2]
+
+    @property
+    def faces(self) -> List[Dict]:
+        """Triangles as {'vertices': [(v_idx, t_idx, n_idx)] * 3, 'material', 'group'} (indices None if not in the file)"""
+        return self._face_lists()[3]
+
+    @property
+    def groups(self) -> Dict[str, List[int]]:
+        """Object groups and their face indices"""
+        return self._face_lists()[4]
+        
+    def texture_path(self, material_name: str) -> Optional[str]:
+        """Path of a material's diffuse (or ambient) map, None if it has none or the file is missing."""
+        material_data = self.materials.get(material_name, {})
+        texture_path = None
+        
+        # Check for various texture map types
+        if 'map_Kd' in material_data:  # Diffuse map
+            texture_path = material_data['map_Kd']
+        elif 'map_Ka' in material_data:  # Ambient map
+            texture_path = material_data['map_Ka']
+        
+        if not texture_path:
+            logger.debug(f"No texture map found for material: {material_name}")
+            return None
         
+        # Convert relative path to absolute if needed
+        if not os.path.isabs(texture_path):
+            # Assume texture is relative to the model directory
+            model_dir = os.path.dirname(self.file_path) if self.file_path else 'assets/apollo_ncc1570'
+            texture_path = os.path.join(model_dir, texture_path)
+        
+        if not os.path.exists(texture_path):
+            logger.warning(f"Texture file not found: {texture_path}")
+            return None
+        return texture_path
+
+    def prepared_texture(self, material_name: str) -> Optional[PreparedTexture]:
+        """
+        The material's texture downscaled and mipmapped for upload (prepared on first request).
+
+        Images are limited to config SCHEMATICS_TEXTURE_MAX_SIZE and the results cached on disk
+        next to them (SCHEMATICS_TEXTURE_CACHE_ENABLED). Needs no GL context, so it can run on
+        a worker thread.
+        """
+        if material_name in self.prepared_textures:
+            return self.prepared_textures[material_name]
+        texture = None
+        texture_path = self.texture_path(material_name)
+        if texture_path:
+            import config
+            try:
+                texture = load_prepared_texture(
+                    texture_path,
+                    getattr(config, 'SCHEMATICS_TEXTURE_MAX_SIZE', 256),
+                    getattr(config, 'SCHEMATICS_TEXTURE_CACHE_ENABLED', True),
+                )
+                logger.info(f"Texture prepared for material '{material_name}': {texture.width}x{texture.height}, "
+                            f"{len(texture.levels)} mipmap levels")
+            except (pygame.error, OSError, ValueError) as e:
+                logger.error(f"Failed to load texture {texture_path}: {e}")
+        self.prepared_textures[material_name] = texture
+        return texture
+
+    def prepare_textures(self, progress=None) -> int:
+        """
+        Prepare the textures of every material (see prepared_texture).
+
+        Args:
+            progress (callable, optional): progress(index, total, material_name) before each material
+
+        Returns:
+            int: Number of materials with a texture ready
+        """
+        pending = [name for name in self.materials if name not in self.prepared_textures]
+        for index, material_name in enumerate(pending):
+            if progress:
+                progress(index, len(pending), material_name)
+            self.prepared_texture(material_name)
+        return sum(1 for texture in self.prepared_textures.values() if texture)
+
     def calculate_bounds(self):
         """Calculate the bounding box of the model."""
+        if self.mesh is not None:
+            self.bounds = self.mesh.bounds
+            return
         if not self.vertices:
             self.bounds = (0, 0, 0, 0, 0, 0)
             return
@@ -67,16 +184,46 @@ class OBJModel:
             
         return target_size / max_dimension
 
+
+def _face_lists_from_mesh(mesh: CompiledMesh):
+    """Per-face lists in the layout the text parser used to produce."""
+    vertices = [tuple(position) for position in mesh.positions.tolist()]
+    normals = [tuple(normal) for normal in mesh.normals.tolist()]
+    tex_coords = [tuple(uv) for uv in mesh.uvs.tolist()]
+    flags = mesh.flags.tolist()
+    triangles = mesh.indices.reshape(-1, 3).tolist()
+    triangle_groups = mesh.triangle_groups.tolist()
+
+    faces = []
+    groups = {}
+    for material, start, count in mesh.material_ranges:
+        for triangle_index in range(start // 3, (start + count) // 3):
+            corners = [(index,
+                        index if flags[index] & FLAG_UV else None,
+                        index if flags[index] & FLAG_NORMAL else None)
+                       for index in triangles[triangle_index]]
+            group = mesh.group_names[triangle_groups[triangle_index]]
+            groups.setdefault(group, []).append(len(faces))
+            faces.append({'vertices': corners, 'material': material, 'group': group})
+    return vertices, normals, tex_coords, faces, groups
+
+
 class OBJLoader:
     """Loads Wavefront OBJ files."""
     
     @staticmethod
-    def load(file_path: str) -> Optional[OBJModel]:
+    def load(file_path: str, use_cache: Optional[bool] = None) -> Optional[OBJModel]:
         """
         Load an OBJ file and return an OBJModel.
+
+        The first load compiles the OBJ into a binary mesh written next to it
+        (<name>.obj.mesh); later loads memory-map that instead of parsing the text.
+        Coarser level-of-detail meshes (config SCHEMATICS_LOD_*) are built and cached
+        the same way.
         
         Args:
             file_path (str): Path to the OBJ file
+            use_cache (bool, optional): Read/write the compiled mesh; defaults to config MESH_CACHE_ENABLED
             
         Returns:
             OBJModel or None if loading failed
@@ -84,105 +231,29 @@ class OBJLoader:
         if not os.path.exists(file_path):
             logger.error(f"OBJ file not found: {file_path}")
             return None
+        import config
+        if use_cache is None:
+            use_cache = getattr(config, "MESH_CACHE_ENABLED", True)
             
-        model = OBJModel()
-        current_material = None
-        current_group = "default"
-        
         try:
-            with open(file_path, 'r') as file:
-                for line_num, line in enumerate(file, 1):
-                    line = line.strip()
-                    
-                    # Skip empty lines and comments
-                    if not line or line.startswith('#'):
-                        continue
-                        
-                    parts = line.split()
-                    if not parts:
-                        continue
-                        
-                    command = parts[0]
-                    
-                    try:
-                        if command == 'v':  # Vertex
-                            if len(parts) >= 4:
-                                x, y, z = float(parts[1]), float(parts[2]), float(parts[3])
-                                model.vertices.append((x, y, z))
-                                
-                        elif command == 'vn':  # Vertex normal
-                            if len(parts) >= 4:
-                                nx, ny, nz = float(parts[1]), float(parts[2]), float(parts[3])
-                                model.normals.append((nx, ny, nz))
-                                
-                        elif command == 'vt':  # Texture coordinate
-                            if len(parts) >= 3:
-                                u, v = float(parts[1]), float(parts[2])
-                                model.tex_coords.append((u, v))
-                                
-                        elif command == 'f':  # Face
-                            if len(parts) >= 4:
-                                face_vertices = []
-                                for vertex_data in parts[1:]:
-                                    # Parse vertex/texture/normal indices (e.g., "1/1/1" or "1//1" or "1")
-                                    indices = vertex_data.split('/')
-                                    
-                                    v_idx = int(indices[0]) - 1  # OBJ uses 1-based indexing
-                                    t_idx = None
-                                    n_idx = None
-                                    
-                                    if len(indices) > 1 and indices[1]:
-                                        t_idx = int(indices[1]) - 1
-                                    if len(indices) > 2 and indices[2]:
-                                        n_idx = int(indices[2]) - 1
-                                        
-                                    face_vertices.append((v_idx, t_idx, n_idx))
-                                
-                                # Store face data with material and group info
-                                face_data = {
-                                    'vertices': face_vertices,
-                                    'material': current_material,
-                                    'group': current_group
-                                }
-                                model.faces.append(face_data)
-                                
-                                # Add to group
-                                if current_group not in model.groups:
-                                    model.groups[current_group] = []
-                                model.groups[current_group].append(len(model.faces) - 1)
-                                
-                        elif command == 'usemtl':  # Use material
-                            if len(parts) >= 2:
-                                current_material = parts[1]
-                                
-                        elif command == 'o' or command == 'g':  # Object or group
-                            if len(parts) >= 2:
-                                current_group = parts[1]
-                                
-                        elif command == 'mtllib':  # Material library
-                            if len(parts) >= 2:
-                                mtl_file = parts[1]
-                                mtl_path = os.path.join(os.path.dirname(file_path), mtl_file)
-                                materials = OBJLoader._load_materials(mtl_path)
-                                model.materials.update(materials)
-                                
-                    except (ValueError, IndexError) as e:
-                        logger.warning(f"Error parsing line {line_num} in {file_path}: {line} - {e}")
-                        continue
-                        
-            # Calculate model bounds
-            model.calculate_bounds()
+            mesh = load_compiled_mesh(file_path, use_cache)
+            model = OBJModel(mesh)
+            model.lods = load_lod_meshes(file_path, mesh, getattr(config, "SCHEMATICS_LOD_RATIOS", (1.0,)),
+                                         getattr(config, "SCHEMATICS_LOD_MIN_TRIANGLES", 0), use_cache)
+            for mtl_file in mesh.mtllibs:
+                mtl_path = os.path.join(os.path.dirname(file_path), mtl_file)
+                model.materials.update(OBJLoader._load_materials(mtl_path))
             
             # Store the file path for texture loading
             model.file_path = file_path
             
             logger.info(f"OBJ loaded successfully: {file_path}")
-            logger.info(f"  Vertices: {len(model.vertices)}")
-            logger.info(f"  Normals: {len(model.normals)}")
-            logger.info(f"  Texture coords: {len(model.tex_coords)}")
-            logger.info(f"  Faces: {len(model.faces)}")
+            logger.info(f"  Mesh vertices: {len(mesh.vertices)}")
+            logger.info(f"  Triangles: {mesh.triangle_count}")
+            logger.info(f"  LOD triangles: {[lod.triangle_count for lod in model.lods]}")
             logger.info(f"  Materials: {len(model.materials)}")
-            logger.info(f"  Groups: {list(model.groups.keys())}")
+            logger.info(f"  Groups: {mesh.group_names}")
+            logger.info(f"Model bounds: {model.bounds}")
             
             return model
             
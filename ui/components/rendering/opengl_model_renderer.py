@@ -1,11 +1,13 @@
 # --- ui/components/opengl_model_renderer.py ---
 # OpenGL renderer specifically for OBJ models
 
+import ctypes
 import pygame
 import math
 import logging
+import time
+import numpy as np
 from typing import Optional, Dict, Any
-import os
 
 try:
     from OpenGL.GL import *
@@ -15,9 +17,21 @@ except ImportError:
     OPENGL_AVAILABLE = False
 
 from .obj_loader import OBJModel
+from .mesh_cache import VERTEX_STRIDE, NORMAL_OFFSET, UV_OFFSET
 
 logger = logging.getLogger(__name__)
 
+# Material used for faces without one (or whose material is not in the MTL file)
+DEFAULT_MATERIAL = {
+    'diffuse': (0.7, 0.7, 0.7),
+    'ambient': (0.2, 0.2, 0.2),
+    'specular': (0.5, 0.5, 0.5),
+    'shininess': 32.0
+}
+
+LOD_HOLD_SECONDS = 1.0     # Minimum time between two frame-time driven level-of-detail changes
+LOD_RETRY_SECONDS = 10.0   # A level found too slow is not returned to for this long
+
 class OpenGLModelRenderer:
     """OpenGL renderer for OBJ models that extends the basic OpenGL renderer functionality."""
     
@@ -31,12 +45,25 @@ class OpenGLModelRenderer:
         
         # Model data
         self.loaded_model = None
-        self.display_list = None  # OpenGL display list for performance
+        self.display_list = None  # OpenGL display list (fallback when vertex buffers are unavailable)
+        # LOD level -> (vertex buffer, index buffer, draw batches), each batch being
+        # (material dict, texture_id or None, first index, index count)
+        self.mesh_buffers = {}
+        self.vbo_failed = False    # Set once buffer creation/drawing failed; display list used from then on
+        
+        # Level of detail (vertex buffer path only; the display list is always full detail)
+        self.lod_level = 0
+        self.lod_bias = 0              # Levels coarser than the zoom level asks for, because frames were slow
+        self._frame_interval = None    # Smoothed seconds between render() calls
+        self._last_frame_time = None
+        self._lod_changed_at = 0.0
+        self._slow_level_at = {}       # LOD level -> when it was last found too slow
         self.model_scale = 1.0
         self.model_center = (0.0, 0.0, 0.0)
         
         # Texture management
         self.loaded_textures = {}  # Cache for loaded textures {material_name: texture_id}
+        self.textures_uploaded = False
         self.current_texture = None
         
         if not OPENGL_AVAILABLE:
@@ -63,6 +90,11 @@ class OpenGLModelRenderer:
             return False
             
         self.loaded_model = model
+        self.vbo_failed = False
+        self.lod_level = 0
+        self.lod_bias = 0
+        self._frame_interval = None
+        self._slow_level_at.clear()
         
         # Calculate model scaling and centering
         self.model_center = model.get_center()
@@ -73,9 +105,9 @@ class OpenGLModelRenderer:
         # Clear any existing display list and textures
         self._cleanup_resources()
         
-        # Don't load textures here - defer until OpenGL context is active
-        # Textures will be loaded on first render
-        logger.info(f"Model loaded with {len(model.materials)} materials (textures will load on first render)")
+        # Don't upload textures here - defer until OpenGL context is active. prepare_textures()
+        # does the decoding beforehand; the upload happens at the start of the first render
+        logger.info(f"Model loaded with {len(model.materials)} materials (textures will upload on first render)")
         
         return True
     
@@ -91,69 +123,66 @@ class OpenGLModelRenderer:
                 self.loaded_textures[material_name] = texture_id
                 logger.info(f"Loaded texture for material: {material_name}")
     
-    def _load_material_texture(self, material_name: str, material_data: Dict) -> Optional[int]:
-        """Load texture for a specific material."""
-        # Look for texture map in material data
-        texture_path = None
-        
-        # Check for various texture map types
-        if 'map_Kd' in material_data:  # Diffuse map
-            texture_path = material_data['map_Kd']
-        elif 'map_Ka' in material_data:  # Ambient map
-            texture_path = material_data['map_Ka']
-        
-        if not texture_path:
-            logger.debug(f"No texture map found for material: {material_name}")
-            return None
-        
-        logger.info(f"Attempting to load texture for material '{material_name}': {texture_path}")
+    def prepare_textures(self, progress=None) -> int:
+        """
+        Decode, downscale and mipmap the loaded model's textures; needs no GL context.
         
-        # Convert relative path to absolute if needed
-        if not os.path.isabs(texture_path):
-            # Assume texture is relative to the model directory
-            model_dir = os.path.dirname(self.loaded_model.file_path) if hasattr(self.loaded_model, 'file_path') else 'assets/apollo_ncc1570'
-            texture_path = os.path.join(model_dir, texture_path)
-            logger.info(f"Resolved texture path: {texture_path}")
+        Called while the loading screen is up, so the first render only has to upload the
+        prepared levels (see OBJModel.prepare_textures).
         
-        if not os.path.exists(texture_path):
-            logger.warning(f"Texture file not found: {texture_path}")
+        Args:
+            progress (callable, optional): progress(index, total, material_name) before each material
+            
+        Returns:
+            int: Number of materials with a texture ready
+        """
+        if not self.loaded_model:
+            return 0
+        return self.loaded_model.prepare_textures(progress)
+    
+    def _upload_textures(self):
+        """Upload every prepared texture of the model in one go, before the first draw."""
+        self.textures_uploaded = True
+        if not self.loaded_model:
+            return
+        count = 0
+        for material_name, material_data in self.loaded_model.materials.items():
+            if material_name not in self.loaded_textures:
+                texture_id = self._load_material_texture(material_name, material_data)
+                if texture_id:
+                    self.loaded_textures[material_name] = texture_id
+                    count += 1
+        if count:
+            logger.info(f"Uploaded {count} textures")
+    
+    def _load_material_texture(self, material_name: str, material_data: Dict) -> Optional[int]:
+        """Upload the texture for a specific material (preparing it first if that has not happened)."""
+        texture = self.loaded_model.prepared_texture(material_name)
+        if texture is None:
             return None
         
         try:
-            # Load texture using pygame
-            logger.info(f"Loading texture file: {texture_path}")
-            texture_surface = pygame.image.load(texture_path)
-            
-            # Convert to RGB format - pygame surfaces don't have get_format() method
-            # Just convert to RGB directly
-            texture_surface = texture_surface.convert()
-            logger.debug("Converted texture to RGB format")
-            
-            texture_data = pygame.image.tostring(texture_surface, "RGB", False)
-            
-            width = texture_surface.get_width()
-            height = texture_surface.get_height()
-            
-            logger.info(f"Texture loaded: {width}x{height} pixels")
-            
             # Generate OpenGL texture
             texture_id = glGenTextures(1)
             glBindTexture(GL_TEXTURE_2D, texture_id)
             
-            # Set texture parameters
+            # Set texture parameters; the minification filter samples the mipmap chain
             glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
             glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR_MIPMAP_LINEAR)
             glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAX_LEVEL, len(texture.levels) - 1)
             
-            # Upload texture data
-            glTexImage2D(GL_TEXTURE_2D, 0, GL_RGB, width, height, 0, GL_RGB, GL_UNSIGNED_BYTE, texture_data)
+            # Upload every level; RGB rows of the small levels are not 4-byte aligned
+            glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+            for level, (width, height, data) in enumerate(texture.levels):
+                glTexImage2D(GL_TEXTURE_2D, level, GL_RGB, width, height, 0, GL_RGB, GL_UNSIGNED_BYTE, data)
             
-            logger.info(f"Texture uploaded to OpenGL successfully: {texture_path} (ID: {texture_id})")
+            logger.debug(f"Texture uploaded for material '{material_name}' (ID: {texture_id}, {texture.nbytes} bytes)")
             return texture_id
             
         except Exception as e:
-            logger.error(f"Failed to load texture {texture_path}: {e}", exc_info=True)
+            logger.error(f"Failed to upload texture for material {material_name}: {e}", exc_info=True)
             return None
         
     def _init_opengl(self):
@@ -227,6 +256,7 @@ class OpenGLModelRenderer:
             except:
                 pass
             self.display_list = None
+        self._delete_vertex_buffers()
         
         # Clean up textures
         for texture_id in self.loaded_textures.values():
@@ -235,6 +265,7 @@ class OpenGLModelRenderer:
             except:
                 pass
         self.loaded_textures.clear()
+        self.textures_uploaded = False
     
     def render(self, pitch, roll, yaw, fonts=None, schematics_info=None, pause_menu_active=False, pause_menu_index=0, auto_rotation_mode=True, zoom_level=1.0):
         """
@@ -261,7 +292,13 @@ class OpenGLModelRenderer:
             if not self.initialized:
                 return False
         
+        self._measure_frame_interval()
+        
         try:
+            if not self.textures_uploaded:
+                self._upload_textures()
+            
+
             # Clear buffers
             glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
             
@@ -290,8 +327,12 @@ class OpenGLModelRenderer:
         if not self.loaded_model:
             return
             
-        # Create display list if not exists (for performance)
-        if not self.display_list:
+        # Upload each level's vertex buffers once; without them, compile a display list instead
+        use_buffers = self._use_vertex_buffers()
+        if use_buffers:
+            level = self._select_lod_level(zoom_level)
+            use_buffers = level in self.mesh_buffers or self._create_vertex_buffers(level)
+        if not use_buffers and not self.display_list:
             self._create_display_list()
         
         # Set up model-view matrix
@@ -315,6 +356,16 @@ class OpenGLModelRenderer:
         glTranslatef(-center_x, -center_y, -center_z)
         
         # Render the model
+        if use_buffers:
+            try:
+                self._render_vertex_buffers(level)
+                return
+            except Exception as e:
+                logger.warning(f"Vertex buffer rendering failed, falling back to display list: {e}")
+                self.vbo_failed = True
+                self._delete_vertex_buffers()
+                self._create_display_list()
+        
         if self.display_list:
             try:
                 glCallList(self.display_list)
@@ -331,6 +382,163 @@ class OpenGLModelRenderer:
         else:
             self._render_immediate_mode()
     
+    def _use_vertex_buffers(self):
+        """Whether the model is drawn from vertex buffers (needs a compiled mesh and VBO support)."""
+        return (getattr(self.config, 'MESH_VBO_ENABLED', True)
+                and not self.vbo_failed
+                and getattr(self.loaded_model, 'mesh', None) is not None)
+    
+    def _measure_frame_interval(self):
+        """Track the smoothed time between frames; a pause of over half a second restarts the measurement."""
+        now = time.monotonic()
+        if self._last_frame_time is not None:
+            interval = now - self._last_frame_time
+            if interval > 0.5:
+                self._frame_interval = None
+            elif self._frame_interval is None:
+                self._frame_interval = interval
+            else:
+                self._frame_interval += (interval - self._frame_interval) * 0.1
+        self._last_frame_time = now
+    
+    def _select_lod_level(self, zoom_level):
+        """
+        Level of detail (index into loaded_model.lods) to draw this frame.
+        
+        The zoom level picks the base level: one level coarser for every
+        SCHEMATICS_LOD_ZOOM_THRESHOLDS entry the zoom is below. While frames take longer than
+        1 / SCHEMATICS_LOD_TARGET_FPS, lod_bias adds coarser levels; once frames are well
+        under that it steps back, except into a level found too slow in the last
+        LOD_RETRY_SECONDS. Frame-time changes are at least LOD_HOLD_SECONDS apart.
+        """
+        coarsest = len(getattr(self.loaded_model, 'lods', None) or (None,)) - 1
+        if coarsest <= 0:
+            return 0
+        thresholds = getattr(self.config, 'SCHEMATICS_LOD_ZOOM_THRESHOLDS', ())
+        zoom_level_index = min(coarsest, sum(1 for threshold in thresholds if zoom_level < threshold))
+        
+        now = time.monotonic()
+        budget = 1.0 / max(1, getattr(self.config, 'SCHEMATICS_LOD_TARGET_FPS', 30))
+        if self._frame_interval is not None and now - self._lod_changed_at >= LOD_HOLD_SECONDS:
+            if self._frame_interval > budget and zoom_level_index + self.lod_bias < coarsest:
+                self._slow_level_at[self.lod_level] = now
+                self.lod_bias += 1
+                self._lod_changed_at = now
+                self._frame_interval = None
+            elif self._frame_interval < budget * 0.75 and self.lod_bias > 0:
+                finer = min(coarsest, zoom_level_index + self.lod_bias - 1)
+                if now - self._slow_level_at.get(finer, now - LOD_RETRY_SECONDS) >= LOD_RETRY_SECONDS:
+                    self.lod_bias -= 1
+                    self._lod_changed_at = now
+                    self._frame_interval = None
+        
+        level = min(coarsest, zoom_level_index + self.lod_bias)
+        if level != self.lod_level:
+            logger.debug(f"Model LOD {self.lod_level} -> {level} (zoom {zoom_level:.1f}, bias {self.lod_bias})")
+            self.lod_level = level
+        return level
+    
+    def _create_vertex_buffers(self, level=0):
+        """
+        Upload one level of detail into vertex/index buffers and build its per-material draw batches.
+        
+        The mesh indices are already grouped by material, so every material is a single
+        glDrawElements call over a contiguous index range. Batches are ordered by texture so
+        each texture is bound once per frame. Textures are loaded here (the context is active).
+        
+        Returns:
+            bool: True if the buffers are ready to draw
+        """
+        lods = getattr(self.loaded_model, 'lods', None) or [self.loaded_model.mesh]
+        mesh = lods[level]
+        vertex_buffer = index_buffer = None
+        try:
+            vertices = np.ascontiguousarray(mesh.vertices, dtype=np.float32)
+            indices = np.ascontiguousarray(mesh.indices, dtype=np.uint32)
+            
+            vertex_buffer = glGenBuffers(1)
+            glBindBuffer(GL_ARRAY_BUFFER, vertex_buffer)
+            glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STATIC_DRAW)
+            
+            index_buffer = glGenBuffers(1)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, index_buffer)
+            glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, GL_STATIC_DRAW)
+            
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        except Exception as e:
+            logger.warning(f"Failed to create vertex buffers, falling back to display list: {e}")
+            self.vbo_failed = True
+            self.mesh_buffers[level] = (vertex_buffer, index_buffer, [])
+            self._delete_vertex_buffers()
+            return False
+        
+        materials = self.loaded_model.materials or {}
+        batches = []
+        for material_name, first_index, index_count in mesh.material_ranges:
+            if index_count <= 0:
+                continue
+            material = materials.get(material_name) if material_name else None
+            texture_id = None
+            if material is None:
+                material = DEFAULT_MATERIAL
+            elif material_name in self.loaded_textures:
+                texture_id = self.loaded_textures[material_name]
+            else:
+                texture_id = self._load_material_texture(material_name, material)
+                if texture_id:
+                    self.loaded_textures[material_name] = texture_id
+            batches.append((material, texture_id, first_index, index_count))
+        batches.sort(key=lambda batch: batch[1] or 0)
+        self.mesh_buffers[level] = (vertex_buffer, index_buffer, batches)
+        
+        logger.info(f"Vertex buffers created for LOD {level}: {len(vertices)} vertices, {mesh.triangle_count} triangles, "
+                    f"{len(batches)} material batches, {len(set(b[1] for b in batches if b[1]))} textures")
+        return True
+    
+    def _render_vertex_buffers(self, level=0):
+        """Draw one level of detail from its vertex buffers, one glDrawElements per material batch."""
+        vertex_buffer, index_buffer, draw_batches = self.mesh_buffers[level]
+        glBindBuffer(GL_ARRAY_BUFFER, vertex_buffer)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, index_buffer)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_NORMAL_ARRAY)
+        glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+        try:
+            glVertexPointer(3, GL_FLOAT, VERTEX_STRIDE, ctypes.c_void_p(0))
+            glNormalPointer(GL_FLOAT, VERTEX_STRIDE, ctypes.c_void_p(NORMAL_OFFSET))
+            glTexCoordPointer(2, GL_FLOAT, VERTEX_STRIDE, ctypes.c_void_p(UV_OFFSET))
+            
+            bound_texture = -1  # Nothing bound yet
+            for material, texture_id, first_index, index_count in draw_batches:
+                self._apply_material(material)
+                if texture_id != bound_texture:
+                    bound_texture = texture_id
+                    if texture_id:
+                        glEnable(GL_TEXTURE_2D)
+                        glBindTexture(GL_TEXTURE_2D, texture_id)
+                    else:
+                        glDisable(GL_TEXTURE_2D)
+                glDrawElements(GL_TRIANGLES, index_count, GL_UNSIGNED_INT,
+                               ctypes.c_void_p(first_index * 4))
+        finally:
+            glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+            glDisableClientState(GL_NORMAL_ARRAY)
+            glDisableClientState(GL_VERTEX_ARRAY)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+    
+    def _delete_vertex_buffers(self):
+        """Free the vertex/index buffers of every level and forget their draw batches."""
+        for vertex_buffer, index_buffer, _batches in self.mesh_buffers.values():
+            for buffer_id in (vertex_buffer, index_buffer):
+                if buffer_id:
+                    try:
+                        glDeleteBuffers(1, [buffer_id])
+                    except:
+                        pass
+        self.mesh_buffers.clear()
+    
     def _create_display_list(self):
         """Create an OpenGL display list for efficient rendering."""
         if not self.loaded_model:
@@ -360,14 +568,6 @@ class OpenGLModelRenderer:
         if not self.loaded_model:
             return
             
-        # Default material if no materials are defined
-        default_material = {
-            'diffuse': (0.7, 0.7, 0.7),
-            'ambient': (0.2, 0.2, 0.2),
-            'specular': (0.5, 0.5, 0.5),
-            'shininess': 32.0
-        }
-        
         current_material = None
         current_texture_id = None
         
@@ -399,7 +599,7 @@ class OpenGLModelRenderer:
                     mat = self.loaded_model.materials[face_material]
                     logger.debug(f"Applying material: {face_material}")
                 else:
-                    mat = default_material
+                    mat = DEFAULT_MATERIAL
                     logger.debug(f"Using default material for face material: {face_material}")
                 
                 self._apply_material(mat)
@@ -689,5 +889,6 @@ class OpenGLModelRenderer:
         if self.display_list:
             glDeleteLists(self.display_list, 1)
             self.display_list = None
+        self._delete_vertex_buffers()
         self.initialized = False
         logger.info("OpenGL model renderer cleaned up") 
\ No newline at end of file
@@ -0,0 +1,162 @@
+# --- ui/components/rendering/texture_cache.py ---
+# Model textures prepared for upload: downscaled, mipmapped RGB, cached compressed on disk
+
+import json
+import logging
+import os
+import struct
+import tempfile
+import zlib
+
+import numpy as np
+import pygame
+
+logger = logging.getLogger(__name__)
+
+TEXTURE_CACHE_SUFFIX = ".tex"    # Written next to the image as <image>.<max size>.tex
+TEXTURE_FORMAT_VERSION = 1
+_MAGIC = b"TRTEX\x00\x00\x00"
+_COMPRESSION_LEVEL = 1           # Cache files are read far more often than written; favour fast inflate
+
+
+class PreparedTexture:
+    """
+    An image ready for glTexImage2D: power-of-two RGB levels, full size first.
+
+    levels holds (width, height, bytes) per mipmap level down to 1x1, rows top to bottom
+    (the order pygame.image.tostring(surface, "RGB", False) uses), tightly packed.
+    """
+
+    def __init__(self, levels):
+        self.levels = levels
+
+    @property
+    def width(self):
+        return self.levels[0][0]
+
+    @property
+    def height(self):
+        return self.levels[0][1]
+
+    @property
+    def nbytes(self):
+        return sum(len(data) for _width, _height, data in self.levels)
+
+
+def texture_cache_path(image_path, max_size):
+    """Path of the prepared texture for an image at a given size limit."""
+    return f"{image_path}.{max_size}{TEXTURE_CACHE_SUFFIX}"
+
+
+def load_prepared_texture(image_path, max_size, use_cache=True):
+    """
+    Return the PreparedTexture for an image, at most max_size pixels on each side.
+
+    With use_cache, a cache file written from the same image (same size and modification
+    time) is inflated instead of decoding and resampling the image; otherwise the texture is
+    built and the cache (re)written. Needs no display or GL context.
+
+    Returns:
+        PreparedTexture: The texture (raises pygame.error/OSError if the image cannot be read)
+    """
+    cache_path = texture_cache_path(image_path, max_size)
+    source_stat = os.stat(image_path)
+    source = {"size": source_stat.st_size, "mtime_ns": source_stat.st_mtime_ns}
+    if use_cache and os.path.exists(cache_path):
+        texture = _read_cache(cache_path, source, max_size)
+        if texture is not None:
+            logger.debug(f"Prepared texture loaded: {cache_path}")
+            return texture
+
+    texture = prepare_texture(pygame.image.load(image_path), max_size)
+    if use_cache:
+        try:
+            _write_cache(cache_path, texture, source, max_size)
+            logger.info(f"Prepared texture written: {cache_path}")
+        except OSError as e:
+            logger.warning(f"Could not write prepared texture {cache_path}: {e}")
+    return texture
+
+
+def prepare_texture(surface, max_size):
+    """Downscale a surface to power-of-two sides no larger than max_size and build its mipmap chain."""
+    width, height = surface.get_size()
+    target = (_power_of_two_at_most(min(width, max_size)), _power_of_two_at_most(min(height, max_size)))
+    if surface.get_bitsize() not in (24, 32):
+        rgb_surface = pygame.Surface((width, height), 0, 24)
+        rgb_surface.blit(surface, (0, 0))
+        surface = rgb_surface
+    if target != (width, height):
+        surface = pygame.transform.smoothscale(surface, target)
+
+    # surfarray is indexed [x, y]; GL wants rows
+    pixels = pygame.surfarray.array3d(surface).transpose(1, 0, 2).astype(np.float32)
+    levels = []
+    while True:
+        levels.append((pixels.shape[1], pixels.shape[0], np.rint(pixels).astype(np.uint8).tobytes()))
+        if pixels.shape[0] == 1 and pixels.shape[1] == 1:
+            break
+        pixels = _half_size(pixels)
+    return PreparedTexture(levels)
+
+
+def _power_of_two_at_most(value):
+    return 1 << (max(1, int(value)).bit_length() - 1)
+
+
+def _half_size(pixels):
+    """2x2 box filter (2x1 once a side is down to one pixel)."""
+    if pixels.shape[0] > 1:
+        pixels = (pixels[0::2] + pixels[1::2]) * 0.5
+    if pixels.shape[1] > 1:
+        pixels = (pixels[:, 0::2] + pixels[:, 1::2]) * 0.5
+    return pixels
+
+
+def _write_cache(cache_path, texture, source, max_size):
+    """Write magic, header length, JSON header, then the zlib-compressed levels in order."""
+    blobs = [zlib.compress(data, _COMPRESSION_LEVEL) for _width, _height, data in texture.levels]
+    header = {
+        "version": TEXTURE_FORMAT_VERSION,
+        "source": source,
+        "max_size": max_size,
+        "levels": [[width, height, len(blob)] for (width, height, _data), blob in zip(texture.levels, blobs)],
+    }
+    header_bytes = json.dumps(header).encode("utf-8")
+    # Unique temp file: a cancelled load and its retry may write the same cache concurrently
+    fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(cache_path) + ".", suffix=".tmp",
+                                     dir=os.path.dirname(cache_path) or ".")
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(_MAGIC)
+            file.write(struct.pack("<I", len(header_bytes)))
+            file.write(header_bytes)
+            for blob in blobs:
+                file.write(blob)
+        os.replace(temp_path, cache_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def _read_cache(cache_path, source, max_size):
+    """Read a cache file; None if it is unreadable, from another format version or size limit, or stale."""
+    try:
+        with open(cache_path, 'rb') as file:
+            if file.read(len(_MAGIC)) != _MAGIC:
+                return None
+            (header_length,) = struct.unpack("<I", file.read(4))
+            header = json.loads(file.read(header_length).decode("utf-8"))
+            if (header.get("version") != TEXTURE_FORMAT_VERSION or header.get("max_size") != max_size
+                    or header.get("source") != source):
+                return None
+            levels = []
+            for width, height, length in header["levels"]:
+                data = zlib.decompress(file.read(length))
+                if len(data) != width * height * 3:
+                    return None
+                levels.append((width, height, data))
+        return PreparedTexture(levels) if levels else None
+    except (OSError, ValueError, KeyError, struct.error, zlib.error) as e:
+        logger.warning(f"Ignoring unreadable prepared texture {cache_path}: {e}")
+        return None
@@ -4,6 +4,8 @@
 import pygame
 import logging
 
+from utils.text_cache import get_text_cache
+
 logger = logging.getLogger(__name__)
 
 def render_text(screen, text, font, color, position, align="center", ui_scaler=None):
@@ -23,7 +25,7 @@ def render_text(screen, text, font, color, position, align="center", ui_scaler=N
         pygame.Rect: The rectangle of the rendered text
     """
     try:
-        text_surface = font.render(text, True, color)
+        text_surface = get_text_cache().render(font, text, color)
         text_rect = text_surface.get_rect()
         
         # Set position based on alignment
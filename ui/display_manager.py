@@ -5,7 +5,8 @@ import pygame
 import logging
 from models.app_state import STATE_MENU, STATE_DASHBOARD, STATE_SENSOR_VIEW, STATE_SYSTEM_INFO, STATE_SETTINGS, STATE_SECRET_GAMES, STATE_PONG_ACTIVE, STATE_BREAKOUT_ACTIVE, STATE_SNAKE_ACTIVE, STATE_TETRIS_ACTIVE, STATE_SCHEMATICS, STATE_SCHEMATICS_MENU, STATE_SCHEMATICS_CATEGORY, STATE_LOGS_MENU, STATE_DATA_MENU, STATE_CREW_MENU, STATE_CREW_DETAIL, STATE_MEDIA_PLAYER, STATE_ST_WIKI, STATE_SENSORS_MENU, STATE_SETTINGS_DISPLAY, STATE_SETTINGS_DEVICE, STATE_SETTINGS_CONTROLS, STATE_SETTINGS_UPDATE, STATE_SETTINGS_STAPI, STATE_SETTINGS_SOUND_TEST, STATE_SETTINGS_DEBUG, STATE_SETTINGS_DEBUG_OVERLAY, STATE_SETTINGS_LOG_VIEWER, STATE_CONFIRM_REBOOT, STATE_CONFIRM_SHUTDOWN, STATE_CONFIRM_RESTART_APP, STATE_SELECT_COMBO_DURATION, STATE_SETTINGS_VOLUME, STATE_DISPLAY_CYCLE_INTERVAL, STATE_SETTINGS_WIFI, STATE_SETTINGS_WIFI_NETWORKS, STATE_WIFI_PASSWORD_ENTRY, STATE_SETTINGS_WIFI_FORGET, STATE_CONFIRM_FORGET_WIFI, STATE_SETTINGS_BLUETOOTH, STATE_SETTINGS_BLUETOOTH_DEVICES, STATE_LOADING
 from ui.menu import draw_menu_screen
-from ui.views.sensors.sensor_view import draw_sensor_view
+from ui.views.sensors.sensor_view import SensorView
+from ui.views.sensors.dashboard_view import DashboardView
 from ui.views.system.system_info_view import draw_system_info_view
 from ui.views.settings.settings_view import draw_settings_view
 from ui.views.games.secret_games_view import draw_secret_games_view
@@ -36,6 +37,10 @@ from ui.views.settings.stapi_settings_view import draw_stapi_settings_view
 
 # Import UIScaler for centralized scaling
 from utils.ui_scaler import UIScaler
+from ui.frame_presenter import get_frame_presenter
+from ui.view_registry import View, DrawFunctionView, ListMenuView, StaticDrawFunctionView, ViewRegistry
+from utils.text_cache import get_text_cache
+from utils.safe_area_helper import apply_safe_area_mask
 
 # Temporary placeholder function until schematics_view.py is created
 # def draw_schematics_view(screen, app_state, fonts, config_module):
@@ -50,6 +55,8 @@ logger = logging.getLogger(__name__)
 current_display_mode = "NORMAL"  # "NORMAL" or "OPENGL"
 opengl_screen = None
 ui_scaler = None  # Global UIScaler instance
+view_registry = None  # State -> View table, built on first update_display
+_retained_view = None  # View that drew the last frame in retained mode (None after a full redraw)
 
 def init_display():
     """
@@ -166,9 +173,8 @@ def _init_opengl_display(config):
         if ui_scaler:
             screen_width = opengl_screen.get_width()
             screen_height = opengl_screen.get_height()
-            if screen_width != ui_scaler.screen_width or screen_height != ui_scaler.screen_height:
-                ui_scaler = UIScaler(screen_width, screen_height, config)
-                logger.info(f"UIScaler updated for OpenGL mode: {screen_width}x{screen_height}")
+            # Resized in place (dropping its memoized layout) so every holder sees the new size
+            ui_scaler.resize(screen_width, screen_height)
         
         current_display_mode = "OPENGL"
         logger.info("OpenGL display mode initialized")
@@ -201,6 +207,8 @@ def _switch_display_mode_if_needed(app_state):
     global current_display_mode, ui_scaler
     
     needs_opengl = _needs_opengl_mode(app_state)
+    if needs_opengl != (current_display_mode == "OPENGL"):
+        get_frame_presenter().invalidate()  # New display surface: next frame goes out in full
     
     if needs_opengl and current_display_mode != "OPENGL":
         # Switch to OpenGL mode
@@ -227,23 +235,198 @@ def _switch_display_mode_if_needed(app_state):
         if ui_scaler:
             screen_width = screen.get_width()
             screen_height = screen.get_height()
-            if screen_width != ui_scaler.screen_width or screen_height != ui_scaler.screen_height:
-                ui_scaler = UIScaler(screen_width, screen_height, config)
-                logger.info(f"UIScaler updated for normal mode: {screen_width}x{screen_height}")
+            # Resized in place (dropping its memoized layout) so every holder sees the new size
+            ui_scaler.resize(screen_width, screen_height)
         logger.info("Switched back to normal display mode")
         return screen
     
     # No mode change needed
     return pygame.display.get_surface()
 
-def _draw_game_into_display(screen, game, fonts, config_module, ui_scaler):
-    """Draw the game onto the screen using the app safe area when enabled (games use our UI)."""
-    if ui_scaler and getattr(ui_scaler, 'safe_area_enabled', False):
-        game_rect = ui_scaler.get_safe_area_rect()
-        game_surface = screen.subsurface(game_rect)
-        game.draw(game_surface, fonts, config_module)
-    else:
-        game.draw(screen, fonts, config_module)
+class MessageView(View):
+    """Centered one-line message (missing game instance, unknown state)."""
+
+    def __init__(self, message, color_name="ALERT"):
+        super().__init__()
+        self.message = message
+        self.color_name = color_name
+
+    def compute_layout(self, screen, ui_scaler, fonts):
+        if ui_scaler:
+            return (ui_scaler.screen_width // 2, ui_scaler.screen_height // 2)
+        return (screen.get_width() // 2, screen.get_height() // 2)
+
+    def render(self, screen, app_state, sensor_values, sensor_history, fonts, config_module, ui_scaler):
+        screen.fill(config_module.Theme.BACKGROUND)
+        text = get_text_cache().render(fonts['medium'], self.message, getattr(config_module.Theme, self.color_name))
+        screen.blit(text, text.get_rect(center=self.layout(screen, ui_scaler, fonts)))
+
+
+class GameView(View):
+    """Active mini-game, drawn into the app safe area when enabled (games use our UI)."""
+
+    def __init__(self, game_attribute, game_name):
+        super().__init__()
+        self.game_attribute = game_attribute
+        self.missing = MessageView(f"Error: {game_name} game not loaded")
+
+    def compute_layout(self, screen, ui_scaler, fonts):
+        if ui_scaler and getattr(ui_scaler, 'safe_area_enabled', False):
+            return ui_scaler.get_safe_area_rect()
+        return None
+
+    def render(self, screen, app_state, sensor_values, sensor_history, fonts, config_module, ui_scaler):
+        game = getattr(app_state, self.game_attribute, None)
+        if not game:
+            logger.error(f"In {app_state.current_state} state but no {self.game_attribute} instance found!")
+            self.missing.render(screen, app_state, sensor_values, sensor_history, fonts, config_module, ui_scaler)
+            return
+        screen.fill(config_module.Theme.BACKGROUND)
+        game_rect = self.layout(screen, ui_scaler, fonts)
+        game.draw(screen.subsurface(game_rect) if game_rect else screen, fonts, config_module)
+
+
+class SchematicsView(DrawFunctionView):
+    """3D viewer; goes through the OpenGL path while the display is in OpenGL mode."""
+
+    def __init__(self):
+        super().__init__(draw_schematics_view)
+
+    def render(self, screen, app_state, sensor_values, sensor_history, fonts, config_module, ui_scaler):
+        if current_display_mode == "OPENGL":
+            _render_opengl_schematics(screen, app_state, fonts, config_module, ui_scaler)
+        else:
+            draw_schematics_view(screen, app_state, fonts, config_module, ui_scaler)
+
+
+class MediaPlayerView(DrawFunctionView):
+    """Media player: embeds VLC in our window (same as 3D schematics)."""
+
+    def __init__(self):
+        super().__init__(draw_media_player_view)
+
+    def render(self, screen, app_state, sensor_values, sensor_history, fonts, config_module, ui_scaler):
+        try:
+            wm_info = pygame.display.get_wm_info()
+            hwnd = wm_info.get("window")
+            if hwnd is not None and hasattr(app_state, "media_player_manager") and app_state.media_player_manager:
+                app_state.media_player_manager.set_window_handle(hwnd)
+        except Exception:
+            pass
+        draw_media_player_view(screen, app_state, fonts, config_module, ui_scaler)
+
+
+class WifiPasswordEntryView(DrawFunctionView):
+    """Password entry; hands the fonts to the character selector on first draw."""
+
+    def __init__(self):
+        super().__init__(draw_wifi_password_entry_view)
+
+    def render(self, screen, app_state, sensor_values, sensor_history, fonts, config_module, ui_scaler):
+        if not app_state.password_entry_manager.character_selector.fonts:
+            app_state.password_entry_manager.character_selector.fonts = fonts
+        draw_wifi_password_entry_view(screen, app_state, fonts, config_module, ui_scaler)
+
+
+class LoadingView(View):
+    """Loading screen; UI component setup is handled here in the display layer."""
+
+    def __init__(self):
+        super().__init__()
+        self.fallback = MessageView("Loading...", "FOREGROUND")
+
+    def render(self, screen, app_state, sensor_values, sensor_history, fonts, config_module, ui_scaler):
+        loading_screen = app_state.get_loading_screen()
+        if not loading_screen:
+            self.fallback.render(screen, app_state, sensor_values, sensor_history, fonts, config_module, ui_scaler)
+            return
+        # Set UIScaler on loading screen UI component directly
+        if ui_scaler and hasattr(loading_screen, 'set_ui_scaler'):
+            loading_screen.set_ui_scaler(ui_scaler)
+        loading_screen.draw(screen, fonts)
+
+
+def _confirmation_option(app_state):
+    return getattr(app_state, 'confirmation_option_index', 0)
+
+
+def _confirmation(message):
+    return StaticDrawFunctionView(draw_confirmation_view, lambda app_state, values, history: {"message": message},
+                                  state=_confirmation_option)
+
+
+def _build_view_registry():
+    """State -> view table used by update_display."""
+    registry = ViewRegistry(fallback=MessageView("Error: Unknown state"))
+    with_sensor_values = lambda app_state, values, history: {"sensor_values": values}
+    with_sensor_data = lambda app_state, values, history: {"sensor_values": values, "sensor_history": history}
+
+    # Main menu and sensors
+    registry.register(STATE_MENU, DrawFunctionView(draw_menu_screen, with_sensor_values))
+    registry.register(STATE_DASHBOARD, DashboardView())
+    registry.register(STATE_SENSOR_VIEW, SensorView())
+    registry.register(STATE_SENSORS_MENU, DrawFunctionView(draw_sensors_menu_view, with_sensor_data))
+    registry.register(STATE_SYSTEM_INFO, DrawFunctionView(draw_system_info_view, with_sensor_values))
+
+    # Schematics, logs, data and crew
+    registry.register(STATE_SCHEMATICS, SchematicsView())
+    registry.register((STATE_SCHEMATICS_MENU, STATE_LOGS_MENU, STATE_DATA_MENU), ListMenuView(draw_schematics_menu_view))
+    registry.register(STATE_SCHEMATICS_CATEGORY, ListMenuView(draw_schematics_category_view))
+    registry.register(STATE_CREW_MENU, ListMenuView(draw_crew_menu_view))
+    registry.register(STATE_CREW_DETAIL, DrawFunctionView(draw_crew_detail_view))
+    registry.register(STATE_MEDIA_PLAYER, MediaPlayerView())
+    registry.register(STATE_ST_WIKI, DrawFunctionView(draw_star_trek_wiki_view))
+
+    # Secret games
+    registry.register(STATE_SECRET_GAMES, DrawFunctionView(draw_secret_games_view))
+    registry.register(STATE_PONG_ACTIVE, GameView("active_pong_game", "Pong"))
+    registry.register(STATE_BREAKOUT_ACTIVE, GameView("active_breakout_game", "Breakout"))
+    registry.register(STATE_SNAKE_ACTIVE, GameView("active_snake_game", "Snake"))
+    registry.register(STATE_TETRIS_ACTIVE, GameView("active_tetris_game", "Tetris"))
+
+    # Settings
+    registry.register(STATE_SETTINGS, ListMenuView(draw_settings_view))
+    registry.register(STATE_SETTINGS_DISPLAY, ListMenuView(draw_display_settings_view))
+    registry.register(STATE_DISPLAY_CYCLE_INTERVAL, ListMenuView(draw_display_cycle_interval_view))
+    registry.register(STATE_SETTINGS_DEVICE, ListMenuView(draw_device_settings_view))
+    registry.register(STATE_SETTINGS_CONTROLS, DrawFunctionView(draw_controls_view))
+    registry.register(STATE_SETTINGS_UPDATE, DrawFunctionView(draw_update_view))
+    registry.register(STATE_SETTINGS_STAPI, ListMenuView(draw_stapi_settings_view))
+    registry.register(STATE_SETTINGS_SOUND_TEST, ListMenuView(draw_sound_test_view))
+    registry.register(STATE_SETTINGS_DEBUG, ListMenuView(draw_debug_settings_view))
+    registry.register(STATE_SETTINGS_DEBUG_OVERLAY, ListMenuView(draw_debug_overlay_view))
+    registry.register(STATE_SETTINGS_LOG_VIEWER, DrawFunctionView(draw_log_viewer_view))
+    registry.register(STATE_SELECT_COMBO_DURATION, ListMenuView(draw_select_combo_duration_view))
+    registry.register(STATE_SETTINGS_VOLUME, DrawFunctionView(draw_volume_settings_view))
+    registry.register(STATE_SETTINGS_WIFI, ListMenuView(draw_wifi_settings_view))
+    registry.register(STATE_SETTINGS_WIFI_NETWORKS, DrawFunctionView(draw_wifi_networks_view))
+    registry.register(STATE_SETTINGS_WIFI_FORGET, DrawFunctionView(draw_wifi_forget_view))
+    registry.register(STATE_WIFI_PASSWORD_ENTRY, WifiPasswordEntryView())
+    registry.register(STATE_SETTINGS_BLUETOOTH, ListMenuView(draw_bluetooth_settings_view))
+    registry.register(STATE_SETTINGS_BLUETOOTH_DEVICES, DrawFunctionView(draw_bluetooth_devices_view))
+
+    # Confirmation dialogs
+    registry.register(STATE_CONFIRM_REBOOT, _confirmation("Reboot Device?"))
+    registry.register(STATE_CONFIRM_SHUTDOWN, _confirmation("Shutdown Device?"))
+    registry.register(STATE_CONFIRM_RESTART_APP, _confirmation("Restart Application?"))
+    registry.register(STATE_CONFIRM_FORGET_WIFI, StaticDrawFunctionView(
+        draw_confirmation_view,
+        lambda app_state, values, history: {
+            "message": f"Forget {app_state.wifi_forget_ssid}?" if getattr(app_state, 'wifi_forget_ssid', None) else "Forget network?"
+        },
+        state=_confirmation_option,
+    ))
+
+    registry.register(STATE_LOADING, LoadingView())
+    return registry
+
+
+def _get_view_registry():
+    """Return the view registry, building it on first use."""
+    global view_registry
+    if view_registry is None:
+        view_registry = _build_view_registry()
+    return view_registry
 
 def update_display(screen, app_state, sensor_values, sensor_history, fonts, config_module, ui_scaler_instance=None):
     """
@@ -261,7 +444,7 @@ def update_display(screen, app_state, sensor_values, sensor_history, fonts, conf
     Returns:
         None
     """
-    global ui_scaler
+    global ui_scaler, _retained_view
     
     if not screen or not fonts:
         logger.error("Screen or fonts not initialized for drawing.")
@@ -270,8 +453,8 @@ def update_display(screen, app_state, sensor_values, sensor_history, fonts, conf
     # Use provided UIScaler or fall back to global instance
     current_ui_scaler = ui_scaler_instance or ui_scaler
     if not current_ui_scaler:
-        logger.warning("No UIScaler available, creating temporary instance")
-        current_ui_scaler = UIScaler(screen.get_width(), screen.get_height(), config_module)
+        logger.warning("No UIScaler available, creating one for the current screen")
+        current_ui_scaler = ui_scaler = UIScaler(screen.get_width(), screen.get_height(), config_module)
 
     # Re-hide mouse cursor every frame (kiosk mode). VLC detach, games, and display mode
     # switches can cause SDL/OS to show the cursor again; re-assert hidden here.
@@ -295,199 +478,39 @@ def update_display(screen, app_state, sensor_values, sensor_history, fonts, conf
         and app_state.media_player_manager
         and (app_state.media_player_manager.is_playing() or app_state.media_player_manager.is_paused())
     )
-    if not show_video:
+    # Retained views draw over their previous frame and report what they changed; the
+    # debug overlay draws over whole frames, so it needs full redraws
+    presenter = get_frame_presenter()
+    registry = _get_view_registry()
+    view = registry.activate(app_state.current_state, app_state)
+    debug_overlay_enabled = hasattr(app_state, 'debug_overlay') and app_state.debug_overlay.enabled
+    retained = bool(view and view.retained and not show_video and not debug_overlay_enabled)
+    if view and (not retained or presenter.invalidated or _retained_view is not view):
+        view.invalidate_frame()
+    _retained_view = view if retained else None
+    if not show_video and not retained:
         screen.fill(config_module.Theme.BACKGROUND)
 
-    # Draw the appropriate view based on app state
-    if app_state.current_state == STATE_MENU:
-        # Menu state shows sidebar with system info in main content
-        draw_menu_screen(screen, app_state, fonts, config_module, sensor_values, current_ui_scaler)
-    elif app_state.current_state == STATE_DASHBOARD:
-        # Use the merged sensor view for the dashboard
-        draw_sensor_view(screen, app_state, sensor_values, sensor_history, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state == STATE_SENSOR_VIEW:
-        # For all sensors, use the standard sensor_view
-        draw_sensor_view(screen, app_state, sensor_values, sensor_history, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state == STATE_SYSTEM_INFO:
-        # System info state shows system info full screen using the new view
-        draw_system_info_view(screen, app_state, sensor_values, fonts, config_module, ui_scaler=current_ui_scaler)
-    elif app_state.current_state == STATE_SETTINGS:
-        # Settings state shows settings full screen using the new view
-        draw_settings_view(screen, app_state, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state == STATE_SCHEMATICS:
-        # Schematics state will show the 3D model viewer
-        if current_display_mode == "OPENGL":
-            # For OpenGL mode, we need special handling
-            _render_opengl_schematics(screen, app_state, fonts, config_module, current_ui_scaler)
-        else:
-            # Normal mode rendering
-            draw_schematics_view(screen, app_state, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state in (STATE_SCHEMATICS_MENU, STATE_LOGS_MENU, STATE_DATA_MENU):
-        # Schematics submenus (Ship, Logs, Data)
-        draw_schematics_menu_view(screen, app_state, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state == STATE_CREW_MENU:
-        draw_crew_menu_view(screen, app_state, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state == STATE_CREW_DETAIL:
-        draw_crew_detail_view(screen, app_state, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state == STATE_SCHEMATICS_CATEGORY:
-        # Schematics category: Schematics | Media Player
-        draw_schematics_category_view(screen, app_state, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state == STATE_MEDIA_PLAYER:
-        # Media player: embed VLC in our window (same as 3D schematics)
-        try:
-            wm_info = pygame.display.get_wm_info()
-            hwnd = wm_info.get("window")
-            if hwnd is not None and hasattr(app_state, "media_player_manager") and app_state.media_player_manager:
-                app_state.media_player_manager.set_window_handle(hwnd)
-        except Exception:
-            pass
-        draw_media_player_view(screen, app_state, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state == STATE_ST_WIKI:
-        draw_star_trek_wiki_view(screen, app_state, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state == STATE_SECRET_GAMES:
-        # Draw the secret games menu
-        draw_secret_games_view(screen, app_state, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state == STATE_PONG_ACTIVE:
-        if app_state.active_pong_game:
-            screen.fill(config_module.Theme.BACKGROUND)
-            _draw_game_into_display(screen, app_state.active_pong_game, fonts, config_module, current_ui_scaler)
-        else:
-            logger.error("In PONG_ACTIVE state but no active_pong_game instance found!")
-            screen.fill(config_module.Theme.BACKGROUND)
-            error_text = fonts['medium'].render("Error: Pong game not loaded", True, config_module.Theme.ALERT)
-            cx = current_ui_scaler.screen_width // 2 if current_ui_scaler else screen.get_width() // 2
-            cy = current_ui_scaler.screen_height // 2 if current_ui_scaler else screen.get_height() // 2
-            screen.blit(error_text, (cx - error_text.get_width()//2, cy - error_text.get_height()//2))
-    elif app_state.current_state == STATE_BREAKOUT_ACTIVE:
-        if app_state.active_breakout_game:
-            screen.fill(config_module.Theme.BACKGROUND)
-            _draw_game_into_display(screen, app_state.active_breakout_game, fonts, config_module, current_ui_scaler)
-        else:
-            logger.error("In BREAKOUT_ACTIVE state but no active_breakout_game instance found!")
-            screen.fill(config_module.Theme.BACKGROUND)
-            error_text = fonts['medium'].render("Error: Breakout game not loaded", True, config_module.Theme.ALERT)
-            cx = current_ui_scaler.screen_width // 2 if current_ui_scaler else screen.get_width() // 2
-            cy = current_ui_scaler.screen_height // 2 if current_ui_scaler else screen.get_height() // 2
-            screen.blit(error_text, (cx - error_text.get_width()//2, cy - error_text.get_height()//2))
-    elif app_state.current_state == STATE_SNAKE_ACTIVE:
-        if app_state.active_snake_game:
-            screen.fill(config_module.Theme.BACKGROUND)
-            _draw_game_into_display(screen, app_state.active_snake_game, fonts, config_module, current_ui_scaler)
-        else:
-            logger.error("In SNAKE_ACTIVE state but no active_snake_game instance found!")
-            screen.fill(config_module.Theme.BACKGROUND)
-            error_text = fonts['medium'].render("Error: Snake game not loaded", True, config_module.Theme.ALERT)
-            cx = current_ui_scaler.screen_width // 2 if current_ui_scaler else screen.get_width() // 2
-            cy = current_ui_scaler.screen_height // 2 if current_ui_scaler else screen.get_height() // 2
-            screen.blit(error_text, (cx - error_text.get_width()//2, cy - error_text.get_height()//2))
-    elif app_state.current_state == STATE_TETRIS_ACTIVE:
-        if app_state.active_tetris_game:
-            screen.fill(config_module.Theme.BACKGROUND)
-            _draw_game_into_display(screen, app_state.active_tetris_game, fonts, config_module, current_ui_scaler)
-        else:
-            logger.error("In TETRIS_ACTIVE state but no active_tetris_game instance found!")
-            screen.fill(config_module.Theme.BACKGROUND)
-            error_text = fonts['medium'].render("Error: Tetris game not loaded", True, config_module.Theme.ALERT)
-            cx = current_ui_scaler.screen_width // 2 if current_ui_scaler else screen.get_width() // 2
-            cy = current_ui_scaler.screen_height // 2 if current_ui_scaler else screen.get_height() // 2
-            screen.blit(error_text, (cx - error_text.get_width()//2, cy - error_text.get_height()//2))
-    elif app_state.current_state == STATE_SENSORS_MENU:
-        # Draw the sensors menu
-        draw_sensors_menu_view(screen, app_state, sensor_values, sensor_history, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state == STATE_SETTINGS_DISPLAY:
-        draw_display_settings_view(screen, app_state, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state == STATE_DISPLAY_CYCLE_INTERVAL:
-        draw_display_cycle_interval_view(screen, app_state, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state == STATE_SETTINGS_DEVICE:
-        draw_device_settings_view(screen, app_state, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state == STATE_SETTINGS_CONTROLS:
-        draw_controls_view(screen, app_state, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state == STATE_SETTINGS_UPDATE:
-        draw_update_view(screen, app_state, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state == STATE_SETTINGS_STAPI:
-        draw_stapi_settings_view(screen, app_state, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state == STATE_SETTINGS_SOUND_TEST:
-        draw_sound_test_view(screen, app_state, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state == STATE_SETTINGS_DEBUG:
-        draw_debug_settings_view(screen, app_state, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state == STATE_SETTINGS_DEBUG_OVERLAY:
-        draw_debug_overlay_view(screen, app_state, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state == STATE_SETTINGS_LOG_VIEWER:
-        draw_log_viewer_view(screen, app_state, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state == STATE_CONFIRM_REBOOT:
-        draw_confirmation_view(screen, app_state, fonts, config_module, message="Reboot Device?", ui_scaler=current_ui_scaler)
-    elif app_state.current_state == STATE_CONFIRM_SHUTDOWN:
-        draw_confirmation_view(screen, app_state, fonts, config_module, message="Shutdown Device?", ui_scaler=current_ui_scaler)
-    elif app_state.current_state == STATE_CONFIRM_RESTART_APP:
-        draw_confirmation_view(screen, app_state, fonts, config_module, message="Restart Application?", ui_scaler=current_ui_scaler)
-    elif app_state.current_state == STATE_SELECT_COMBO_DURATION:
-        draw_select_combo_duration_view(screen, app_state, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state == STATE_SETTINGS_VOLUME:
-        draw_volume_settings_view(screen, app_state, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state == STATE_SETTINGS_WIFI:
-        draw_wifi_settings_view(screen, app_state, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state == STATE_SETTINGS_BLUETOOTH:
-        draw_bluetooth_settings_view(screen, app_state, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state == STATE_SETTINGS_BLUETOOTH_DEVICES:
-        draw_bluetooth_devices_view(screen, app_state, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state == STATE_SETTINGS_WIFI_NETWORKS:
-        draw_wifi_networks_view(screen, app_state, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state == STATE_SETTINGS_WIFI_FORGET:
-        draw_wifi_forget_view(screen, app_state, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state == STATE_CONFIRM_FORGET_WIFI:
-        msg = getattr(app_state, 'wifi_forget_ssid', None)
-        draw_confirmation_view(screen, app_state, fonts, config_module, message=f"Forget {msg}?" if msg else "Forget network?", ui_scaler=current_ui_scaler)
-    elif app_state.current_state == STATE_WIFI_PASSWORD_ENTRY:
-        # Set fonts for password entry manager if not already set
-        if not app_state.password_entry_manager.character_selector.fonts:
-            app_state.password_entry_manager.character_selector.fonts = fonts
-        draw_wifi_password_entry_view(screen, app_state, fonts, config_module, current_ui_scaler)
-    elif app_state.current_state == STATE_LOADING:
-        # Draw loading screen - handle UI component setup here in display layer
-        loading_screen = app_state.get_loading_screen()
-        if loading_screen:
-            # Set UIScaler on loading screen UI component directly
-            if current_ui_scaler and hasattr(loading_screen, 'set_ui_scaler'):
-                loading_screen.set_ui_scaler(current_ui_scaler)
-            loading_screen.draw(screen, fonts)
-        else:
-            # Fallback if no loading screen
-            screen.fill(config_module.Theme.BACKGROUND)
-            error_text = fonts['medium'].render("Loading...", True, config_module.Theme.FOREGROUND)
-            cx = current_ui_scaler.screen_width // 2 if current_ui_scaler else screen.get_width() // 2
-            cy = current_ui_scaler.screen_height // 2 if current_ui_scaler else screen.get_height() // 2
-            screen.blit(error_text, (cx - error_text.get_width()//2, cy - error_text.get_height()//2))
-    else:
-        logger.error(f"Unknown application state: {app_state.current_state}")
-        # Draw fallback screen
-        screen.fill(config_module.Theme.BACKGROUND)
-        error_text = fonts['medium'].render("Error: Unknown state", True, config_module.Theme.ALERT)
-        cx = current_ui_scaler.screen_width // 2 if current_ui_scaler else screen.get_width() // 2
-        cy = current_ui_scaler.screen_height // 2 if current_ui_scaler else screen.get_height() // 2
-        screen.blit(error_text, (cx - error_text.get_width()//2, cy - error_text.get_height()//2))
+    # Draw the view registered for the current state
+    registry.render(screen, app_state, sensor_values, sensor_history, fonts, config_module, current_ui_scaler)
     # When VLC is showing video it draws directly into the window; do not overwrite with
     # Pygame's surface (flip) or we get menu/video flashing every frame.
     if not show_video:
         # Update and draw debug overlay if enabled
-        if hasattr(app_state, 'debug_overlay') and app_state.debug_overlay.enabled:
+        if debug_overlay_enabled:
             app_state.debug_overlay.update()
             app_state.debug_overlay.draw(screen, fonts, config_module)
 
-        # Apply rounded corner clipping to match curved screen protector
+        # Apply rounded corner clipping to match curved screen protector (idempotent, so
+        # retained frames can reapply it over their redrawn regions)
         if current_ui_scaler and current_ui_scaler.safe_area_enabled:
-            mask_surface = pygame.Surface((current_ui_scaler.screen_width, current_ui_scaler.screen_height), pygame.SRCALPHA)
-            mask_surface.fill((0, 0, 0, 0))  # Transparent
-
-            # Draw rounded rectangle in white (visible area); use theme radius app-wide
-            safe_rect = current_ui_scaler.get_safe_area_rect()
             corner_radius = getattr(config_module.Theme, 'CORNER_CURVE_RADIUS', 8)
-            pygame.draw.rect(mask_surface, (255, 255, 255, 255), safe_rect, border_radius=corner_radius)
+            apply_safe_area_mask(screen, current_ui_scaler, corner_radius)
 
-            # Apply the mask to clip content to rounded corners
-            screen.blit(mask_surface, (0, 0), special_flags=pygame.BLEND_MULT)
-
-        # Update the display
-        pygame.display.flip()
+        # Update the display: only the regions the view reported (retained) or a full flip
+        presenter.present(screen, retained=retained)
+    else:
+        presenter.invalidate()  # VLC owns the window; repaint fully once it stops
 
 def _render_opengl_schematics(screen, app_state, fonts, config_module, ui_scaler):
     """Handle OpenGL rendering for schematics view with full UI controls."""
@@ -0,0 +1,165 @@
+# --- ui/frame_presenter.py ---
+# Presents finished frames to the display, pushing only the regions that changed
+
+import logging
+
+import numpy as np
+import pygame
+
+logger = logging.getLogger(__name__)
+
+_tobytes = getattr(pygame.image, "tobytes", None) or pygame.image.tostring
+
+
+class FramePresenter:
+    """
+    Dirty-rectangle presentation for the software (non-OpenGL) display.
+
+    Retained views (View.retained) leave their previous frame on the screen, redraw only
+    what changed and report each region they drew with mark_dirty(); present(screen,
+    retained=True) pushes just those regions with pygame.display.update(rects), and nothing
+    at all when no region was marked. Frames drawn in full by other views are flipped, or
+    with pixel_diff enabled (config DIRTY_RECT_PIXEL_DIFF, on by default) compared with the
+    last presented frame in tile_size x tile_size tiles so only changed tiles are pushed and
+    an unchanged frame pushes nothing; that costs a copy and a compare of the whole frame,
+    which retained views avoid. Updates covering at least
+    full_update_ratio of the screen fall back to a plain flip(). Anything that draws to the
+    window behind the presenter's back (VLC video, error screens, display mode switches) must
+    call invalidate(): the next frame is pushed in full and retained views redraw everything.
+    """
+
+    def __init__(self, tile_size=16, full_update_ratio=0.5, enabled=True, pixel_diff=False):
+        """
+        Initialize the presenter.
+
+        Args:
+            tile_size (int): Side of the comparison tiles in pixels
+            full_update_ratio (float): Fraction of the screen at which a full flip is cheaper
+            enabled (bool): False always flips (previous behavior)
+            pixel_diff (bool): Diff frames of non-retained views instead of flipping them
+        """
+        self.tile_size = max(1, int(tile_size))
+        self.full_update_ratio = full_update_ratio
+        self.enabled = enabled
+        self.pixel_diff = pixel_diff
+        self._previous = None  # uint32 (height, width) copy of the last presented frame (pixel_diff)
+        self._marked_rects = []
+        self._invalidated = True
+        self.frames_skipped = 0
+
+    @property
+    def invalidated(self):
+        """True until the next full flip after invalidate(): the window may not show the last frame."""
+        return self._invalidated
+
+    def invalidate(self):
+        """Present the next frame in full (the window no longer shows the last frame)."""
+        self._invalidated = True
+
+    def mark_dirty(self, rect):
+        """Push rect with the next frame (retained views report every region they drew)."""
+        self._marked_rects.append(pygame.Rect(rect))
+
+    def present(self, screen, retained=False):
+        """
+        Push the frame drawn on screen to the display.
+
+        Args:
+            screen (pygame.Surface): The finished frame
+            retained (bool): The frame was drawn by a retained view on top of the previous
+                one; only the regions passed to mark_dirty() changed
+
+        Returns:
+            list or None: Rects that were updated ([] when the frame was unchanged), None after a full flip
+        """
+        marked_rects, self._marked_rects = self._marked_rects, []
+        if not self.enabled or screen.get_flags() & pygame.OPENGL:
+            self._previous = None
+            return self._flip()
+
+        screen_rect = screen.get_rect()
+        if retained:
+            self._previous = None  # Not compared: the diff baseline is stale from here on
+            if self._invalidated:
+                return self._flip()
+            rects = [rect.clip(screen_rect) for rect in marked_rects]
+            rects = [rect for rect in rects if rect.width and rect.height]
+            if sum(rect.width * rect.height for rect in rects) >= self.full_update_ratio * screen_rect.width * screen_rect.height:
+                return self._flip()
+        elif not self.pixel_diff:
+            return self._flip()
+        else:
+            width, height = screen.get_size()
+            frame = np.frombuffer(_tobytes(screen, "RGBX"), dtype=np.uint32).reshape(height, width)
+            previous, self._previous = self._previous, frame
+            if self._invalidated or previous is None or previous.shape != frame.shape:
+                return self._flip()
+            tiles = self._changed_tiles(frame, previous)
+            if tiles.mean() >= self.full_update_ratio:
+                return self._flip()
+            rects = self._tiles_to_rects(tiles, screen_rect)
+            rects.extend(rect.clip(screen_rect) for rect in marked_rects)
+            rects = [rect for rect in rects if rect.width and rect.height]
+
+        if not rects:
+            self.frames_skipped += 1
+            return rects
+        pygame.display.update(rects)
+        return rects
+
+    def _flip(self):
+        self._invalidated = False
+        pygame.display.flip()
+        return None
+
+    def _changed_tiles(self, frame, previous):
+        """Boolean (rows, cols) grid of tiles containing at least one changed pixel."""
+        size = self.tile_size
+        height, width = frame.shape
+        rows, cols = -(-height // size), -(-width // size)
+        changed = frame != previous
+        if rows * size != height or cols * size != width:
+            padded = np.zeros((rows * size, cols * size), dtype=bool)
+            padded[:height, :width] = changed
+            changed = padded
+        # Reduce one axis at a time (much faster than any() over two strided axes at once)
+        changed_rows = changed.reshape(rows, size, cols * size).any(axis=1)
+        return changed_rows.reshape(rows, cols, size).any(axis=2)
+
+    def _tiles_to_rects(self, tiles, screen_rect):
+        """Merge changed tiles into horizontal runs, then stack equal runs on adjacent rows."""
+        if not tiles.any():
+            return []
+        size = self.tile_size
+        # Run edges for every row at once: +1 where a run starts, -1 one past where it ends
+        edges = np.diff(np.pad(tiles.view(np.int8), ((0, 0), (1, 1))), axis=1)
+        starts = np.argwhere(edges == 1).tolist()  # Row-major order, so starts and ends pair up
+        ends = np.argwhere(edges == -1)[:, 1].tolist()
+        rects = []
+        open_runs = {}  # (first col, end col) -> (last row, Rect still growing downwards)
+        for (row, start), end in zip(starts, ends):
+            last_row, rect = open_runs.get((start, end), (None, None))
+            if last_row == row - 1:
+                rect.height += size
+            else:
+                rect = pygame.Rect(start * size, row * size, (end - start) * size, size)
+                rects.append(rect)
+            open_runs[(start, end)] = (row, rect)
+        return [rect.clip(screen_rect) for rect in rects]
+
+
+_shared_presenter = None
+
+
+def get_frame_presenter():
+    """Return the application-wide FramePresenter (configured by config DIRTY_RECT_* settings)."""
+    global _shared_presenter
+    if _shared_presenter is None:
+        import config
+        _shared_presenter = FramePresenter(
+            tile_size=getattr(config, "DIRTY_RECT_TILE_SIZE", 16),
+            full_update_ratio=getattr(config, "DIRTY_RECT_FULL_UPDATE_RATIO", 0.5),
+            enabled=getattr(config, "DIRTY_RECT_RENDERING", True),
+            pixel_diff=getattr(config, "DIRTY_RECT_PIXEL_DIFF", False),
+        )
+    return _shared_presenter
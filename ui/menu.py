@@ -3,6 +3,7 @@
 
 import pygame
 import logging
+import math
 import time
 from datetime import datetime
 from config import version
@@ -11,6 +12,9 @@ from ui.components.menus.menu_base import draw_menu_base_layout
 from ui.components.text.text_display import render_footer
 from models.app_state import STATE_MENU, STATE_SECRET_GAMES # Import necessary states
 from config import CLASSIFIED_TEXT
+from utils.animation_layers import COLORKEY, get_animation_layers
+from utils.asset_cache import get_asset_cache
+from utils.text_cache import get_text_cache
 
 logger = logging.getLogger(__name__)
 
@@ -127,22 +131,21 @@ def _draw_main_menu_content(screen, main_content_rect, sensor_values, fonts, con
     
     current_logo_path = logo_paths[logo_cycle_phase]
     
-    logo_surface = None
-    scaled_logo_height = 0 
-    try:
-        logo_surface = pygame.image.load(current_logo_path).convert_alpha()
-    except pygame.error as e:
-        logger.warning(f"Could not load logo '{current_logo_path}' for menu: {e}")
+    # Decoded and scaled once via the shared asset cache (failures are logged once, not per frame)
+    asset_cache = get_asset_cache()
+    logo_path = current_logo_path
+    logo_original = asset_cache.load(logo_path)
+    if logo_original is None and logo_path != config_module.SPLASH_LOGO_PATH:
         # Fallback to main logo
-        try:
-            logo_surface = pygame.image.load(config_module.SPLASH_LOGO_PATH).convert_alpha()
-        except pygame.error as e2:
-            logger.warning(f"Could not load fallback logo: {e2}")
+        logo_path = config_module.SPLASH_LOGO_PATH
+        logo_original = asset_cache.load(logo_path)
     
-    if logo_surface:
+    logo_surface = None
+    scaled_logo_height = 0 
+    if logo_original:
         content_width = main_content_rect.width
         content_height = main_content_rect.height
-        logo_orig_width, logo_orig_height = logo_surface.get_size()
+        logo_orig_width, logo_orig_height = logo_original.get_size()
         
         # Use UIScaler for responsive logo sizing - make it larger since we removed WiFi info
         max_logo_width = int(content_width * 0.8)  # Increased from 0.6
@@ -158,12 +161,7 @@ def _draw_main_menu_content(screen, main_content_rect, sensor_values, fonts, con
             scale_ratio = max_logo_height / scaled_logo_height
             scaled_logo_height = max_logo_height
             scaled_width = int(scaled_width * scale_ratio)
-        if scaled_width != logo_orig_width or scaled_logo_height != logo_orig_height:
-            try:
-                logo_surface = pygame.transform.smoothscale(logo_surface, (scaled_width, scaled_logo_height))
-            except pygame.error as e:
-                logger.warning(f"Could not scale logo: {e}")
-                logo_surface = None
+        logo_surface = asset_cache.load(logo_path, (scaled_width, scaled_logo_height))
     
     # Center the logo vertically in the available space
     logo_display_y = main_content_rect.top + (main_content_rect.height // 2) - (scaled_logo_height // 2 if logo_surface else 0)
@@ -180,40 +178,43 @@ def _draw_main_menu_content(screen, main_content_rect, sensor_values, fonts, con
             # Fading out with smooth curve
             fade_progress = (cycle_progress - (1.0 - fade_duration / logo_cycle_interval)) / (fade_duration / logo_cycle_interval)
             # Use sine curve for smoother fade
-            alpha = int(255 * (0.5 + 0.5 * pygame.math.Vector2(1, 0).rotate((1.0 - fade_progress) * 90).x))
+            alpha = int(255 * (0.5 + 0.5 * math.cos(math.radians((1.0 - fade_progress) * 90))))
         elif cycle_progress < (fade_duration / logo_cycle_interval):
             # Fading in with smooth curve
             fade_progress = cycle_progress / (fade_duration / logo_cycle_interval)
             # Use sine curve for smoother fade
-            alpha = int(255 * (0.5 + 0.5 * pygame.math.Vector2(1, 0).rotate(fade_progress * 90).x))
+            alpha = int(255 * (0.5 + 0.5 * math.cos(math.radians(fade_progress * 90))))
         else:
             alpha = 255
         
-        # Apply alpha if fading
-        if alpha < 255:
-            logo_surface = logo_surface.copy()
-            logo_surface.set_alpha(alpha)
-        
         # Improved breathing effect with smoother, less frequent scaling
         breathing_cycle = 12.0  # Slower, more relaxed breathing cycle
+        breathing_amplitude = 0.015  # Reduced scale range
         breathing_progress = (current_time % breathing_cycle) / breathing_cycle
-        # Reduced scale range and smoother curve
-        breathing_scale = 1.0 + (0.015 * (0.5 + 0.5 * pygame.math.Vector2(1, 0).rotate(breathing_progress * 360).x))
+        breathing_level = 0.5 + 0.5 * math.cos(math.radians(breathing_progress * 360))
         
         # Only apply breathing when not fading to avoid compound scaling issues
-        if alpha >= 240 and breathing_scale != 1.0:
-            # Scale the logo slightly for breathing effect
-            new_width = int(logo_surface.get_width() * breathing_scale)
-            new_height = int(logo_surface.get_height() * breathing_scale)
-            if new_width > 0 and new_height > 0:
-                try:
-                    logo_surface = pygame.transform.smoothscale(logo_surface, (new_width, new_height))
+        if alpha >= 240:
+            # Snap to one of a few precomputed scale steps; each frame is scaled once and cached
+            breathing_frames = max(2, getattr(config_module, "LOGO_BREATHING_FRAMES", 8))
+            step = round(breathing_level * (breathing_frames - 1))
+            if step > 0:
+                breathing_scale = 1.0 + breathing_amplitude * step / (breathing_frames - 1)
+                new_width = int(scaled_width * breathing_scale)
+                new_height = int(scaled_logo_height * breathing_scale)
+                breathing_surface = asset_cache.load(logo_path, (new_width, new_height))
+                if breathing_surface is not None:
+                    logo_surface = breathing_surface
                     # Recalculate position to keep centered
                     logo_rect = logo_surface.get_rect(centerx=main_content_rect.centerx, centery=logo_display_y + scaled_logo_height // 2)
-                except pygame.error:
-                    pass  # Use original if scaling fails
         
-        screen.blit(logo_surface, logo_rect)
+        # Fade via surface alpha on the shared cached surface; restored right after the blit
+        if alpha < 255:
+            logo_surface.set_alpha(alpha)
+            screen.blit(logo_surface, logo_rect)
+            logo_surface.set_alpha(255)
+        else:
+            screen.blit(logo_surface, logo_rect)
         
         # Add multiple tricorder-style animations
         _draw_tricorder_scanning_effect(screen, main_content_rect, logo_rect, current_time, config_module, ui_scaler)
@@ -228,21 +229,22 @@ def _draw_floating_data_particles(screen, main_content_rect, logo_rect, current_
     """
     if main_content_rect.width < 200 or main_content_rect.height < 150:
         return
-    margin = ui_scaler.margin("small")
+    margin = ui_scaler.layout.margin_small
     dot_size = 1
     num_particles = 12
     speed = 0.03
+    # Periods of minutes, so drawn directly rather than from a pre-rendered layer
     for i in range(num_particles):
         seed = (i * 1.618) % 1.0  # golden ratio spread
         # Horizontal drift with vertical wave
         x_phase = (current_time * speed + seed * 6.28) % 6.28
         y_phase = (current_time * 0.02 + i * 0.7) % 6.28
-        x = main_content_rect.left + margin + (main_content_rect.width - 2 * margin) * (0.5 + 0.4 * pygame.math.Vector2(1, 0).rotate(x_phase * 57.3).x)
-        y = main_content_rect.top + margin + (main_content_rect.height - 2 * margin) * (0.5 + 0.45 * pygame.math.Vector2(1, 0).rotate(y_phase * 57.3).x)
+        x = main_content_rect.left + margin + (main_content_rect.width - 2 * margin) * (0.5 + 0.4 * math.cos(math.radians(x_phase * 57.3)))
+        y = main_content_rect.top + margin + (main_content_rect.height - 2 * margin) * (0.5 + 0.45 * math.cos(math.radians(y_phase * 57.3)))
         # Skip if too close to logo center to avoid clutter
         if logo_rect.collidepoint(x, y):
             continue
-        alpha = 0.3 + 0.2 * (0.5 + 0.5 * pygame.math.Vector2(1, 0).rotate((current_time + i) * 0.5).x)
+        alpha = 0.3 + 0.2 * (0.5 + 0.5 * math.cos(math.radians((current_time + i) * 0.5)))
         color = (0, int(70 * alpha), int(25 * alpha))
         pygame.draw.circle(screen, color, (int(x), int(y)), dot_size)
 
@@ -255,18 +257,27 @@ def _draw_subtle_grid_drift(screen, main_content_rect, current_time, config_modu
         return
     line_spacing = ui_scaler.scale(24) if ui_scaler else 24
     drift = int((current_time * 8) % line_spacing) - line_spacing // 2
-    y_start = main_content_rect.top + drift
+    # The visible lines repeat every line_spacing pixels: blit a window of one cached
+    # strip (lines every line_spacing, one spacing taller than the area) at the drift offset
+    width, height = main_content_rect.width + 1, main_content_rect.height
+    strip = get_asset_cache().get_or_create(
+        ("menu_grid_drift", width, height, line_spacing),
+        lambda: _build_grid_drift_strip(width, height + line_spacing, line_spacing),
+    )
+    first_line = drift % line_spacing
+    screen.blit(strip, main_content_rect.topleft, pygame.Rect(0, (line_spacing - first_line) % line_spacing, width, height))
+
+
+def _build_grid_drift_strip(width, height, line_spacing):
+    """Color-keyed strip with a dim scan line every line_spacing pixels from the top."""
+    strip = pygame.Surface((width, height)).convert()
+    strip.fill(COLORKEY)
     dim = (0, 35, 12)
-    while y_start < main_content_rect.bottom:
-        if y_start >= main_content_rect.top:
-            pygame.draw.line(
-                screen, dim,
-                (main_content_rect.left, y_start),
-                (main_content_rect.right, y_start),
-                1
-            )
-        y_start += line_spacing
-    
+    for y in range(0, height, line_spacing):
+        pygame.draw.line(strip, dim, (0, y), (width - 1, y), 1)
+    strip.set_colorkey(COLORKEY, pygame.RLEACCEL)
+    return strip
+
 def _draw_tricorder_scanning_effect(screen, main_content_rect, logo_rect, current_time, config_module, ui_scaler):
     """
     Draw tricorder-style scanning lines animation (growing/shrinking bars below logo).
@@ -274,37 +285,48 @@ def _draw_tricorder_scanning_effect(screen, main_content_rect, logo_rect, curren
     scan_speed = 2.2
     scan_height = max(2, ui_scaler.scale(2) if ui_scaler else 2)
     scan_spacing = max(12, (ui_scaler.scale(14) if ui_scaler else 14))
-    scan_area_top = logo_rect.bottom + ui_scaler.margin("medium")
+    layout = ui_scaler.layout
+    scan_area_top = logo_rect.bottom + layout.margin_medium
     # Leave room for footer (stardate/version) so animations don't overlap
-    footer_clearance = ui_scaler.margin("large") + ui_scaler.scale(24)
+    footer_clearance = layout.margin_large + ui_scaler.scale(24)
     scan_area_bottom = main_content_rect.bottom - footer_clearance
     scan_area_height = scan_area_bottom - scan_area_top
 
     if scan_area_height > 30:
         num_lines = max(2, scan_area_height // scan_spacing)
         max_width = main_content_rect.width * 0.75
-        primary = (0, 140, 45)
-        secondary = (0, 90, 28)
-
-        for i in range(num_lines):
-            line_offset = i * 0.25
-            line_progress = (current_time * scan_speed + line_offset) % 4.0
-            if line_progress >= 2.0:
-                continue
-            line_y = scan_area_top + (i * scan_spacing)
-            if line_progress < 1.0:
-                line_width = int(max_width * line_progress)
-            else:
-                line_width = int(max_width * (2.0 - line_progress))
-            if line_width < 6:
-                continue
-            line_x = main_content_rect.centerx - line_width // 2
-            line_rect = pygame.Rect(line_x, line_y, line_width, scan_height)
-            scan_color = secondary if i % 2 else primary
-            pygame.draw.rect(screen, scan_color, line_rect)
-            # Slight highlight on top edge for depth
-            highlight = (min(255, scan_color[0] + 40), min(255, scan_color[1] + 30), min(255, scan_color[2] + 15))
-            pygame.draw.line(screen, highlight, (line_rect.left, line_rect.top), (line_rect.right, line_rect.top), 1)
+        # Layer is centered on the content area; one spare pixel each side for the highlight line
+        half_width = int(max_width) // 2 + 1
+        bounds = pygame.Rect(main_content_rect.centerx - half_width, scan_area_top,
+                             int(max_width) + 3, (num_lines - 1) * scan_spacing + scan_height)
+
+        def draw_frame(surface, t):
+            primary = (0, 140, 45)
+            secondary = (0, 90, 28)
+            for i in range(num_lines):
+                line_offset = i * 0.25
+                line_progress = (t * scan_speed + line_offset) % 4.0
+                if line_progress >= 2.0:
+                    continue
+                line_y = i * scan_spacing
+                if line_progress < 1.0:
+                    line_width = int(max_width * line_progress)
+                else:
+                    line_width = int(max_width * (2.0 - line_progress))
+                if line_width < 6:
+                    continue
+                line_x = half_width - line_width // 2
+                line_rect = pygame.Rect(line_x, line_y, line_width, scan_height)
+                scan_color = secondary if i % 2 else primary
+                pygame.draw.rect(surface, scan_color, line_rect)
+                # Slight highlight on top edge for depth
+                highlight = (min(255, scan_color[0] + 40), min(255, scan_color[1] + 30), min(255, scan_color[2] + 15))
+                pygame.draw.line(surface, highlight, (line_rect.left, line_rect.top), (line_rect.right, line_rect.top), 1)
+
+        get_animation_layers().blit(
+            screen, ("menu_scan", num_lines, max_width, scan_height, scan_spacing),
+            bounds, 4.0 / scan_speed, current_time, draw_frame,
+        )
 
 def _draw_data_stream_animation(screen, main_content_rect, current_time, config_module, ui_scaler):
     """
@@ -316,26 +338,45 @@ def _draw_data_stream_animation(screen, main_content_rect, current_time, config_
     stream_speed = 3.5
     dot_size = max(2, ui_scaler.scale(2) if ui_scaler else 2)
     stream_length = 14
-    corner_margin = ui_scaler.margin("small")
+    corner_margin = ui_scaler.layout.margin_small
     step_x = 10
     step_y = 5
+    layers = get_animation_layers()
+    # Layer covers the whole stream: 3 steps of flow sideways, stream_length dots down/up, plus the dot radius
+    span_x = int(3.0 * step_x) + 2 * dot_size + 1
+    span_y = (stream_length - 1) * step_y + 2 * dot_size + 1
 
     def draw_stream(origin_x, origin_y, dx, dy, reverse=False):
-        for i in range(stream_length):
-            flow_offset = (current_time * stream_speed + i * 0.4 + (0.5 if reverse else 0)) % 6.0
-            if flow_offset >= 3.0:
-                continue
-            dot_x = origin_x + int(flow_offset * step_x) * (1 if dx > 0 else -1)
-            dot_y = origin_y + (i * step_y) * (1 if dy > 0 else -1)
-            if flow_offset < 1.0:
-                alpha_factor = flow_offset
-            elif flow_offset > 2.0:
-                alpha_factor = 3.0 - flow_offset
-            else:
-                alpha_factor = 1.0
-            dot_color = (0, int(110 * alpha_factor), int(35 * alpha_factor))
-            if dot_color[1] > 15:
-                pygame.draw.circle(screen, dot_color, (dot_x, dot_y), dot_size)
+        bounds = pygame.Rect(0, 0, span_x, span_y)
+        if dx > 0:
+            bounds.left = origin_x - dot_size
+        else:
+            bounds.right = origin_x + dot_size + 1
+        if dy > 0:
+            bounds.top = origin_y - dot_size
+        else:
+            bounds.bottom = origin_y + dot_size + 1
+        local_x, local_y = origin_x - bounds.left, origin_y - bounds.top
+
+        def draw_frame(surface, t):
+            for i in range(stream_length):
+                flow_offset = (t * stream_speed + i * 0.4 + (0.5 if reverse else 0)) % 6.0
+                if flow_offset >= 3.0:
+                    continue
+                dot_x = local_x + int(flow_offset * step_x) * (1 if dx > 0 else -1)
+                dot_y = local_y + (i * step_y) * (1 if dy > 0 else -1)
+                if flow_offset < 1.0:
+                    alpha_factor = flow_offset
+                elif flow_offset > 2.0:
+                    alpha_factor = 3.0 - flow_offset
+                else:
+                    alpha_factor = 1.0
+                dot_color = (0, int(110 * alpha_factor), int(35 * alpha_factor))
+                if dot_color[1] > 15:
+                    pygame.draw.circle(surface, dot_color, (dot_x, dot_y), dot_size)
+
+        layers.blit(screen, ("menu_stream", dx > 0, dy > 0, reverse, dot_size), bounds,
+                    6.0 / stream_speed, current_time, draw_frame)
 
     # Top-right stream (flows right and down)
     draw_stream(
@@ -363,7 +404,7 @@ def _draw_corner_status_indicators(screen, main_content_rect, current_time, conf
     if main_content_rect.width < 150 or main_content_rect.height < 100:
         return
 
-    corner_margin = ui_scaler.margin("small")
+    corner_margin = ui_scaler.layout.margin_small
     indicator_size = max(4, ui_scaler.scale(4) if ui_scaler else 4)
     gap = 8
 
@@ -416,7 +457,7 @@ def _draw_secret_games_content(screen, main_content_rect, fonts, config_module,
     """
     title_font = fonts['large']
     title_text = CLASSIFIED_TEXT
-    title_surface = title_font.render(title_text, True, config_module.Theme.ACCENT)
+    title_surface = get_text_cache().render(title_font, title_text, config_module.Theme.ACCENT)
     # Use UIScaler for responsive positioning
     title_y = main_content_rect.top + ui_scaler.scale(50)
     title_rect = title_surface.get_rect(centerx=main_content_rect.centerx, centery=title_y)
@@ -438,20 +479,24 @@ def _draw_main_menu_footer(screen, main_content_rect, fonts, config_module, scre
 
     # Footer left-aligned in main content area; scale to fit if text is wider than content (avoids cutoff)
     footer_font = fonts.get('small', fonts.get('medium'))
-    footer_surface = footer_font.render(hint_text, True, config_module.Theme.FOREGROUND)
+    footer_surface = get_text_cache().render(footer_font, hint_text, config_module.Theme.FOREGROUND)
+    layout = ui_scaler.layout
     left_inset = max(2, ui_scaler.scale(4))
-    right_inset = ui_scaler.get_safe_area_margins()["right"] if (ui_scaler and ui_scaler.safe_area_enabled) else ui_scaler.margin("small")
+    right_inset = layout.safe_margins["right"] if ui_scaler.safe_area_enabled else layout.margin_small
     available_width = main_content_rect.width - left_inset - right_inset
     if footer_surface.get_width() > available_width and available_width > 0:
         scale_w = available_width
         scale_h = max(1, int(footer_surface.get_height() * (available_width / footer_surface.get_width())))
+        unscaled_surface = footer_surface
         try:
-            footer_surface = pygame.transform.smoothscale(footer_surface, (scale_w, scale_h))
+            footer_surface = get_asset_cache().get_or_create(
+                ("main_menu_footer", hint_text, (scale_w, scale_h)),
+                lambda: pygame.transform.smoothscale(unscaled_surface, (scale_w, scale_h)))
         except pygame.error:
-            pass  # keep original if scale fails
-    footer_margin = ui_scaler.margin("small")
-    safe_bottom = ui_scaler.get_safe_area_margins()["bottom"] if (ui_scaler and ui_scaler.safe_area_enabled) else 0
-    extra_top_offset = ui_scaler.margin("medium") + ui_scaler.scale(8)
+            footer_surface = unscaled_surface  # keep original if scale fails
+    footer_margin = layout.margin_small
+    safe_bottom = layout.safe_margins["bottom"]  # 0 when the safe area is disabled
+    extra_top_offset = layout.margin_medium + ui_scaler.scale(8)
     footer_y = screen_height - footer_surface.get_height() - footer_margin - safe_bottom - extra_top_offset
     footer_x = main_content_rect.left + left_inset
     screen.blit(footer_surface, (footer_x, footer_y))
@@ -0,0 +1,265 @@
+# --- ui/view_registry.py ---
+# Maps application states to view objects so update_display dispatches with one lookup
+
+import abc
+import logging
+import time
+
+import pygame
+
+from ui.frame_presenter import get_frame_presenter
+
+logger = logging.getLogger(__name__)
+
+
+class View(abc.ABC):
+    """
+    One screen of the application, drawn by update_display while its state is active.
+
+    Subclasses implement render() and, when they have geometry that depends only on the
+    screen size (and fonts), compute_layout(). layout() caches that result until the screen
+    size, the UIScaler instance or the fonts change, so per-frame code reads ready-made rects
+    instead of redoing the scaling math. A view object lives for the whole run, so it can
+    also keep cached surfaces between frames. on_enter/on_exit are called when its state
+    becomes active or inactive.
+
+    Retained views (retained = True) are not given a cleared screen: the screen still holds
+    their previous frame, render() redraws only what changed and reports every region it
+    drew with get_frame_presenter().mark_dirty(), and only those regions are pushed to the
+    display. Whenever the screen may not hold their last frame (first frame, another view or
+    the debug overlay drew in between, the presenter was invalidated), invalidate_frame() is
+    called first and the next render() must draw everything.
+    """
+
+    retained = False
+
+    def __init__(self):
+        self._layout = None
+        self._layout_key = None
+
+    def layout(self, screen, ui_scaler, fonts=None):
+        """Return compute_layout(screen, ui_scaler, fonts), recomputed only when the screen size, scaler or fonts changed."""
+        key = (screen.get_size(), id(ui_scaler), id(fonts))
+        if self._layout_key != key:
+            self._layout = self.compute_layout(screen, ui_scaler, fonts)
+            self._layout_key = key
+        return self._layout
+
+    def compute_layout(self, screen, ui_scaler, fonts):
+        """Geometry that depends only on screen size, scaling and fonts (None if the view has none)."""
+        return None
+
+    def invalidate_layout(self):
+        """Force compute_layout() on the next layout() call."""
+        self._layout_key = None
+
+    def invalidate_frame(self):
+        """Retained views: the screen no longer holds the last frame; draw all of it on the next render()."""
+
+    def on_enter(self, app_state):
+        """Called when the view's state becomes the current state."""
+
+    def on_exit(self, app_state):
+        """Called when the application leaves the view's state."""
+
+    @abc.abstractmethod
+    def render(self, screen, app_state, sensor_values, sensor_history, fonts, config_module, ui_scaler):
+        """Draw the view for the current frame."""
+
+
+class DrawFunctionView(View):
+    """
+    Adapter for the existing draw_*_view(screen, app_state, fonts, config_module, ui_scaler) functions.
+
+    Views that take extra data (sensor readings, a confirmation message) pass extra_args, a
+    callable (app_state, sensor_values, sensor_history) -> dict of keyword arguments.
+    """
+
+    def __init__(self, draw_function, extra_args=None):
+        super().__init__()
+        self.draw_function = draw_function
+        self.extra_args = extra_args
+
+    def render(self, screen, app_state, sensor_values, sensor_history, fonts, config_module, ui_scaler):
+        if self.extra_args is None:
+            self.draw_function(screen, app_state, fonts, config_module, ui_scaler)
+        else:
+            kwargs = self.extra_args(app_state, sensor_values, sensor_history)
+            self.draw_function(screen, app_state, fonts=fonts, config_module=config_module, ui_scaler=ui_scaler, **kwargs)
+
+    def __repr__(self):
+        return f"DrawFunctionView({self.draw_function.__name__})"
+
+
+class StaticDrawFunctionView(DrawFunctionView):
+    """
+    DrawFunctionView for screens without animation (confirmation dialogs).
+
+    Retained: the screen is drawn and pushed only on the first frame and when what it shows
+    changes, i.e. the extra_args keyword arguments or state(app_state) (for example the
+    selected option); other frames draw and push nothing.
+    """
+
+    retained = True
+
+    def __init__(self, draw_function, extra_args=None, state=None):
+        """
+        Initialize the view.
+
+        Args:
+            draw_function (callable): draw_*_view(screen, app_state, fonts, config_module, ui_scaler, **kwargs)
+            extra_args (callable, optional): (app_state, sensor_values, sensor_history) -> dict of keyword arguments
+            state (callable, optional): app_state -> hashable value the drawing depends on
+        """
+        super().__init__(draw_function, extra_args)
+        self.state = state
+        self._drawn_key = None
+
+    def invalidate_frame(self):
+        self._drawn_key = None
+
+    def render(self, screen, app_state, sensor_values, sensor_history, fonts, config_module, ui_scaler):
+        kwargs = self.extra_args(app_state, sensor_values, sensor_history) if self.extra_args else {}
+        key = (screen.get_size(), id(ui_scaler), id(fonts), tuple(sorted(kwargs.items())),
+               self.state(app_state) if self.state else None)
+        if key == self._drawn_key:
+            return  # Still on screen as drawn
+        screen.fill(config_module.Theme.BACKGROUND)
+        self.draw_function(screen, app_state, fonts=fonts, config_module=config_module, ui_scaler=ui_scaler, **kwargs)
+        get_frame_presenter().mark_dirty(screen.get_rect())
+        self._drawn_key = key
+
+    def __repr__(self):
+        return f"StaticDrawFunctionView({self.draw_function.__name__})"
+
+
+class ListMenuView(DrawFunctionView):
+    """
+    Adapter for draw_*_view functions built on the shared list menu.
+
+    The list menu geometry (header, item rects, ambient effect positions) is computed once
+    per screen size in compute_layout() and handed to the draw function as layout=, which
+    passes it on to draw_scrollable_list_menu.
+
+    The view is retained. Every frame the draw function draws the menu without its animated
+    parts (animate=False) onto a cached surface, which only costs cached label blits. While
+    that drawing is unchanged (the menu's static_key), a frame restores last frame's animation
+    rects from it, draws the animations again (draw_list_menu_animations) and only those rects
+    are pushed; otherwise the whole cached drawing is copied to the screen. Screens drawn
+    without a list menu (error messages, sub-screens) are copied and pushed in full.
+    """
+
+    retained = True
+
+    def __init__(self, draw_function, item_style="simple"):
+        super().__init__(draw_function)
+        self.item_style = item_style
+        self._static = None
+        self._static_key = None
+        self._frame_valid = False
+        self._animation_rects = []
+
+    def invalidate_frame(self):
+        self._frame_valid = False
+
+    def compute_layout(self, screen, ui_scaler, fonts):
+        import config as app_config
+        from ui.components.menus.list_menu_base import compute_list_menu_layout
+        return compute_list_menu_layout(screen.get_size(), app_config, self.item_style, ui_scaler)
+
+    def render(self, screen, app_state, sensor_values, sensor_history, fonts, config_module, ui_scaler):
+        from ui.components.menus.list_menu_base import draw_list_menu_animations
+        layout = self.layout(screen, ui_scaler, fonts)
+        if self._static is None or self._static.get_size() != screen.get_size():
+            self._static = pygame.Surface(screen.get_size())
+            if pygame.display.get_surface() is not None:
+                self._static = self._static.convert()
+        self._static.fill(config_module.Theme.BACKGROUND)
+        menu = self.draw_function(self._static, app_state, fonts, config_module, ui_scaler, layout=layout, animate=False)
+        animations = menu.get("animations") if isinstance(menu, dict) else None
+        static_key = (id(layout), menu["static_key"]) if animations else None
+
+        presenter = get_frame_presenter()
+        if self._frame_valid and static_key is not None and static_key == self._static_key:
+            # Erase last frame's animations; everything else on screen is still current
+            erased = self._animation_rects
+            for rect in erased:
+                screen.blit(self._static, rect, rect)
+        else:
+            erased = [screen.blit(self._static, (0, 0))]
+        self._static_key = static_key
+        self._animation_rects = []
+        if animations:
+            # The menu may sit on a subsurface (below the settings update header)
+            surface_rect = animations.surface_rect
+            target = screen if surface_rect == screen.get_rect() else screen.subsurface(surface_rect)
+            rects = draw_list_menu_animations(target, animations, fonts, time.time(), config_module)
+            self._animation_rects = [rect.move(surface_rect.topleft) for rect in rects]
+        for rect in erased + self._animation_rects:
+            presenter.mark_dirty(rect)
+        self._frame_valid = True
+
+    def __repr__(self):
+        return f"ListMenuView({self.draw_function.__name__})"
+
+
+class ViewRegistry:
+    """
+    State -> View table with enter/exit notifications.
+
+    render() looks the current state up in a dict (instead of walking an if/elif chain),
+    fires on_exit/on_enter when the state changed since the previous frame, and falls back
+    to the fallback view for states nobody registered.
+    """
+
+    def __init__(self, fallback=None):
+        """
+        Initialize the registry.
+
+        Args:
+            fallback (View, optional): Drawn for states without a registered view
+        """
+        self._views = {}
+        self.fallback = fallback
+        self._active_state = None
+        self._active_view = None
+
+    def register(self, states, view):
+        """Register view for one state or an iterable of states; returns the view."""
+        if isinstance(states, str):
+            states = (states,)
+        for state in states:
+            if state in self._views:
+                logger.warning(f"View for state {state} replaced by {view!r}")
+            self._views[state] = view
+        return view
+
+    def get(self, state):
+        """Return the View registered for state, or None."""
+        return self._views.get(state)
+
+    def __contains__(self, state):
+        return state in self._views
+
+    def activate(self, state, app_state):
+        """Make state the active one, calling on_exit/on_enter if it changed; returns its view."""
+        if state == self._active_state and self._active_view is not None:
+            return self._active_view
+        view = self._views.get(state)
+        if view is None:
+            logger.error(f"Unknown application state: {state}")
+            view = self.fallback
+        if view is not self._active_view:
+            if self._active_view is not None:
+                self._active_view.on_exit(app_state)
+            if view is not None:
+                view.on_enter(app_state)
+        self._active_state = state
+        self._active_view = view
+        return view
+
+    def render(self, screen, app_state, sensor_values, sensor_history, fonts, config_module, ui_scaler):
+        """Draw the view for app_state.current_state."""
+        view = self.activate(app_state.current_state, app_state)
+        if view is not None:
+            view.render(screen, app_state, sensor_values, sensor_history, fonts, config_module, ui_scaler)
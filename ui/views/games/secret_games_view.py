@@ -4,28 +4,16 @@
 import pygame
 import logging
 import os 
+from utils.asset_cache import get_asset_cache
 
 logger = logging.getLogger(__name__)
 
-# Keep track of loaded images to avoid reloading every frame
-loaded_images = {}
-
 def _get_background_image(selected_game, config):
-    """Get the background image for the selected game."""
+    """Get the background image for the selected game (cached; not reloaded every frame)."""
     if not selected_game.image_path:
         return None
         
-    image_path_abs = os.path.abspath(selected_game.image_path)
-    if image_path_abs not in loaded_images:
-        try:
-            logger.debug(f"Loading background image: {image_path_abs}")
-            loaded_image = pygame.image.load(image_path_abs).convert_alpha()
-            loaded_images[image_path_abs] = loaded_image
-        except (pygame.error, FileNotFoundError) as e:
-            logger.error(f"Failed to load background image '{image_path_abs}': {e}")
-            loaded_images[image_path_abs] = None
-    
-    return loaded_images.get(image_path_abs)
+    return get_asset_cache().load(os.path.abspath(selected_game.image_path))
 
 def draw_secret_games_view(screen, app_state, fonts, config, ui_scaler=None):
     """
@@ -87,14 +75,13 @@ def draw_secret_games_view(screen, app_state, fonts, config, ui_scaler=None):
         scaled_height = int(bg_rect.height * scale)
         
         if scaled_width > 0 and scaled_height > 0:
-            try:
-                scaled_bg = pygame.transform.smoothscale(bg_image, (scaled_width, scaled_height))
+            # Scaled once per size via the asset cache; None if scaling failed (solid background)
+            scaled_bg = get_asset_cache().load(os.path.abspath(selected_game.image_path), (scaled_width, scaled_height))
+            if scaled_bg is not None:
                 # Tile the background
                 for x in range(0, screen_width + scaled_width, scaled_width):
                     for y in range(0, screen_height + scaled_height, scaled_height):
                         screen.blit(scaled_bg, (x - scaled_width//2, y - scaled_height//2))
-            except pygame.error:
-                pass  # If scaling fails, just use solid background
     
     # Draw semi-transparent overlay for readability
     overlay = pygame.Surface((screen_width, screen_height))
@@ -4,6 +4,7 @@
 import os
 import pygame
 import logging
+from utils.asset_cache import get_asset_cache
 
 logger = logging.getLogger(__name__)
 
@@ -29,17 +30,20 @@ def draw_crew_detail_view(screen, app_state, fonts, config_module, ui_scaler=Non
         safe_rect = pygame.Rect(0, 0, screen_width, screen_height)
         scale = lambda x: int(x)
 
-    # Load and draw image if path exists
+    # Load and draw image if path exists (decoded and scaled once via the shared asset cache)
     if image_path and os.path.isfile(image_path):
         try:
-            img = pygame.image.load(image_path).convert_alpha()
+            asset_cache = get_asset_cache()
+            img = asset_cache.load(image_path)
+            if img is None:
+                raise pygame.error("image could not be loaded")
             iw, ih = img.get_size()
             max_w = int(safe_rect.width * 0.85)
             max_h = int(safe_rect.height * 0.6)
             if iw > max_w or ih > max_h:
                 ratio = min(max_w / iw, max_h / ih)
                 new_w, new_h = int(iw * ratio), int(ih * ratio)
-                img = pygame.transform.smoothscale(img, (new_w, new_h))
+                img = asset_cache.load(image_path, (new_w, new_h)) or img
             else:
                 new_w, new_h = iw, ih
             img_rect = img.get_rect(centerx=safe_rect.centerx, top=safe_rect.top + scale(24))
@@ -8,7 +8,7 @@ from ui.components.menus.list_menu_base import draw_scrollable_list_menu
 logger = logging.getLogger(__name__)
 
 
-def draw_crew_menu_view(screen, app_state, fonts, config_module, ui_scaler=None):
+def draw_crew_menu_view(screen, app_state, fonts, config_module, ui_scaler=None, layout=None, animate=True):
     """
     Draw the crew list menu (names from assets/ship/Crew). Selecting opens crew detail view.
     """
@@ -18,7 +18,7 @@ def draw_crew_menu_view(screen, app_state, fonts, config_module, ui_scaler=None)
     labels = config_module.get_control_labels()
     footer_hint = f"< {labels['prev']}=Up | {labels['next']}=Down | {labels['select']}=Select >"
 
-    draw_scrollable_list_menu(
+    return draw_scrollable_list_menu(
         screen=screen,
         title="Crew",
         menu_items=menu_items,
@@ -27,5 +27,7 @@ def draw_crew_menu_view(screen, app_state, fonts, config_module, ui_scaler=None)
         config_module=config_module,
         footer_hint=footer_hint,
         item_style="simple",
-        ui_scaler=ui_scaler
+        ui_scaler=ui_scaler,
+        layout=layout,
+        animate=animate,
     )
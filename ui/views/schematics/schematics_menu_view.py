@@ -8,7 +8,7 @@ from models.app_state import STATE_SCHEMATICS_MENU, STATE_LOGS_MENU, STATE_DATA_
 
 logger = logging.getLogger(__name__)
 
-def draw_schematics_menu_view(screen, app_state, fonts, config_module, ui_scaler=None):
+def draw_schematics_menu_view(screen, app_state, fonts, config_module, ui_scaler=None, layout=None, animate=True):
     """
     Draw the schematics submenu view (Ship, Logs, or Data) using the standardized list menu component.
     """
@@ -27,7 +27,7 @@ def draw_schematics_menu_view(screen, app_state, fonts, config_module, ui_scaler
     labels = config_module.get_control_labels()
     footer_hint = f"< {labels['prev']}=Up | {labels['next']}=Down | {labels['select']}=Select >"
 
-    draw_scrollable_list_menu(
+    return draw_scrollable_list_menu(
         screen=screen,
         title=title,
         menu_items=menu_items,
@@ -36,5 +36,7 @@ def draw_schematics_menu_view(screen, app_state, fonts, config_module, ui_scaler
         config_module=config_module,
         footer_hint=footer_hint,
         item_style="simple",
-        ui_scaler=ui_scaler
+        ui_scaler=ui_scaler,
+        layout=layout,
+        animate=animate,
     ) 
\ No newline at end of file
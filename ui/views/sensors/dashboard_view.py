@@ -0,0 +1,238 @@
+# --- ui/views/sensors/dashboard_view.py ---
+# Multi-sensor dashboard: every SENSOR_MODES sensor in its own panel with a sparkline
+
+import logging
+import time
+
+import pygame
+
+from ui.view_registry import View
+from ui.frame_presenter import get_frame_presenter
+from ui.components.charts.graph import draw_sparkline
+from utils.text_cache import get_text_cache
+import config as app_config
+
+logger = logging.getLogger(__name__)
+
+class _Panel:
+    """Cached drawing of one sensor panel, when it was drawn and where its sparkline sits."""
+
+    __slots__ = ("surface", "drawn_at", "spark_rect", "value_text")
+
+    def __init__(self):
+        self.surface = None
+        self.drawn_at = 0.0
+        self.spark_rect = None  # None: the surface holds no complete drawing
+        self.value_text = None
+
+
+class DashboardView(View):
+    """
+    All sensors at once, one panel each: name, current value and a sparkline of the history.
+
+    Each panel is drawn onto its own surface and re-blitted every frame; it is redrawn only
+    when its sensor shows up in app_state.dirty_text (name/value text, redrawn alone) or
+    app_state.dirty_data (new sample, only the sparkline is redrawn). Marks are collected into
+    pending sets so they survive frames where the redraw is deferred, and entering the view
+    marks every panel pending (readings taken while it was hidden went unseen). Redraws share a per-frame time budget (DASHBOARD_REDRAW_BUDGET_MS), stalest panel
+    first, so a burst of readings is spread over a few frames instead of stalling one. At
+    least one pending panel is redrawn per frame, and panels that were never drawn are always
+    drawn. The auto-cycled sensor (app_state.current_sensor) is outlined; while frozen, every
+    panel is outlined in the frozen color instead.
+
+    The view is retained: a frame re-blits only the panels that were redrawn or whose outline
+    changed, and only those rects are pushed to the display.
+    """
+
+    retained = True
+
+    def __init__(self, sensor_modes=None):
+        """
+        Initialize the view.
+
+        Args:
+            sensor_modes (list, optional): Sensors to show; defaults to config SENSOR_MODES
+        """
+        super().__init__()
+        self.sensor_modes = list(sensor_modes if sensor_modes is not None else app_config.SENSOR_MODES)
+        self._panels = {key: _Panel() for key in self.sensor_modes}
+        self._pending_text = set(self.sensor_modes)
+        self._pending_data = set(self.sensor_modes)
+        self._outlines = {}  # sensor_key -> (color, width) or None, as on screen
+        self._drawn_panels = None  # Layout the screen was last drawn with; None: redraw everything
+
+    def invalidate_frame(self):
+        self._drawn_panels = None
+
+    def on_enter(self, app_state):
+        self._pending_text.update(self.sensor_modes)
+        self._pending_data.update(self.sensor_modes)
+
+    def compute_layout(self, screen, ui_scaler, fonts):
+        """[(sensor_key, panel rect)] in a DASHBOARD_COLUMNS wide grid filling the safe area."""
+        if ui_scaler:
+            safe_rect = ui_scaler.get_safe_area_rect() if ui_scaler.safe_area_enabled else screen.get_rect()
+            gap = ui_scaler.margin("small")
+            inset = ui_scaler.margin("medium")
+        else:
+            safe_rect = screen.get_rect()
+            gap = 4
+            inset = 8
+        # Keep panels clear of the rounded corners of the safe-area mask
+        safe_rect = safe_rect.inflate(-2 * inset, -2 * inset)
+
+        count = len(self.sensor_modes)
+        columns = max(1, min(getattr(app_config, "DASHBOARD_COLUMNS", 2), count or 1))
+        rows = max(1, -(-count // columns))
+        grid_top = safe_rect.top
+        panel_width = (safe_rect.width - gap * (columns - 1)) // columns
+        panel_height = max(1, (safe_rect.bottom - grid_top - gap * (rows - 1)) // rows)
+
+        panels = []
+        for index, sensor_key in enumerate(self.sensor_modes):
+            row, column = divmod(index, columns)
+            left = safe_rect.left + column * (panel_width + gap)
+            width = panel_width
+            if row == rows - 1 and count % columns and column == count % columns - 1:
+                # Last panel of a short final row takes the rest of the row
+                width = safe_rect.right - left
+            panels.append((sensor_key, pygame.Rect(left, grid_top + row * (panel_height + gap), width, panel_height)))
+        return panels
+
+    def render(self, screen, app_state, sensor_values, sensor_history, fonts, config_module, ui_scaler):
+        panels = self.layout(screen, ui_scaler, fonts)
+        self._pending_text.update(app_state.dirty_text)
+        self._pending_data.update(app_state.dirty_data)
+        redrawn = self._redraw_stale_panels(panels, sensor_values, sensor_history, fonts, config_module, ui_scaler)
+
+        presenter = get_frame_presenter()
+        full = self._drawn_panels is not panels
+        if full:
+            screen.fill(config_module.Theme.BACKGROUND)
+            presenter.mark_dirty(screen.get_rect())
+        for sensor_key, rect in panels:
+            if app_state.is_frozen:
+                outline = (config_module.Theme.FROZEN_INDICATOR, 2 if sensor_key == app_state.current_sensor else 1)
+            elif sensor_key == app_state.current_sensor:
+                outline = (config_module.Theme.ACCENT, 2)
+            else:
+                outline = None
+            if not full and sensor_key not in redrawn and outline == self._outlines.get(sensor_key):
+                continue  # Still on screen as drawn
+            screen.blit(self._panels[sensor_key].surface, rect)
+            if outline:
+                pygame.draw.rect(screen, outline[0], rect, outline[1])
+            self._outlines[sensor_key] = outline
+            if not full:
+                presenter.mark_dirty(rect)
+        self._drawn_panels = panels
+
+    def _redraw_stale_panels(self, panels, sensor_values, sensor_history, fonts, config_module, ui_scaler):
+        """Redraw pending or resized panels, stalest first, until the frame's budget is spent; returns the keys redrawn."""
+        stale = []
+        for sensor_key, rect in panels:
+            panel = self._panels[sensor_key]
+            if (sensor_key in self._pending_text or sensor_key in self._pending_data
+                    or panel.surface is None or panel.surface.get_size() != rect.size):
+                stale.append((panel.drawn_at, sensor_key, rect, panel))
+        stale.sort(key=lambda item: item[0])
+
+        budget = getattr(config_module, "DASHBOARD_REDRAW_BUDGET_MS", 4.0) / 1000.0
+        start = time.perf_counter()
+        redrawn = set()
+        for _drawn_at, sensor_key, rect, panel in stale:
+            if redrawn and panel.surface is not None and time.perf_counter() - start >= budget:
+                continue  # Over budget: keep showing the previous drawing until a later frame
+            if panel.surface is None or panel.surface.get_size() != rect.size:
+                panel.surface = pygame.Surface(rect.size)
+                if pygame.display.get_surface() is not None:
+                    panel.surface = panel.surface.convert()
+                panel.spark_rect = None
+            try:
+                self._draw_panel(panel, sensor_key, sensor_values.get(sensor_key, {}), sensor_history, fonts, config_module, ui_scaler,
+                                 text=sensor_key in self._pending_text, data=sensor_key in self._pending_data)
+            except Exception as e:
+                logger.error(f"Error drawing dashboard panel for {sensor_key}: {e}", exc_info=True)
+                panel.surface.set_clip(None)
+                panel.spark_rect = None  # Draw it whole next time
+            self._pending_text.discard(sensor_key)
+            self._pending_data.discard(sensor_key)
+            panel.drawn_at = start
+            redrawn.add(sensor_key)
+        return redrawn
+
+    def _draw_panel(self, panel, sensor_key, sensor_data, sensor_history, fonts, config_module, ui_scaler, text=True, data=True):
+        """
+        Draw one sensor's panel onto its surface: all of it, or only the text and/or the sparkline.
+
+        Only the parts asked for are redrawn when the surface already holds a complete drawing
+        with the same row arrangement; otherwise the whole panel is drawn.
+        """
+        surface = panel.surface
+        text_cache = get_text_cache()
+        font = fonts.get('tiny', fonts['medium'])
+        padding = max(2, ui_scaler.padding("small")) if ui_scaler else 3
+        display_props = config_module.SENSOR_DISPLAY_PROPERTIES.get(sensor_key, {})
+        sensor_color = _sensor_color(display_props, config_module)
+        panel_rect = surface.get_rect()
+
+        value_text = _value_text(sensor_key, sensor_data, config_module)
+        name_surface = text_cache.render(font, display_props.get("display_name", sensor_key), sensor_color)
+        value_surface = text_cache.render(font, value_text, config_module.Theme.FOREGROUND)
+        text_bottom = padding + name_surface.get_height()
+        if name_surface.get_width() + value_surface.get_width() + 3 * padding <= panel_rect.width:
+            # Name and value share the first row
+            value_topleft = value_surface.get_rect(topright=(panel_rect.width - padding, padding)).topleft
+        else:
+            value_topleft = (padding, text_bottom)
+            text_bottom += value_surface.get_height()
+        spark_rect = pygame.Rect(padding, text_bottom, panel_rect.width - 2 * padding, panel_rect.height - text_bottom - padding)
+
+        if spark_rect != panel.spark_rect:
+            text = data = True  # No drawing yet, or the value moved rows: the sparkline moves too
+        elif value_text != panel.value_text:
+            text = True  # Temperature's K value follows the reading without a text change
+        if text and data:
+            surface.fill(config_module.Theme.BACKGROUND)
+            pygame.draw.rect(surface, config_module.Theme.GRAPH_BORDER, panel_rect, 1)
+        elif text:
+            surface.fill(config_module.Theme.BACKGROUND, (1, 1, panel_rect.width - 2, spark_rect.top - 1))
+        if text:
+            surface.blit(name_surface, (padding, padding))
+            surface.blit(value_surface, value_topleft)
+        panel.spark_rect = spark_rect
+        panel.value_text = value_text
+
+        if not data or spark_rect.height < 4 or sensor_history is None:
+            return
+        # Clipped so redrawing the sparkline alone cannot leave pixels outside its rect behind
+        surface.set_clip(spark_rect)
+        surface.fill(config_module.Theme.BACKGROUND)
+        history = sensor_history.get_view(sensor_key)
+        drawn = history is not None and draw_sparkline(
+            surface, history, spark_rect, sensor_color,
+            value_range=sensor_history.get_range(sensor_key),
+            line_width=max(1, ui_scaler.scale(config_module.GRAPH_LINE_WIDTH)) if ui_scaler else config_module.GRAPH_LINE_WIDTH,
+        )
+        if not drawn:
+            # No samples yet: flat dim baseline where the line will appear
+            pygame.draw.line(surface, config_module.Theme.GRAPH_GRID, spark_rect.midleft, spark_rect.midright, 1)
+        surface.set_clip(None)
+
+
+def _sensor_color(display_props, config_module):
+    """Color of the sensor's menu item (display property color_key), accent if it has none."""
+    color_key = display_props.get("color_key")
+    if color_key:
+        for source in (config_module.Theme, config_module.Palette):
+            if hasattr(source, color_key):
+                return getattr(source, color_key)
+    return config_module.Theme.ACCENT
+
+
+def _value_text(sensor_key, sensor_data, config_module):
+    """Current value as the sensor view shows it (temperature in K)."""
+    numeric_val = sensor_data.get("value")
+    if sensor_key == config_module.SENSOR_TEMPERATURE and numeric_val is not None:
+        return f"{numeric_val + 273.15:.1f} K"
+    return f"{sensor_data.get('text', 'N/A')} {sensor_data.get('unit', '')}".strip()
@@ -1,140 +1,337 @@
 # --- ui/sensor_view.py ---
-# Handles rendering of individual sensor views OR the auto-cycling dashboard view
+# Handles rendering of individual sensor views (the dashboard has its own multi-panel view)
 
+import collections
 import pygame
 import logging
 import time
 import math
+import numpy as np
 from ui.components.text.text_display import render_title, render_value, render_note, render_footer, render_text
 from ui.components.charts.vertical_bar_graph import VerticalBarGraph
 from ui.components.charts.graph import draw_graph # Re-import the old graph component
+from ui.view_registry import View
+from ui.frame_presenter import get_frame_presenter
 # Import app state constants
 from models.app_state import STATE_SENSOR_VIEW, STATE_DASHBOARD # These are fine as they are AppState internal states
 # Import config for sensor mode constants and display properties
 import config as app_config # Use an alias
+from utils.animation_layers import get_animation_layers
+from utils.text_cache import get_text_cache
 # import re # No longer needed
 
 logger = logging.getLogger(__name__)
 
-def draw_sensor_view(screen, app_state, sensor_values, sensor_history, fonts, config_module, ui_scaler=None):
+# Geometry of one sensor's view for one screen size and font set (see compute_sensor_view_layout).
+# graph_rects and ambient are keyed by graph kind: "LINE", "LINE_NO_VALUE" (line graph without
+# the large value, i.e. temperature), "VERTICAL_BAR" and None (no graph).
+SensorViewLayout = collections.namedtuple("SensorViewLayout", [
+    "screen_size", "title", "safe_rect", "title_topleft", "title_bottom",
+    "value_midleft", "frozen_topright", "note_pos", "fallback_center",
+    "scan_strip_height", "time_label_offset", "graph_rects", "ambient",
+])
+
+
+def compute_sensor_view_layout(screen_size, fonts, config_module, ui_scaler=None, title=""):
     """
-    Draw the individual sensor view screen.
-    
+    Compute the sensor view geometry that does not change between frames.
+
+    Depends only on the screen size, the fonts, the scaler and the sensor's title, so
+    SensorView computes it once per sensor (View.compute_layout) and draw_sensor_view only
+    looks rects up per frame.
+
     Args:
-        screen (pygame.Surface): The surface to draw on
-        app_state (AppState): The current application state
-        sensor_values (dict): Dictionary of current sensor data (new structure with dict per sensor)
-        sensor_history (ReadingHistory): The history of sensor readings
+        screen_size (tuple): (width, height) of the surface the view is drawn on
         fonts (dict): Dictionary of loaded fonts
         config_module (module): Configuration module (config package)
-        ui_scaler (UIScaler): The UI scaler for scaling the graph
+        ui_scaler (UIScaler, optional): The UI scaler
+        title (str): Sensor display name; everything below the title is placed from its rendered
+            height (glyphs missing from the font fall back to a taller one)
+
+    Returns:
+        SensorViewLayout: Rects and positions used by draw_sensor_view
     """
-    screen.fill(config_module.Theme.BACKGROUND)
-    
-    if ui_scaler:
-        screen_width = ui_scaler.screen_width
-        screen_height = ui_scaler.screen_height
-        safe_rect = ui_scaler.get_safe_area_rect() if ui_scaler.safe_area_enabled else pygame.Rect(0, 0, screen_width, screen_height)
-    else:
-        screen_width = screen.get_width()
-        screen_height = screen.get_height()
-        safe_rect = pygame.Rect(0, 0, screen_width, screen_height)
-    current_time = time.time()
-    
-    # Use UIScaler for responsive spacing if available; keep content inside safe area for curved bezel
-    if ui_scaler:
-        title_margin = max(ui_scaler.margin("small"), ui_scaler.get_safe_area_margins()["left"] if ui_scaler.safe_area_enabled else 0)
-        value_spacing = ui_scaler.margin("medium")
-        graph_margin = ui_scaler.margin("medium")
-        
+    scale = ui_scaler.scale if ui_scaler else (lambda value: value)
+    ui_layout = ui_scaler.layout if ui_scaler else None
+    if ui_layout:
+        screen_width = ui_layout.screen_width
+        screen_height = ui_layout.screen_height
+        safe_rect = ui_layout.safe_rect.copy()  # Whole screen when the safe area is disabled
+        # Keep content inside safe area for curved bezel
+        title_margin = max(ui_layout.margin_small, ui_layout.safe_margins["left"])
+        value_spacing = ui_layout.margin_medium
+        graph_margin = ui_layout.margin_medium
+        vbar_margin_top = vbar_margin_bottom = ui_layout.margin_medium
+
         # Debug logging for sensor view layout
         if ui_scaler.debug_mode:
             logger.info(f"🎨 SensorView: screen={screen_width}x{screen_height}, margins={title_margin}px/{graph_margin}px")
     else:
         # Fallback to original hardcoded values
+        screen_width, screen_height = screen_size
+        safe_rect = pygame.Rect(0, 0, screen_width, screen_height)
         title_margin = 10
         value_spacing = 15
         graph_margin = 15
+        vbar_margin_top = vbar_margin_bottom = 20
+
+    # Title top left, large value below it, frozen indicator top right, note middle right
+    title_topleft = (safe_rect.left + title_margin, safe_rect.top + title_margin)
+    title_bottom = title_topleft[1] + fonts['medium'].size(title)[1]
+    value_midleft = (safe_rect.left + title_margin, title_bottom + value_spacing)
+    value_height = fonts['large'].get_height()
+    value_bottom = value_midleft[1] - value_height // 2 + value_height
+
+    # Line graph: reserve space for the time axis label + orange/yellow scanning strip below it
+    time_label_height = (config_module.FONT_SIZE_SMALL or 14) + scale(8)
+    scan_strip_height = scale(24)
+    min_graph_h = scale(100)
+
+    def line_graph_rect(top):
+        graph_height = safe_rect.bottom - top - graph_margin * 2 - time_label_height - scan_strip_height
+        return pygame.Rect(safe_rect.left + graph_margin, top + graph_margin,
+                           safe_rect.width - graph_margin * 2, max(min_graph_h, graph_height))
+
+    # Vertical bar: no footer when graph is shown; use full safe area height
+    vbar_width = scale(120)
+    vbar_height = max(80, safe_rect.height - vbar_margin_top - vbar_margin_bottom)
+    graph_rects = {
+        "LINE": line_graph_rect(value_bottom),
+        "LINE_NO_VALUE": line_graph_rect(title_bottom + value_spacing),
+        "VERTICAL_BAR": pygame.Rect(safe_rect.centerx - vbar_width // 2, safe_rect.top + vbar_margin_top, vbar_width, vbar_height),
+        None: None,
+    }
+
+    return SensorViewLayout(
+        screen_size=tuple(screen_size),
+        title=title,
+        safe_rect=safe_rect,
+        title_topleft=title_topleft,
+        title_bottom=title_bottom,
+        value_midleft=value_midleft,
+        frozen_topright=(safe_rect.right - title_margin, safe_rect.top + title_margin),
+        note_pos=(safe_rect.right - title_margin, safe_rect.centery),
+        fallback_center=(safe_rect.centerx, title_bottom + scale(80)),
+        scan_strip_height=scan_strip_height,
+        time_label_offset=scan_strip_height + (config_module.FONT_SIZE_SMALL or 14) + scale(5),
+        graph_rects=graph_rects,
+        ambient={kind: _compute_ambient_areas(screen_width, screen_height, rect, ui_scaler) for kind, rect in graph_rects.items()},
+    )
+
+
+class SensorView(View):
+    """
+    Single sensor screen (draw_sensor_view) with each sensor's geometry computed once per screen size.
+
+    Everything but the animations is drawn onto a cached surface. A change of sensor, frozen
+    flag or layout redraws all of it; otherwise only the areas that changed are redrawn: the
+    value and note rows when the current sensor is in
+    app_state.dirty_text, the graph when it is in app_state.dirty_data. The view is retained:
+    a frame restores last frame's animation rects and the redrawn areas from the cached
+    surface, draws the animations again, and only those rects are pushed to the display.
+    """
+
+    retained = True
+
+    def __init__(self):
+        super().__init__()
+        self._static = None
+        self._static_state = None
+        self._static_layout = None
+        self._scratch = None  # Partial redraws are drawn here, then their areas copied to _static
+        self._frame_valid = False
+        self._animation_rects = []
+
+    def invalidate_frame(self):
+        self._frame_valid = False
+
+    def on_enter(self, app_state):
+        self._static_state = None  # Readings taken while hidden were not drawn
+
+    def compute_layout(self, screen, ui_scaler, fonts):
+        """{sensor_key: SensorViewLayout} for every sensor."""
+        layouts = {}
+        for sensor_key in app_config.ALL_SENSOR_MODES:
+            title = app_config.SENSOR_DISPLAY_PROPERTIES.get(sensor_key, {}).get("display_name", sensor_key)
+            layouts[sensor_key] = compute_sensor_view_layout(screen.get_size(), fonts, app_config, ui_scaler, title)
+        return layouts
+
+    def render(self, screen, app_state, sensor_values, sensor_history, fonts, config_module, ui_scaler):
+        layout = self.layout(screen, ui_scaler, fonts).get(app_state.current_sensor)
+        state = (app_state.current_sensor, app_state.is_frozen, id(layout))
+        redrawn = []
+        if self._static is None or self._static.get_size() != screen.get_size() or self._static_state != state:
+            if self._static is None or self._static.get_size() != screen.get_size():
+                self._static = pygame.Surface(screen.get_size())
+                if pygame.display.get_surface() is not None:
+                    self._static = self._static.convert()
+            self._static_layout = draw_sensor_view(self._static, app_state, sensor_values, sensor_history, fonts,
+                                                   config_module, ui_scaler, layout=layout, animate=False)
+            self._static_state = state
+            self._frame_valid = False
+        else:
+            redrawn = self._redraw_changed_parts(app_state, sensor_values, sensor_history, fonts, config_module, ui_scaler)
+
+        presenter = get_frame_presenter()
+        if self._frame_valid:
+            # Erase last frame's animations and bring in redrawn parts; everything else on screen is still current
+            erased = self._animation_rects + redrawn
+            for rect in erased:
+                screen.blit(self._static, rect, rect)
+        else:
+            erased = [screen.blit(self._static, (0, 0))]
+        self._animation_rects = draw_sensor_animations(screen, _current_sensor_key(app_state, config_module), self._static_layout,
+                                                       time.time(), config_module, ui_scaler, app_state.is_frozen)
+        for rect in erased + [rect for rect in self._animation_rects if rect not in erased]:
+            presenter.mark_dirty(rect)
+        self._frame_valid = True
+
+    def _redraw_changed_parts(self, app_state, sensor_values, sensor_history, fonts, config_module, ui_scaler):
+        """Redraw the text and/or graph area of the cached drawing for the dirty sets; returns the areas redrawn."""
+        sensor_key = _current_sensor_key(app_state, config_module)
+        layout = self._static_layout
+        graph_area = _graph_area(layout, _graph_kind(sensor_key, config_module))
+        areas = []
+        if sensor_key in app_state.dirty_text:
+            areas.extend(_text_areas(layout, fonts))
+        if sensor_key in app_state.dirty_data and graph_area is not None:
+            areas.append(graph_area)
+        if not areas:
+            return areas
+        # Everything that can reach the areas is drawn again, in order, onto the scratch surface and
+        # only the areas are copied over; the graph only when an area reaches it (text and footer are
+        # cached blits). Not clipped: pygame draws thick lines differently where a clip edge cuts them.
+        if self._scratch is None or self._scratch.get_size() != self._static.get_size():
+            self._scratch = self._static.copy()
+        for area in areas:
+            self._scratch.fill(config_module.Theme.BACKGROUND, area)
+        _draw_sensor_text(self._scratch, sensor_key, app_state.is_frozen, sensor_values, fonts, config_module, layout)
+        if graph_area is None or any(area.colliderect(graph_area) for area in areas):
+            _draw_sensor_graph(self._scratch, sensor_key, sensor_values, sensor_history, fonts, config_module, ui_scaler, layout)
+        _draw_sensor_footer(self._scratch, sensor_key, fonts, config_module, ui_scaler, layout)
+        for area in areas:
+            self._static.blit(self._scratch, area, area)
+        return areas
+
+
+def draw_sensor_view(screen, app_state, sensor_values, sensor_history, fonts, config_module, ui_scaler=None, layout=None, animate=True):
+    """
+    Draw the individual sensor view screen.
     
-    current_sensor_key = app_state.current_sensor
-    if not current_sensor_key:
+    Args:
+        screen (pygame.Surface): The surface to draw on
+        app_state (AppState): The current application state
+        sensor_values (dict): Dictionary of current sensor data (new structure with dict per sensor)
+        sensor_history (ReadingHistory): The history of sensor readings
+        fonts (dict): Dictionary of loaded fonts
+        config_module (module): Configuration module (config package)
+        ui_scaler (UIScaler): The UI scaler for scaling the graph
+        layout (SensorViewLayout, optional): Precomputed geometry for the current sensor from SensorView
+        animate (bool): Also draw the animations (draw_sensor_animations); SensorView draws them
+            separately on top of its cached drawing
+
+    Returns:
+        SensorViewLayout: The layout the view was drawn with
+    """
+    screen.fill(config_module.Theme.BACKGROUND)
+    
+    if not app_state.current_sensor:
         logger.error("No sensor selected for sensor view, defaulting.")
-        current_sensor_key = config_module.SENSOR_MODES[0] if config_module.SENSOR_MODES else "UNKNOWN_SENSOR_KEY"
+    current_sensor_key = _current_sensor_key(app_state, config_module)
         
-    # Get display properties for the current sensor
-    display_props = config_module.SENSOR_DISPLAY_PROPERTIES.get(current_sensor_key, {})
-    display_name = display_props.get("display_name", current_sensor_key)
+    display_name = config_module.SENSOR_DISPLAY_PROPERTIES.get(current_sensor_key, {}).get("display_name", current_sensor_key)
+    if layout is None or layout.screen_size != screen.get_size() or layout.title != display_name:
+        layout = compute_sensor_view_layout(screen.get_size(), fonts, config_module, ui_scaler, display_name)
 
-                    # Get the values for the current sensor using the new structure
-    current_sensor_data = sensor_values.get(current_sensor_key, {})
-    text_val = current_sensor_data.get("text", "N/A")
-    unit = current_sensor_data.get("unit", "")
-    note = current_sensor_data.get("note", "")
-    numeric_val = current_sensor_data.get("value")
-    
-    # Prepare text for vertical bar graph arrow display
-    arrow_text = text_val  # Default to main text (inertia no longer uses vertical bar graph)
+    _draw_sensor_text(screen, current_sensor_key, app_state.is_frozen, sensor_values, fonts, config_module, layout)
+    _draw_sensor_graph(screen, current_sensor_key, sensor_values, sensor_history, fonts, config_module, ui_scaler, layout)
+    if animate:
+        draw_sensor_animations(screen, current_sensor_key, layout, time.time(), config_module, ui_scaler, app_state.is_frozen)
+    _draw_sensor_footer(screen, current_sensor_key, fonts, config_module, ui_scaler, layout)
+    return layout
+
+def _value_texts(sensor_key, sensor_data, config_module):
+    """(large value text, vertical bar pointer text) for a sensor entry; temperature is shown in K."""
+    text_val = sensor_data.get("text", "N/A")
+    numeric_val = sensor_data.get("value")
     # UI-only: show temperature as K (convert at draw time; data stays in Celsius)
-    if current_sensor_key == config_module.SENSOR_TEMPERATURE and numeric_val is not None:
+    if sensor_key == config_module.SENSOR_TEMPERATURE and numeric_val is not None:
         k_val = numeric_val + 273.15
-        value_text_display = f"{k_val:.1f} K"
-        arrow_text = f"{k_val:.1f}"
-    else:
-        value_text_display = f"{text_val} {unit}".strip()
+        return f"{k_val:.1f} K", f"{k_val:.1f}"
+    return f"{text_val} {sensor_data.get('unit', '')}".strip(), text_val
+
+def _draw_sensor_text(screen, sensor_key, is_frozen, sensor_values, fonts, config_module, layout):
+    """Draw the title, frozen indicator, large value and note of the sensor view."""
+    display_name = config_module.SENSOR_DISPLAY_PROPERTIES.get(sensor_key, {}).get("display_name", sensor_key)
+    current_sensor_data = sensor_values.get(sensor_key, {})
+    note = current_sensor_data.get("note", "")
+    value_text_display, _arrow_text = _value_texts(sensor_key, current_sensor_data, config_module)
     
     # Draw sensor name in top left within safe area
+    text_cache = get_text_cache()
     title_font = fonts['medium']
-    title_surface = title_font.render(display_name, True, config_module.Theme.ACCENT)
-    title_rect = title_surface.get_rect(topleft=(safe_rect.left + title_margin, safe_rect.top + title_margin))
-    _draw_subtle_title_glow(screen, display_name, title_font, config_module.Theme.ACCENT, title_rect.center, current_time)
+    title_surface = text_cache.render(title_font, display_name, config_module.Theme.ACCENT)
+    title_rect = title_surface.get_rect(topleft=layout.title_topleft)
+    _draw_subtle_title_glow(screen, display_name, title_font, config_module.Theme.ACCENT, title_rect.center, time.time())
     screen.blit(title_surface, title_rect)
     
     # Draw frozen indicator if needed (moved to top right) within safe area
-    if app_state.is_frozen:
+    if is_frozen:
         frozen_font = fonts['medium']
-        frozen_surface = frozen_font.render("[FROZEN]", True, config_module.Theme.FROZEN_INDICATOR)
-        frozen_rect = frozen_surface.get_rect(topright=(safe_rect.right - title_margin, safe_rect.top + title_margin))
+        frozen_surface = text_cache.render(frozen_font, "[FROZEN]", config_module.Theme.FROZEN_INDICATOR)
+        frozen_rect = frozen_surface.get_rect(topright=layout.frozen_topright)
         screen.blit(frozen_surface, frozen_rect)
     
     # Draw current value below the title (temperature: omit so only small ticks show), within safe area
-    value_font = fonts['large']
-    value_surface = value_font.render(value_text_display, True, config_module.Theme.FOREGROUND)
-    value_rect = value_surface.get_rect(midleft=(safe_rect.left + title_margin, title_rect.bottom + value_spacing))
-    if current_sensor_key != config_module.SENSOR_TEMPERATURE:
-        screen.blit(value_surface, value_rect)
-    else:
-        value_rect = pygame.Rect(title_rect.x, title_rect.y, title_rect.width, title_rect.height + value_spacing)
+    # The value changes with every reading: draw it from the glyph atlas, not a new surface
+    if sensor_key != config_module.SENSOR_TEMPERATURE:
+        value_atlas = text_cache.atlas(fonts['large'], config_module.Theme.FOREGROUND)
+        value_rect = pygame.Rect((0, 0), value_atlas.size(value_text_display))
+        value_rect.midleft = layout.value_midleft
+        value_atlas.blit_text(screen, value_text_display, topleft=value_rect.topleft)
     
     # Draw note in middle right if present, within safe area
     if note:
-        note_x_pos = safe_rect.right - title_margin
-        note_y_pos = safe_rect.centery
         render_text(
             screen, note, 
             fonts['small'] if 'small' in fonts else fonts['medium'],
             config_module.Theme.ACCENT,
-            (note_x_pos, note_y_pos),
+            layout.note_pos,
             align="right"
         )
-    
+
+def _draw_sensor_graph(screen, current_sensor_key, sensor_values, sensor_history, fonts, config_module, ui_scaler, layout):
+    """Draw the sensor's graph (line or vertical bar), or its placeholder when it has none."""
+    text_cache = get_text_cache()
+    display_props = config_module.SENSOR_DISPLAY_PROPERTIES.get(current_sensor_key, {})
+    current_sensor_data = sensor_values.get(current_sensor_key, {})
+    unit = current_sensor_data.get("unit", "")
+    numeric_val = current_sensor_data.get("value")
+    # Text for vertical bar graph arrow display (inertia no longer uses vertical bar graph)
+    _value_text, arrow_text = _value_texts(current_sensor_key, current_sensor_data, config_module)
+
     graph_type = display_props.get("graph_type", "NONE")
-    graph_rect = None  # Track graph position for ambient effects
+    graph_kind = _graph_kind(current_sensor_key, config_module)  # Which precomputed graph rect applies
 
     if graph_type == "LINE":
-        history_data = sensor_history.get_history(current_sensor_key)
-        # Reserve space: time axis label + orange/yellow scanning strip below graph
-        time_label_height = (config_module.FONT_SIZE_SMALL or 14) + (ui_scaler.scale(8) if ui_scaler else 8)
-        scan_strip_height = ui_scaler.scale(24) if ui_scaler else 24
-        min_graph_h = ui_scaler.scale(100) if ui_scaler else 100
-        graph_height = safe_rect.bottom - value_rect.bottom - graph_margin * 2 - time_label_height - scan_strip_height
-        graph_width = safe_rect.width - graph_margin * 2
-        graph_rect = pygame.Rect(
-            safe_rect.left + graph_margin,
-            value_rect.bottom + graph_margin,
-            graph_width,
-            max(min_graph_h, graph_height)
-        )
-        scan_strip_rect = pygame.Rect(graph_rect.left, graph_rect.bottom, graph_rect.width, scan_strip_height)
+        graph_rect = layout.graph_rects[graph_kind]
+
+        window_seconds = getattr(config_module, "GRAPH_WINDOW_SECONDS", None)
+        aggregate = None
+        if window_seconds:
+            # Long window: pre-aggregated buckets, at most one per two pixels
+            aggregate = sensor_history.get_window(current_sensor_key, window_seconds, max(2, graph_rect.width // 2))
+        if aggregate is not None:
+            history_data = aggregate.mean
+            history_range = None
+            if not np.all(np.isnan(aggregate.min)):
+                history_range = (float(np.nanmin(aggregate.min)), float(np.nanmax(aggregate.max)))
+            time_span = window_seconds
+        else:
+            # Zero-copy ordered view + cached min/max; no per-frame list building
+            history_data = sensor_history.get_view(current_sensor_key)
+            history_range = sensor_history.get_range(current_sensor_key)
+            time_span = config_module.GRAPH_HISTORY_SIZE
         range_override = display_props.get("range_override", (None, None))
         min_val_cfg, max_val_cfg = range_override if range_override is not None else (None, None)
 
@@ -145,17 +342,14 @@ def draw_sensor_view(screen, app_state, sensor_values, sensor_history, fonts, co
                 min_val_cfg, max_val_cfg, 
                 current_sensor_key,
                 config_module,
-                ui_scaler
+                ui_scaler,
+                value_range=history_range
             )
-            # Orange/yellow scanning lines animation below the graph (tricorder-style)
-            if not app_state.is_frozen and scan_strip_rect.height >= 12:
-                _draw_line_graph_scanning_effect(screen, scan_strip_rect, current_time, config_module, ui_scaler)
             # Draw time axis label below the scanning strip
             time_font = fonts.get('small', fonts['medium'])
-            time_text = f"Time ({config_module.GRAPH_HISTORY_SIZE}s →)"
-            time_surf = time_font.render(time_text, True, config_module.Theme.GRAPH_GRID)
-            time_label_offset = scan_strip_height + (config_module.FONT_SIZE_SMALL or 14) + (ui_scaler.scale(5) if ui_scaler else 5)
-            time_rect = time_surf.get_rect(center=(graph_rect.centerx, graph_rect.bottom + time_label_offset))
+            time_text = f"Time ({time_span}s →)"
+            time_surf = text_cache.render(time_font, time_text, config_module.Theme.GRAPH_GRID)
+            time_rect = time_surf.get_rect(center=(graph_rect.centerx, graph_rect.bottom + layout.time_label_offset))
             screen.blit(time_surf, time_rect)
         except Exception as e:
              logger.error(f"Error drawing line graph for {current_sensor_key}: {e}", exc_info=True)
@@ -163,23 +357,7 @@ def draw_sensor_view(screen, app_state, sensor_values, sensor_history, fonts, co
     elif graph_type == "VERTICAL_BAR":
         vbar_config = display_props.get("vertical_graph_config")
         if vbar_config:
-            # Calculate graph dimensions to maximize available space using UIScaler
-            if ui_scaler:
-                graph_width = ui_scaler.scale(120)  # Responsive graph width
-                graph_margin_top = ui_scaler.margin("medium")  # Responsive top margin
-                graph_margin_bottom = ui_scaler.margin("medium")  # Responsive bottom margin
-            else:
-                # Fallback to original hardcoded values
-                graph_width = 120
-                graph_margin_top = 20
-                graph_margin_bottom = 20
-                
-            # No footer when graph is shown; use full safe area height
-            graph_height = safe_rect.height - graph_margin_top - graph_margin_bottom
-            graph_height = max(80, graph_height)
-            graph_x = safe_rect.centerx - (graph_width // 2)
-            graph_y = safe_rect.top + graph_margin_top
-            graph_rect = pygame.Rect(graph_x, graph_y, graph_width, graph_height)
+            graph_rect = layout.graph_rects[graph_kind]
             
             # UI-only: temperature graph shows K scale 0–1701 (convert at draw time; data unchanged)
             if current_sensor_key == config_module.SENSOR_TEMPERATURE:
@@ -230,34 +408,31 @@ def draw_sensor_view(screen, app_state, sensor_values, sensor_history, fonts, co
                  logger.error(f"Error creating/drawing VerticalBarGraph for {current_sensor_key}: {e}", exc_info=True)
         else:
             logger.warning(f"Graph type for {current_sensor_key} is VERTICAL_BAR but no vertical_graph_config found.")
-            fallback_font = fonts.get('medium', pygame.font.Font(None, config_module.FONT_SIZE_MEDIUM))
+            fallback_font = fonts.get('medium') or pygame.font.Font(None, config_module.FONT_SIZE_MEDIUM)
             fallback_text = "Graph N/A"
-            fallback_surf = fallback_font.render(fallback_text, True, config_module.Theme.ACCENT)
-            fallback_offset = ui_scaler.scale(80) if ui_scaler else 80
-            fallback_rect = fallback_surf.get_rect(center=(safe_rect.centerx, title_rect.bottom + fallback_offset))
+            fallback_surf = text_cache.render(fallback_font, fallback_text, config_module.Theme.ACCENT)
+            fallback_rect = fallback_surf.get_rect(center=layout.fallback_center)
             screen.blit(fallback_surf, fallback_rect)
 
     elif graph_type == "NONE" or current_sensor_key == config_module.SENSOR_CLOCK:
         logger.debug(f"No graph to display for sensor: {current_sensor_key}")
-        fallback_font = fonts.get('medium', pygame.font.Font(None, config_module.FONT_SIZE_MEDIUM))
+        fallback_font = fonts.get('medium') or pygame.font.Font(None, config_module.FONT_SIZE_MEDIUM)
         fallback_text = "Graph N/A" if graph_type == "NONE" else ""
         if fallback_text:
-            fallback_surf = fallback_font.render(fallback_text, True, config_module.Theme.ACCENT)
-            fallback_offset = ui_scaler.scale(80) if ui_scaler else 80
-            fallback_rect = fallback_surf.get_rect(center=(safe_rect.centerx, title_rect.bottom + fallback_offset))
+            fallback_surf = text_cache.render(fallback_font, fallback_text, config_module.Theme.ACCENT)
+            fallback_rect = fallback_surf.get_rect(center=layout.fallback_center)
             screen.blit(fallback_surf, fallback_rect)
     else:
         logger.warning(f"Unknown graph_type '{graph_type}' or no graph configured for sensor: {current_sensor_key}")
-        fallback_font = fonts.get('medium', pygame.font.Font(None, config_module.FONT_SIZE_MEDIUM))
+        fallback_font = fonts.get('medium') or pygame.font.Font(None, config_module.FONT_SIZE_MEDIUM)
         fallback_text = "Graph N/A"
-        fallback_surf = fallback_font.render(fallback_text, True, config_module.Theme.ACCENT)
-        fallback_offset = ui_scaler.scale(80) if ui_scaler else 80
-        fallback_rect = fallback_surf.get_rect(center=(safe_rect.centerx, title_rect.bottom + fallback_offset))
+        fallback_surf = text_cache.render(fallback_font, fallback_text, config_module.Theme.ACCENT)
+        fallback_rect = fallback_surf.get_rect(center=layout.fallback_center)
         screen.blit(fallback_surf, fallback_rect)
 
-    # Draw ambient tricorder effects in available spaces
-    _draw_sensor_ambient_effects(screen, screen_width, screen_height, graph_rect, current_sensor_data, current_time, config_module, ui_scaler, app_state.is_frozen)
-
+def _draw_sensor_footer(screen, sensor_key, fonts, config_module, ui_scaler, layout):
+    """Draw the back hint at the bottom for sensors without a graph."""
+    graph_type = config_module.SENSOR_DISPLAY_PROPERTIES.get(sensor_key, {}).get("graph_type", "NONE")
     # No footer when a graph is shown (LINE or VERTICAL_BAR) to avoid overlap; short hint when no graph
     if graph_type not in ("LINE", "VERTICAL_BAR"):
         labels = config_module.get_control_labels()
@@ -265,56 +440,125 @@ def draw_sensor_view(screen, app_state, sensor_values, sensor_history, fonts, co
         render_footer(
             screen, hint_text, fonts,
             config_module.Theme.FOREGROUND,
-            screen_width, screen_height,
+            layout.screen_size[0], layout.screen_size[1],
             ui_scaler=ui_scaler,
-            content_center_x=safe_rect.centerx
+            content_center_x=layout.safe_rect.centerx
         )
 
+def _current_sensor_key(app_state, config_module):
+    """The sensor to show: app_state.current_sensor, else the first of SENSOR_MODES."""
+    if app_state.current_sensor:
+        return app_state.current_sensor
+    return config_module.SENSOR_MODES[0] if config_module.SENSOR_MODES else "UNKNOWN_SENSOR_KEY"
+
+def _graph_kind(sensor_key, config_module):
+    """Key into SensorViewLayout.graph_rects/ambient for the graph the sensor shows."""
+    display_props = config_module.SENSOR_DISPLAY_PROPERTIES.get(sensor_key, {})
+    graph_type = display_props.get("graph_type", "NONE")
+    if graph_type == "LINE":
+        return "LINE_NO_VALUE" if sensor_key == config_module.SENSOR_TEMPERATURE else "LINE"
+    if graph_type == "VERTICAL_BAR" and display_props.get("vertical_graph_config"):
+        return "VERTICAL_BAR"
+    return None
+
+def _text_areas(layout, fonts):
+    """Rows of the cached drawing that hold the large value and the note (full safe-area width)."""
+    value_height = fonts['large'].get_height()
+    note_height = (fonts['small'] if 'small' in fonts else fonts['medium']).get_height()
+    safe_rect = layout.safe_rect
+    return [
+        pygame.Rect(safe_rect.left, layout.value_midleft[1] - value_height // 2, safe_rect.width, value_height),
+        pygame.Rect(safe_rect.left, layout.note_pos[1] - note_height // 2, safe_rect.width, note_height),
+    ]
+
+def _graph_area(layout, graph_kind):
+    """Area of the cached drawing that depends on the readings (None: the sensor has no graph)."""
+    graph_rect = layout.graph_rects.get(graph_kind)
+    if graph_rect is None:
+        return None
+    screen_width, screen_height = layout.screen_size
+    if graph_kind == "VERTICAL_BAR":
+        # Tick labels and the pointer label reach past the bar on both sides
+        return pygame.Rect(0, graph_rect.top, screen_width, graph_rect.height)
+    # Line graph plus the time label below it
+    return pygame.Rect(graph_rect.left, graph_rect.top, graph_rect.width, screen_height - graph_rect.top)
+
+def draw_sensor_animations(screen, sensor_key, layout, current_time, config_module, ui_scaler=None, is_frozen=False):
+    """
+    Draw the sensor view's animations (line graph scanning strip, ambient effects) over the drawn view.
+
+    Returns:
+        list: Rects drawn to (empty while frozen)
+    """
+    # Frozen readings freeze the screen, so the animations are hidden too
+    if is_frozen:
+        return []
+    graph_kind = _graph_kind(sensor_key, config_module)
+    graph_rect = layout.graph_rects.get(graph_kind)
+    rects = []
+    if graph_kind in ("LINE", "LINE_NO_VALUE") and layout.scan_strip_height >= 12:
+        # Orange/yellow scanning lines animation below the graph (tricorder-style)
+        scan_strip_rect = pygame.Rect(graph_rect.left, graph_rect.bottom, graph_rect.width, layout.scan_strip_height)
+        rects.append(_draw_line_graph_scanning_effect(screen, scan_strip_rect, current_time, config_module, ui_scaler))
+    # Ambient tricorder effects in available spaces
+    rects.extend(_draw_sensor_ambient_effects(screen, layout.ambient[graph_kind], current_time, config_module, ui_scaler))
+    return [rect for rect in rects if rect]
+
 def _draw_subtle_title_glow(screen, text, font, color, center_pos, current_time):
     """Draw title with subtle animated glow effect behind the main text."""
     # Remove glow effect - not visible on small screen, just draw normal text
     pass  # No glow effect needed
 
 def _draw_line_graph_scanning_effect(screen, strip_rect, current_time, config_module, ui_scaler=None):
-    """Draw orange/yellow tricorder-style scanning lines (growing/shrinking bars) below the line graph."""
+    """Draw orange/yellow tricorder-style scanning lines (growing/shrinking bars) below the line graph; returns the rect drawn."""
     scan_speed = 2.2
     scan_height = max(2, ui_scaler.scale(2) if ui_scaler else 2)
     scan_spacing = max(10, (ui_scaler.scale(12) if ui_scaler else 12))
     if strip_rect.height < scan_spacing:
-        return
+        return None
     num_lines = max(1, strip_rect.height // scan_spacing)
     max_width = strip_rect.width * 0.75
     # Orange and yellow (theme accent / engineering gold)
     primary = getattr(config_module.Palette, "ORANGE", (255, 165, 0))
     secondary = getattr(config_module.Palette, "ENGINEERING_GOLD", (255, 200, 0))
-    for i in range(num_lines):
-        line_offset = i * 0.25
-        line_progress = (current_time * scan_speed + line_offset) % 4.0
-        if line_progress >= 2.0:
-            continue
-        line_y = strip_rect.top + (i * scan_spacing) + 2
-        if line_progress < 1.0:
-            line_width = int(max_width * line_progress)
-        else:
-            line_width = int(max_width * (2.0 - line_progress))
-        if line_width < 6:
-            continue
-        line_x = strip_rect.centerx - line_width // 2
-        line_rect = pygame.Rect(line_x, line_y, line_width, scan_height)
-        scan_color = secondary if i % 2 else primary
-        pygame.draw.rect(screen, scan_color, line_rect)
-        highlight = (min(255, scan_color[0] + 30), min(255, scan_color[1] + 25), min(255, scan_color[2] + 10))
-        pygame.draw.line(screen, highlight, (line_rect.left, line_rect.top), (line_rect.right, line_rect.top), 1)
-
-def _draw_sensor_ambient_effects(screen, screen_width, screen_height, graph_rect, sensor_data, current_time, config_module, ui_scaler, is_frozen=False):
-    """Draw ambient tricorder effects in available spaces around the graph. Uses ui_scaler for insets when available."""
+    # Layer centered on the strip; one spare pixel each side for the highlight line
+    half_width = int(max_width) // 2 + 1
+    bounds = pygame.Rect(strip_rect.centerx - half_width, strip_rect.top + 2,
+                         int(max_width) + 3, (num_lines - 1) * scan_spacing + scan_height)
+
+    def draw_frame(surface, t):
+        for i in range(num_lines):
+            line_offset = i * 0.25
+            line_progress = (t * scan_speed + line_offset) % 4.0
+            if line_progress >= 2.0:
+                continue
+            line_y = i * scan_spacing
+            if line_progress < 1.0:
+                line_width = int(max_width * line_progress)
+            else:
+                line_width = int(max_width * (2.0 - line_progress))
+            if line_width < 6:
+                continue
+            line_x = half_width - line_width // 2
+            line_rect = pygame.Rect(line_x, line_y, line_width, scan_height)
+            scan_color = secondary if i % 2 else primary
+            pygame.draw.rect(surface, scan_color, line_rect)
+            highlight = (min(255, scan_color[0] + 30), min(255, scan_color[1] + 25), min(255, scan_color[2] + 10))
+            pygame.draw.line(surface, highlight, (line_rect.left, line_rect.top), (line_rect.right, line_rect.top), 1)
+
+    return get_animation_layers().blit(
+        screen, ("graph_scan", num_lines, max_width, scan_height, scan_spacing, primary, secondary),
+        bounds, 4.0 / scan_speed, current_time, draw_frame,
+    )
+
+def _compute_ambient_areas(screen_width, screen_height, graph_rect, ui_scaler):
+    """[(effect, area)] for the ambient effects that fit around graph_rect (None: no graph). Uses ui_scaler for insets when available."""
     if screen_width < 200 or screen_height < 150:
-        return
-    animation_time = 0 if is_frozen else current_time
+        return []
     if ui_scaler:
         safe_top_y = ui_scaler.scale(100)
-        inset_sm = ui_scaler.margin("small")
-        inset_md = ui_scaler.margin("medium")
+        inset_sm = ui_scaler.layout.margin_small
+        inset_md = ui_scaler.layout.margin_medium
         inset_bottom = ui_scaler.scale(40)
         frozen_top = ui_scaler.scale(50)
     else:
@@ -338,39 +582,58 @@ def _draw_sensor_ambient_effects(screen, screen_width, screen_height, graph_rect
     min_effect_size = ui_scaler.scale(50) if ui_scaler else 50
     min_bottom_w = ui_scaler.scale(100) if ui_scaler else 100
     min_bottom_h = ui_scaler.scale(30) if ui_scaler else 30
+    areas = []
     if left_area.width > min_effect_size and left_area.height > min_effect_size:
-        _draw_sensor_data_stream(screen, left_area, animation_time, config_module, "left", ui_scaler)
+        areas.append(("left", left_area))
     if right_area.width > min_effect_size and right_area.height > min_effect_size:
-        _draw_sensor_data_stream(screen, right_area, animation_time, config_module, "right", ui_scaler)
+        areas.append(("right", right_area))
     if bottom_area.width > min_bottom_w and bottom_area.height > min_bottom_h:
-        _draw_sensor_status_indicators(screen, bottom_area, animation_time, config_module, ui_scaler)
+        areas.append(("status", bottom_area))
+    return areas
+
+def _draw_sensor_ambient_effects(screen, areas, current_time, config_module, ui_scaler):
+    """Draw ambient tricorder effects in the precomputed areas around the graph (see _compute_ambient_areas); returns the rects drawn."""
+    rects = []
+    for effect, area in areas:
+        if effect == "status":
+            rects.append(_draw_sensor_status_indicators(screen, area, current_time, config_module, ui_scaler))
+        else:
+            rects.append(_draw_sensor_data_stream(screen, area, current_time, config_module, effect, ui_scaler))
+    return rects
 
 def _draw_sensor_data_stream(screen, area, current_time, config_module, side, ui_scaler=None):
-    """Draw flickering data stream effect with fixed position dots. Uses ui_scaler for spacing/size when available."""
-    if current_time == 0:  # Frozen
-        return
+    """Draw flickering data stream effect with fixed position dots; returns the rect drawn. Uses ui_scaler for spacing/size when available."""
     dot_spacing = ui_scaler.scale(14) if ui_scaler else 14
     dot_offset = ui_scaler.scale(5) if ui_scaler else 5
+    dot_size = max(1, ui_scaler.scale(2) if ui_scaler else 2)
     num_dots = max(1, area.height // dot_spacing)
-    for i in range(num_dots):
-        dot_y = area.top + (i * dot_spacing) + dot_offset
-        if side == "left":
-            dot_x = area.left + area.width // 3
-        else:
-            dot_x = area.right - area.width // 3
-        flicker_offset = i * 0.7
-        flicker_progress = (current_time * 1.5 + flicker_offset) % 3.0
-        if flicker_progress < 1.0:
-            alpha = flicker_progress
-        elif flicker_progress < 2.0:
-            alpha = 1.0
-        else:
-            alpha = 3.0 - flicker_progress
-        if alpha > 0.1:
-            viking_blue = config_module.Palette.VIKING_BLUE
-            dot_color = tuple(min(255, int(c * alpha)) for c in viking_blue)
-            dot_size = max(1, ui_scaler.scale(2) if ui_scaler else 2)
-            pygame.draw.circle(screen, dot_color, (dot_x, dot_y), dot_size)
+    if side == "left":
+        dot_x = area.left + area.width // 3
+    else:
+        dot_x = area.right - area.width // 3
+    viking_blue = config_module.Palette.VIKING_BLUE
+    # Layer is one column of dots around dot_x
+    bounds = pygame.Rect(dot_x - dot_size, area.top + dot_offset - dot_size,
+                         2 * dot_size + 1, (num_dots - 1) * dot_spacing + 2 * dot_size + 1)
+
+    def draw_frame(surface, t):
+        for i in range(num_dots):
+            flicker_offset = i * 0.7
+            flicker_progress = (t * 1.5 + flicker_offset) % 3.0
+            if flicker_progress < 1.0:
+                alpha = flicker_progress
+            elif flicker_progress < 2.0:
+                alpha = 1.0
+            else:
+                alpha = 3.0 - flicker_progress
+            if alpha > 0.1:
+                dot_color = tuple(min(255, int(c * alpha)) for c in viking_blue)
+                pygame.draw.circle(surface, dot_color, (dot_size, dot_size + i * dot_spacing), dot_size)
+
+    return get_animation_layers().blit(
+        screen, ("sensor_stream", num_dots, dot_spacing, dot_size, tuple(viking_blue)),
+        bounds, 3.0 / 1.5, current_time, draw_frame,
+    )
 
 def _draw_sensor_readout_display(screen, area, sensor_data, current_time, config_module):
     """Draw animated sensor readout information without text messages."""
@@ -402,23 +665,27 @@ def _draw_sensor_readout_display(screen, area, sensor_data, current_time, config
                 pygame.draw.circle(screen, segment_color, (line_x + segment_length, line_y), 2)
 
 def _draw_sensor_status_indicators(screen, area, current_time, config_module, ui_scaler=None):
-    """Draw status indicator dots across the bottom. Uses ui_scaler for spacing/size when available."""
-    if current_time == 0:  # Frozen
-        return
+    """Draw status indicator dots across the bottom; returns the rect drawn. Uses ui_scaler for spacing/size when available."""
     min_width_per_indicator = ui_scaler.scale(24) if ui_scaler else 24
     indicator_radius = max(1, ui_scaler.scale(5) if ui_scaler else 5)
     indicator_count = min(6, area.width // max(1, min_width_per_indicator))
+    if indicator_count < 1:
+        return None
     indicator_spacing = area.width // max(1, indicator_count)
-    for i in range(indicator_count):
-        indicator_x = area.left + (i * indicator_spacing) + indicator_spacing // 2
-        indicator_y = area.centery
-        pulse_offset = i * 0.5
-        pulse_alpha = 0.4 + 0.5 * (0.5 + 0.5 * math.sin(current_time * 1.8 + pulse_offset))
-        if i % 3 == 0:
-            base_color = config_module.Palette.GREEN
-        elif i % 3 == 1:
-            base_color = config_module.Palette.ENGINEERING_GOLD
-        else:
-            base_color = config_module.Theme.ACCENT
-        indicator_color = tuple(min(255, int(c * pulse_alpha)) for c in base_color)
-        pygame.draw.circle(screen, indicator_color, (indicator_x, indicator_y), max(1, indicator_radius)) 
\ No newline at end of file
+    base_colors = (config_module.Palette.GREEN, config_module.Palette.ENGINEERING_GOLD, config_module.Theme.ACCENT)
+    # Layer is the row of indicators along area.centery
+    bounds = pygame.Rect(area.left + indicator_spacing // 2 - indicator_radius, area.centery - indicator_radius,
+                         (indicator_count - 1) * indicator_spacing + 2 * indicator_radius + 1, 2 * indicator_radius + 1)
+
+    def draw_frame(surface, t):
+        for i in range(indicator_count):
+            indicator_x = indicator_radius + i * indicator_spacing
+            pulse_offset = i * 0.5
+            pulse_alpha = 0.4 + 0.5 * (0.5 + 0.5 * math.sin(t * 1.8 + pulse_offset))
+            indicator_color = tuple(min(255, int(c * pulse_alpha)) for c in base_colors[i % 3])
+            pygame.draw.circle(surface, indicator_color, (indicator_x, indicator_radius), indicator_radius)
+
+    return get_animation_layers().blit(
+        screen, ("sensor_indicators", indicator_count, indicator_spacing, indicator_radius, tuple(map(tuple, base_colors))),
+        bounds, 2 * math.pi / 1.8, current_time, draw_frame,
+    )
@@ -7,6 +7,7 @@ import time
 import math
 from ui.components.menus.menu_base import draw_menu_base_layout
 from ui.components.text.text_display import render_footer
+from utils.animation_layers import get_animation_layers
 
 logger = logging.getLogger(__name__)
 
@@ -343,19 +344,25 @@ def _draw_sensor_data_streams(screen, main_content_rect, current_time, config_mo
     # Top-right corner stream
     start_x = main_content_rect.right - corner_margin - 40
     start_y = main_content_rect.top + corner_margin + 30
-    
-    for i in range(stream_length):
-        flow_offset = (current_time * 2.5 + i * 0.4) % 4.0
-        
-        if flow_offset < 2.0:
-            dot_x = start_x + int(flow_offset * 8)
-            dot_y = start_y + (i * 8)
-            
-            alpha_factor = 1.0 - (flow_offset / 2.0) if flow_offset > 1.0 else flow_offset
-            dot_color = (0, int(60 * alpha_factor), int(20 * alpha_factor))
-            
-            if dot_color[1] > 10:
-                pygame.draw.circle(screen, dot_color, (dot_x, dot_y), dot_size)
+    # Layer covers two steps of flow to the right and stream_length dots down, plus the dot radius
+    bounds = pygame.Rect(start_x - dot_size, start_y - dot_size,
+                         16 + 2 * dot_size + 1, (stream_length - 1) * 8 + 2 * dot_size + 1)
+
+    def draw_frame(surface, t):
+        for i in range(stream_length):
+            flow_offset = (t * 2.5 + i * 0.4) % 4.0
+
+            if flow_offset < 2.0:
+                dot_x = dot_size + int(flow_offset * 8)
+                dot_y = dot_size + (i * 8)
+
+                alpha_factor = 1.0 - (flow_offset / 2.0) if flow_offset > 1.0 else flow_offset
+                dot_color = (0, int(60 * alpha_factor), int(20 * alpha_factor))
+
+                if dot_color[1] > 10:
+                    pygame.draw.circle(surface, dot_color, (dot_x, dot_y), dot_size)
+
+    get_animation_layers().blit(screen, ("sensors_menu_stream",), bounds, 4.0 / 2.5, current_time, draw_frame)
 
 def _draw_sensor_grid_pattern(screen, main_content_rect, current_time, config_module):
     """Draw subtle grid pattern for ambient effect (larger dots, denser grid)."""
@@ -364,18 +371,29 @@ def _draw_sensor_grid_pattern(screen, main_content_rect, current_time, config_mo
     
     cols = min(8, main_content_rect.width // grid_spacing)
     rows = min(6, main_content_rect.height // grid_spacing)
-    
-    for row in range(rows):
-        for col in range(cols):
-            offset = (row * cols + col) * 0.3
-            alpha_cycle = (current_time * 0.8 + offset) % 4.0
-            
-            if alpha_cycle < 2.0:
-                alpha = 0.35 * (1.0 - abs(alpha_cycle - 1.0))
-                
-                if alpha > 0.05:
-                    dot_x = main_content_rect.left + col * grid_spacing + 12
-                    dot_y = main_content_rect.top + row * grid_spacing + 24
-                    
-                    dot_color = (0, int(40 * alpha), int(15 * alpha))
-                    pygame.draw.circle(screen, dot_color, (dot_x, dot_y), dot_size)
\ No newline at end of file
+    if not rows or not cols:
+        return
+    bounds = pygame.Rect(main_content_rect.left + 12 - dot_size, main_content_rect.top + 24 - dot_size,
+                         (cols - 1) * grid_spacing + 2 * dot_size + 1, (rows - 1) * grid_spacing + 2 * dot_size + 1)
+
+    def draw_frame(surface, t):
+        for row in range(rows):
+            for col in range(cols):
+                offset = (row * cols + col) * 0.3
+                alpha_cycle = (t * 0.8 + offset) % 4.0
+
+                if alpha_cycle < 2.0:
+                    alpha = 0.35 * (1.0 - abs(alpha_cycle - 1.0))
+
+                    if alpha > 0.05:
+                        dot_x = dot_size + col * grid_spacing
+                        dot_y = dot_size + row * grid_spacing
+
+                        dot_color = (0, int(40 * alpha), int(15 * alpha))
+                        pygame.draw.circle(surface, dot_color, (dot_x, dot_y), dot_size)
+
+    # The dots only reach a green level of 14, so 10 frames per second of the 5 s cycle
+    # look the same as the full frame rate at a third of the memory
+    period = 4.0 / 0.8
+    get_animation_layers().blit(screen, ("sensors_menu_grid", rows, cols), bounds, period, current_time,
+                                draw_frame, frame_count=round(period * 10))
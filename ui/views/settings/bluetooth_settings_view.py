@@ -7,7 +7,7 @@ from ui.components.menus.list_menu_base import draw_simple_list_menu
 logger = logging.getLogger(__name__)
 
 
-def draw_bluetooth_settings_view(screen, app_state, fonts, config_module, ui_scaler=None):
+def draw_bluetooth_settings_view(screen, app_state, fonts, config_module, ui_scaler=None, layout=None, animate=True):
     """
     Draw the Bluetooth settings screen using BluetoothManager: toggle, devices, back.
 
@@ -17,9 +17,11 @@ def draw_bluetooth_settings_view(screen, app_state, fonts, config_module, ui_sca
         fonts (dict): Dictionary of loaded fonts
         config_module (module): Configuration module
         ui_scaler (UIScaler, optional): UI scaling system
+        layout (ListMenuLayout, optional): Precomputed list menu geometry from the registered view
+        animate (bool): False leaves out the list menu's animated parts (the registered view draws them)
     """
     if not app_state.bluetooth_manager:
-        draw_simple_list_menu(
+        return draw_simple_list_menu(
             screen=screen,
             title="Bluetooth",
             menu_items=["<- Back to Settings"],
@@ -29,8 +31,9 @@ def draw_bluetooth_settings_view(screen, app_state, fonts, config_module, ui_sca
             footer_hint="Bluetooth manager not available",
             show_footer=True,
             ui_scaler=ui_scaler,
+            layout=layout,
+            animate=animate,
         )
-        return
 
     options_data = app_state.bluetooth_manager.get_current_display_options()
     menu_items = [opt["name"] for opt in options_data]
@@ -43,7 +46,7 @@ def draw_bluetooth_settings_view(screen, app_state, fonts, config_module, ui_sca
     ):
         footer = f"Connected: {app_state.bluetooth_manager.device_str}"
 
-    draw_simple_list_menu(
+    return draw_simple_list_menu(
         screen=screen,
         title="Bluetooth",
         menu_items=menu_items,
@@ -53,4 +56,6 @@ def draw_bluetooth_settings_view(screen, app_state, fonts, config_module, ui_sca
         footer_hint=footer,
         show_footer=footer is not None,
         ui_scaler=ui_scaler,
+        layout=layout,
+        animate=animate,
     )
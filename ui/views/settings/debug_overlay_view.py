@@ -9,7 +9,7 @@ import config as app_config
 
 logger = logging.getLogger(__name__)
 
-def draw_debug_overlay_view(screen, app_state, fonts, config_module, ui_scaler=None):
+def draw_debug_overlay_view(screen, app_state, fonts, config_module, ui_scaler=None, layout=None, animate=True):
     """
     Draw the debug overlay settings screen content using the shared list menu component.
 
@@ -19,6 +19,8 @@ def draw_debug_overlay_view(screen, app_state, fonts, config_module, ui_scaler=N
         fonts (dict): Dictionary of loaded fonts
         config_module (module): Configuration module (config package)
         ui_scaler (UIScaler, optional): UI scaling system for responsive design
+        layout (ListMenuLayout, optional): Precomputed list menu geometry from the registered view
+        animate (bool): False leaves out the list menu's animated parts (the registered view draws them)
     """
     # Get current selection index from app_state
     current_selection_idx = getattr(app_state, 'debug_overlay_option_index', 0)
@@ -33,7 +35,7 @@ def draw_debug_overlay_view(screen, app_state, fonts, config_module, ui_scaler=N
     ]
     
     # Use the shared list menu component
-    draw_simple_list_menu(
+    return draw_simple_list_menu(
         screen=screen,
         title="Debug Overlay",
         menu_items=debug_overlay_items,
@@ -41,5 +43,7 @@ def draw_debug_overlay_view(screen, app_state, fonts, config_module, ui_scaler=N
         fonts=fonts,
         config_module=config_module,
         footer_hint=f"{config_module.get_control_labels()['select']} to toggle overlay",
-        ui_scaler=ui_scaler
+        ui_scaler=ui_scaler,
+        layout=layout,
+        animate=animate,
     )
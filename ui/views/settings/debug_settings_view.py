@@ -9,7 +9,7 @@ import config as app_config
 logger = logging.getLogger(__name__)
 
 
-def draw_debug_settings_view(screen, app_state, fonts, config_module, ui_scaler=None):
+def draw_debug_settings_view(screen, app_state, fonts, config_module, ui_scaler=None, layout=None, animate=True):
     """
     Draw the Debug Settings screen: View Logs, Debug Overlay, Admin Timer toggle, Back.
     """
@@ -21,7 +21,7 @@ def draw_debug_settings_view(screen, app_state, fonts, config_module, ui_scaler=
         "<- Back to Settings",
     ]
     selected_index = getattr(app_state, "debug_settings_option_index", 0)
-    draw_simple_list_menu(
+    return draw_simple_list_menu(
         screen=screen,
         title="Debug Settings",
         menu_items=menu_items,
@@ -30,4 +30,6 @@ def draw_debug_settings_view(screen, app_state, fonts, config_module, ui_scaler=
         config_module=config_module,
         footer_hint=f"{config_module.get_control_labels()['select']} open / toggle",
         ui_scaler=ui_scaler,
+        layout=layout,
+        animate=animate,
     )
@@ -20,7 +20,7 @@ DEVICE_ACTION_ITEMS = [
     {"name": "<- Back to Main Menu", "action": app_config.ACTION_GO_TO_MAIN_MENU} # Updated item with simpler arrow
 ]
 
-def draw_device_settings_view(screen, app_state, fonts, config_module, ui_scaler=None):
+def draw_device_settings_view(screen, app_state, fonts, config_module, ui_scaler=None, layout=None, animate=True):
     """
     Draw the device settings screen content using the shared list menu component.
 
@@ -30,6 +30,8 @@ def draw_device_settings_view(screen, app_state, fonts, config_module, ui_scaler
         fonts (dict): Dictionary of loaded fonts
         config_module (module): Configuration module (config package)
         ui_scaler (UIScaler, optional): UI scaling system for responsive design
+        layout (ListMenuLayout, optional): Precomputed list menu geometry from the registered view
+        animate (bool): False leaves out the list menu's animated parts (the registered view draws them)
     """
     # Get current selection index from app_state
     current_selection_idx = getattr(app_state, 'device_settings_option_index', 0)
@@ -38,7 +40,7 @@ def draw_device_settings_view(screen, app_state, fonts, config_module, ui_scaler
     menu_items = [item_data["name"] for item_data in DEVICE_ACTION_ITEMS]
     
     # Use the shared list menu component
-    draw_simple_list_menu(
+    return draw_simple_list_menu(
         screen=screen,
         title="Device Settings",
         menu_items=menu_items,
@@ -46,5 +48,7 @@ def draw_device_settings_view(screen, app_state, fonts, config_module, ui_scaler
         fonts=fonts,
         config_module=config_module,
         footer_hint=None,  # No footer for this view
-        ui_scaler=ui_scaler
+        ui_scaler=ui_scaler,
+        layout=layout,
+        animate=animate,
     ) 
\ No newline at end of file
@@ -18,13 +18,13 @@ def _build_display_settings_menu_items(app_state):
     ]
 
 
-def draw_display_settings_view(screen, app_state, fonts, config_module, ui_scaler=None):
+def draw_display_settings_view(screen, app_state, fonts, config_module, ui_scaler=None, layout=None, animate=True):
     """
     Draw the Display Settings main menu: Dashboard auto-cycle, Safe area, Debug layout, Back.
     """
     current_selection_idx = getattr(app_state.settings_manager, "display_settings_option_index", 0)
     menu_items = _build_display_settings_menu_items(app_state)
-    draw_simple_list_menu(
+    return draw_simple_list_menu(
         screen=screen,
         title="Display Settings",
         menu_items=menu_items,
@@ -33,10 +33,12 @@ def draw_display_settings_view(screen, app_state, fonts, config_module, ui_scale
         config_module=config_module,
         footer_hint=None,
         ui_scaler=ui_scaler,
+        layout=layout,
+        animate=animate,
     )
 
 
-def draw_display_cycle_interval_view(screen, app_state, fonts, config_module, ui_scaler=None):
+def draw_display_cycle_interval_view(screen, app_state, fonts, config_module, ui_scaler=None, layout=None, animate=True):
     """
     Draw the Dashboard auto-cycle interval picker (sub-screen of Display Settings).
     """
@@ -45,7 +47,7 @@ def draw_display_cycle_interval_view(screen, app_state, fonts, config_module, ui
     selected_index = info.get("selected_index", 0)
     menu_items = [f"{v}s" for v in options] + ["<- Back to Display Settings"]
     # Selected index matches: 0..len(options)-1 for intervals, len(options) for Back
-    draw_simple_list_menu(
+    return draw_simple_list_menu(
         screen=screen,
         title="Dashboard auto-cycle",
         menu_items=menu_items,
@@ -54,4 +56,6 @@ def draw_display_cycle_interval_view(screen, app_state, fonts, config_module, ui
         config_module=config_module,
         footer_hint=None,
         ui_scaler=ui_scaler,
+        layout=layout,
+        animate=animate,
     )
@@ -9,7 +9,7 @@ from ui.components.text.text_display import render_footer, render_title # render
 
 logger = logging.getLogger(__name__)
 
-def draw_select_combo_duration_view(screen, app_state, fonts, config_module, ui_scaler=None):
+def draw_select_combo_duration_view(screen, app_state, fonts, config_module, ui_scaler=None, layout=None, animate=True):
     """
     Draws the screen for selecting the secret combo hold duration using the shared list menu component.
     
@@ -19,6 +19,8 @@ def draw_select_combo_duration_view(screen, app_state, fonts, config_module, ui_
         fonts (dict): Dictionary of loaded fonts
         config_module (module): Configuration module (config package)
         ui_scaler (UIScaler, optional): UI scaling system for responsive design
+        layout (ListMenuLayout, optional): Precomputed list menu geometry from the registered view
+        animate (bool): False leaves out the list menu's animated parts (the registered view draws them)
     """
     # Get current selection index from app_state
     current_selection_idx = getattr(app_state, 'combo_duration_selection_index', 0)
@@ -28,7 +30,7 @@ def draw_select_combo_duration_view(screen, app_state, fonts, config_module, ui_
     menu_items = [f"{option_value:.1f}s" for option_value in options_list]
     
     # Use the shared list menu component
-    draw_simple_list_menu(
+    return draw_simple_list_menu(
         screen=screen,
         title="Secret Combo Duration",
         menu_items=menu_items,
@@ -36,5 +38,7 @@ def draw_select_combo_duration_view(screen, app_state, fonts, config_module, ui_
         fonts=fonts,
         config_module=config_module,
         footer_hint=None,  # No footer for this view
-        ui_scaler=ui_scaler
+        ui_scaler=ui_scaler,
+        layout=layout,
+        animate=animate,
     ) 
\ No newline at end of file
@@ -12,7 +12,10 @@ logger = logging.getLogger(__name__)
 # Removed TEMP_SETTINGS_MENU_ITEMS and TEMP_SELECTED_INDEX
 # The view will now get these from app_state, which gets them from MenuManager
 
-def draw_settings_view(screen, app_state, fonts, config_module, ui_scaler=None):
+# Scaler for the content area below the update header, reused while its size is unchanged
+_content_ui_scaler = None
+
+def draw_settings_view(screen, app_state, fonts, config_module, ui_scaler=None, layout=None, animate=True):
     """
     Draw the settings screen content using the shared list menu component.
 
@@ -22,6 +25,8 @@ def draw_settings_view(screen, app_state, fonts, config_module, ui_scaler=None):
         fonts (dict): Dictionary of loaded fonts
         config_module (module): Configuration module (config package)
         ui_scaler (UIScaler, optional): UI scaling system for responsive design
+        layout (ListMenuLayout, optional): Precomputed list menu geometry from the registered view
+        animate (bool): False leaves out the list menu's animated parts (the registered view draws them)
     """
     # Add update available header if needed (respect safe area for curved bezel)
     menu_ui_scaler = ui_scaler
@@ -39,7 +44,12 @@ def draw_settings_view(screen, app_state, fonts, config_module, ui_scaler=None):
         menu_screen = screen.subsurface(content_rect)
         # Use a scaler for the content area so the list menu lays out for the reduced height
         # instead of full screen (avoids pushed/cramped layout)
-        menu_ui_scaler = UIScaler(content_rect.width, content_rect.height, config_module)
+        global _content_ui_scaler
+        if _content_ui_scaler is None:
+            _content_ui_scaler = UIScaler(content_rect.width, content_rect.height, config_module)
+        else:
+            _content_ui_scaler.resize(content_rect.width, content_rect.height)
+        menu_ui_scaler = _content_ui_scaler
     else:
         menu_screen = screen
     
@@ -48,7 +58,7 @@ def draw_settings_view(screen, app_state, fonts, config_module, ui_scaler=None):
     selected_index = app_state.get_current_menu_index()
     
     # Use the shared list menu component
-    draw_simple_list_menu(
+    return draw_simple_list_menu(
         screen=menu_screen,
         title="Settings",
         menu_items=menu_items,
@@ -56,5 +66,7 @@ def draw_settings_view(screen, app_state, fonts, config_module, ui_scaler=None):
         fonts=fonts,
         config_module=config_module,
         footer_hint=None,  # No footer for settings
-        ui_scaler=menu_ui_scaler
+        ui_scaler=menu_ui_scaler,
+        layout=layout,
+        animate=animate,
     ) 
\ No newline at end of file
@@ -11,7 +11,7 @@ import config as app_config
 
 logger = logging.getLogger(__name__)
 
-def draw_sound_test_view(screen, app_state, fonts, config_module, ui_scaler=None):
+def draw_sound_test_view(screen, app_state, fonts, config_module, ui_scaler=None, layout=None, animate=True):
     """
     Draw the sound test screen content - either simple menu or dedicated test screen.
 
@@ -21,6 +21,8 @@ def draw_sound_test_view(screen, app_state, fonts, config_module, ui_scaler=None
         fonts (dict): Dictionary of loaded fonts
         config_module (module): Configuration module (config package)
         ui_scaler (UIScaler, optional): UI scaling system for responsive design
+        layout (ListMenuLayout, optional): Precomputed list menu geometry from the registered view
+        animate (bool): False leaves out the list menu's animated parts (the registered view draws them)
     """
     # Check if AudioManager is available
     if not hasattr(app_state, 'audio_manager') or not app_state.audio_manager:
@@ -61,7 +63,7 @@ def draw_sound_test_view(screen, app_state, fonts, config_module, ui_scaler=None
     ]
     
     # Use the shared list menu component
-    draw_simple_list_menu(
+    return draw_simple_list_menu(
         screen=screen,
         title="Sound Test",
         menu_items=sound_test_items,
@@ -69,5 +71,7 @@ def draw_sound_test_view(screen, app_state, fonts, config_module, ui_scaler=None
         fonts=fonts,
         config_module=config_module,
         footer_hint=f"{config_module.get_control_labels()['select']} to test audio",
-        ui_scaler=ui_scaler
+        ui_scaler=ui_scaler,
+        layout=layout,
+        animate=animate,
     )
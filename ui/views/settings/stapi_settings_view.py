@@ -8,7 +8,7 @@ from ui.components.menus.list_menu_base import draw_simple_list_menu
 logger = logging.getLogger(__name__)
 
 
-def draw_stapi_settings_view(screen, app_state, fonts, config_module, ui_scaler=None):
+def draw_stapi_settings_view(screen, app_state, fonts, config_module, ui_scaler=None, layout=None, animate=True):
     """
     Draw the Star Trek Data settings screen: Fetch data from STAPI or Back.
     Menu items and selection come from app_state (st_wiki_manager manifest + local index).
@@ -18,7 +18,7 @@ def draw_stapi_settings_view(screen, app_state, fonts, config_module, ui_scaler=
     selected_index = getattr(app_state, "stapi_settings_index", 0)
     selected_index = max(0, min(selected_index, len(menu_items) - 1))
 
-    draw_simple_list_menu(
+    return draw_simple_list_menu(
         screen=screen,
         title="Star Trek Data",
         menu_items=menu_items,
@@ -27,5 +27,7 @@ def draw_stapi_settings_view(screen, app_state, fonts, config_module, ui_scaler=
         config_module=config_module,
         footer_hint="Requires network. Data saved to data/stapi/.",
         show_footer=True,
-        ui_scaler=ui_scaler
+        ui_scaler=ui_scaler,
+        layout=layout,
+        animate=animate,
     )
@@ -37,7 +37,7 @@ def _draw_wifi_bars(screen, x, y, signal_pct, bar_w, bar_gap, max_bar_h, config_
             pygame.draw.rect(screen, fill, rect, border_radius=1)
     return total_w
 
-def draw_wifi_settings_view(screen, app_state, fonts, config_module, ui_scaler=None):
+def draw_wifi_settings_view(screen, app_state, fonts, config_module, ui_scaler=None, layout=None, animate=True):
     """
     Draw the WiFi settings screen content using the shared list menu component.
 
@@ -47,6 +47,8 @@ def draw_wifi_settings_view(screen, app_state, fonts, config_module, ui_scaler=N
         fonts (dict): Dictionary of loaded fonts
         config_module (module): Configuration module (config package)
         ui_scaler (UIScaler, optional): UI scaling system for responsive design
+        layout (ListMenuLayout, optional): Precomputed list menu geometry from the registered view
+        animate (bool): False leaves out the list menu's animated parts (the registered view draws them)
     """
     # Check if WifiManager is available
     if not app_state.wifi_manager:
@@ -77,7 +79,7 @@ def draw_wifi_settings_view(screen, app_state, fonts, config_module, ui_scaler=N
     menu_items = [item_data["name"] for item_data in menu_items_data]
     
     # Use the shared list menu component
-    draw_simple_list_menu(
+    return draw_simple_list_menu(
         screen=screen,
         title="Wi-Fi Settings",
         menu_items=menu_items,
@@ -85,7 +87,9 @@ def draw_wifi_settings_view(screen, app_state, fonts, config_module, ui_scaler=N
         fonts=fonts,
         config_module=config_module,
         footer_hint=None,  # No footer for this view
-        ui_scaler=ui_scaler
+        ui_scaler=ui_scaler,
+        layout=layout,
+        animate=animate,
     )
 
 def draw_wifi_networks_view(screen, app_state, fonts, config_module, ui_scaler=None):
@@ -16,22 +16,14 @@ logger = logging.getLogger(__name__)
 HEADER = "timestamp_utc,elapsed_sec,scenario,cpu_pct,ram_pct,temp_c,battery_pct,battery_status"
 
 
-def _get_temp_c():
-    """Get CPU/SoC temperature in °C if available (e.g. Pi thermal_zone0)."""
-    try:
-        cpu_pct, extra = system_info.get_cpu_usage()
-        if extra and extra[0] == "temperature":
-            return round(extra[1], 1)
-    except Exception:
-        pass
-    try:
-        path = "/sys/class/thermal/thermal_zone0/temp"
-        if os.path.exists(path):
-            with open(path, "r") as f:
-                return round(int(f.read().strip()) / 1000.0, 1)
-    except Exception:
-        pass
-    return None
+def _get_system_snapshot(app_state):
+    """Shared SystemSnapshot (CPU%, RAM%, temp °C, ...) from the app's SystemInfoManager, else a fresh read."""
+    manager = getattr(app_state, "system_info_manager", None)
+    if manager is not None:
+        snapshot = manager.get_snapshot()
+        if snapshot is not None:
+            return snapshot
+    return system_info.read_system_snapshot()
 
 
 def _safe_float(value, default=None):
@@ -117,10 +109,10 @@ class AdminTimer:
         self._last_log_time = now
         scenario = str(getattr(app_state, "current_state", "") or "")
 
-        cpu_pct, _ = system_info.get_cpu_usage()
-        ram_result = system_info.get_memory_usage()
-        ram_pct = ram_result[0] if ram_result else None
-        temp_c = _get_temp_c()
+        snapshot = _get_system_snapshot(app_state)
+        cpu_pct = snapshot.cpu_percent
+        ram_pct = snapshot.mem_percent
+        temp_c = round(snapshot.cpu_temp_c, 1) if snapshot.cpu_temp_c is not None else None
         battery_pct, battery_status = system_info.get_battery_info() or (None, None)
 
         elapsed = round(now - self.start_time, 1)
@@ -0,0 +1,100 @@
+# --- utils/animation_layers.py ---
+# Pre-rendered frames for periodic ambient effects (scan lines, data streams, pulsing dots)
+
+import logging
+
+import pygame
+
+from utils.asset_cache import AssetCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FRAME_RATE = 30
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+COLORKEY = (255, 0, 255)  # Transparent color of layer frames; no effect draws pure magenta
+
+
+class AnimationLayerCache:
+    """
+    Periodic effects rendered once per frame slot and then replayed as single blits.
+
+    An effect is identified by a key that includes everything its drawing depends on
+    (geometry, colors, scaling). Its period is split into frame slots (frame_rate slots per
+    second unless the caller picks a count); the first time a slot is shown, draw_frame is
+    called once on a transparent surface of the layer size, and from then on that slot is one
+    color-keyed blit. Frames live in a byte-bounded LRU, so layers for screens that are no
+    longer shown (or an old window size) are dropped when memory is needed. The budget counts
+    full frame surfaces; SDL RLE-encodes the mostly transparent frames on their first blit,
+    so the memory actually held is far smaller.
+    """
+
+    def __init__(self, frame_rate=DEFAULT_FRAME_RATE, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache.
+
+        Args:
+            frame_rate (int): Frame slots per second of animation
+            max_bytes (int): Upper bound on memory held by rendered frames
+        """
+        self.frame_rate = max(1, frame_rate)
+        self._frames = AssetCache(max_bytes)
+
+    def frame_count(self, period):
+        """Number of frame slots used for an effect with the given period (seconds)."""
+        return max(1, round(period * self.frame_rate))
+
+    def blit(self, screen, key, bounds, period, current_time, draw_frame, frame_count=None):
+        """
+        Draw the frame of a periodic effect that matches current_time.
+
+        Args:
+            screen (pygame.Surface): Surface to draw on
+            key (tuple): Hashable identity of the effect, including its geometry and colors
+            bounds (pygame.Rect): Screen area the effect draws into (frames are clipped to it)
+            period (float): Seconds after which the effect repeats exactly
+            current_time (float): Animation time in seconds
+            draw_frame (callable): draw_frame(surface, t) draws the effect at time t onto a
+                bounds-sized surface, in coordinates relative to bounds.topleft
+            frame_count (int, optional): Frame slots per period; defaults to period * frame_rate
+
+        Returns:
+            pygame.Rect or None: Screen area drawn to (None if nothing was drawn)
+        """
+        bounds = pygame.Rect(bounds)
+        if bounds.width <= 0 or bounds.height <= 0 or period <= 0:
+            return None
+        frames = frame_count or self.frame_count(period)
+        index = int((current_time % period) * frames / period) % frames
+        frame = self._frames.get_or_create(
+            (key, bounds.size, period, frames, index),
+            lambda: self._render_frame(bounds.size, draw_frame, index * period / frames),
+        )
+        return screen.blit(frame, bounds.topleft)
+
+    def _render_frame(self, size, draw_frame, t):
+        frame = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            frame = frame.convert()
+        frame.fill(COLORKEY)
+        draw_frame(frame, t)
+        frame.set_colorkey(COLORKEY, pygame.RLEACCEL)
+        return frame
+
+    def clear(self):
+        """Drop all rendered frames (e.g. after the display mode changed)."""
+        self._frames.clear()
+
+
+_shared_layers = None
+
+
+def get_animation_layers():
+    """Return the application-wide AnimationLayerCache (configured by config AMBIENT_LAYER_* settings)."""
+    global _shared_layers
+    if _shared_layers is None:
+        import config
+        _shared_layers = AnimationLayerCache(
+            frame_rate=getattr(config, "AMBIENT_LAYER_FRAME_RATE", DEFAULT_FRAME_RATE),
+            max_bytes=getattr(config, "AMBIENT_LAYER_CACHE_BYTES", DEFAULT_MAX_BYTES),
+        )
+    return _shared_layers
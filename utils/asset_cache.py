@@ -0,0 +1,134 @@
+# --- utils/asset_cache.py ---
+# Shared cache of loaded/scaled image surfaces so views never decode or smoothscale per frame
+
+import collections
+import logging
+import os
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+
+def _surface_bytes(surface):
+    """Approximate memory held by a surface (pitch * height)."""
+    return surface.get_pitch() * surface.get_height()
+
+
+class AssetCache:
+    """
+    LRU cache of pygame surfaces, bounded by total pixel memory.
+
+    Images are keyed by (path, target size, alpha). The decoded original is cached too, so
+    asking for several sizes of the same file decodes it once. Derived surfaces (e.g.
+    animation frames) can be cached under any hashable key with get_or_create(). Paths
+    that fail to load, and sizes that fail to scale, are remembered so they are not retried
+    every frame.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes (int): Upper bound on cached surface memory; least recently used
+                entries are evicted beyond it
+        """
+        self.max_bytes = max_bytes
+        self._entries = collections.OrderedDict()  # key -> (surface, bytes)
+        self._total_bytes = 0
+        self._failed = set()  # Paths that failed to load, (path, size, alpha) keys that failed to scale
+
+    @property
+    def total_bytes(self):
+        """Bytes currently held by cached surfaces."""
+        return self._total_bytes
+
+    def get_or_create(self, key, factory):
+        """
+        Return the cached surface for key, calling factory() to build it on a miss.
+
+        Returns None (and caches nothing) if the factory returns None.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry[0]
+        surface = factory()
+        if surface is not None:
+            self._put(key, surface)
+        return surface
+
+    def load(self, path, size=None, alpha=True):
+        """
+        Load an image, optionally smoothscaled to size, converting it for fast blits.
+
+        Args:
+            path (str): Image file path
+            size (tuple, optional): (width, height) to scale to; None keeps the original size
+            alpha (bool): convert_alpha() when True, convert() otherwise
+
+        Returns:
+            pygame.Surface or None: Shared surface (do not modify it), None if the file cannot be loaded
+        """
+        path = os.path.abspath(path)
+        if path in self._failed:
+            return None
+        original_key = (path, None, alpha)
+        original = self.get_or_create(original_key, lambda: self._load_file(path, alpha))
+        if original is None or size is None:
+            return original
+        size = (max(1, int(size[0])), max(1, int(size[1])))
+        if size == original.get_size():
+            return original
+        scaled_key = (path, size, alpha)
+        if scaled_key in self._failed:
+            return None
+        return self.get_or_create(scaled_key, lambda: self._scale(scaled_key, original))
+
+    def clear(self):
+        """Drop every cached surface and forget failed loads."""
+        self._entries.clear()
+        self._total_bytes = 0
+        self._failed.clear()
+
+    def _load_file(self, path, alpha):
+        try:
+            image = pygame.image.load(path)
+            return image.convert_alpha() if alpha else image.convert()
+        except (pygame.error, FileNotFoundError) as e:
+            logger.warning(f"Could not load image '{path}': {e}")
+            self._failed.add(path)
+            return None
+
+    def _scale(self, key, original):
+        path, size, _alpha = key
+        try:
+            return pygame.transform.smoothscale(original, size)
+        except (pygame.error, ValueError) as e:
+            logger.warning(f"Could not scale image '{path}' to {size}: {e}")
+            self._failed.add(key)
+            return None
+
+    def _put(self, key, surface):
+        size_bytes = _surface_bytes(surface)
+        self._entries[key] = (surface, size_bytes)
+        self._total_bytes += size_bytes
+        # Evict least recently used, but never the entry just added
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            _old_key, (_old_surface, old_bytes) = self._entries.popitem(last=False)
+            self._total_bytes -= old_bytes
+
+
+_shared_cache = None
+
+
+def get_asset_cache():
+    """Return the application-wide AssetCache (sized by config ASSET_CACHE_MAX_BYTES)."""
+    global _shared_cache
+    if _shared_cache is None:
+        import config
+        _shared_cache = AssetCache(getattr(config, "ASSET_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES))
+    return _shared_cache
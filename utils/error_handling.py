@@ -49,6 +49,8 @@ def display_critical_error_on_screen(screen, fonts, config_module, messages, ui_
                     current_y += extra_spacing_after_first
             
             pygame.display.flip()
+            from ui.frame_presenter import get_frame_presenter
+            get_frame_presenter().invalidate()  # Error screen replaced the last presented frame
             pygame.time.wait(5000) # Show error for 5 seconds
         except Exception as display_e:
             logger.error(f"Failed to display critical error message on screen: {display_e}", exc_info=True)
@@ -0,0 +1,139 @@
+# --- utils/frame_scheduler.py ---
+# Adaptive frame pacing: per-state frame rates, a boost after input, and an idle rate
+
+import logging
+import time
+
+from models.app_state import (
+    STATE_PONG_ACTIVE, STATE_BREAKOUT_ACTIVE, STATE_SNAKE_ACTIVE, STATE_TETRIS_ACTIVE, STATE_SCHEMATICS,
+    STATE_DASHBOARD, STATE_MEDIA_PLAYER, STATE_LOADING,
+    STATE_SETTINGS_WIFI, STATE_SETTINGS_BLUETOOTH, STATE_SETTINGS_BLUETOOTH_DEVICES, STATE_SETTINGS_DEVICE,
+    STATE_SETTINGS_DISPLAY, STATE_SETTINGS_CONTROLS, STATE_SETTINGS_UPDATE, STATE_SETTINGS_SOUND_TEST,
+    STATE_SETTINGS_DEBUG, STATE_SETTINGS_DEBUG_OVERLAY, STATE_SETTINGS_LOG_VIEWER, STATE_SETTINGS_STAPI,
+    STATE_SELECT_COMBO_DURATION, STATE_SETTINGS_VOLUME, STATE_DISPLAY_CYCLE_INTERVAL,
+    STATE_SETTINGS_WIFI_NETWORKS, STATE_WIFI_PASSWORD_ENTRY, STATE_SETTINGS_WIFI_FORGET, STATE_CONFIRM_FORGET_WIFI,
+    STATE_CONFIRM_REBOOT, STATE_CONFIRM_SHUTDOWN, STATE_CONFIRM_RESTART_APP, STATE_CREW_DETAIL, STATE_ST_WIKI,
+)
+
+logger = logging.getLogger(__name__)
+
+# Frame-rate tier per state (see FRAME_RATE_TIERS); states not listed are "animated"
+STATE_FRAME_RATE_TIERS = {
+    # Games and the 3D viewer need every frame
+    STATE_PONG_ACTIVE: "realtime",
+    STATE_BREAKOUT_ACTIVE: "realtime",
+    STATE_SNAKE_ACTIVE: "realtime",
+    STATE_TETRIS_ACTIVE: "realtime",
+    STATE_SCHEMATICS: "realtime",
+    # Settings pages, pickers, dialogs and text pages barely change between inputs
+    STATE_SETTINGS_WIFI: "static",
+    STATE_SETTINGS_BLUETOOTH: "static",
+    STATE_SETTINGS_BLUETOOTH_DEVICES: "static",
+    STATE_SETTINGS_DEVICE: "static",
+    STATE_SETTINGS_DISPLAY: "static",
+    STATE_SETTINGS_CONTROLS: "static",
+    STATE_SETTINGS_UPDATE: "static",
+    STATE_SETTINGS_SOUND_TEST: "static",
+    STATE_SETTINGS_DEBUG: "static",
+    STATE_SETTINGS_DEBUG_OVERLAY: "static",
+    STATE_SETTINGS_LOG_VIEWER: "static",
+    STATE_SETTINGS_STAPI: "static",
+    STATE_SELECT_COMBO_DURATION: "static",
+    STATE_SETTINGS_VOLUME: "static",
+    STATE_DISPLAY_CYCLE_INTERVAL: "static",
+    STATE_SETTINGS_WIFI_NETWORKS: "static",
+    STATE_WIFI_PASSWORD_ENTRY: "static",
+    STATE_SETTINGS_WIFI_FORGET: "static",
+    STATE_CONFIRM_FORGET_WIFI: "static",
+    STATE_CONFIRM_REBOOT: "static",
+    STATE_CONFIRM_SHUTDOWN: "static",
+    STATE_CONFIRM_RESTART_APP: "static",
+    STATE_CREW_DETAIL: "static",
+    STATE_ST_WIKI: "static",
+}
+
+# States that keep their normal rate without input: games, 3D, video, loading, auto-cycling dashboard
+IDLE_EXEMPT_STATES = frozenset((
+    STATE_PONG_ACTIVE, STATE_BREAKOUT_ACTIVE, STATE_SNAKE_ACTIVE, STATE_TETRIS_ACTIVE, STATE_SCHEMATICS,
+    STATE_MEDIA_PLAYER, STATE_LOADING, STATE_DASHBOARD,
+))
+
+
+class FrameScheduler:
+    """
+    Replaces the fixed clock.tick(FPS) at the end of the main loop.
+
+    Each state runs at its tier's rate (realtime / animated / static). Input boosts the
+    rate for a short while so navigation animations stay smooth, and after a stretch
+    without input non-exempt states drop to the idle rate. Long waits are slept in short
+    slices that end early when input arrives, so a low frame rate never delays a key press.
+    """
+
+    def __init__(self, config_module):
+        """
+        Initialize the scheduler.
+
+        Args:
+            config_module: The configuration module (FPS and FRAME_RATE_* settings)
+        """
+        self.max_fps = config_module.FPS
+        self.enabled = getattr(config_module, "FRAME_PACING_ENABLED", True)
+        self.tier_fps = dict(getattr(config_module, "FRAME_RATE_TIERS", {}))
+        self.boost_fps = getattr(config_module, "FRAME_RATE_INPUT_BOOST", self.max_fps)
+        self.boost_seconds = getattr(config_module, "FRAME_RATE_BOOST_SECONDS", 1.5)
+        self.idle_fps = getattr(config_module, "FRAME_RATE_IDLE", 2)
+        self.idle_after_seconds = getattr(config_module, "FRAME_RATE_IDLE_AFTER_SECONDS", 30.0)
+        self.poll_interval = getattr(config_module, "FRAME_RATE_INPUT_POLL_INTERVAL", 0.02)
+
+        self._last_input_time = time.monotonic()
+        self._last_frame_time = self._last_input_time
+        self.current_fps = self.max_fps
+
+    def note_input(self, now=None):
+        """Record user input (starts the boost window and leaves idle mode)."""
+        self._last_input_time = time.monotonic() if now is None else now
+
+    def target_fps(self, state, keys_held=False, now=None):
+        """Frame rate for state right now, capped at config FPS."""
+        if not self.enabled:
+            return self.max_fps
+        now = time.monotonic() if now is None else now
+        since_input = now - self._last_input_time
+        fps = self.tier_fps.get(STATE_FRAME_RATE_TIERS.get(state, "animated"), self.max_fps)
+        if keys_held or since_input < self.boost_seconds:
+            fps = max(fps, self.boost_fps)
+        elif self.idle_after_seconds and since_input >= self.idle_after_seconds and state not in IDLE_EXEMPT_STATES:
+            fps = min(fps, self.idle_fps)
+        return max(1, min(fps, self.max_fps))
+
+    def wait(self, clock, state, keys_held=False, input_pending=None):
+        """
+        Sleep until the next frame is due.
+
+        Args:
+            clock (pygame.time.Clock): The main loop clock (ticked so its FPS stays meaningful)
+            state (str): Current application state
+            keys_held (bool): True while a key is held (keeps the boost rate for long presses)
+            input_pending (callable, optional): Returns True if input is waiting; ends a low-rate wait early
+
+        Returns:
+            int: The frame rate used for this frame
+        """
+        fps = self.target_fps(state, keys_held)
+        if fps != self.current_fps:
+            logger.debug(f"Frame rate {self.current_fps} -> {fps} FPS (state {state})")
+            self.current_fps = fps
+
+        frame_time = 1.0 / fps
+        if input_pending is None or frame_time <= self.poll_interval * 2:
+            clock.tick(fps)
+        else:
+            deadline = self._last_frame_time + frame_time
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or input_pending():
+                    break
+                time.sleep(min(self.poll_interval, remaining))
+            clock.tick()
+        self._last_frame_time = time.monotonic()
+        return fps
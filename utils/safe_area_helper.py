@@ -153,3 +153,68 @@ def adjust_safe_area_for_cover(cover_type="curved_corners", screen_width=320, sc
     }
     
     return recommendations.get(cover_type, recommendations["none"])
+
+
+# Corner patches of the rounded safe-area mask, keyed by (mask size, safe rect, corner radius)
+_mask_patch_cache = {}
+
+
+def _build_safe_area_mask_patches(mask_size, safe_rect, corner_radius):
+    """
+    Split the rounded safe-area mask into what actually has to be applied per frame.
+
+    Returns:
+        tuple: (border rects to fill black, [(corner patch surface, position)] to BLEND_MULT)
+    """
+    mask_rect = pygame.Rect((0, 0), mask_size)
+    inner = safe_rect.clip(mask_rect)
+    border_rects = [
+        pygame.Rect(0, 0, mask_rect.width, inner.top),
+        pygame.Rect(0, inner.bottom, mask_rect.width, mask_rect.height - inner.bottom),
+        pygame.Rect(0, inner.top, inner.left, inner.height),
+        pygame.Rect(inner.right, inner.top, mask_rect.width - inner.right, inner.height),
+    ]
+    border_rects = [rect for rect in border_rects if rect.width > 0 and rect.height > 0]
+
+    corner_patches = []
+    patch_size = min(corner_radius, inner.width // 2, inner.height // 2)
+    if patch_size > 0:
+        # Draw the full mask once (same call as before) and keep only its corner squares
+        mask_surface = pygame.Surface(mask_size, pygame.SRCALPHA)
+        mask_surface.fill((0, 0, 0, 0))
+        pygame.draw.rect(mask_surface, (255, 255, 255, 255), safe_rect, border_radius=corner_radius)
+        for corner_pos in (inner.topleft, (inner.right - patch_size, inner.top),
+                           (inner.left, inner.bottom - patch_size),
+                           (inner.right - patch_size, inner.bottom - patch_size)):
+            patch_rect = pygame.Rect(corner_pos, (patch_size, patch_size))
+            corner_patches.append((mask_surface.subsurface(patch_rect).copy(), patch_rect.topleft))
+    return border_rects, corner_patches
+
+
+def apply_safe_area_mask(screen, ui_scaler, corner_radius):
+    """
+    Black out everything outside the rounded safe area, matching the screen cover.
+
+    Gives the same pixels as multiplying the frame by a full-screen rounded-rect mask, but
+    the mask is split once per geometry into border strips (filled black) and four small
+    corner patches (multiplied), so no full-screen surface is allocated or blended per frame.
+
+    Args:
+        screen (pygame.Surface): The finished frame
+        ui_scaler (UIScaler): UI scaler instance with safe area settings
+        corner_radius (int): Radius of the visible rounded rect's corners
+    """
+    mask_size = (ui_scaler.screen_width, ui_scaler.screen_height)
+    safe_rect = ui_scaler.get_safe_area_rect()
+    key = (mask_size, tuple(safe_rect), corner_radius)
+    patches = _mask_patch_cache.get(key)
+    if patches is None:
+        patches = _build_safe_area_mask_patches(mask_size, safe_rect, corner_radius)
+        _mask_patch_cache[key] = patches
+        logger.debug(f"Built safe area mask for {mask_size}, safe rect {safe_rect}, radius {corner_radius}")
+
+    border_rects, corner_patches = patches
+    for rect in border_rects:
+        screen.fill((0, 0, 0), rect)
+    for patch, position in corner_patches:
+        screen.blit(patch, position, special_flags=pygame.BLEND_MULT)
@@ -0,0 +1,156 @@
+# --- utils/text_cache.py ---
+# Shared cache of rendered text surfaces, plus per-glyph atlases for frequently changing values
+
+import collections
+import logging
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 512
+MAX_ATLASES = 64  # One per (font, color); bounded in case a caller animates the color
+
+
+def _color_key(color):
+    """Hashable RGBA form of a color, so (r, g, b), (r, g, b, 255) and pygame.Color share entries."""
+    return tuple(pygame.Color(color)) if color is not None else None
+
+
+class GlyphAtlas:
+    """
+    Glyphs for one (font, color, antialias) packed side by side on a single surface.
+
+    Each character is rendered once; blit_text() then draws strings as blits from the atlas,
+    so a value whose digits change every frame allocates nothing. Glyphs are laid out by
+    their individual advance, so kerning pairs are ignored (not noticeable for numbers).
+    """
+
+    def __init__(self, font, color, antialias=True):
+        self.font = font
+        self.color = color
+        self.antialias = antialias
+        self.height = font.get_height()
+        self._glyphs = {}  # char -> pygame.Rect area on the atlas surface
+        self._surface = pygame.Surface((64, self.height), pygame.SRCALPHA)
+        self._used_width = 0
+
+    def _glyph(self, char):
+        area = self._glyphs.get(char)
+        if area is not None:
+            return area
+        glyph = self.font.render(char, self.antialias, self.color)
+        width = glyph.get_width()
+        if self._used_width + width > self._surface.get_width():
+            # Grow the atlas (doubling) and keep existing glyphs where they are
+            new_width = max(self._surface.get_width() * 2, self._used_width + width)
+            grown = pygame.Surface((new_width, self.height), pygame.SRCALPHA)
+            grown.blit(self._surface, (0, 0))
+            self._surface = grown
+        self._surface.blit(glyph, (self._used_width, 0))
+        area = pygame.Rect(self._used_width, 0, width, self.height)
+        self._glyphs[char] = area
+        self._used_width += width
+        return area
+
+    def size(self, text):
+        """(width, height) the text occupies when drawn from the atlas."""
+        return sum(self._glyph(char).width for char in text), self.height
+
+    def blit_text(self, screen, text, **rect_kwargs):
+        """
+        Draw text glyph by glyph, positioned like Surface.get_rect(**rect_kwargs).
+
+        Returns:
+            pygame.Rect: The area covered by the text
+        """
+        text_rect = pygame.Rect((0, 0), self.size(text))
+        for attribute, value in rect_kwargs.items():
+            setattr(text_rect, attribute, value)
+        x = text_rect.left
+        for char in text:
+            area = self._glyphs[char]
+            screen.blit(self._surface, (x, text_rect.top), area)
+            x += area.width
+        return text_rect
+
+
+class TextCache:
+    """
+    LRU cache of rendered text surfaces keyed by (font, text, color, antialias, background).
+
+    Static strings (titles, labels, footers) are rendered once and reused every frame. For
+    values that change constantly, use draw_dynamic(), which goes through a GlyphAtlas so
+    each new value costs only blits instead of a fresh surface that then evicts something.
+    The font object itself is part of the key, which keeps fonts alive while their surfaces
+    are cached and avoids id() reuse after a font reload.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int): Rendered strings kept; least recently used beyond this are evicted
+        """
+        self.max_entries = max_entries
+        self._entries = collections.OrderedDict()
+        self._atlases = collections.OrderedDict()
+
+    def render(self, font, text, color, antialias=True, background=None):
+        """
+        Cached equivalent of font.render(text, antialias, color, background).
+
+        Returns:
+            pygame.Surface: Shared surface (do not modify it)
+        """
+        key = (font, text, _color_key(color), antialias, _color_key(background))
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            return surface
+        if background is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, background)
+        self._entries[key] = surface
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return surface
+
+    def atlas(self, font, color, antialias=True):
+        """Return the GlyphAtlas for (font, color, antialias), creating it on first use."""
+        key = (font, _color_key(color), antialias)
+        atlas = self._atlases.get(key)
+        if atlas is not None:
+            self._atlases.move_to_end(key)
+            return atlas
+        atlas = GlyphAtlas(font, color, antialias)
+        self._atlases[key] = atlas
+        if len(self._atlases) > MAX_ATLASES:
+            self._atlases.popitem(last=False)
+        return atlas
+
+    def draw_dynamic(self, screen, font, text, color, antialias=True, **rect_kwargs):
+        """Draw frequently changing text through the glyph atlas; returns the covered Rect."""
+        return self.atlas(font, color, antialias).blit_text(screen, text, **rect_kwargs)
+
+    def clear(self):
+        """Drop all cached surfaces and glyph atlases (e.g. after fonts are reloaded)."""
+        self._entries.clear()
+        self._atlases.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_shared_cache = None
+
+
+def get_text_cache():
+    """Return the application-wide TextCache (sized by config TEXT_CACHE_MAX_ENTRIES)."""
+    global _shared_cache
+    if _shared_cache is None:
+        import config
+        _shared_cache = TextCache(getattr(config, "TEXT_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES))
+    return _shared_cache
@@ -1,11 +1,32 @@
 # --- utils/ui_scaler.py ---
 # Centralized UI scaling system for consistent responsive design
 
+import collections
 import logging
 import pygame
 
 logger = logging.getLogger(__name__)
 
+# Base sizes at 320x240 for the named size helpers
+BASE_MARGINS = {"small": 4, "medium": 8, "large": 12, "xlarge": 16}  # Reduced from 6/12/18/24
+BASE_PADDINGS = {"small": 2, "medium": 5, "large": 8, "xlarge": 12}  # Reduced from 3/8/12/16
+BASE_ITEM_HEIGHTS = {"small": 20, "medium": 25, "large": 30}
+BASE_ITEM_SPACINGS = {"small": 10, "medium": 15, "large": 20}
+
+MAX_CACHED_SCALES = 1024  # scale() results kept; bounded in case a caller scales continuously varying values
+
+# Precomputed layout values for the current screen size (UIScaler.layout). safe_rect is
+# shared: copy it before modifying.
+UILayout = collections.namedtuple("UILayout", [
+    "screen_width", "screen_height", "scale_factor", "breakpoint", "is_small_screen",
+    "header_height", "header_top_margin", "content_margin",
+    "margin_small", "margin_medium", "margin_large", "margin_xlarge",
+    "padding_small", "padding_medium", "padding_large", "padding_xlarge",
+    "item_height_small", "item_height_medium", "item_height_large",
+    "item_spacing_small", "item_spacing_medium", "item_spacing_large",
+    "safe_rect", "safe_margins",
+])
+
 class UIScaler:
     """
     Centralized UI scaling system that provides consistent sizing and spacing
@@ -13,6 +34,11 @@ class UIScaler:
     
     This class eliminates hardcoded values and inconsistent calculations
     throughout the UI components and views.
+
+    Everything it computes is a pure function of the screen size and config, so results
+    are memoized per instance (views call these helpers hundreds of times per frame).
+    resize() updates the dimensions in place and drops the memoized values. Returned
+    dicts are shared and must not be modified; returned Rects are fresh copies.
     """
     
     def __init__(self, screen_width, screen_height, config_module=None):
@@ -24,9 +50,25 @@ class UIScaler:
             screen_height (int): Current screen height in pixels
             config_module (module, optional): Configuration module for theme constants
         """
+        self.config = config_module
+        self._configure(screen_width, screen_height)
+        
+        # Basic initialization logging
+        logger.debug(f"UIScaler initialized: {screen_width}x{screen_height}, scale={self.scale_factor:.2f}")
+        
+        if self.debug_mode:
+            logger.info(f"🎨 UIScaler DEBUG MODE: {screen_width}x{screen_height}, scale_factor={self.scale_factor:.2f}")
+            if self.safe_area_enabled:
+                logger.info(f"🎨 Safe Area: top={self.safe_area_top}, bottom={self.safe_area_bottom}, left={self.safe_area_left}, right={self.safe_area_right}")
+
+    def _configure(self, screen_width, screen_height):
+        """Derive scale factors and safe area for the given screen size and reset the memoized values."""
+        config_module = self.config
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.config = config_module
+        self._scale_cache = {}
+        self._cache = {}  # helper name (or (name, size)) -> result
+        self._layout = None
         
         # Get base resolution from config or use defaults
         if config_module and hasattr(config_module, 'UI_BASE_WIDTH'):
@@ -49,14 +91,55 @@ class UIScaler:
         
         # Initialize safe area settings
         self._init_safe_area()
-        
-        # Basic initialization logging
-        logger.debug(f"UIScaler initialized: {screen_width}x{screen_height}, scale={self.scale_factor:.2f}")
-        
-        if self.debug_mode:
-            logger.info(f"🎨 UIScaler DEBUG MODE: {screen_width}x{screen_height}, scale_factor={self.scale_factor:.2f}")
-            if self.safe_area_enabled:
-                logger.info(f"🎨 Safe Area: top={self.safe_area_top}, bottom={self.safe_area_bottom}, left={self.safe_area_left}, right={self.safe_area_right}")
+
+    def resize(self, screen_width, screen_height):
+        """
+        Rescale for a new screen size (e.g. after a display mode switch).
+
+        Updates this instance in place, so every holder of the scaler sees the new size,
+        and invalidates all memoized values.
+        """
+        if (screen_width, screen_height) == (self.screen_width, self.screen_height):
+            return
+        self._configure(screen_width, screen_height)
+        logger.info(f"UIScaler resized: {screen_width}x{screen_height}, scale={self.scale_factor:.2f}")
+
+    def invalidate_cache(self):
+        """Drop memoized values (call after changing config settings the scaler depends on)."""
+        self._configure(self.screen_width, self.screen_height)
+
+    @property
+    def layout(self):
+        """UILayout with the common sizes for the current screen, built once per size."""
+        if self._layout is None:
+            safe_rect = self.get_safe_area_rect()
+            self._layout = UILayout(
+                screen_width=self.screen_width,
+                screen_height=self.screen_height,
+                scale_factor=self.scale_factor,
+                breakpoint=self.get_responsive_breakpoint(),
+                is_small_screen=self.is_small_screen(),
+                header_height=self.header_height(),
+                header_top_margin=self.header_top_margin(),
+                content_margin=self.content_margin(),
+                margin_small=self.margin("small"),
+                margin_medium=self.margin("medium"),
+                margin_large=self.margin("large"),
+                margin_xlarge=self.margin("xlarge"),
+                padding_small=self.padding("small"),
+                padding_medium=self.padding("medium"),
+                padding_large=self.padding("large"),
+                padding_xlarge=self.padding("xlarge"),
+                item_height_small=self.item_height("small"),
+                item_height_medium=self.item_height("medium"),
+                item_height_large=self.item_height("large"),
+                item_spacing_small=self.item_spacing("small"),
+                item_spacing_medium=self.item_spacing("medium"),
+                item_spacing_large=self.item_spacing("large"),
+                safe_rect=safe_rect,
+                safe_margins=self.get_safe_area_margins(),
+            )
+        return self._layout
     
     def _init_safe_area(self):
         """Initialize safe area settings from config."""
@@ -122,31 +205,39 @@ class UIScaler:
         Get the safe area rectangle where content should be placed.
         
         Returns:
-            pygame.Rect: Safe area rectangle
+            pygame.Rect: Safe area rectangle (a copy; free to modify)
         """
-        if not self.safe_area_enabled:
-            return pygame.Rect(0, 0, self.screen_width, self.screen_height)
-        
-        return pygame.Rect(
-            self.safe_area_left,
-            self.safe_area_top,
-            self.screen_width - self.safe_area_left - self.safe_area_right,
-            self.screen_height - self.safe_area_top - self.safe_area_bottom
-        )
+        rect = self._cache.get("safe_area_rect")
+        if rect is None:
+            if not self.safe_area_enabled:
+                rect = pygame.Rect(0, 0, self.screen_width, self.screen_height)
+            else:
+                rect = pygame.Rect(
+                    self.safe_area_left,
+                    self.safe_area_top,
+                    self.screen_width - self.safe_area_left - self.safe_area_right,
+                    self.screen_height - self.safe_area_top - self.safe_area_bottom
+                )
+            self._cache["safe_area_rect"] = rect
+        return rect.copy()
     
     def get_safe_area_margins(self):
         """
         Get safe area margins as a dictionary.
         
         Returns:
-            dict: Dictionary with 'top', 'bottom', 'left', 'right' margins
-        """
-        return {
-            'top': self.safe_area_top,
-            'bottom': self.safe_area_bottom,
-            'left': self.safe_area_left,
-            'right': self.safe_area_right
-        }
+            dict: Dictionary with 'top', 'bottom', 'left', 'right' margins (shared; do not modify)
+        """
+        margins = self._cache.get("safe_area_margins")
+        if margins is None:
+            margins = {
+                'top': self.safe_area_top,
+                'bottom': self.safe_area_bottom,
+                'left': self.safe_area_left,
+                'right': self.safe_area_right
+            }
+            self._cache["safe_area_margins"] = margins
+        return margins
     
     def is_point_in_safe_area(self, x, y):
         """
@@ -175,9 +266,14 @@ class UIScaler:
         Returns:
             int: Scaled value for current resolution
         """
+        result = self._scale_cache.get(base_value)
+        if result is not None:
+            return result
         result = max(1, int(base_value * self.scale_factor))
+        if len(self._scale_cache) < MAX_CACHED_SCALES:
+            self._scale_cache[base_value] = result
         
-        # Only log very significant scaling operations to avoid spam
+        # Only log very significant scaling operations to avoid spam (logged once per value)
         if self.debug_mode and base_value >= 50:  # Only log large values
             logger.info(f"🎨 UIScaler.scale: {base_value} → {result}px (factor: {self.scale_factor:.2f})")
         
@@ -193,19 +289,11 @@ class UIScaler:
         Returns:
             int: Margin size in pixels
         """
-        # Reduced base margins for better proportions
-        base_margins = {
-            "small": 4,      # Reduced from 6
-            "medium": 8,     # Reduced from 12
-            "large": 12,     # Reduced from 18
-            "xlarge": 16     # Reduced from 24
-        }
-        
-        base_value = base_margins.get(size, base_margins["medium"])
-        result = self.scale(base_value)
-        
-        # Remove debug logging to avoid spam - margins are called every frame
-        
+        key = ("margin", size)
+        result = self._cache.get(key)
+        if result is None:
+            result = self.scale(BASE_MARGINS.get(size, BASE_MARGINS["medium"]))
+            self._cache[key] = result
         return result
     
     def padding(self, size="medium"):
@@ -218,19 +306,11 @@ class UIScaler:
         Returns:
             int: Padding size in pixels
         """
-        # Reduced base paddings for better proportions
-        base_paddings = {
-            "small": 2,      # Reduced from 3
-            "medium": 5,     # Reduced from 8
-            "large": 8,      # Reduced from 12
-            "xlarge": 12     # Reduced from 16
-        }
-        
-        base_value = base_paddings.get(size, base_paddings["medium"])
-        result = self.scale(base_value)
-        
-        # Remove debug logging to avoid spam - paddings are called every frame
-        
+        key = ("padding", size)
+        result = self._cache.get(key)
+        if result is None:
+            result = self.scale(BASE_PADDINGS.get(size, BASE_PADDINGS["medium"]))
+            self._cache[key] = result
         return result
     
     def header_height(self):
@@ -241,9 +321,13 @@ class UIScaler:
         Returns:
             int: Header height in pixels
         """
+        result = self._cache.get("header_height")
+        if result is not None:
+            return result
         # Revert to original proportional calculation - // 10 was correct
         # This matches the original design proportions
         result = max(20, self.screen_height // 10)  # 10% of screen height, minimum 20px
+        self._cache["header_height"] = result
         
         if self.debug_mode:
             logger.info(f"🎨 UIScaler.header_height: {result}px ({result/self.screen_height*100:.1f}% of {self.screen_height}px)")
@@ -258,8 +342,12 @@ class UIScaler:
         Returns:
             int: Header top margin in pixels
         """
+        result = self._cache.get("header_top_margin")
+        if result is not None:
+            return result
         # Use original proportional calculation
         result = self.screen_height // 20
+        self._cache["header_top_margin"] = result
         
         if self.debug_mode:
             logger.info(f"🎨 UIScaler.header_top_margin: {result}px ({result/self.screen_height*100:.1f}% of {self.screen_height}px)")
@@ -275,6 +363,9 @@ class UIScaler:
         Returns:
             int: Content margin in pixels
         """
+        result = self._cache.get("content_margin")
+        if result is not None:
+            return result
         # Use original proportional calculation
         base_margin = max(8, self.screen_width // 30)
         
@@ -285,6 +376,7 @@ class UIScaler:
             result = max(base_margin, max(safe_margins['left'], safe_margins['right']))
         else:
             result = base_margin
+        self._cache["content_margin"] = result
         
         if self.debug_mode:
             logger.info(f"🎨 UIScaler.content_margin: {result}px ({result/self.screen_width*100:.1f}% of {self.screen_width}px)")
@@ -301,14 +393,7 @@ class UIScaler:
         Returns:
             int: Item height in pixels
         """
-        base_heights = {
-            "small": 20,
-            "medium": 25,
-            "large": 30
-        }
-        
-        base_value = base_heights.get(size, base_heights["medium"])
-        return self.scale(base_value)
+        return self.scale(BASE_ITEM_HEIGHTS.get(size, BASE_ITEM_HEIGHTS["medium"]))
     
     def item_spacing(self, size="medium"):
         """
@@ -320,14 +405,7 @@ class UIScaler:
         Returns:
             int: Spacing in pixels
         """
-        base_spacings = {
-            "small": 10,
-            "medium": 15,
-            "large": 20
-        }
-        
-        base_value = base_spacings.get(size, base_spacings["medium"])
-        return self.scale(base_value)
+        return self.scale(BASE_ITEM_SPACINGS.get(size, BASE_ITEM_SPACINGS["medium"]))
     
     def font_size(self, base_size):
         """